@@ -0,0 +1,462 @@
+"""This module serves the portfolio operations as a local JSON HTTP API,
+so many light clients can be served by one process instead of each
+running the terminal app. Every client shares one PortfolioService, so
+one warm cache, one pool of connections to Google Sheets and one
+scheduler keeping sheet calls within the quota. Start it with
+"run.py serve", it only listens on this machine unless told otherwise.
+
+GET /portfolio, /needed and /appraise, and POST /cards/add and
+/cards/remove with {"cards": "4 5 1-16"}, need the token from
+POST /login in an "Authorization: Bearer" header. DELETE /portfolio
+removes every card and POST /logout revokes the users tokens.
+GET /cards/<number> shows a card, and if the user has it when a token
+is given."""
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import gspread
+from requests.adapters import HTTPAdapter
+
+import session_tokens
+from commands import parse_card_list, summarise_results
+from login_throttle import LoginThrottle, TokenBucket
+from portfolio_service import (LoginFailed, PortfolioService, ServiceBusy,
+                               ServiceError, UserNotFound)
+from session_tokens import issue_token, revoke_tokens, verify_token
+
+# Address the server listens on, only this machine by default
+API_HOST = os.environ.get("API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("API_PORT", 8765))
+
+# Sheets allows 60 read requests a minute for each user, reads from every
+# client are paced to stay within it
+READ_BURST = int(os.environ.get("SHEETS_READ_BURST", 10))
+READ_RATE = float(os.environ.get("SHEETS_READ_RATE", 1.0))
+
+# Connections kept open to Google Sheets, and the most sheet calls made
+# at once so a call never waits for a connection
+POOL_SIZE = int(os.environ.get("SHEETS_POOL_SIZE", 10))
+
+# Largest request body accepted, in bytes
+MAX_BODY = 64 * 1024
+
+# Worksheet methods that write, they are paced by write_ranges
+WRITE_METHODS = frozenset(("batch_update", "update", "update_acell",
+                           "update_cell", "append_row", "insert_cols"))
+
+# Card pages, such as /cards/4
+CARD_PATH = re.compile(r"/cards/(\d+)")
+
+
+class ApiError(Exception):
+    """
+    Raised to answer a request with an error status and message
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ---- SHEET ACCESS ----
+
+
+class QuotaScheduler:
+    """
+    A class that schedules sheet calls from every client, reads wait for
+    a token from a shared bucket and at most POOL_SIZE calls run at once
+    """
+
+    def __init__(self, read_burst=READ_BURST, read_rate=READ_RATE,
+                 pool_size=POOL_SIZE):
+        """
+        Initialise an instance of the QuotaScheduler class.
+
+        Parameters:
+            read_burst (int): Reads that can be made at once
+            read_rate (float): Reads allowed each second
+            pool_size (int): Most calls made at once
+        """
+        self._reads = TokenBucket(read_burst, read_rate)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self.calls = 0
+        self.waited = 0.0
+
+    def call(self, func, *args, write=False, **kwargs):
+        """
+        Makes a sheet call once there is quota and a free connection
+
+        Parameters:
+            func (func): Call to make
+            args: Arguments for the call
+            write (boolean): Flag set for writes, which are paced by
+                write_ranges rather than the read bucket
+            kwargs: Keyword arguments for the call
+        Returns:
+            result (object): What the call returned
+        """
+        while not write:
+            with self._lock:
+                wait = self._reads.wait_time()
+                if not wait:
+                    self._reads.tokens -= 1
+                    break
+                self.waited += wait
+            time.sleep(wait)
+
+        with self._slots:
+            with self._lock:
+                self.calls += 1
+            return func(*args, **kwargs)
+
+
+class QuotaWorksheet:
+    """
+    A class that wraps a gspread worksheet so each call on it is made
+    through a QuotaScheduler. Attributes that are not methods, such as
+    col_count, are read directly.
+    """
+
+    def __init__(self, worksheet, scheduler):
+        """
+        Initialise an instance of the QuotaWorksheet class.
+
+        Parameters:
+            worksheet (object): Worksheet to wrap
+            scheduler (QuotaScheduler): Scheduler shared by every client
+        """
+        self._worksheet = worksheet
+        self._scheduler = scheduler
+
+    def __getattr__(self, name):
+        attribute = getattr(self._worksheet, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            return self._scheduler.call(attribute, *args,
+                                        write=name in WRITE_METHODS,
+                                        **kwargs)
+        return call
+
+
+def pool_connections(sheet, pool_size=POOL_SIZE):
+    """
+    Keeps up to pool_size connections to Google Sheets open, so calls
+    from many clients do not each open a new one
+
+    Parameters:
+        sheet (object): Spreadsheet holding the worksheets
+        pool_size (int): Connections kept open
+    Returns:
+        None
+    """
+    session = getattr(sheet.client, "session", None)
+    if session is not None:
+        session.mount("https://", HTTPAdapter(pool_connections=pool_size,
+                                              pool_maxsize=pool_size))
+
+
+# ---- REQUESTS ----
+
+
+def read_cards(body):
+    """
+    Returns the card numbers in a request body, given as a list of
+    numbers or as text such as "4 5 1-16"
+
+    Parameters:
+        body (dict): Request body
+    Returns:
+        (card_nums, rejected) (tuple): As parse_card_list
+    Raises:
+        ApiError: If there are no valid card numbers
+    """
+    cards = body.get("cards", "")
+    if isinstance(cards, list):
+        cards = " ".join(str(card) for card in cards)
+    card_nums, rejected = parse_card_list(str(cards))
+    if not card_nums:
+        raise ApiError(400, "No valid card numbers given")
+    return card_nums, rejected
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """
+    A class that answers API requests, one instance is made for each
+    connection on a thread of the server
+    """
+
+    # Keep connections open so clients can send many requests on one
+    protocol_version = "HTTP/1.1"
+    server_version = "PokemonPortfolio"
+
+    # ---- ROUTES ----
+
+    def get_health(self, body):
+        """
+        Answers with the sheet calls made and seconds spent waiting for
+        quota, to check the server is up
+        """
+        scheduler = self.server.scheduler
+        return 200, {"status": "ok", "sheet_calls": scheduler.calls,
+                     "quota_wait": round(scheduler.waited, 3)}
+
+    def post_login(self, body):
+        """
+        Checks a username and password, answering with the account and
+        a token for the other routes
+        """
+        username = str(body.get("username", ""))
+        self.throttle(username)
+        account = self.server.service.login(
+            username, str(body.get("password", "")))
+        return 200, dict(account, token=issue_token(
+            account["col_number"], account["col_letter"]))
+
+    def post_logout(self, body):
+        """
+        Revokes every token issued to the user, including the one sent
+        """
+        revoke_tokens(self.col_letter())
+        return 200, {"status": "logged out"}
+
+    def post_accounts(self, body):
+        """
+        Creates an account from username, password and phone_num
+        """
+        username = str(body.get("username", ""))
+        self.throttle(username)
+        account = self.server.service.create_account(
+            username, str(body.get("password", "")),
+            str(body.get("phone_num", "")))
+        return 201, account
+
+    def get_portfolio(self, body):
+        """
+        Answers with the cards the user has
+        """
+        return 200, self.server.service.portfolio(self.col_letter())
+
+    def get_needed(self, body):
+        """
+        Answers with the cards the user is missing
+        """
+        return 200, self.server.service.needed(self.col_letter())
+
+    def get_appraise(self, body):
+        """
+        Answers with the value of the users portfolio
+        """
+        return 200, self.server.service.appraise(self.col_letter())
+
+    def delete_portfolio(self, body):
+        """
+        Removes every card from the users portfolio
+        """
+        self.server.service.delete_portfolio(self.col_letter())
+        return 200, {"deleted": True}
+
+    def post_cards_add(self, body):
+        """
+        Adds the cards given
+        """
+        return self.change_cards("add", body)
+
+    def post_cards_remove(self, body):
+        """
+        Removes the cards given
+        """
+        return self.change_cards("remove", body)
+
+    def change_cards(self, name, body):
+        """
+        Adds or removes cards, answering with what changed
+        """
+        card_nums, rejected = read_cards(body)
+        result = self.server.service.apply_commands(self.col_letter(),
+                                                    [(name, card_nums)])
+        results = result["results"]
+        return 200, {
+            "changed": [card for _, card, changed in results if changed],
+            "unchanged": [card for _, card, changed in results
+                          if not changed],
+            "rejected": rejected,
+            "messages": [message.strip() for message, _ in
+                         summarise_results(results, result["card_names"],
+                                           rejected)],
+        }
+
+    def show_card(self, card_num):
+        """
+        Answers with a cards details, and if the user has it when a
+        token is sent
+        """
+        col_letter = (self.col_letter()
+                      if self.headers.get("Authorization") else None)
+        return 200, self.server.service.search(card_num, col_letter)
+
+    # ---- HANDLING ----
+
+    def throttle(self, username):
+        """
+        Takes a token from the usernames bucket for a login or account
+        creation. Every client connects from this machine, so clients
+        are not told apart by address.
+
+        Raises:
+            ApiError: If the username has no attempts left for now
+        """
+        wait = self.server.throttle.attempt(username)
+        if wait:
+            raise ApiError(429, "Too many attempts, try again in "
+                           f"{int(wait) + 1} seconds")
+
+    def col_letter(self):
+        """
+        Returns the column letter of the user whose token was sent
+
+        Raises:
+            ApiError: If no token was sent, or it is not valid
+        """
+        scheme, _, token = self.headers.get("Authorization", "").partition(
+            " ")
+        user = verify_token(token) if scheme.lower() == "bearer" else None
+        if not user:
+            raise ApiError(401, "Log in with POST /login and send the "
+                           "token as Authorization: Bearer <token>")
+        return user[1]
+
+    def read_body(self):
+        """
+        Returns the JSON body of the request, {} if there is none
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            # The body is not read, so the connection cannot be reused
+            self.close_connection = True
+            raise ApiError(413, "Request body is too large")
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise ApiError(400, "Request body is not valid JSON") from None
+        if not isinstance(body, dict):
+            raise ApiError(400, "Request body must be a JSON object")
+        return body
+
+    def send_json(self, status, data):
+        """
+        Sends a JSON response, prices are sent as numbers
+        """
+        payload = json.dumps(data, default=float).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def handle_request(self, method):
+        """
+        Runs the route for a request, answering errors as JSON
+        """
+        path = self.path.split("?", 1)[0].rstrip("/") or "/"
+        try:
+            body = self.read_body()
+            card = CARD_PATH.fullmatch(path)
+            if card and method == "get":
+                status, data = self.show_card(int(card[1]))
+            else:
+                route = getattr(self, f"{method}_" + path.strip("/")
+                                .replace("/", "_"), None)
+                if route is None or path == "/":
+                    raise ApiError(404, f"No route for {method.upper()} "
+                                   f"{path}")
+                status, data = route(body)
+        except ApiError as e:
+            status, data = e.status, {"error": str(e)}
+        except UserNotFound as e:
+            status, data = 404, {"error": str(e)}
+        except LoginFailed as e:
+            status, data = 401, {"error": str(e)}
+        except ServiceBusy as e:
+            status, data = 503, {"error": str(e)}
+        except (ServiceError, ValueError) as e:
+            status, data = 400, {"error": str(e)}
+        except gspread.exceptions.APIError as e:
+            status, data = 502, {"error": f"Google Sheets error: {e}"}
+        except Exception as e:
+            status, data = 500, {"error": f"An error occurred: {e}"}
+        self.send_json(status, data)
+
+    def do_GET(self):
+        self.handle_request("get")
+
+    def do_POST(self):
+        self.handle_request("post")
+
+    def do_DELETE(self):
+        self.handle_request("delete")
+
+
+def make_server(sheet, host=API_HOST, port=API_PORT):
+    """
+    Makes the API server with its shared service, scheduler and login
+    throttle, reading the catalog and users so the cache starts warm
+
+    Parameters:
+        sheet (object): Spreadsheet holding the worksheets
+        host (string): Address to listen on
+        port (int): Port to listen on, 0 picks a free one
+    Returns:
+        server (ThreadingHTTPServer): Server ready to serve_forever
+    """
+    # Tokens are signed with a key for this process when none is set,
+    # so they stop working when the server restarts
+    if not session_tokens.SECRET:
+        session_tokens.SECRET = secrets.token_urlsafe(32)
+
+    pool_connections(sheet)
+    scheduler = QuotaScheduler()
+    throttle = LoginThrottle()
+    service = PortfolioService(
+        lambda name: QuotaWorksheet(scheduler.call(sheet.worksheet, name),
+                                    scheduler), throttle)
+    service.catalog()
+    service.users()
+
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.scheduler = scheduler
+    server.throttle = throttle
+    return server
+
+
+def serve(sheet, host=API_HOST, port=API_PORT):
+    """
+    Serves the API until interrupted with Ctrl-C
+
+    Parameters:
+        sheet (object): Spreadsheet holding the worksheets
+        host (string): Address to listen on
+        port (int): Port to listen on
+    Returns:
+        None
+    """
+    server = make_server(sheet, host, port)
+    print(f"Serving the portfolio API on http://{host}:"
+          f"{server.server_address[1]}, press Ctrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,45 @@
+"""This module provides cached pyfiglet fonts and rendered art font text"""
+from functools import lru_cache
+
+import pyfiglet as pyf
+from termcolor import colored
+
+# Width passed to pyfiglet for all rendered text
+FONT_WIDTH = 110
+
+# Max number of rendered strings kept in memory
+RENDER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def get_figlet(font, width=FONT_WIDTH):
+    """
+    Returns a Figlet object for the font, loading each font file once
+
+    Parameters:
+        font (string): Font to load
+        width (int): Max width of rendered text
+    Returns:
+        figlet (object): Figlet object for the font
+    """
+    return pyf.Figlet(font=font, width=width)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_art_font(string, font, color, width=FONT_WIDTH):
+    """
+    Converts given string into a coloured art font style, caching the
+    result so repeated headings are only rendered once
+
+    Parameters:
+        string (string): Text to be converted
+        font (string): Font to render in
+        color (string): Colour of rendered text
+        width (int): Max width of rendered text
+    Returns:
+        msg (string): Rendered and coloured text
+    """
+    msg = get_figlet(font, width).renderText(string)
+    msg = msg.rstrip()
+
+    return colored(msg, color)
@@ -0,0 +1,291 @@
+"""This module converts card or sprite images into braille dot art and
+writes the results into the art store used by print_pokemon"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from art_store import (ART_FILE, VARIANT_SEPARATOR, read_art_store,
+                       variant_key, write_art_store)
+from terminal_metrics import DEFAULT_WIDTH
+
+# Image file types picked up when converting a whole folder
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp")
+
+# Terminal cells are about twice as tall as they are wide
+CELL_ASPECT = 2
+
+# 4x4 Bayer matrix, normalised to -0.5 - 0.5, used for ordered dithering
+BAYER_4X4 = (np.array([[0, 8, 2, 10],
+                       [12, 4, 14, 6],
+                       [3, 11, 1, 9],
+                       [15, 7, 13, 5]]) + 0.5) / 16 - 0.5
+
+# Cut off used for images of a single shade, which have no mean to split
+MIDPOINT = 0.5
+
+# Bit for each dot in a 4 row x 2 column braille cell
+BRAILLE_BITS = np.array([[0x01, 0x08],
+                         [0x02, 0x10],
+                         [0x04, 0x20],
+                         [0x40, 0x80]], dtype=np.uint32)
+
+# First braille code point (a cell with no dots)
+BRAILLE_BLANK = 0x2800
+
+# Widths of the smaller art variants used on narrow terminals
+VARIANT_WIDTHS = (60, 44, 32)
+
+# Share of a shrunk block that must be dots to keep a dot, kept low
+# so thin outlines survive
+VARIANT_THRESHOLD = 0.3
+
+
+def load_pixels(image, width):
+    """
+    Loads an image as greyscale pixels sized for a given art width,
+    transparent areas are treated as white background
+
+    Parameters:
+        image (string or object): Image path or PIL image
+        width (int): Art width in braille cells
+    Returns:
+        pixels (array): Greyscale values 0 - 1, sized to whole cells
+    """
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+
+    image = image.convert("RGBA")
+    background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+    image = Image.alpha_composite(background, image).convert("L")
+
+    # Each cell is 2 pixels wide and 4 high, keep the image aspect ratio
+    cells_high = max(1, round(
+        width * image.height / image.width / CELL_ASPECT))
+    image = image.resize((width * 2, cells_high * 4), Image.LANCZOS)
+
+    return np.asarray(image, dtype=np.float32) / 255
+
+
+def threshold_pixels(pixels, threshold=None, dither=True, invert=False):
+    """
+    Decides which pixels become dots, darker pixels are dots by default
+
+    Parameters:
+        pixels (array): Greyscale values 0 - 1
+        threshold (float or None): Cut off, None uses the image mean, or
+            the midpoint if the image is a single shade
+        dither (boolean): Flag to control ordered dithering
+        invert (boolean): Flag to make lighter pixels dots instead
+    Returns:
+        dots (array): True where a dot is drawn
+    """
+    if invert:
+        pixels = 1 - pixels
+    if threshold is None:
+        # Every pixel of a single shade equals its mean, dithering would
+        # then turn half of them into dots
+        threshold = (float(pixels.mean()) if np.ptp(pixels) > 0
+                     else MIDPOINT)
+
+    dithered = pixels
+    if dither:
+        height, width = pixels.shape
+        tiled = np.tile(BAYER_4X4, (height // 4 + 1, width // 4 + 1))
+        dithered = pixels + tiled[:height, :width] * 0.5
+
+    # Pure white is never a dot and pure black always is, so backgrounds
+    # stay clear however the threshold falls
+    return (dithered < threshold) & (pixels < 1) | (pixels <= 0)
+
+
+def pack_braille(dots):
+    """
+    Packs every 2x4 block of dots into a braille character
+
+    Parameters:
+        dots (array): True where a dot is drawn, sized to whole cells
+    Returns:
+        rows (list): One string of braille characters per cell row
+    """
+    height, width = dots.shape
+    cells = dots.reshape(height // 4, 4, width // 2, 2)
+    codes = BRAILLE_BLANK + np.einsum("ijkl,jl->ik", cells.astype(np.uint32),
+                                      BRAILLE_BITS)
+
+    text = codes.astype("<u4").tobytes().decode("utf-32-le")
+    row_length = width // 2
+    return [text[i:i + row_length] for i in range(0, len(text), row_length)]
+
+
+def image_to_braille(image, width, threshold=None, dither=True,
+                     invert=False, terminal_width=DEFAULT_WIDTH):
+    """
+    Converts an image into braille art laid out like the hand made art,
+    centred in the terminal with a leading newline
+
+    Parameters:
+        image (string or object): Image path or PIL image
+        width (int): Art width in braille cells
+        threshold (float or None): Cut off, None uses the image mean
+        dither (boolean): Flag to control ordered dithering
+        invert (boolean): Flag to make lighter pixels dots instead
+        terminal_width (int): Width the art is centred in
+    Returns:
+        art (string): Braille art
+    """
+    dots = threshold_pixels(load_pixels(image, width), threshold,
+                            dither, invert)
+    indent = " " * max(0, (terminal_width - width) // 2)
+    rows = pack_braille(dots)
+
+    return "\n" + "\n".join(indent + row for row in rows) + "\n"
+
+
+def braille_to_dots(art):
+    """
+    Unpacks braille art back into dots, the reverse of pack_braille
+    Characters that are not braille, such as spaces, have no dots
+
+    Parameters:
+        art (string): Braille art, the indent shared by all lines is removed
+    Returns:
+        dots (array): True where a dot is drawn
+    """
+    lines = [line for line in art.split("\n") if line.strip()]
+    indent = min(len(line) - len(line.lstrip(" ")) for line in lines)
+    lines = [line[indent:].rstrip() for line in lines]
+    width = max(len(line) for line in lines)
+
+    codes = np.array([[ord(char) for char in line.ljust(width, " ")]
+                      for line in lines], dtype=np.int64) - BRAILLE_BLANK
+    codes[(codes < 0) | (codes > 0xFF)] = 0
+
+    # Expand each cell to 4x2 and test the bit for each dot position
+    cells = codes[:, None, :, None] & BRAILLE_BITS[None, :, None, :]
+    return cells.reshape(len(lines) * 4, width * 2) > 0
+
+
+def shrink_art(art, width, terminal_width=DEFAULT_WIDTH):
+    """
+    Makes a smaller version of braille art by averaging blocks of dots
+
+    Parameters:
+        art (string): Braille art
+        width (int): Width of the smaller version in braille cells
+        terminal_width (int): Width the art is centred in
+    Returns:
+        art (string): Smaller braille art
+    """
+    dots = braille_to_dots(art).astype(np.float32)
+    height = dots.shape[0] * width * 2 / dots.shape[1]
+    cells_high = max(1, round(height / 4))
+
+    image = Image.fromarray(dots, mode="F").resize(
+        (width * 2, cells_high * 4), Image.BOX)
+    rows = pack_braille(np.asarray(image) > VARIANT_THRESHOLD)
+
+    indent = " " * max(0, (terminal_width - width) // 2)
+    return "\n" + "\n".join(indent + row for row in rows) + "\n"
+
+
+def generate_variants(widths=VARIANT_WIDTHS, store_path=ART_FILE):
+    """
+    Adds smaller versions of all art in the store for narrow terminals,
+    only for widths smaller than the full size art
+
+    Parameters:
+        widths (tuple): Widths of the variants to make
+        store_path (string): Art store to update
+    Returns:
+        keys (list): Keys of the variants written
+    """
+    art = {key: text for key, text in read_art_store(store_path).items()
+           if VARIANT_SEPARATOR not in key}
+
+    variants = {}
+    for key, text in art.items():
+        full_width = braille_to_dots(text).shape[1] // 2
+        for width in widths:
+            if width < full_width:
+                variants[variant_key(key, width)] = shrink_art(text, width)
+
+    art.update(variants)
+    write_art_store(art, store_path)
+
+    return list(variants)
+
+
+def _convert_file(job):
+    """
+    Converts one image file, run in a worker process
+    """
+    path, width, threshold, dither, invert = job
+    key = os.path.splitext(os.path.basename(path))[0]
+    return key, image_to_braille(path, width, threshold, dither, invert)
+
+
+def generate_set(image_dir, width, threshold=None, dither=True,
+                 invert=False, store_path=ART_FILE, workers=None):
+    """
+    Converts every image in a folder across all cores and writes the art
+    into the store, keyed by file name (4.png is stored as "4")
+
+    Parameters:
+        image_dir (string): Folder of images to convert
+        width (int): Art width in braille cells
+        threshold (float or None): Cut off, None uses each image mean
+        dither (boolean): Flag to control ordered dithering
+        invert (boolean): Flag to make lighter pixels dots instead
+        store_path (string): Art store to add the art to
+        workers (int or None): Number of processes, None uses all cores
+    Returns:
+        keys (list): Keys of the art written
+    """
+    jobs = [(os.path.join(image_dir, name), width, threshold, dither, invert)
+            for name in sorted(os.listdir(image_dir))
+            if name.lower().endswith(IMAGE_EXTENSIONS)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        generated = dict(executor.map(_convert_file, jobs))
+
+    # Drop variants of replaced art, they can be rebuilt with --variants
+    art = {key: text for key, text in read_art_store(store_path).items()
+           if key.split(VARIANT_SEPARATOR)[0] not in generated}
+    art.update(generated)
+    write_art_store(art, store_path)
+
+    return list(generated)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert a folder of images into braille art")
+    parser.add_argument("image_dir", nargs="?",
+                        help="folder of images to convert")
+    parser.add_argument("--width", type=int, default=40,
+                        help="art width in characters")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="dot cut off 0 - 1, defaults to image mean")
+    parser.add_argument("--no-dither", action="store_true",
+                        help="turn off ordered dithering")
+    parser.add_argument("--invert", action="store_true",
+                        help="draw light pixels as dots")
+    parser.add_argument("--store", default=ART_FILE,
+                        help="art store to write to")
+    parser.add_argument("--variants", type=int, nargs="*",
+                        help="rebuild smaller variants of all art at "
+                             f"these widths (default {VARIANT_WIDTHS})")
+    args = parser.parse_args()
+
+    if args.image_dir:
+        keys = generate_set(args.image_dir, args.width, args.threshold,
+                            not args.no_dither, args.invert, args.store)
+        print(f"Wrote {len(keys)} images to {args.store}")
+
+    if args.variants is not None:
+        keys = generate_variants(tuple(args.variants) or VARIANT_WIDTHS,
+                                 args.store)
+        print(f"Wrote {len(keys)} variants to {args.store}")
@@ -0,0 +1,206 @@
+"""This module provides the pokemon ascii art store, a memory mapped data
+file of art entries that are decoded on demand"""
+import os
+import zlib
+from functools import lru_cache
+
+from data_store import IndexedFile
+
+# Data file holding every pokemon art entry
+ART_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "assets", "art", "pokemon_art.bin")
+
+# Max number of decoded art entries kept in memory
+ART_CACHE_SIZE = 16
+
+# Max number of art entries laid out for a terminal width kept in memory
+LAYOUT_CACHE_SIZE = 64
+
+# Smaller versions of art are stored as <key>@<width>, e.g. "4@40"
+VARIANT_SEPARATOR = "@"
+
+# Terminal width the original art was laid out for
+ART_LAYOUT_WIDTH = 85
+
+# Art store, opened on first use
+_store = None
+
+
+def get_store():
+    """
+    Returns the art store, opening it on first use
+
+    Parameters:
+        None
+    Returns:
+        store (IndexedFile): Opened art store
+    """
+    global _store
+
+    if _store is None:
+        _store = IndexedFile(ART_FILE)
+    return _store
+
+
+@lru_cache(maxsize=ART_CACHE_SIZE)
+def get_art(key):
+    """
+    Returns the art stored for a key, decompressing it if needed
+
+    Parameters:
+        key (string): Key associated with the art
+    Returns:
+        art (string): Pokemon ascii art
+    """
+    return decode_entry(get_store(), key)
+
+
+def decode_entry(store, key):
+    """
+    Reads and decodes an art entry from a store
+
+    Parameters:
+        store (IndexedFile): Store to read from
+        key (string): Key associated with the art
+    Returns:
+        art (string): Pokemon ascii art
+    """
+    data = store.get(key)
+    if data is None:
+        raise KeyError(key)
+
+    if store.index[key].get("zlib"):
+        data = zlib.decompress(data)
+    return data.decode("utf-8")
+
+
+def get_art_size(key):
+    """
+    Returns the size of the art stored for a key, used for layout
+
+    Parameters:
+        key (string): Key associated with the art
+    Returns:
+        (width, height) (tuple): Widest line, not counting the
+            indent shared by every line, and number of lines
+    """
+    entry = get_store().index[key]
+    return entry["width"], entry["height"]
+
+
+def variant_key(key, width):
+    """
+    Returns the key a smaller version of some art is stored under
+
+    Parameters:
+        key (string): Key associated with the full size art
+        width (int): Width of the smaller version
+    Returns:
+        key (string): Key of the smaller version
+    """
+    return f"{key}{VARIANT_SEPARATOR}{width}"
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def get_art_for_width(key, columns, max_width=None):
+    """
+    Returns the largest version of the art that fits the terminal,
+    centred for it. Art is returned unchanged for the width it was
+    laid out for, so prerendered frames still match.
+
+    Parameters:
+        key (string): Key associated with the art
+        columns (int): Width of the terminal
+        max_width (int or None): Widest art to use, 0 for the smallest
+    Returns:
+        art (string): Pokemon ascii art
+    """
+    entry = get_store().index.get(key)
+    if entry is None:
+        raise KeyError(key)
+    if columns == ART_LAYOUT_WIDTH and max_width is None:
+        return get_art(key)
+    fit_width = columns if max_width is None else min(columns, max_width)
+
+    # Full size first then smaller variants, use the first that fits
+    # or the smallest if none do
+    candidates = [(entry["width"], key)] + [
+        (width, variant_key(key, width))
+        for width in sorted(entry.get("variants", []), reverse=True)
+    ]
+    chosen = next((candidate for candidate in candidates
+                   if candidate[0] <= fit_width), candidates[-1])
+    width, chosen_key = chosen
+
+    indent = get_store().index[chosen_key].get("indent", 0)
+    new_indent = " " * max(0, (columns - width) // 2)
+    return "\n".join(new_indent + line[indent:] if line.strip() else ""
+                     for line in get_art(chosen_key).split("\n"))
+
+
+def art_keys():
+    """
+    Returns the keys of all art in the store
+
+    Parameters:
+        None
+    Returns:
+        keys (list): Keys in the order they were stored, not
+            including smaller variants
+    """
+    return [key for key in get_store().index
+            if VARIANT_SEPARATOR not in key]
+
+
+def read_art_store(path=ART_FILE):
+    """
+    Reads every art entry from a store, used when rewriting the store
+
+    Parameters:
+        path (string): Path of the store to read
+    Returns:
+        art (dict): Key to art string
+    """
+    store = IndexedFile(path)
+    return {key: decode_entry(store, key) for key in store.index}
+
+
+def write_art_store(art, path=ART_FILE, compress=True):
+    """
+    Writes art entries to a new art store
+
+    Parameters:
+        art (dict): Key to art string
+        path (string): Path to write the store to
+        compress (boolean): Flag to control if entries are zlib compressed
+    Returns:
+        None
+    """
+    # Widths of the smaller variants stored for each key
+    variants = {}
+    for key in art:
+        if VARIANT_SEPARATOR in key:
+            base_key, width = key.split(VARIANT_SEPARATOR)
+            variants.setdefault(base_key, []).append(int(width))
+
+    entries = {}
+    for key, text in art.items():
+        data = text.encode("utf-8")
+        lines = text.splitlines()
+        drawn_lines = [line for line in lines if line.strip()]
+        indent = min((len(line) - len(line.lstrip(" "))
+                      for line in drawn_lines), default=0)
+        metadata = {
+            "width": max((len(line.rstrip()) - indent
+                          for line in drawn_lines), default=0),
+            "height": len(lines),
+            "indent": indent,
+            "zlib": compress,
+        }
+        if key in variants:
+            metadata["variants"] = sorted(variants[key])
+        if compress:
+            data = zlib.compress(data, 9)
+        entries[key] = (data, metadata)
+
+    IndexedFile.write(path, entries)
@@ -0,0 +1,247 @@
+"""This module runs network calls off the UI thread, showing a spinner
+with the elapsed time while they run and letting the user cancel them"""
+import builtins
+import os
+import re
+import select
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from contextlib import contextmanager
+from functools import partial
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows, Ctrl-C still cancels
+    termios = None
+
+# Seconds a call runs before the spinner is shown, so quick calls
+# do not flicker
+SPINNER_DELAY = float(os.environ.get("SPINNER_DELAY", 0.3))
+
+# Seconds between spinner updates, each update is sent to the terminal
+SPINNER_INTERVAL = float(os.environ.get("SPINNER_INTERVAL", 0.2))
+
+SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+# Esc on its own cancels a call, longer sequences starting with it are
+# keys such as the arrows
+ESCAPE_KEY = b"\x1b"
+
+# Other keys that cancel a call
+CANCEL_KEYS = b"qQ"
+
+# Escape sequences, such as the arrow keys, dropped from typed ahead keys
+ESCAPE_SEQUENCE = re.compile(r"\x1b(\[[0-9;]*[A-Za-z~]|O.|.)?")
+
+# Keys typed while a call ran that did not cancel it, given to the next
+# input as if typed there
+_typed_ahead = bytearray()
+
+
+class ActionCancelled(BaseException):
+    """
+    Raised when the user cancels a network call. It is not an Exception
+    so the error handlers around sheet calls let it through.
+
+    Attributes:
+        pending (Future or None): The abandoned call, which may still
+            finish, such as a write landing after the cancel
+    """
+
+    def __init__(self, pending=None):
+        """
+        Initialise an instance of the ActionCancelled class.
+
+        Parameters:
+            pending (Future or None): The abandoned call
+        """
+        super().__init__()
+        self.pending = pending
+
+
+def invalidate_when_done(error, invalidate):
+    """
+    Drops cached values after a write raised, and again once a cancelled
+    write has finished on its worker thread, so nothing read in between
+    is kept
+
+    Parameters:
+        error (BaseException): What the write raised
+        invalidate (func): Drops the cached values
+    Returns:
+        None
+    """
+    invalidate()
+    pending = getattr(error, "pending", None)
+    if pending is not None:
+        pending.add_done_callback(lambda _: invalidate())
+
+
+def typed_ahead_input(prompt="", _input=builtins.input):
+    """
+    Reads a line like input, starting with any keys typed while a call
+    was running, which are shown after the prompt
+
+    Parameters:
+        prompt (string): Text shown before the line
+    Returns:
+        line (string): Line entered, without the newline
+    """
+    if not _typed_ahead:
+        return _input(prompt)
+
+    text = _typed_ahead.decode(errors="ignore").replace("\r", "\n")
+    _typed_ahead.clear()
+    typed = ""
+    for char in ESCAPE_SEQUENCE.sub("", text):
+        if char in "\x7f\b":
+            typed = typed[:-1]
+        else:
+            typed += char
+
+    line, newline, rest = typed.partition("\n")
+    if newline:
+        # The rest is kept for the inputs after this one
+        _typed_ahead.extend(rest.encode())
+        sys.stdout.write(prompt + line + "\n")
+        sys.stdout.flush()
+        return line
+    return line + _input(prompt + line)
+
+
+def install_typeahead():
+    """
+    Replaces input so keys typed while a call runs are not lost
+
+    Parameters:
+        None
+    Returns:
+        None
+    """
+    builtins.input = partial(typed_ahead_input, _input=builtins.input)
+
+
+@contextmanager
+def read_keys():
+    """
+    Puts the terminal into cbreak mode so keys can be read as they are
+    pressed, restoring it afterwards
+
+    Yields:
+        read (func): Returns the keys pressed since the last read,
+            b"" if there are none or there is no terminal
+    """
+    if termios is None or not sys.stdin.isatty():
+        yield lambda: b""
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+
+        def read():
+            if select.select([fd], [], [], 0)[0]:
+                return os.read(fd, 32)
+            return b""
+
+        yield read
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def run_in_background(func, *args, message="Waiting for Google Sheets",
+                      **kwargs):
+    """
+    Runs a call on a worker thread and waits for it, showing a spinner
+    after a short delay. Esc, q or Ctrl-C cancels the wait, the call
+    itself cannot be stopped so its result is thrown away. Other keys
+    are kept for the next input.
+    Calls made off the main thread, such as by the prefetcher, are run
+    directly.
+
+    Parameters:
+        func (func): Call to run
+        args: Arguments for the call
+        message (string): Text shown next to the spinner
+        kwargs: Keyword arguments for the call
+    Returns:
+        result (object): What the call returned, its errors are raised
+    Raises:
+        ActionCancelled: If the user cancelled
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return func(*args, **kwargs)
+
+    future = Future()
+
+    def work():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    # A daemon thread, so a hung request does not stop the app exiting
+    threading.Thread(target=work, daemon=True).start()
+
+    start = time.monotonic()
+    shown = False
+    try:
+        with read_keys() as read:
+            while True:
+                try:
+                    return future.result(timeout=SPINNER_INTERVAL)
+                except TimeoutError:
+                    pass
+
+                keys = read()
+                if keys == ESCAPE_KEY or any(key in CANCEL_KEYS
+                                             for key in keys):
+                    raise ActionCancelled(future)
+                _typed_ahead.extend(keys)
+
+                elapsed = time.monotonic() - start
+                if elapsed >= SPINNER_DELAY:
+                    frame = SPINNER_FRAMES[int(elapsed / SPINNER_INTERVAL)
+                                           % len(SPINNER_FRAMES)]
+                    sys.stdout.write(f"\r{frame} {message} {elapsed:.1f}s, "
+                                     "press Esc to cancel\x1b[K")
+                    sys.stdout.flush()
+                    shown = True
+    except KeyboardInterrupt:
+        raise ActionCancelled(future) from None
+    finally:
+        if shown:
+            sys.stdout.write("\r\x1b[K")
+            sys.stdout.flush()
+
+
+class BackgroundWorksheet:
+    """
+    A class that wraps a gspread worksheet so each call on it runs off
+    the UI thread with run_in_background. Attributes that are not
+    methods, such as col_count, are read directly.
+    """
+
+    def __init__(self, worksheet):
+        """
+        Initialise an instance of the BackgroundWorksheet class.
+
+        Parameters:
+            worksheet (object): Worksheet to wrap
+        """
+        self._worksheet = worksheet
+
+    def __getattr__(self, name):
+        attribute = getattr(self._worksheet, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            return run_in_background(attribute, *args, **kwargs)
+        return call
@@ -0,0 +1,208 @@
+"""This module provides the low bandwidth lite mode settings and counts
+the bytes written to the terminal for each screen"""
+import atexit
+import io
+import json
+import os
+import sys
+import time
+
+# Lite mode shrinks art and reuses frames already on screen
+LITE_MODE = os.environ.get("LITE_MODE") == "1"
+
+# Art in lite mode, "small" for the smallest variant or "none" to drop it
+LITE_ART = os.environ.get("LITE_ART", "small")
+
+# Bytes a single screen should stay within, 0 turns the check off
+SCREEN_BYTE_BUDGET = int(os.environ.get("SCREEN_BYTE_BUDGET", 0))
+
+# File that per session screen byte counts are appended to, if set
+SCREEN_BYTES_LOG = os.environ.get("SCREEN_BYTES_LOG", "")
+
+# Blank braille cell, sent as 3 bytes in utf-8
+BRAILLE_BLANK = "⠀"
+
+
+def trim_art(art):
+    """
+    Trims blank braille cells from the end of each line of art, and sends
+    leading blank cells as single byte spaces, which look the same
+
+    Parameters:
+        art (string): Braille art
+    Returns:
+        art (string): Trimmed braille art
+    """
+    trimmed_lines = []
+    for line in art.split("\n"):
+        line = line.rstrip(BRAILLE_BLANK + " ")
+        drawn = line.lstrip(BRAILLE_BLANK + " ")
+        trimmed_lines.append(" " * (len(line) - len(drawn)) + drawn)
+    return "\n".join(trimmed_lines)
+
+
+class _CountingBuffer:
+    """
+    Wraps the binary stdout buffer, counting bytes written to it
+    """
+
+    def __init__(self, buffer, counter):
+        self._buffer = buffer
+        self._counter = counter
+
+    def write(self, data):
+        self._counter.add(len(data))
+        return self._buffer.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._buffer, name)
+
+
+class ScreenByteCounter:
+    """
+    A class that wraps stdout and counts the bytes written for each screen.
+
+    Attributes:
+        screens (dict): Screen name to list of bytes written per visit
+    """
+
+    def __init__(self, stream):
+        """
+        Initialise an instance of the ScreenByteCounter class.
+
+        Parameters:
+            stream (object): Text stream to wrap, normally sys.stdout
+        """
+        self._stream = stream
+        self.buffer = _CountingBuffer(stream.buffer, self)
+        self.screens = {}
+        self._screen = None
+        self._screen_bytes = 0
+
+    def write(self, text):
+        """
+        Writes text to the wrapped stream, counting its encoded size
+
+        Parameters:
+            text (string): Text to write
+        Returns:
+            count (int): Characters written
+        """
+        self.add(len(text.encode(self._stream.encoding or "utf-8",
+                                 errors="replace")))
+        return self._stream.write(text)
+
+    def add(self, num_bytes):
+        """
+        Adds written bytes to the current screens count
+
+        Parameters:
+            num_bytes (int): Bytes written
+        Returns:
+            None
+        """
+        self._screen_bytes += num_bytes
+
+    def fileno(self):
+        """
+        Hides the file descriptor so input() writes its prompt through
+        write, where it is counted, instead of straight to the terminal
+        """
+        raise io.UnsupportedOperation("fileno")
+
+    def start_screen(self, name):
+        """
+        Records the bytes written by the previous screen and starts
+        counting for the next one
+
+        Parameters:
+            name (string): Name of the screen being shown
+        Returns:
+            None
+        """
+        if self._screen is not None:
+            self.screens.setdefault(self._screen, []).append(
+                self._screen_bytes)
+        self._screen = name
+        self._screen_bytes = 0
+
+    def report(self):
+        """
+        Returns bytes written per screen and screens over the budget
+
+        Parameters:
+            None
+        Returns:
+            report (dict): Per screen visits, total and max bytes
+        """
+        screens = {name: list(visits) for name, visits in self.screens.items()}
+        if self._screen is not None:
+            screens.setdefault(self._screen, []).append(self._screen_bytes)
+
+        report = {}
+        for name, visits in screens.items():
+            report[name] = {
+                "visits": len(visits),
+                "total_bytes": sum(visits),
+                "max_bytes": max(visits),
+                "over_budget": bool(SCREEN_BYTE_BUDGET)
+                and max(visits) > SCREEN_BYTE_BUDGET,
+            }
+        return report
+
+    def save_report(self):
+        """
+        Appends this sessions report to the log file, if one is set
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        if not SCREEN_BYTES_LOG:
+            return
+        line = {"time": int(time.time()), "lite": LITE_MODE,
+                "screens": self.report()}
+        try:
+            with open(SCREEN_BYTES_LOG, "a", encoding="utf-8") as file:
+                file.write(json.dumps(line) + "\n")
+        except OSError:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# Counter installed over stdout, None until install_counter is called
+counter = None
+
+
+def install_counter():
+    """
+    Wraps stdout with a ScreenByteCounter and saves its report on exit
+
+    Parameters:
+        None
+    Returns:
+        counter (ScreenByteCounter): Installed counter
+    """
+    global counter
+
+    if counter is None:
+        counter = ScreenByteCounter(sys.stdout)
+        sys.stdout = counter
+        atexit.register(counter.save_report)
+    return counter
+
+
+def start_screen(name):
+    """
+    Starts counting bytes for a screen, if the counter is installed
+
+    Parameters:
+        name (string): Name of the screen being shown
+    Returns:
+        None
+    """
+    if counter is not None:
+        counter.start_screen(name)
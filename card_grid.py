@@ -0,0 +1,147 @@
+"""This module renders card listings as a grid of fixed width columns
+that fit the terminal, drawn with tabulate's fancy_grid lines but
+without inferring the type and width of every cell on each call"""
+import hashlib
+import textwrap
+from functools import lru_cache
+
+# Number of cards shown on each row of the grid
+GRID_COLUMNS = 4
+
+# Max number of wrapped cells kept in memory
+WRAP_CACHE_SIZE = 1024
+
+# Box drawing characters for the lines above, between and below rows,
+# as used by tabulate's fancy_grid
+GRID_LINES = {
+    "top": ("╒", "═", "╤", "╕"),
+    "between": ("├", "─", "┼", "┤"),
+    "bottom": ("╘", "═", "╧", "╛"),
+}
+
+
+@lru_cache(maxsize=4)
+def catalog_cells(card_nums, card_names):
+    """
+    Returns the grid cell for every card in the set, the set only
+    changes if the sheet is edited so this is kept
+
+    Parameters:
+        card_nums (tuple): Card numbers
+        card_names (tuple): Card names
+    Returns:
+        cells (tuple): Cell text such as "B4:Charizard" for each card
+    """
+    # Stripped as tabulate does, so wrapping matches the older views
+    return tuple(f"B{card_num}:{name}".strip()
+                 for card_num, name in zip(card_nums, card_names))
+
+
+@lru_cache(maxsize=4)
+def catalog_version(cells):
+    """
+    Returns a digest of the card set, which changes if the sheet is edited
+
+    Parameters:
+        cells (tuple): Cell text for each card in the set
+    Returns:
+        version (bytes): Digest of the set
+    """
+    return hashlib.blake2b("\n".join(cells).encode(),
+                           digest_size=16).digest()
+
+
+def collection_fingerprint(cells, owned_values):
+    """
+    Returns a fingerprint of the card set and which cards a user has,
+    used to tell if a rendered view of the collection is still current
+
+    Parameters:
+        cells (tuple): Cell text for each card in the set
+        owned_values (list): "Yes" or "No" for each card
+    Returns:
+        fingerprint (bytes): Digest of the set and the owned cards
+    """
+    owned = bytes(value == "Yes" for value in owned_values[:len(cells)])
+    return hashlib.blake2b(catalog_version(cells) + owned,
+                           digest_size=16).digest()
+
+
+def fixed_widths(terminal_width, num_cols=GRID_COLUMNS):
+    """
+    Returns equal column widths that fill the terminal, used when rows
+    are drawn before every cell in the grid is known
+
+    Parameters:
+        terminal_width (int): Width of the terminal
+        num_cols (int): Number of cards on each row
+    Returns:
+        widths (list): Width of each column, not counting padding
+    """
+    # Leave a column spare so lines never reach the terminal edge
+    return [max(1, (terminal_width - 2) // num_cols - 3)] * num_cols
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_cell(cell, width):
+    """
+    Splits a cell into lines no wider than its column
+
+    Parameters:
+        cell (string): Cell text
+        width (int): Column width
+    Returns:
+        lines (tuple): Lines of the cell, at least one
+    """
+    return tuple(textwrap.wrap(cell, width)) or ("",)
+
+
+def grid_line(widths, position):
+    """
+    Returns the line drawn above, between or below grid rows
+
+    Parameters:
+        widths (list): Width of each column
+        position (string): "top", "between" or "bottom"
+    Returns:
+        line (string): Box drawing line
+    """
+    left, bar, middle, right = GRID_LINES[position]
+    return left + middle.join(bar * (width + 2) for width in widths) + right
+
+
+def grid_row_height(cells, widths):
+    """
+    Returns the number of lines a grid row takes up, not counting the
+    line below it
+
+    Parameters:
+        cells (list): Cell text for each card on the row
+        widths (list): Width of each column
+    Returns:
+        height (int): Number of lines
+    """
+    return max(len(wrap_cell(cell, width))
+               for cell, width in zip(cells, widths))
+
+
+def grid_row(cells, widths):
+    """
+    Returns the lines of a grid row, cells wider than their column are
+    wrapped onto more lines and a short row is filled with empty cells
+
+    Parameters:
+        cells (list): Cell text for each card on the row
+        widths (list): Width of each column
+    Returns:
+        lines (list): Lines of the row
+    """
+    cells = list(cells) + [""] * (len(widths) - len(cells))
+    wrapped = [wrap_cell(cell, width) for cell, width in zip(cells, widths)]
+    height = max(len(lines) for lines in wrapped)
+
+    return ["│ " + " │ ".join(
+        (lines[row] if row < len(lines) else "").ljust(width)
+        for lines, width in zip(wrapped, widths)) + " │"
+        for row in range(height)]
+
@@ -0,0 +1,405 @@
+"""This module renders the collection views, the grid of cards a user has
+or is missing along with how complete their set is, a page at a time.
+The first page can be streamed, drawing rows as the sheet is read."""
+import os
+import random
+import sys
+import timeit
+
+from card_grid import (GRID_COLUMNS, catalog_cells, fixed_widths, grid_line,
+                       grid_row, grid_row_height)
+from display import styled_msg
+from terminal_metrics import DEFAULT_HEIGHT, DEFAULT_WIDTH
+
+# Rows taken up by the view heading frame above the grid
+VIEW_FRAME_ROWS = 8
+
+# Rows taken up below the grid by the message, page number and prompt
+VIEW_FOOTER_ROWS = 6
+
+# Sheet rows read by each request when streaming a view
+STREAM_CHUNK_ROWS = int(os.environ.get("STREAM_CHUNK_ROWS", 25))
+
+
+def page_lines_for_height(height):
+    """
+    Returns how many grid lines fit on a page without scrolling
+
+    Parameters:
+        height (int): Number of rows in the terminal
+    Returns:
+        page_lines (int): Number of grid lines on each page
+    """
+    return max(3, height - VIEW_FRAME_ROWS - VIEW_FOOTER_ROWS)
+
+
+def fits_on_page(lines_used, row_height, page_lines):
+    """
+    Returns True if a row and the line below it fit on the page, the
+    first row on a page always fits
+
+    Parameters:
+        lines_used (int): Grid lines already on the page
+        row_height (int): Lines the row takes up
+        page_lines (int): Number of grid lines on each page
+    Returns:
+        fits (boolean): True if the row fits
+    """
+    return lines_used <= 1 or lines_used + row_height + 1 <= page_lines
+
+
+class CardPages:
+    """
+    A class representing a collection view split into pages that fit
+    the terminal. Only the cards on a page are rendered when it is shown,
+    and each rendered page is kept, so a page costs the same however
+    large the set is.
+
+    Attributes:
+        message (string): Styled message shown below every page
+        num_pages (int): Number of pages, at least 1
+    """
+
+    def __init__(self, card_cells, indexes, message, widths, page_lines):
+        """
+        Initialise an instance of the CardPages class.
+
+        Parameters:
+            card_cells (tuple): Cell text for each card in the set
+            indexes (list): Indexes of the cards in the view
+            message (string): Styled message shown below every page
+            widths (list): Width of each grid column
+            page_lines (int): Number of grid lines on each page
+        """
+        self._widths = widths
+        self._rendered = {}
+        self.message = message
+
+        # Split the grid rows into pages, the same way stream_first_page
+        # fills the first page
+        self._pages = [[]]
+        lines_used = 1
+        for start in range(0, len(indexes), len(widths)):
+            row = [card_cells[i] for i in indexes[start:start + len(widths)]]
+            height = grid_row_height(row, widths)
+            if not fits_on_page(lines_used, height, page_lines):
+                self._pages.append([])
+                lines_used = 1
+            self._pages[-1].append(row)
+            lines_used += height + 1
+        self.num_pages = len(self._pages)
+
+    def render_grid(self, page):
+        """
+        Returns the grid of cards on a page
+
+        Parameters:
+            page (int): Page number, starting at 1
+        Returns:
+            grid (string): Rendered grid, empty if there are no cards
+        """
+        rows = self._pages[page - 1]
+        if not rows:
+            return ""
+
+        between = "\n" + grid_line(self._widths, "between") + "\n"
+        return "\n".join((
+            grid_line(self._widths, "top"),
+            between.join("\n".join(grid_row(row, self._widths))
+                         for row in rows),
+            grid_line(self._widths, "bottom")))
+
+    def render_footer(self, page):
+        """
+        Returns the message shown below a page, with the page number when
+        there is more than one page
+
+        Parameters:
+            page (int): Page number, starting at 1
+        Returns:
+            footer (string): Rendered footer
+        """
+        if self.num_pages == 1:
+            return self.message
+        return self.message + "\n" + styled_msg(
+            f"Page {page} of {self.num_pages}", "white")
+
+    def render_below_grid(self, page):
+        """
+        Returns what is printed after a pages grid, used when the grid
+        has already been streamed
+
+        Parameters:
+            page (int): Page number, starting at 1
+        Returns:
+            footer (string): Rendered footer
+        """
+        if self._pages[page - 1]:
+            return self.render_footer(page)
+        return "\n" + self.render_footer(page)
+
+    def render_page(self, page):
+        """
+        Returns a page of the view
+
+        Parameters:
+            page (int): Page number, starting at 1
+        Returns:
+            view (string): Rendered page
+        """
+        if page not in self._rendered:
+            grid = self.render_grid(page)
+            self._rendered[page] = (grid + "\n" if grid else "") + \
+                self.render_below_grid(page)
+        return self._rendered[page]
+
+
+def select_cards(card_cells, user_cards, value):
+    """
+    Returns the indexes of the cards with a given value in the users column
+
+    Parameters:
+        card_cells (tuple): Cell text for each card in the set
+        user_cards (list): "Yes" or "No" for each card
+        value (string): "Yes" for owned cards, "No" for missing cards
+    Returns:
+        indexes (list): Indexes of the cards
+    """
+    return [index for index, card
+            in enumerate(user_cards[:len(card_cells)]) if card == value]
+
+
+def portfolio_pages(card_cells, user_cards, widths, page_lines):
+    """
+    Returns the pages of cards in a users collection and how complete it is
+
+    Parameters:
+        card_cells (tuple): Cell text for each card in the set
+        user_cards (list): "Yes" or "No" for each card
+        widths (list): Width of each grid column
+        page_lines (int): Number of grid lines on each page
+    Returns:
+        pages (CardPages): Pages of the view
+    """
+    indexes = select_cards(card_cells, user_cards, "Yes")
+
+    # Check if we have cards to display and display % complete
+    percentage = round((len(indexes) / max(1, len(card_cells)) * 100))
+    if not indexes:
+        message = styled_msg(
+            "You do not have any cards in you collection\n", "red")
+    elif percentage == 100:
+        message = styled_msg(f"Congratulation your set is {percentage}%"
+                             " complete\n", "green")
+    else:
+        message = styled_msg(f"You have collected {percentage}%, "
+                             "of available cards in this set\n", "green")
+
+    return CardPages(card_cells, indexes, message, widths, page_lines)
+
+
+def cards_needed_pages(card_cells, user_cards, widths, page_lines):
+    """
+    Returns the pages of cards missing from a users collection
+
+    Parameters:
+        card_cells (tuple): Cell text for each card in the set
+        user_cards (list): "Yes" or "No" for each card
+        widths (list): Width of each grid column
+        page_lines (int): Number of grid lines on each page
+    Returns:
+        pages (CardPages): Pages of the view
+    """
+    indexes = select_cards(card_cells, user_cards, "No")
+
+    # Check if we have cards to display and display % missing
+    percentage = round((len(indexes) / max(1, len(card_cells)) * 100))
+    if not indexes:
+        message = styled_msg("Your collection is 100% complete, "
+                             "CONGRATULATIONS\n", "green")
+    else:
+        message = styled_msg(f"You are missing {percentage}%, "
+                             "of available cards in this set\n", "red")
+
+    return CardPages(card_cells, indexes, message, widths, page_lines)
+
+
+# ---- STREAMING ----
+
+
+def iter_card_chunks(worksheet, user_col_letter,
+                     chunk_rows=STREAM_CHUNK_ROWS):
+    """
+    Reads card numbers, names and the users column a chunk of rows at a
+    time, each chunk is a single batch request
+
+    Parameters:
+        worksheet (object): Base set worksheet
+        user_col_letter (string): Letter of the users column
+        chunk_rows (int): Number of sheet rows in each chunk
+    Yields:
+        (card_nums, card_names, user_cards) (tuple): Values for each
+            card in the chunk
+    """
+    start = 2
+    while True:
+        end = start + chunk_rows - 1
+        value_ranges = worksheet.batch_get([
+            f"D{start}:D{end}", f"B{start}:B{end}",
+            f"{user_col_letter}{start}:{user_col_letter}{end}"])
+        # Match col_values, which returns "" for empty cells
+        card_nums, card_names, user_cards = (
+            [row[0] if row else "" for row in value_range]
+            for value_range in value_ranges)
+
+        if card_names:
+            user_cards += [""] * (len(card_names) - len(user_cards))
+            yield card_nums, card_names, user_cards
+        # The sheet leaves out empty rows at the end, so a short chunk
+        # is the last
+        if len(card_names) < chunk_rows:
+            return
+        start = end + 1
+
+
+def iter_matching_cells(chunks, value, collected):
+    """
+    Turns chunks of sheet values into cells for the cards with a given
+    value, keeping every value read so the whole view can be built after
+
+    Parameters:
+        chunks (iterable): Chunks from iter_card_chunks
+        value (string): "Yes" for owned cards, "No" for missing cards
+        collected (tuple): Lists the card numbers, names and users
+            column are added to
+    Yields:
+        cell (string): Cell text for each matching card
+    """
+    card_nums, card_names, user_cards = collected
+    for chunk_nums, chunk_names, chunk_cards in chunks:
+        card_nums += chunk_nums
+        card_names += chunk_names
+        user_cards += chunk_cards
+        for card_num, name, card in zip(chunk_nums, chunk_names,
+                                        chunk_cards):
+            if card == value:
+                yield f"B{card_num}:{name}".strip()
+
+
+def iter_grid_rows(cells, num_cols=GRID_COLUMNS):
+    """
+    Groups cells into grid rows as they arrive
+
+    Parameters:
+        cells (iterable): Cell text for each card
+        num_cols (int): Number of cards on each row
+    Yields:
+        row (list): Cells on the row, the last row may be short
+    """
+    row = []
+    for cell in cells:
+        row.append(cell)
+        if len(row) == num_cols:
+            yield row
+            row = []
+    if row:
+        yield row
+
+
+def stream_first_page(rows, widths, page_lines):
+    """
+    Prints grid rows as soon as each one is complete, until the first
+    page is full, then reads the rest of the rows without printing them
+
+    Parameters:
+        rows (iterable): Rows from iter_grid_rows
+        widths (list): Width of each grid column
+        page_lines (int): Number of grid lines on each page
+    Returns:
+        None
+    """
+    lines_used = 1
+    page_full = False
+    for row in rows:
+        if page_full:
+            continue
+
+        height = grid_row_height(row, widths)
+        if not fits_on_page(lines_used, height, page_lines):
+            page_full = True
+            continue
+
+        # The line above the row is only known once the row arrives
+        if lines_used == 1:
+            print(grid_line(widths, "top"))
+        else:
+            print(grid_line(widths, "between"))
+        print("\n".join(grid_row(row, widths)))
+        sys.stdout.flush()
+        lines_used += height + 1
+
+    if lines_used > 1:
+        print(grid_line(widths, "bottom"))
+
+
+# ---- BENCHMARK ----
+
+
+def benchmark(num_cards=102, repeats=200, width=DEFAULT_WIDTH,
+              height=DEFAULT_HEIGHT):
+    """
+    Times rendering every page of a portfolio view with tabulate, as the
+    views once did, and with the fixed width card grid they use now,
+    checking every grid line fits the terminal
+
+    Parameters:
+        num_cards (int): Number of cards in the set
+        repeats (int): Number of renders to time
+        width (int): Terminal width
+        height (int): Terminal height
+    Returns:
+        results (dict): Seconds per render for each and the speedup
+    """
+    from tabulate import tabulate
+
+    # Names of varied length, as in the real set
+    rng = random.Random(0)
+    card_nums = tuple(str(num) for num in range(1, num_cards + 1))
+    card_names = tuple(
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz")
+                for _ in range(rng.randint(4, 16))).title()
+        for _ in card_nums)
+    user_cards = ["Yes" if rng.random() < 0.6 else "No" for _ in card_nums]
+    cells = catalog_cells(card_nums, card_names)
+    widths = fixed_widths(width)
+    page_lines = page_lines_for_height(height)
+
+    def with_tabulate():
+        collection = [cell for cell, owned in zip(cells, user_cards)
+                      if owned == "Yes"]
+        rows = [collection[i:i + GRID_COLUMNS]
+                for i in range(0, len(collection), GRID_COLUMNS)]
+        return tabulate(rows, tablefmt="fancy_grid")
+
+    def with_card_grid():
+        pages = portfolio_pages(cells, user_cards, widths, page_lines)
+        return "\n".join(pages.render_grid(page)
+                         for page in range(1, pages.num_pages + 1))
+
+    if any(len(line) >= width for line in with_card_grid().splitlines()):
+        raise AssertionError("Card grid is wider than the terminal")
+
+    tabulate_time = timeit.timeit(with_tabulate, number=repeats) / repeats
+    grid_time = timeit.timeit(with_card_grid, number=repeats) / repeats
+    return {
+        "tabulate_ms": tabulate_time * 1000,
+        "card_grid_ms": grid_time * 1000,
+        "speedup": tabulate_time / grid_time,
+    }
+
+
+if __name__ == "__main__":
+    results = benchmark()
+    print(f"tabulate:  {results['tabulate_ms']:.3f} ms per view")
+    print(f"card grid: {results['card_grid_ms']:.3f} ms per view")
+    print(f"speedup:   {results['speedup']:.0f}x")
@@ -0,0 +1,330 @@
+"""This module runs commands from the command line without drawing any
+screens, such as "run.py add --user ashketchum 4 5 6". It calls the same
+PortfolioService as the app and exits with a status scripts can check.
+"run.py batch" runs many commands in one process, sharing what the
+service has read."""
+import argparse
+import json
+import os
+import shlex
+import sys
+from functools import partial
+
+from api_server import API_HOST, API_PORT, serve
+from commands import parse_card_list, summarise_results
+from exporter import EXPORT_FORMATS
+from importer import iter_entries, summarise_import
+from portfolio_service import PortfolioService, UserNotFound
+
+# Exit status for each outcome, 2 is also used by argparse for bad usage
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_NOT_FOUND = 3
+EXIT_PARTIAL = 4
+
+
+class CliError(Exception):
+    """
+    Raised to end a command with a message and exit status
+    """
+
+    def __init__(self, message, status=EXIT_ERROR):
+        super().__init__(message)
+        self.status = status
+
+
+def emit(args, data, lines):
+    """
+    Prints the result of a command, as JSON with --json
+
+    Parameters:
+        args (Namespace): Parsed arguments
+        data (object): Result to print as JSON
+        lines (iterable): Lines to print otherwise
+    Returns:
+        None
+    """
+    if args.json:
+        print(json.dumps(data, default=float))
+    else:
+        for line in lines:
+            print(line)
+
+
+def user_letter(service, args):
+    """
+    Returns the letter of the column of the user given with --user
+    """
+    return service.find_user(args.user)["col_letter"]
+
+
+# ---- COMMANDS ----
+
+
+def change_cards(service, args):
+    """
+    Adds or removes cards, given as numbers, lists or ranges
+    """
+    card_nums, rejected = parse_card_list(" ".join(args.cards))
+    if not card_nums:
+        raise CliError(f"No valid card numbers in {' '.join(args.cards)}",
+                       EXIT_USAGE)
+
+    result = service.apply_commands(user_letter(service, args),
+                                    [(args.command, card_nums)])
+    results = result["results"]
+    emit(args, {
+        "user": args.user,
+        "action": args.command,
+        "changed": [card for _, card, changed in results if changed],
+        "unchanged": [card for _, card, changed in results if not changed],
+        "rejected": rejected,
+    }, (message.strip() for message, _ in summarise_results(
+        results, result["card_names"], rejected)))
+    return EXIT_PARTIAL if rejected else EXIT_OK
+
+
+def list_cards(service, args):
+    """
+    Lists the cards a user has or is missing, one on each line
+    """
+    portfolio = service.portfolio(user_letter(service, args),
+                                  owned=args.command == "portfolio")
+    emit(args, dict(portfolio, user=args.user),
+         ("\t".join("" if value is None else str(value)
+                    for value in card.values())
+          for card in portfolio["cards"]))
+    return EXIT_OK
+
+
+def appraise(service, args):
+    """
+    Prints the value of a users portfolio
+    """
+    appraisal = service.appraise(user_letter(service, args))
+    emit(args, dict(appraisal, user=args.user), [f"${appraisal['value']}"])
+    return EXIT_OK
+
+
+def search(service, args):
+    """
+    Prints a cards details, and if a user has it with --user
+    """
+    col_letter = user_letter(service, args) if args.user else None
+    try:
+        card = service.search(args.card, col_letter)
+    except ValueError as e:
+        raise CliError(str(e), EXIT_USAGE) from None
+    emit(args, card, (f"{name}: {'' if value is None else value}"
+                      for name, value in card.items()))
+    return EXIT_OK
+
+
+def import_cards(service, args):
+    """
+    Imports card numbers or names from a CSV or JSON file, - for stdin
+    """
+    col_letter = user_letter(service, args)
+    if args.file == "-":
+        # The format is told by the extension for files
+        plan = service.import_cards(
+            col_letter, iter_entries(sys.stdin, f".{args.format}"),
+            args.replace)
+    else:
+        with open(args.file, newline="", encoding="utf-8-sig") as file:
+            plan = service.import_cards(
+                col_letter, iter_entries(file, args.file), args.replace)
+
+    data = dict(plan, user=args.user, updates=len(plan["updates"]))
+    emit(args, data, (message.strip()
+                      for message, _ in summarise_import(plan)))
+    return EXIT_PARTIAL if plan["rejected_count"] else EXIT_OK
+
+
+def export_cards(service, args):
+    """
+    Exports a portfolio, the cards needed, the catalog or every users
+    cards, to a file or stdout
+    """
+    col_letter = None
+    if args.what in ("portfolio", "needed"):
+        if not args.user:
+            raise CliError(f"export {args.what} needs --user", EXIT_USAGE)
+        col_letter = user_letter(service, args)
+
+    if args.output:
+        with open(args.output, "wb") as file:
+            count, size = service.export(args.what, args.format, file,
+                                         col_letter)
+        print(f"Exported {count} records to {args.output}, {size} bytes",
+              file=sys.stderr)
+    else:
+        sys.stdout.flush()
+        service.export(args.what, args.format, sys.stdout.buffer,
+                       col_letter)
+        sys.stdout.buffer.flush()
+    return EXIT_OK
+
+
+def run_batch(service, args):
+    """
+    Runs commands read from a file or stdin, one on each line, sharing
+    what is read from the sheet. Every command is run even if some fail.
+    """
+    file = sys.stdin if args.file == "-" else open(args.file)
+    status = EXIT_OK
+    with file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            line_status = run_command(service, shlex.split(line))
+            status = max(status, line_status)
+    return status
+
+
+def start_server(sheet, service, args):
+    """
+    Serves the JSON HTTP API until interrupted, it has its own service
+    with a scheduler shared by every client
+    """
+    serve(sheet, args.host, args.port)
+    return EXIT_OK
+
+
+# ---- PARSING ----
+
+
+def build_parser(sheet=None):
+    """
+    Returns the parser for command line arguments
+
+    Parameters:
+        sheet (object or None): Spreadsheet, given for the command line
+            but not inside a batch, batch and serve are only offered
+            with it
+    Returns:
+        parser (ArgumentParser): Parser with a sub command for each action
+    """
+    parser = argparse.ArgumentParser(
+        prog="run.py",
+        description="Manage Pokemon Portfolio collections without the "
+                    "interactive screens. Run with no arguments for the app.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--json", action="store_true",
+                        help="print the result as JSON")
+    user = argparse.ArgumentParser(add_help=False)
+    user.add_argument("--user", required=True, help="username")
+
+    for name, handler in (("add", change_cards), ("remove", change_cards)):
+        command = subparsers.add_parser(
+            name, parents=[output, user], help=f"{name} cards")
+        command.add_argument("cards", nargs="+",
+                             help="card numbers or ranges, such as 4 1-16")
+        command.set_defaults(handler=handler)
+
+    for name, text in (("portfolio", "list the cards a user has"),
+                       ("needed", "list the cards a user is missing"),
+                       ("appraise", "value a users portfolio")):
+        command = subparsers.add_parser(name, parents=[output, user],
+                                        help=text)
+        command.set_defaults(
+            handler=appraise if name == "appraise" else list_cards)
+
+    command = subparsers.add_parser("search", parents=[output],
+                                    help="show a cards details")
+    command.add_argument("card", type=int, help="card number")
+    command.add_argument("--user", help="also show if this user has it")
+    command.set_defaults(handler=search)
+
+    command = subparsers.add_parser(
+        "import", parents=[output, user],
+        help="import cards from a CSV or JSON file")
+    command.add_argument("file", help="file to import, - for stdin")
+    command.add_argument("--replace", action="store_true",
+                         help="remove cards that are not in the file")
+    command.add_argument("--format", choices=["csv", "json"],
+                         default="csv", help="format of stdin")
+    command.set_defaults(handler=import_cards)
+
+    command = subparsers.add_parser(
+        "export", help="export cards as CSV, JSON Lines or columnar")
+    command.add_argument("what", choices=["portfolio", "needed", "catalog",
+                                          "collections"])
+    command.add_argument("--user", help="username, for portfolio and needed")
+    command.add_argument("--format", choices=list(EXPORT_FORMATS),
+                         default="csv")
+    command.add_argument("--output", help="file to write, stdout if not "
+                                          "given")
+    command.set_defaults(handler=export_cards)
+
+    if sheet is not None:
+        command = subparsers.add_parser(
+            "batch", help="run commands from a file, one on each line")
+        command.add_argument("file", nargs="?", default="-",
+                             help="file of commands, - for stdin")
+        command.set_defaults(handler=run_batch)
+
+        command = subparsers.add_parser(
+            "serve", help="serve a local JSON HTTP API")
+        command.add_argument("--host", default=API_HOST,
+                             help="address to listen on")
+        command.add_argument("--port", type=int, default=API_PORT,
+                             help="port to listen on")
+        command.set_defaults(handler=partial(start_server, sheet))
+    return parser
+
+
+def run_command(service, argv, sheet=None):
+    """
+    Parses and runs a single command
+
+    Parameters:
+        service (PortfolioService): Service holding the values read
+        argv (list): Command line arguments
+        sheet (object or None): Spreadsheet, not given inside a batch
+    Returns:
+        status (int): Exit status
+    """
+    try:
+        args = build_parser(sheet).parse_args(argv)
+    except SystemExit as e:
+        # argparse has printed the problem
+        return e.code if isinstance(e.code, int) else EXIT_USAGE
+
+    try:
+        return args.handler(service, args)
+    except CliError as e:
+        print(f"{argv[0]}: {e}", file=sys.stderr)
+        return e.status
+    except UserNotFound as e:
+        print(f"{argv[0]}: {e}", file=sys.stderr)
+        return EXIT_NOT_FOUND
+    except BrokenPipeError:
+        # The reader, such as head, stopped early, nothing more is sent
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_OK
+    except OSError as e:
+        print(f"{argv[0]}: {e.strerror}"
+              + (f": {e.filename}" if e.filename else ""), file=sys.stderr)
+        return EXIT_ERROR
+    except Exception as e:
+        # API and network errors from gspread
+        print(f"{argv[0]}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+
+def run_cli(argv, sheet):
+    """
+    Runs the command given on the command line
+
+    Parameters:
+        argv (list): Command line arguments, without the program name
+        sheet (object): Spreadsheet holding the worksheets
+    Returns:
+        status (int): Exit status
+    """
+    return run_command(PortfolioService(sheet.worksheet), argv, sheet)
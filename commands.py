@@ -0,0 +1,231 @@
+"""This module parses chained commands entered at the main menu, such as
+"a 4 5 16; r 9; v", and works out the sheet updates they make so every
+add and remove in a chain is written with a single request"""
+import re
+
+# Cards in the base set, card numbers run from 1
+CARD_COUNT = 102
+
+# Card numbers that can be entered, worked out once for every prompt
+VALID_CARDS = frozenset(range(1, CARD_COUNT + 1))
+
+# A range of cards such as 1-16, after spaces around the dash are removed
+CARD_RANGE = re.compile(r"(\d+)-(\d+)")
+
+# Separates the commands in a chain
+COMMAND_SEPARATOR = ";"
+
+# Command names and the words that can be typed for them
+COMMAND_ALIASES = {
+    "a": "add", "add": "add",
+    "r": "remove", "remove": "remove",
+    "v": "view", "view": "view",
+    "n": "needed", "needed": "needed",
+    "$": "appraise", "appraise": "appraise",
+    "s": "search", "search": "search",
+    "l": "logout", "logout": "logout",
+    "i": "import", "import": "import",
+    "x": "export", "export": "export",
+}
+
+# Main menu option each command stands for, used by the prefetcher,
+# import and export have no option of their own
+MENU_OPTIONS = {
+    "add": 1,
+    "remove": 2,
+    "view": 3,
+    "needed": 4,
+    "appraise": 5,
+    "search": 7,
+    "logout": 8,
+}
+
+# Commands that are followed by card numbers
+CARD_COMMANDS = ("add", "remove", "search")
+
+# Value a card must have in the users column for each update to change
+# it, and the value it is changed to
+UPDATE_VALUES = {
+    "add": ("No", "Yes"),
+    "remove": ("Yes", "No"),
+}
+
+# Summary message and colour for each update, by whether it changed
+# the card
+SUMMARY_MESSAGES = {
+    ("add", True): ("Added", "green"),
+    ("add", False): ("Already in your collection", "red"),
+    ("remove", True): ("Removed", "green"),
+    ("remove", False): ("Not in your collection", "red"),
+}
+
+
+class CommandError(ValueError):
+    """
+    Raised when a chain of commands cannot be parsed, nothing in the
+    chain is run
+    """
+
+
+def parse_card_list(text, valid_cards=VALID_CARDS):
+    """
+    Reads a list of card numbers and ranges, such as "1-16, 23, 58-60",
+    in one pass. Entries are separated by commas or spaces and a card
+    entered twice is only kept once.
+
+    Parameters:
+        text (string): Card numbers and ranges
+        valid_cards (frozenset): Card numbers that can be entered
+    Returns:
+        (card_nums, rejected) (tuple): Valid card numbers in the order
+            entered, and the entries that are not valid cards or ranges
+    """
+    card_nums = {}
+    rejected = []
+    for entry in re.sub(r"\s*-\s*", "-", text).replace(",", " ").split():
+        if entry.isdecimal():
+            cards = range(int(entry), int(entry) + 1)
+        else:
+            match = CARD_RANGE.fullmatch(entry)
+            cards = (range(int(match[1]), int(match[2]) + 1)
+                     if match else range(0))
+
+        if cards and valid_cards.issuperset(cards):
+            card_nums.update(dict.fromkeys(cards))
+        else:
+            rejected.append(entry)
+    return list(card_nums), rejected
+
+
+def parse_commands(line, valid_cards=VALID_CARDS):
+    """
+    Splits a line into commands and checks each one, cards can be given
+    as lists and ranges as in parse_card_list
+
+    Parameters:
+        line (string): Commands separated by ";", such as "a 4 5; v"
+        valid_cards (frozenset): Card numbers that can be entered
+    Returns:
+        commands (list): (name, card_nums) for each command in order
+    Raises:
+        CommandError: If a command or card number is not valid
+    """
+    commands = []
+    for part in line.split(COMMAND_SEPARATOR):
+        words = part.split(maxsplit=1)
+        if not words:
+            continue
+
+        name = COMMAND_ALIASES.get(words[0].lower())
+        if name is None:
+            raise CommandError(f"{words[0]} is not a command")
+
+        card_nums, rejected = parse_card_list(words[1] if len(words) > 1
+                                              else "", valid_cards)
+        if rejected:
+            raise CommandError(f"{rejected[0]} is not a card number "
+                               f"({min(valid_cards)} - {max(valid_cards)})")
+
+        if name in CARD_COMMANDS and not card_nums:
+            raise CommandError(f"{words[0]} needs at least one card number")
+        if name not in CARD_COMMANDS and card_nums:
+            raise CommandError(f"{words[0]} does not take card numbers")
+        commands.append((name, card_nums))
+
+    if not commands:
+        raise CommandError("no commands entered")
+    return commands
+
+
+def plan_updates(commands, user_cards):
+    """
+    Applies the adds and removes in a chain, in order, to a copy of the
+    users column
+
+    Parameters:
+        commands (list): Commands from parse_commands
+        user_cards (list): "Yes" or "No" for each card
+    Returns:
+        (updates, results) (tuple): New value for each card that changes,
+            and (name, card_num, changed) for each card in each update
+    """
+    original = {}
+    values = {}
+    results = []
+    for name, card_nums in commands:
+        if name not in UPDATE_VALUES:
+            continue
+        old_value, new_value = UPDATE_VALUES[name]
+        for card_num in card_nums:
+            if card_num not in values:
+                original[card_num] = values[card_num] = (
+                    user_cards[card_num - 1]
+                    if card_num <= len(user_cards) else "")
+            changed = values[card_num] == old_value
+            if changed:
+                values[card_num] = new_value
+            results.append((name, card_num, changed))
+
+    # A card added then removed again is left as it was
+    updates = {card_num: value for card_num, value in values.items()
+               if value != original[card_num]}
+    return updates, results
+
+
+def update_ranges(updates, col_letter):
+    """
+    Groups updates into ranges of neighbouring cells with the same value,
+    in the form taken by batch_update
+
+    Parameters:
+        updates (dict): New value for each card number
+        col_letter (string): Letter of the users column
+    Returns:
+        ranges (list): {"range": ..., "values": ...} for each range
+    """
+    ranges = []
+    start = previous = None
+    for card_num in sorted(updates) + [None]:
+        if card_num is not None and previous is not None and \
+                card_num == previous + 1 and \
+                updates[card_num] == updates[previous]:
+            previous = card_num
+            continue
+
+        if start is not None:
+            # Card rows start at 2, below the headings
+            ranges.append({
+                "range": f"{col_letter}{start + 1}:{col_letter}{previous + 1}",
+                "values": [[updates[start]]] * (previous - start + 1),
+            })
+        start = previous = card_num
+    return ranges
+
+
+def summarise_results(results, card_names, rejected=()):
+    """
+    Returns a message for each kind of result, listing the cards
+
+    Parameters:
+        results (list): Results from plan_updates
+        card_names (list): Name of each card
+        rejected (list): Entries that were not valid cards
+    Returns:
+        messages (list): (message, colour) for each kind of result
+    """
+    grouped = {}
+    for name, card_num, changed in results:
+        card_name = (card_names[card_num - 1]
+                     if card_num <= len(card_names) else "")
+        grouped.setdefault((name, changed), []).append(
+            f"{card_name} No.{card_num}".strip())
+
+    messages = []
+    for key, (heading, colour) in SUMMARY_MESSAGES.items():
+        if key in grouped:
+            messages.append((f"{heading}: {', '.join(grouped[key])}\n",
+                             colour))
+    if rejected:
+        messages.append((f"Not card numbers: {', '.join(rejected)}\n",
+                         "red"))
+    return messages
@@ -0,0 +1,229 @@
+"""This module provides the frame compositor, which collects everything
+printed for a screen in memory and sends it to the terminal in one write"""
+import atexit
+import io
+import os
+import re
+import sys
+
+from terminal_metrics import display_width, get_terminal_size
+
+# Moves to the top left and clears the screen and scrollback, as clear does
+CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+# Only send the lines that changed since the last screen
+COMPOSITOR_DIFF = os.environ.get("COMPOSITOR_DIFF") == "1"
+
+# Any other escape code, which may move the cursor, turns diffing off
+OTHER_CODES = re.compile(r"\x1b(?!\[[0-9;]*m)")
+
+
+class _FrameBuffer:
+    """
+    Binary stdout used by prerendered frames, writes are added to the
+    frame being composed so text and bytes stay in order
+    """
+
+    def __init__(self, compositor):
+        self._compositor = compositor
+
+    def write(self, data):
+        self._compositor.pending += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+class FrameCompositor:
+    """
+    A class that wraps stdout and holds everything written until it is
+    flushed, which happens when input() shows a prompt or the app waits.
+
+    A clear starts a new frame and is only sent along with the frame.
+    With COMPOSITOR_DIFF set, a frame is sent as just the lines that
+    differ from the last frame, when the last frame is known to still
+    be on screen.
+
+    Attributes:
+        pending (bytearray): Bytes written and not yet sent
+        writes (int): Number of writes sent to the terminal
+    """
+
+    def __init__(self, stream):
+        """
+        Initialise an instance of the FrameCompositor class.
+
+        Parameters:
+            stream (object): Text stream to wrap, normally sys.stdout
+        """
+        stream.flush()
+        self._stream = stream
+        self._encoding = stream.encoding or "utf-8"
+        self.buffer = _FrameBuffer(self)
+        self.pending = bytearray()
+        self.writes = 0
+        # Position in pending of the last clear, None if there is none
+        self._clear_at = None
+        # Lines of the last frame and rows used since, None if unknown
+        self._screen_lines = None
+        self._rows_used = 0
+
+    def write(self, text):
+        """
+        Adds text to the frame being composed
+
+        Parameters:
+            text (string): Text to write
+        Returns:
+            count (int): Characters written
+        """
+        self.pending += text.encode(self._encoding, errors="replace")
+        return len(text)
+
+    def clear(self):
+        """
+        Starts a new frame, clearing the terminal when it is sent
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        self._clear_at = len(self.pending)
+
+    def flush(self):
+        """
+        Sends the composed output to the terminal in a single write
+        A frame that has only been cleared is held until it has content
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        if self._clear_at is None:
+            output = bytes(self.pending)
+            self._track_rows(output)
+        else:
+            frame = bytes(self.pending[self._clear_at:])
+            if not frame:
+                return
+            output = bytes(self.pending[:self._clear_at]) + \
+                self._compose_frame(frame)
+            self._clear_at = None
+
+        self.pending.clear()
+        if output:
+            self._stream.buffer.write(output)
+            self._stream.buffer.flush()
+            self.writes += 1
+
+    def _compose_frame(self, frame):
+        """
+        Returns the bytes to send for a new frame, only the changed lines
+        when diffing is possible, otherwise a clear and the whole frame
+        """
+        lines = self._frame_lines(frame)
+        previous = self._screen_lines
+        self._screen_lines = lines
+        self._rows_used = 0 if lines is None else len(lines)
+
+        redraw = CLEAR_SEQUENCE.encode() + frame
+        if not COMPOSITOR_DIFF or lines is None or previous is None:
+            return redraw
+
+        output = []
+        for row, line in enumerate(lines[:-1]):
+            if row >= len(previous) - 1 or previous[row] != line:
+                output.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+        # Finish on the last line, clearing anything left below it
+        output.append(f"\x1b[{len(lines)};1H{lines[-1]}\x1b[J")
+        changes = "".join(output).encode(self._encoding, errors="replace")
+
+        # Moving to each changed line costs bytes, so use the smaller
+        return min(changes, redraw, key=len)
+
+    def _frame_lines(self, frame):
+        """
+        Splits a frame into the lines it takes up on screen, None if it
+        moves the cursor, wraps or scrolls so its lines are not known
+        """
+        text = frame.decode(self._encoding, errors="replace")
+        if OTHER_CODES.search(text):
+            return None
+
+        columns, rows = get_terminal_size()
+        lines = text.split("\n")
+        if len(lines) >= rows or any(
+                display_width(line) >= columns for line in lines):
+            return None
+        return lines
+
+    def _track_rows(self, output):
+        """
+        Counts the rows used below the last frame, forgetting the frame
+        once it may have scrolled or been written over. A row is allowed
+        for each flush in case input() echoes a line
+        """
+        if self._screen_lines is None or not output:
+            return
+
+        text = output.decode(self._encoding, errors="replace")
+        columns, rows = get_terminal_size()
+        self._rows_used += 1 + sum(
+            1 + display_width(line) // columns
+            for line in text.split("\n")[1:])
+        if OTHER_CODES.search(text) or self._rows_used >= rows:
+            self._screen_lines = None
+
+    def fileno(self):
+        """
+        Hides the file descriptor so input() writes its prompt through
+        write and it is sent along with the frame
+        """
+        raise io.UnsupportedOperation("fileno")
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# Compositor installed over stdout, None until install_compositor is called
+compositor = None
+
+
+def install_compositor():
+    """
+    Wraps stdout with a FrameCompositor, sending anything left on exit
+
+    Parameters:
+        None
+    Returns:
+        compositor (FrameCompositor): Installed compositor
+    """
+    global compositor
+
+    if compositor is None:
+        compositor = FrameCompositor(sys.stdout)
+        sys.stdout = compositor
+        atexit.register(compositor.flush)
+    return compositor
+
+
+def clear_screen():
+    """
+    Clears the terminal with escape codes, through the compositor if
+    it is installed
+
+    Parameters:
+        None
+    Returns:
+        None
+    """
+    if compositor is not None:
+        compositor.clear()
+    elif os.name == "nt":  # Windows
+        sys.stdout.flush()
+        os.system("cls")
+    else:
+        sys.stdout.write(CLEAR_SEQUENCE)
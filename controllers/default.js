@@ -15,40 +15,89 @@ function socket() {
 
     this.on('open', function (client) {
 
-        // Spawn terminal
-        client.tty = Pty.spawn('python3', ['run.py'], {
-            name: 'xterm-color',
-            cols: 85,
-            rows: 37,
-            cwd: process.env.PWD,
-            env: process.env
-        });
-
-        client.tty.on('exit', function (code, signal) {
-            client.tty = null;
-            client.close();
-            console.log("Process killed");
-        });
-
-        client.tty.on('data', function (data) {
-            client.send(data);
-        });
+        // The browser sends any resume token as its first message, the
+        // terminal is started once it arrives, or without one if it
+        // does not arrive in time
+        client.resumeTimer = setTimeout(function () {
+            spawnTerminal(client, '');
+        }, 2000);
 
     });
 
     this.on('close', function (client) {
+        clearTimeout(client.resumeTimer);
+        client.resumeTimer = null;
         if (client.tty) {
-            client.tty.kill(9);
+            var tty = client.tty;
             client.tty = null;
-            console.log("Process killed and terminal unloaded");
+
+            // SIGHUP lets run.py save its state and exit, it is killed
+            // if it has not exited a few seconds later
+            tty.kill('SIGHUP');
+            var timer = setTimeout(function () {
+                try {
+                    tty.kill('SIGKILL');
+                } catch (err) {
+                    // Already exited
+                }
+            }, 3000);
+            tty.on('exit', function () {
+                clearTimeout(timer);
+            });
+            console.log("Process hung up and terminal unloaded");
         }
     });
 
     this.on('message', function (client, msg) {
+        if (client.resumeTimer) {
+            var resume = /^resume:([\w.-]*)$/.exec(msg);
+            spawnTerminal(client, resume ? resume[1] : '');
+            if (resume)
+                return;
+        }
         client.tty && client.tty.write(msg);
     });
 }
 
+function spawnTerminal(client, resume) {
+
+    clearTimeout(client.resumeTimer);
+    client.resumeTimer = null;
+
+    // Pass the resume token to run.py so a reconnect skips logging in
+    // again
+    var env = Object.assign({}, process.env);
+    if (resume)
+        env.RESUME_TOKEN = resume;
+
+    // Login attempts are throttled per client address, shared by
+    // every terminal the client opens
+    env.CONNECTION_ID = client.ip;
+
+    // Low bandwidth lite mode, shrinks art and reuses frames
+    if (client.query && client.query.lite === '1')
+        env.LITE_MODE = '1';
+
+    // Spawn terminal
+    client.tty = Pty.spawn('python3', ['run.py'], {
+        name: 'xterm-color',
+        cols: 85,
+        rows: 37,
+        cwd: process.env.PWD,
+        env: env
+    });
+
+    client.tty.on('exit', function (code, signal) {
+        client.tty = null;
+        client.close();
+        console.log("Process killed");
+    });
+
+    client.tty.on('data', function (data) {
+        client.send(data);
+    });
+}
+
 if (process.env.CREDS != null) {
     console.log("Creating creds.json file.");
     fs.writeFile('creds.json', process.env.CREDS, 'utf8', function (err) {
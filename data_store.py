@@ -0,0 +1,80 @@
+"""This module provides a read only data file of named entries, with a
+JSON index line followed by the entry bytes, memory mapped on open"""
+import json
+import mmap
+import os
+
+
+class IndexedFile:
+    """
+    A class representing an indexed data file.
+
+    The first line of the file is a JSON index of
+    {name: {"offset": int, "length": int, ...metadata}}, offsets are
+    relative to the end of that line.
+
+    Attributes:
+        index (dict): Entry name to offset, length and metadata
+    """
+
+    def __init__(self, path):
+        """
+        Initialise an instance of the IndexedFile class.
+        A missing or unreadable file is treated as empty.
+
+        Parameters:
+            path (string): Path to the data file
+        """
+        self.index = {}
+        self._data = None
+        self._data_start = 0
+        try:
+            with open(path, "rb") as file:
+                index = json.loads(file.readline())
+                self._data_start = file.tell()
+                if index:
+                    self._data = mmap.mmap(file.fileno(), 0,
+                                           access=mmap.ACCESS_READ)
+                self.index = index
+        except (OSError, ValueError):
+            self.index = {}
+
+    def get(self, name):
+        """
+        Returns the bytes stored for an entry
+
+        Parameters:
+            name (string): Entry name
+        Returns:
+            data (bytes or None): Entry bytes, None if there is no entry
+        """
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        start = self._data_start + entry["offset"]
+        return self._data[start:start + entry["length"]]
+
+    @staticmethod
+    def write(path, entries):
+        """
+        Writes entries to a new data file, replacing any existing file
+
+        Parameters:
+            path (string): Path to write the data file to
+            entries (dict): Entry name to (bytes, metadata dict)
+        Returns:
+            None
+        """
+        index = {}
+        offset = 0
+        for name, (data, metadata) in entries.items():
+            index[name] = {"offset": offset, "length": len(data), **metadata}
+            offset += len(data)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(json.dumps(index).encode() + b"\n")
+            for data, _ in entries.values():
+                file.write(data)
+        os.replace(temp_path, path)
@@ -0,0 +1,184 @@
+"""This module provides the helper functions used to print
+styled text to the terminal"""
+import atexit
+import sys
+
+from termcolor import colored
+
+from art_fonts import render_art_font
+from compositor import clear_screen
+from terminal_metrics import display_width, get_terminal_size
+
+# Name and number of rows of the frame pinned to the top of the
+# terminal in lite mode, None when nothing is pinned
+_pinned_frame = None
+
+
+def print_art_font(string, font, color):
+    """
+    Uses pyfiglet library to convert given string into an art font style
+    Prints sting in selected colour, rendered text is cached
+
+    Parameters:
+        string (string): Text to be converted
+        color (string): Colour to print converted text
+        font (string): Font to print in
+    Returns:
+        None
+    """
+    print(render_art_font(string, font, color))
+
+
+def get_terminal_width():
+    """
+    Returns the width of the terminal, cached until it is resized
+
+    Parameters:
+        None
+    Returns:
+        width (int): Number of columns in the terminal
+    """
+    return get_terminal_size().columns
+
+
+def get_terminal_height():
+    """
+    Returns the height of the terminal, cached until it is resized
+
+    Parameters:
+        None
+    Returns:
+        height (int): Number of rows in the terminal
+    """
+    return get_terminal_size().lines
+
+
+def center_string(string):
+    """
+    Returns the given text with spaces to center it in the terminal
+    Spacing uses the width the text takes up on screen, so escape
+    codes for colour etc are ignored and wide characters count as 2
+
+    Parameters:
+        string (string): String to be centered
+    Returns:
+        centered_string (string): Centered string
+    """
+
+    terminal_width = get_terminal_width()
+
+    spaces = int((terminal_width - display_width(string)) / 2)
+    return " " * spaces + string
+
+
+def print_center_string(string):
+    """
+    Centers and prints the given text to the terminal
+
+    Parameters:
+        string (string): String to be centered and printed
+    Returns:
+        None
+    """
+    print(center_string(string))
+
+
+def clear_terminal():
+    """
+    Clears text from terminal with escape codes rather than running
+    clear, releasing any pinned frame
+    """
+    release_frame()
+    clear_screen()
+
+
+def pin_frame(name, rows):
+    """
+    Stops the top rows of the terminal, holding a frame, from scrolling
+    so later screens can reuse the frame without sending it again
+
+    Parameters:
+        name (string): Frame name
+        rows (int): Number of rows the frame takes up
+    Returns:
+        None
+    """
+    global _pinned_frame
+
+    # Scroll only the rows below the frame and move below it
+    sys.stdout.write(f"\x1b[{rows + 1};{get_terminal_height()}r"
+                     f"\x1b[{rows + 1};1H")
+    if _pinned_frame is None:
+        atexit.register(release_frame)
+    _pinned_frame = (name, rows)
+
+
+def get_pinned_frame():
+    """
+    Returns the name of the frame pinned to the top of the terminal
+
+    Parameters:
+        None
+    Returns:
+        name (string or None): Frame name, None if nothing is pinned
+    """
+    return _pinned_frame[0] if _pinned_frame else None
+
+
+def release_frame():
+    """
+    Lets the whole terminal scroll again after a frame was pinned
+
+    Parameters:
+        None
+    Returns:
+        None
+    """
+    global _pinned_frame
+
+    if _pinned_frame is not None:
+        atexit.unregister(release_frame)
+        _pinned_frame = None
+        sys.stdout.write("\x1b[r")
+
+
+def clear_below_frame():
+    """
+    Clears the terminal below a pinned frame, or the whole terminal
+    if no frame is pinned
+
+    Parameters:
+        None
+    Returns:
+        None
+    """
+    if _pinned_frame is None:
+        clear_terminal()
+    else:
+        sys.stdout.write(f"\x1b[{_pinned_frame[1] + 1};1H\x1b[J")
+
+
+def styled_msg(msg, color):
+    """
+    Returns a centered, bold message in a selected colour
+
+    Parameters:
+        msg: Message to be styled
+        color: Colour of message
+    Returns:
+        styled_msg (string): Centered and coloured message
+    """
+    return center_string(colored(msg, color, attrs=["bold", "underline"]))
+
+
+def print_styled_msg(msg, color):
+    """
+    Prints a centered, bold message in a selected colour
+
+    Parameters:
+        msg: Message to be printed
+        color: Colour of message to be printed
+    Returns:
+        None:
+    """
+    print(styled_msg(msg, color))
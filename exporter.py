@@ -0,0 +1,596 @@
+"""This module exports a users portfolio, the card catalog or the cards
+every user has, as CSV, JSON Lines or a compact binary columnar format.
+Portfolios and the catalog are read with a single request, and the cards
+of every user a chunk of columns at a time. Records are made by
+generators and written as they are made, a row group at a time for the
+columnar format, so memory use does not grow with the export."""
+import csv
+import io
+import json
+import os
+import time
+import tracemalloc
+from decimal import Decimal, InvalidOperation
+
+from commands import CARD_COUNT
+
+# Formats that can be exported, and the file extension of each
+EXPORT_FORMATS = {
+    "csv": ".csv",
+    "jsonl": ".jsonl",
+    "columnar": ".pkc",
+}
+
+# Records held in memory at a time by the columnar format
+ROW_GROUP_SIZE = int(os.environ.get("EXPORT_ROW_GROUP_SIZE", 1024))
+
+# Users columns read with each request when exporting every collection
+COLLECTION_CHUNK_COLS = int(os.environ.get("EXPORT_CHUNK_COLS", 100))
+
+# First bytes of a columnar file, the last is the format version
+COLUMNAR_MAGIC = b"PKC\x01"
+
+# Field names and types for each export, types are "u" for card numbers,
+# "s" for text, "c" for prices stored in cents
+CATALOG_FIELDS = (("number", "u"), ("name", "s"), ("rarity", "s"),
+                  ("price", "c"))
+COLLECTION_FIELDS = (("user", "s"), ("number", "u"), ("name", "s"))
+
+# Catalog columns (name, rarity, number, price) for every card
+CATALOG_RANGE = f"B2:E{CARD_COUNT + 1}"
+
+# First column holding a users cards, columns before it are the catalog
+FIRST_USER_COL = 6
+
+
+# ---- READING THE SHEET ----
+
+
+def read_catalog(worksheet):
+    """
+    Reads the catalog with a single request
+
+    Parameters:
+        worksheet (object): Base set worksheet
+    Returns:
+        rows (list): Name, rarity, number and price for each card
+    """
+    return worksheet.batch_get([CATALOG_RANGE])[0]
+
+
+def read_portfolio(worksheet, col_letter):
+    """
+    Reads the catalog and a users column with a single request
+
+    Parameters:
+        worksheet (object): Base set worksheet
+        col_letter (string): Letter of the users column
+    Returns:
+        (rows, user_cells) (tuple): Catalog rows and the users cells
+    """
+    rows, user_cells = worksheet.batch_get([
+        CATALOG_RANGE, f"{col_letter}2:{col_letter}{CARD_COUNT + 1}"])
+    return rows, user_cells
+
+
+def read_collections(worksheet, users, chunk_cols=COLLECTION_CHUNK_COLS):
+    """
+    Reads the users columns a chunk of columns at a time, each chunk is a
+    single batch request, so the whole sheet is never held at once
+
+    Parameters:
+        worksheet (object): Base set worksheet
+        users (list): (username, col_letter) for each user
+        chunk_cols (int): Number of columns in each chunk
+    Yields:
+        (username, user_cells) (tuple): Each users cells
+    """
+    for start in range(0, len(users), chunk_cols):
+        chunk = users[start:start + chunk_cols]
+        value_ranges = worksheet.batch_get([
+            f"{col_letter}2:{col_letter}{CARD_COUNT + 1}"
+            for _, col_letter in chunk])
+        for (username, _), user_cells in zip(chunk, value_ranges):
+            yield username, user_cells
+
+
+# ---- RECORDS ----
+
+
+def to_number(value):
+    """
+    Returns a card number, None if the cell is not a number
+
+    Parameters:
+        value (string): Cell value
+    Returns:
+        number (int or None): Card number
+    """
+    value = value.strip()
+    return int(value) if value.isdecimal() else None
+
+
+def to_price(value):
+    """
+    Returns a price to the cent, None if the cell is not a price
+
+    Parameters:
+        value (string): Cell value, such as "6.00" or "$6.00"
+    Returns:
+        price (Decimal or None): Price
+    """
+    try:
+        return Decimal(value.strip().lstrip("$")).quantize(Decimal("0.01"))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def catalog_record(row):
+    """
+    Returns the record for a catalog row, in the order of CATALOG_FIELDS
+
+    Parameters:
+        row (list): Name, rarity, number and price cells, may be short
+    Returns:
+        record (tuple): Card number, name, rarity and price
+    """
+    name, rarity, number, price = (list(row) + [""] * 4)[:4]
+    return to_number(number), name, rarity, to_price(price)
+
+
+def iter_catalog_records(rows):
+    """
+    Makes a record for each card in the catalog
+
+    Parameters:
+        rows (iterable): Catalog rows from read_catalog
+    Yields:
+        record (tuple): Card number, name, rarity and price
+    """
+    for row in rows:
+        yield catalog_record(row)
+
+
+def iter_portfolio_records(rows, user_cells, owned=True):
+    """
+    Makes a record for each card in a users collection, or each card
+    missing from it
+
+    Parameters:
+        rows (list): Catalog rows from read_portfolio
+        user_cells (list): Users cells from read_portfolio
+        owned (boolean): Flag cleared to make records for missing cards
+    Yields:
+        record (tuple): Card number, name, rarity and price
+    """
+    # The sheet leaves out empty cells at the end of the column
+    user_cells = list(user_cells) + [[]] * (len(rows) - len(user_cells))
+    for row, cell in zip(rows, user_cells):
+        if (cell[:1] == ["Yes"]) == owned:
+            yield catalog_record(row)
+
+
+def iter_collection_records(rows, columns):
+    """
+    Makes a record for each card each user has, a user at a time
+
+    Parameters:
+        rows (list): Catalog rows from read_catalog
+        columns (iterable): (username, user_cells) from read_collections
+    Yields:
+        record (tuple): Username, card number and card name
+    """
+    for username, user_cells in columns:
+        for row, cell in zip(rows, user_cells):
+            if cell[:1] == ["Yes"]:
+                number, name, _, _ = catalog_record(row)
+                yield username, number, name
+
+
+# ---- TEXT FORMATS ----
+
+
+def iter_csv(records, fields):
+    """
+    Writes records as CSV, a line at a time
+
+    Parameters:
+        records (iterable): Records to write
+        fields (tuple): Field names and types
+    Yields:
+        chunk (bytes): Heading line, then a line for each record
+    """
+    line = io.StringIO()
+    writer = csv.writer(line, lineterminator="\n")
+    writer.writerow(name for name, _ in fields)
+    yield line.getvalue().encode()
+    for record in records:
+        line.seek(0)
+        line.truncate()
+        writer.writerow("" if value is None else value for value in record)
+        yield line.getvalue().encode()
+
+
+def iter_jsonl(records, fields):
+    """
+    Writes records as JSON Lines, an object on each line
+
+    Parameters:
+        records (iterable): Records to write
+        fields (tuple): Field names and types
+    Yields:
+        chunk (bytes): A line for each record
+    """
+    names = [name for name, _ in fields]
+    for record in records:
+        yield (json.dumps(dict(zip(names, record)), default=float,
+                          ensure_ascii=False) + "\n").encode()
+
+
+# ---- COLUMNAR FORMAT ----
+# After COLUMNAR_MAGIC the file holds the number of fields and each
+# field name and type, then row groups, each the number of records in
+# the group and its size in bytes followed by every value of each field
+# in turn. A group of 0 records ends the file. Numbers are varints:
+#   u: card number + 1, 0 for none
+#   c: price in cents, zigzag encoded, + 1, 0 for none
+#   s: a list of the distinct values in the group, then the position
+#      of each value in that list, so repeated names cost a byte or two
+
+
+def encode_varint(value):
+    """
+    Returns an unsigned integer as a little endian base 128 varint
+
+    Parameters:
+        value (int): Integer to encode, 0 or more
+    Returns:
+        varint (bytes): Encoded integer
+    """
+    output = bytearray()
+    while value > 0x7F:
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+    output.append(value)
+    return bytes(output)
+
+
+def read_varint(data, position):
+    """
+    Reads a varint from data
+
+    Parameters:
+        data (bytes): Bytes to read from
+        position (int): Position of the varint
+    Returns:
+        (value, position) (tuple): Integer read and the position after it
+    """
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def read_file_varint(file):
+    """
+    Reads a varint from a file
+
+    Parameters:
+        file (object): File opened in binary mode
+    Returns:
+        value (int): Integer read
+    Raises:
+        ValueError: If the file ends first
+    """
+    value = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            raise ValueError("The columnar export is cut short")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def encode_column(values, field_type):
+    """
+    Returns the values of a field in a row group as bytes
+
+    Parameters:
+        values (list): Value of the field for each record
+        field_type (string): "u", "c" or "s"
+    Returns:
+        column (bytes): Encoded values
+    """
+    if field_type == "u":
+        return b"".join(encode_varint(0 if value is None else value + 1)
+                        for value in values)
+    if field_type == "c":
+        output = []
+        for value in values:
+            if value is None:
+                output.append(encode_varint(0))
+            else:
+                cents = int(value * 100)
+                output.append(encode_varint(
+                    ((cents << 1) ^ (cents >> 63)) + 1))
+        return b"".join(output)
+
+    distinct = {}
+    positions = [distinct.setdefault(value, len(distinct))
+                 for value in values]
+    output = [encode_varint(len(distinct))]
+    for value in distinct:
+        text = value.encode()
+        output += [encode_varint(len(text)), text]
+    output += [encode_varint(position) for position in positions]
+    return b"".join(output)
+
+
+def iter_columnar(records, fields, group_size=ROW_GROUP_SIZE):
+    """
+    Writes records in the columnar format, a row group at a time
+
+    Parameters:
+        records (iterable): Records to write
+        fields (tuple): Field names and types
+        group_size (int): Max records in each row group
+    Yields:
+        chunk (bytes): Header, then each row group, then the end marker
+    """
+    header = [COLUMNAR_MAGIC, encode_varint(len(fields))]
+    for name, field_type in fields:
+        text = name.encode()
+        header += [encode_varint(len(text)), text, field_type.encode()]
+    yield b"".join(header)
+
+    group = []
+    for record in records:
+        group.append(record)
+        if len(group) == group_size:
+            yield encode_group(group, fields)
+            group = []
+    if group:
+        yield encode_group(group, fields)
+    yield encode_varint(0)
+
+
+def encode_group(group, fields):
+    """
+    Returns a row group as bytes, each field stored in turn
+
+    Parameters:
+        group (list): Records in the group
+        fields (tuple): Field names and types
+    Returns:
+        group (bytes): Encoded row group
+    """
+    body = b"".join(
+        encode_column([record[index] for record in group], field_type)
+        for index, (_, field_type) in enumerate(fields))
+    return encode_varint(len(group)) + encode_varint(len(body)) + body
+
+
+def decode_column(data, position, count, field_type):
+    """
+    Reads the values of a field in a row group
+
+    Parameters:
+        data (bytes): Row group bytes
+        position (int): Position of the column
+        count (int): Number of records in the group
+        field_type (string): "u", "c" or "s"
+    Returns:
+        (values, position) (tuple): Values and the position after them
+    """
+    values = []
+    if field_type == "s":
+        distinct = []
+        size, position = read_varint(data, position)
+        for _ in range(size):
+            length, position = read_varint(data, position)
+            distinct.append(data[position:position + length].decode())
+            position += length
+        for _ in range(count):
+            index, position = read_varint(data, position)
+            values.append(distinct[index])
+        return values, position
+
+    for _ in range(count):
+        value, position = read_varint(data, position)
+        if value == 0:
+            values.append(None)
+        elif field_type == "u":
+            values.append(value - 1)
+        else:
+            value -= 1
+            cents = (value >> 1) ^ -(value & 1)
+            values.append(Decimal(cents).scaleb(-2))
+    return values, position
+
+
+def read_columnar(file):
+    """
+    Reads records from a columnar file, a row group at a time
+
+    Parameters:
+        file (object): File opened in binary mode
+    Yields:
+        record (dict): Field name to value for each record
+    Raises:
+        ValueError: If the file is not in the columnar format
+    """
+    if file.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Not a columnar export")
+
+    fields = []
+    for _ in range(read_file_varint(file)):
+        name = file.read(read_file_varint(file)).decode()
+        fields.append((name, file.read(1).decode()))
+    names = [name for name, _ in fields]
+
+    while True:
+        count = read_file_varint(file)
+        if count == 0:
+            return
+        size = read_file_varint(file)
+        data = file.read(size)
+        if len(data) < size:
+            raise ValueError("The columnar export is cut short")
+
+        columns = []
+        position = 0
+        for _, field_type in fields:
+            values, position = decode_column(data, position, count,
+                                             field_type)
+            columns.append(values)
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+# ---- EXPORTING ----
+
+# Writer for each format
+FORMAT_WRITERS = {
+    "csv": iter_csv,
+    "jsonl": iter_jsonl,
+    "columnar": iter_columnar,
+}
+
+
+def export(records, fields, export_format, file):
+    """
+    Writes records to a binary file in an export format, chunk by chunk
+
+    Parameters:
+        records (iterable): Records to write
+        fields (tuple): Field names and types
+        export_format (string): A format in EXPORT_FORMATS
+        file (object): File opened in binary mode
+    Returns:
+        (count, size) (tuple): Records and bytes written
+    """
+    count = 0
+
+    def counted():
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    size = 0
+    for chunk in FORMAT_WRITERS[export_format](counted(), fields):
+        file.write(chunk)
+        size += len(chunk)
+    return count, size
+
+
+def column_letter(col_number):
+    """
+    Returns the letter of a column, such as "AB" for 28
+    """
+    letters = ""
+    while col_number:
+        col_number, remainder = divmod(col_number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+class _GeneratedSheet:
+    """
+    Base set worksheet of many users for the benchmark, values are made
+    as they are read so only what is fetched is held in memory
+    """
+
+    def __init__(self, num_users):
+        self.calls = 0
+        self.users = [(f"trainer{user}",
+                       column_letter(FIRST_USER_COL + user))
+                      for user in range(num_users)]
+        self._columns = {f"{col_letter}2:{col_letter}{CARD_COUNT + 1}": user
+                         for user, (_, col_letter) in enumerate(self.users)}
+
+    def batch_get(self, ranges):
+        self.calls += 1
+        value_ranges = []
+        for value_range in ranges:
+            if value_range == CATALOG_RANGE:
+                value_ranges.append([
+                    [f"Pokemon {card}", "Rare", str(card),
+                     f"{card * 1.25:.2f}"]
+                    for card in range(1, CARD_COUNT + 1)])
+            else:
+                user = self._columns[value_range]
+                value_ranges.append([
+                    ["Yes" if (card + user) % 3 else "No"]
+                    for card in range(1, CARD_COUNT + 1)])
+        return value_ranges
+
+
+class _ByteCounter:
+    """
+    Binary file that only counts what is written to it
+    """
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+
+
+def benchmark(num_users=2000):
+    """
+    Exports the cards of every user in a generated sheet in each format,
+    to compare their size and check memory use does not grow with the
+    export. Memory is measured from the first read of the sheet.
+
+    Parameters:
+        num_users (int): Number of users in the sheet
+    Returns:
+        results (dict): Bytes, requests, milliseconds and peak KiB for
+            each format
+    """
+    results = {}
+    for export_format in EXPORT_FORMATS:
+        sheet = _GeneratedSheet(num_users)
+        tracemalloc.start()
+        start = time.perf_counter()
+        count, size = export(
+            iter_collection_records(read_catalog(sheet),
+                                    read_collections(sheet, sheet.users)),
+            COLLECTION_FIELDS, export_format, _ByteCounter())
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[export_format] = {
+            "records": count,
+            "bytes": size,
+            "requests": sheet.calls,
+            "ms": elapsed * 1000,
+            "peak_kib": peak / 1024,
+        }
+
+    # Check the columnar format reads back the same
+    rows = read_catalog(_GeneratedSheet(0))
+    file = io.BytesIO()
+    export(iter_catalog_records(rows), CATALOG_FIELDS, "columnar", file)
+    file.seek(0)
+    expected = list(iter_catalog_records(rows))
+    if [tuple(record.values()) for record in read_columnar(file)] != \
+            expected:
+        raise AssertionError("Columnar export does not read back the same")
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in benchmark().items():
+        print(f"{name:<9} {result['records']} records, "
+              f"{result['bytes'] / 1024:.0f} KiB, "
+              f"{result['requests']} requests, {result['ms']:.0f} ms, "
+              f"peak memory {result['peak_kib']:.0f} KiB")
@@ -0,0 +1,385 @@
+"""This module provides the static frames printed by each screen, and
+writes prerendered copies of them in a single write when available"""
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
+
+from termcolor import colored
+
+from bandwidth import LITE_MODE
+from display import (clear_below_frame, clear_terminal, get_pinned_frame,
+                     get_terminal_height, get_terminal_width, pin_frame,
+                     print_art_font, print_center_string, print_styled_msg)
+from data_store import IndexedFile
+from pokemon_ascii_art import print_pokemon
+from terminal_metrics import DEFAULT_WIDTH
+
+# File written by prerender.py, frames are rendered for the default width
+FRAMES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "assets", "frames", "frames.bin")
+
+# Max number of lite mode frames kept in memory
+LITE_FRAME_CACHE_SIZE = 32
+
+# Fewest rows left below a lite mode frame for it to be pinned
+MIN_CONTENT_ROWS = 8
+
+
+def welcome_frame():
+    """
+    Prints welcome banner text and image
+    """
+    print_art_font("Pokemon Portfolio", "big", "yellow")
+    print()
+    print_center_string(
+        colored(
+            "Manage and appraise your base set pokemon"
+            " card collection", "yellow"
+        )
+    )
+
+    print_pokemon("pikachu_banner")
+
+
+def account_login_frame():
+    """
+    Prints account login heading, image and instructions
+    """
+    print_art_font("       Account  Login", "big", "yellow")
+    print_pokemon("10")
+
+    print_styled_msg("Please enter your username and password below to login "
+                     "(both are case sensitive)", "white")
+
+
+def create_account_frame():
+    """
+    Prints account creation heading, image and instructions
+    """
+    print_art_font(" Account Creation", "big", "yellow")
+    print_pokemon("44")
+
+    print("")
+    print_styled_msg("Please follow the steps below to create an account\n",
+                     "white")
+
+
+def account_created_frame():
+    """
+    Prints account created message and image
+    """
+    print_styled_msg("Account created successfully\n", "green")
+
+    print_pokemon("5")
+
+
+def reset_password_frame():
+    """
+    Prints password reset heading, image and instructions
+    """
+    print_art_font("      Password  Reset", "big", "yellow")
+    print_pokemon("63")
+
+    print("")
+    print_styled_msg(
+        "Please follow the steps below to reset your password\n", "white")
+
+
+def main_menu_frame():
+    """
+    Prints main menu heading and image
+    """
+    print_art_font("                Main  Menu", "big", "yellow")
+    print_pokemon("4")
+
+
+def delete_portfolio_frame():
+    """
+    Prints delete portfolio heading and image
+    """
+    print_art_font("      Delete  Portfolio", "big", "yellow")
+    print_pokemon("29")
+
+
+def portfolio_deleted_frame():
+    """
+    Prints portfolio deleted heading, image and message
+    """
+    print_art_font("     Portfolio Deleted", "big", "yellow")
+    print_pokemon("50")
+    print_styled_msg("Your Portfolio has been successfully deleted\n",
+                     "green")
+
+
+def add_card_frame():
+    """
+    Prints add a card heading and image
+    """
+    print_art_font("               Add  a  card", "big", "yellow")
+    print_pokemon("19")
+    print("\n")
+
+
+def remove_card_frame():
+    """
+    Prints remove a card heading and image
+    """
+    print_art_font("       Remove  a  Card", "big", "yellow")
+    print_pokemon("28")
+    print("\n")
+
+
+def view_portfolio_frame():
+    """
+    Prints view portfolio heading
+    """
+    print_art_font("       Your  Portfolio", "big", "yellow")
+    print("")
+
+
+def cards_needed_frame():
+    """
+    Prints cards needed heading
+    """
+    print_art_font("         Cards  Needed", "big", "yellow")
+    print("")
+
+
+def portfolio_value_frame():
+    """
+    Prints portfolio value heading
+    """
+    print_art_font("      Portfolio  Value", "big", "yellow")
+
+
+def card_search_frame():
+    """
+    Prints card search heading and image
+    """
+    print_art_font("             Card  search", "big", "yellow")
+    print_pokemon("35")
+
+
+def import_cards_frame():
+    """
+    Prints import cards heading
+    """
+    print_art_font("        Import  cards", "big", "yellow")
+    print("")
+
+
+def export_cards_frame():
+    """
+    Prints export cards heading
+    """
+    print_art_font("        Export  cards", "big", "yellow")
+    print("")
+
+
+# Functions that print each static frame, keyed by frame name
+FRAME_BUILDERS = {
+    "welcome": welcome_frame,
+    "account_login": account_login_frame,
+    "create_account": create_account_frame,
+    "account_created": account_created_frame,
+    "reset_password": reset_password_frame,
+    "main_menu": main_menu_frame,
+    "delete_portfolio": delete_portfolio_frame,
+    "portfolio_deleted": portfolio_deleted_frame,
+    "add_card": add_card_frame,
+    "remove_card": remove_card_frame,
+    "view_portfolio": view_portfolio_frame,
+    "cards_needed": cards_needed_frame,
+    "portfolio_value": portfolio_value_frame,
+    "card_search": card_search_frame,
+    "import_cards": import_cards_frame,
+    "export_cards": export_cards_frame,
+}
+
+
+def card_frame_name(card_num, card_name):
+    """
+    Returns the frame name for a cards heading and image, the name is
+    included so a renamed card is not shown with an old heading
+
+    Parameters:
+        card_num (string): Card number
+        card_name (string): Card name
+    Returns:
+        name (string): Frame name
+    """
+    return f"card:{card_num}:{card_name}"
+
+
+def card_frame(card_num, card_name):
+    """
+    Prints a cards name and image, as shown by card search
+
+    Parameters:
+        card_num (string): Card number
+        card_name (string): Card name
+    Returns:
+        None
+    """
+    print_art_font(f"{card_name}", "small", "yellow")
+    print_pokemon(f"{card_num}")
+
+
+# Prerendered frames, opened on first use
+_store = None
+
+
+def get_prerendered(name):
+    """
+    Returns a prerendered frame if one exists for the current terminal width
+
+    Parameters:
+        name (string): Frame name
+    Returns:
+        frame (bytes or None): Frame bytes, None if it must be rendered
+    """
+    global _store
+
+    # Prerendered frames hold full size art, so lite mode renders its own
+    if LITE_MODE or get_terminal_width() != DEFAULT_WIDTH:
+        return None
+    if _store is None:
+        _store = IndexedFile(FRAMES_FILE)
+    return _store.get(name)
+
+
+def write_frame(frame):
+    """
+    Writes a whole frame to the terminal with a single write
+
+    Parameters:
+        frame (bytes): Frame to write
+    Returns:
+        None
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(frame)
+    sys.stdout.buffer.flush()
+
+
+def show_frame(name):
+    """
+    Shows a static frame, using the prerendered copy when available
+
+    Parameters:
+        name (string): Frame name in FRAME_BUILDERS
+    Returns:
+        None
+    """
+    frame = get_prerendered(name)
+    if frame is not None:
+        write_frame(frame)
+    else:
+        FRAME_BUILDERS[name]()
+
+
+def show_card_frame(card_num, card_name):
+    """
+    Shows a cards name and image, using the prerendered copy when available
+
+    Parameters:
+        card_num (string): Card number
+        card_name (string): Card name
+    Returns:
+        None
+    """
+    frame = get_prerendered(card_frame_name(card_num, card_name))
+    if frame is not None:
+        write_frame(frame)
+    else:
+        card_frame(card_num, card_name)
+
+
+class _FrameBuffer(io.StringIO):
+    """
+    Collects a rendered frame, reporting a terminal when stdout is one
+    so termcolor still colours the frame
+    """
+
+    def isatty(self):
+        return sys.__stdout__.isatty()
+
+
+@lru_cache(maxsize=LITE_FRAME_CACHE_SIZE)
+def render_lite_frame(builder, args, width):
+    """
+    Renders a frame to a string, kept so a frame shown again in the
+    session is not rendered again
+
+    Parameters:
+        builder (function): Function that prints the frame
+        args (tuple): Arguments for the builder
+        width (int): Terminal width the frame is rendered for
+    Returns:
+        frame (string): Rendered frame
+    """
+    buffer = _FrameBuffer()
+    with redirect_stdout(buffer):
+        builder(*args)
+    return buffer.getvalue()
+
+
+def show_lite_frame(name, builder, *args):
+    """
+    Clears the terminal and shows a frame pinned to the top rows, a
+    frame already pinned there is reused and only the rows below it
+    are cleared
+
+    Parameters:
+        name (string): Frame name
+        builder (function): Function that prints the frame
+        args: Arguments for the builder
+    Returns:
+        None
+    """
+    if get_pinned_frame() == name:
+        clear_below_frame()
+        return
+
+    clear_terminal()
+    frame = render_lite_frame(builder, args, get_terminal_width())
+    sys.stdout.write(frame)
+    rows = frame.count("\n")
+    if rows + MIN_CONTENT_ROWS <= get_terminal_height():
+        pin_frame(name, rows)
+
+
+def show_screen(name):
+    """
+    Clears the terminal and shows a static frame
+
+    Parameters:
+        name (string): Frame name in FRAME_BUILDERS
+    Returns:
+        None
+    """
+    if LITE_MODE:
+        show_lite_frame(name, FRAME_BUILDERS[name])
+    else:
+        clear_terminal()
+        show_frame(name)
+
+
+def show_card_screen(card_num, card_name):
+    """
+    Clears the terminal and shows a cards name and image
+
+    Parameters:
+        card_num (string): Card number
+        card_name (string): Card name
+    Returns:
+        None
+    """
+    if LITE_MODE:
+        show_lite_frame(card_frame_name(card_num, card_name), card_frame,
+                        card_num, card_name)
+    else:
+        clear_terminal()
+        show_card_frame(card_num, card_name)
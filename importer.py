@@ -0,0 +1,489 @@
+"""This module imports a collection from a CSV or JSON file of card
+numbers or names. The file is read an entry at a time, so its size does
+not matter, and only the cells that change are written to the sheet."""
+import csv
+import json
+import os
+import re
+import time
+import tracemalloc
+from functools import lru_cache, partial
+
+from login_throttle import TokenBucket
+
+# Unchanged cells a write may cover to join two ranges of changes, each
+# range in a request costs more than the few cells between them
+IMPORT_MAX_GAP = int(os.environ.get("IMPORT_MAX_GAP", 4))
+
+# Max ranges sent in each batch_update request
+IMPORT_BATCH_RANGES = int(os.environ.get("IMPORT_BATCH_RANGES", 50))
+
+# Sheets allows 60 write requests a minute for each user, imports are
+# paced to stay within it
+WRITE_BURST = int(os.environ.get("SHEETS_WRITE_BURST", 5))
+WRITE_RATE = float(os.environ.get("SHEETS_WRITE_RATE", 1.0))
+
+# Characters read from a JSON file at a time
+JSON_CHUNK_SIZE = 64 * 1024
+
+# Entries read between progress updates
+PROGRESS_EVERY = int(os.environ.get("IMPORT_PROGRESS_EVERY", 25))
+
+# Rejected entries kept to show the user, the rest are only counted
+MAX_REJECTED_SHOWN = 10
+
+# File extensions read as JSON, anything else is read as CSV
+JSON_EXTENSIONS = (".json", ".jsonl", ".ndjson")
+
+# CSV headings and JSON keys for each field of an entry
+NUMBER_KEYS = ("number", "card number", "card_number", "card no.", "no",
+               "card")
+NAME_KEYS = ("name", "card name", "card_name", "pokemon")
+OWNED_KEYS = ("owned", "in collection", "in_collection")
+
+# Owned values that mean the card is not in the collection
+NOT_OWNED_VALUES = ("no", "n", "false", "0")
+
+# Card numbers as written on cards or in the sheet, such as 4, BS4,
+# #004 or 4/102
+CARD_NUMBER = re.compile(r"(?:bs|b)?\s*#?\s*(\d+)\s*(?:/\s*\d+)?",
+                         re.IGNORECASE)
+
+# Write requests made by imports in this process
+_write_bucket = TokenBucket(WRITE_BURST, WRITE_RATE)
+
+
+def normalise_name(name):
+    """
+    Returns a card name in the form used to look it up, ignoring case,
+    spaces and punctuation, so "Mr. Mime" matches "mr mime"
+
+    Parameters:
+        name (string): Card name
+    Returns:
+        key (string): Lookup key
+    """
+    return "".join(char for char in name.casefold() if char.isalnum())
+
+
+class CatalogIndex:
+    """
+    A class representing an index of the card set by card number and
+    by name, used to resolve import entries in constant time.
+
+    Attributes:
+        card_count (int): Number of cards in the set
+    """
+
+    def __init__(self, card_nums, card_names):
+        """
+        Initialise an instance of the CatalogIndex class.
+
+        Parameters:
+            card_nums (tuple): Card number of each card in the set
+            card_names (tuple): Name of each card in the set
+        """
+        self.card_count = len(card_names)
+        self._numbers = {}
+        self._names = {}
+        for position, (card_num, name) in enumerate(
+                zip(card_nums, card_names), 1):
+            if card_num.strip().isdecimal():
+                self._numbers[int(card_num)] = position
+            key = normalise_name(name)
+            # Names shared by more than one card cannot be resolved
+            self._names[key] = None if key in self._names else position
+
+    def resolve(self, entry):
+        """
+        Returns the card an entry refers to
+
+        Parameters:
+            entry (string): Card number or name
+        Returns:
+            card (int or None): Position of the card in the set,
+                starting at 1, None if it is not found
+        """
+        match = CARD_NUMBER.fullmatch(entry.strip())
+        if match:
+            return self._numbers.get(int(match[1]))
+        return self._names.get(normalise_name(entry))
+
+
+@lru_cache(maxsize=4)
+def catalog_index(card_nums, card_names):
+    """
+    Returns the index of a card set, the set only changes if the sheet
+    is edited so this is kept
+
+    Parameters:
+        card_nums (tuple): Card numbers
+        card_names (tuple): Card names
+    Returns:
+        index (CatalogIndex): Index of the set
+    """
+    return CatalogIndex(card_nums, card_names)
+
+
+def parse_owned(value):
+    """
+    Reads an owned value from a file, a missing value means owned
+
+    Parameters:
+        value (object): Value from the file
+    Returns:
+        owned (boolean): True if the card is in the collection
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().casefold() not in NOT_OWNED_VALUES
+
+
+def find_key(keys, names):
+    """
+    Returns the first of a set of heading names found in keys
+
+    Parameters:
+        keys (list): CSV headings or JSON object keys, lower case
+        names (tuple): Names the field may have
+    Returns:
+        key (object or None): Matching index or key, None if not found
+    """
+    for name in names:
+        if name in keys:
+            return name
+    return None
+
+
+def iter_csv_entries(lines):
+    """
+    Reads entries from CSV lines. With a heading row the number, name
+    and owned columns are used, otherwise every cell is a card.
+
+    Parameters:
+        lines (iterable): Lines of the file
+    Yields:
+        (entry, owned) (tuple): Card number or name, and if it is owned
+    """
+    columns = None
+    for row in csv.reader(lines):
+        if columns is None:
+            headings = [cell.strip().casefold() for cell in row]
+            fields = [find_key(headings, keys)
+                      for keys in (NUMBER_KEYS, NAME_KEYS, OWNED_KEYS)]
+            columns = [headings.index(field) if field else None
+                       for field in fields]
+            if any(fields):
+                continue
+
+        if not any(column is not None for column in columns):
+            for cell in row:
+                if cell.strip():
+                    yield cell, True
+            continue
+
+        # Number, name and owned cells, empty if the row is short
+        number, name, owned = [
+            row[column] if column is not None and column < len(row) else ""
+            for column in columns]
+        entry = number.strip() or name.strip()
+        if entry:
+            yield entry, parse_owned(owned)
+
+
+def iter_json_values(file, chunk_size=JSON_CHUNK_SIZE):
+    """
+    Reads the values in a JSON array, or JSON Lines, a chunk of the file
+    at a time so the whole file is never held in memory
+
+    Parameters:
+        file (object): Open text file
+        chunk_size (int): Characters read at a time
+    Yields:
+        value (object): Each value in the array or on each line
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    in_array = None
+    finished = False
+    for chunk in iter(partial(file.read, chunk_size), ""):
+        buffer = buffer[position:] + chunk
+        position = 0
+        while not finished:
+            # Skip to the next value
+            while position < len(buffer) and (
+                    buffer[position].isspace()
+                    or (in_array and buffer[position] == ",")):
+                position += 1
+            if position == len(buffer):
+                break
+            if in_array is None:
+                in_array = buffer[position] == "["
+                position += in_array
+                continue
+            if in_array and buffer[position] == "]":
+                finished = True
+                break
+
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The value may carry on in the next chunk
+                break
+            # A number at the end of the chunk may carry on too
+            if end == len(buffer) and not isinstance(
+                    value, (dict, list, str)):
+                break
+            yield value
+            position = end
+        if finished:
+            break
+
+    rest = buffer[position:].strip()
+    if rest and not finished:
+        # Decode what is left, the file has ended
+        try:
+            value, end = decoder.raw_decode(rest)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"The file is not valid JSON, {e}") from None
+        if rest[end:].strip() or in_array:
+            raise ValueError("The file is not valid JSON")
+        yield value
+
+
+def iter_json_entries(file):
+    """
+    Reads entries from a JSON file of card numbers, names or objects
+    with number, name and owned keys
+
+    Parameters:
+        file (object): Open text file
+    Yields:
+        (entry, owned) (tuple): Card number or name, and if it is owned
+    """
+    for value in iter_json_values(file):
+        if isinstance(value, dict):
+            fields = {key.strip().casefold(): item
+                      for key, item in value.items()}
+            number = find_key(fields, NUMBER_KEYS)
+            name = find_key(fields, NAME_KEYS)
+            owned = find_key(fields, OWNED_KEYS)
+            entry = str(fields[number]) if number else ""
+            if not entry.strip() and name:
+                entry = str(fields[name])
+            yield (entry or json.dumps(value),
+                   parse_owned(fields[owned]) if owned else True)
+        elif isinstance(value, (int, str)) and not isinstance(value, bool):
+            yield str(value), True
+        else:
+            yield json.dumps(value), True
+
+
+def iter_entries(file, path=""):
+    """
+    Reads entries from a CSV or JSON file, chosen by the file extension
+
+    Parameters:
+        file (object): Open text file, or lines of text
+        path (string): Path of the file, CSV is read if there is none
+    Yields:
+        (entry, owned) (tuple): Card number or name, and if it is owned
+    """
+    if path.lower().endswith(JSON_EXTENSIONS):
+        return iter_json_entries(file)
+    return iter_csv_entries(file)
+
+
+def plan_import(entries, index, user_cards, replace=False, progress=None):
+    """
+    Resolves each entry against the catalog and compares the result with
+    the users column. The last entry for a card decides its value.
+
+    Parameters:
+        entries (iterable): Entries from iter_entries
+        index (CatalogIndex): Index of the card set
+        user_cards (list): "Yes" or "No" for each card
+        replace (boolean): Flag set to remove cards not in the file
+        progress (func or None): Called with the number of entries
+            read every PROGRESS_EVERY entries
+    Returns:
+        plan (dict): New value for each card that changes ("updates"),
+            counts of cards "added", "removed" and "unchanged", entries
+            read ("entries"), rejected entries to show ("rejected")
+            and how many were rejected ("rejected_count")
+    """
+    targets = {}
+    rejected = []
+    rejected_count = 0
+    count = 0
+    for count, (entry, owned) in enumerate(entries, 1):
+        card = index.resolve(entry)
+        if card is None:
+            rejected_count += 1
+            if len(rejected) < MAX_REJECTED_SHOWN:
+                rejected.append(entry.strip()[:40])
+        else:
+            targets[card] = "Yes" if owned else "No"
+        if progress and count % PROGRESS_EVERY == 0:
+            progress(count)
+
+    if replace:
+        for card in range(1, index.card_count + 1):
+            targets.setdefault(card, "No")
+
+    updates = {}
+    for card, value in targets.items():
+        current = user_cards[card - 1] if card <= len(user_cards) else ""
+        # Empty cells are treated as not owned
+        if value != current and (value == "Yes" or current == "Yes"):
+            updates[card] = value
+
+    added = sum(value == "Yes" for value in updates.values())
+    return {
+        "updates": updates,
+        "added": added,
+        "removed": len(updates) - added,
+        "unchanged": len(targets) - len(updates),
+        "entries": count,
+        "rejected": rejected,
+        "rejected_count": rejected_count,
+    }
+
+
+def import_ranges(updates, user_cards, col_letter, max_gap=IMPORT_MAX_GAP):
+    """
+    Groups updates into as few ranges as is worthwhile, a range covers up
+    to max_gap unchanged cells between changes, writing back their
+    current value
+
+    Parameters:
+        updates (dict): New value for each card that changes
+        user_cards (list): "Yes" or "No" for each card
+        col_letter (string): Letter of the users column
+        max_gap (int): Unchanged cells a range may cover
+    Returns:
+        ranges (list): {"range": ..., "values": ...} for each range
+    """
+    def value(card):
+        if card in updates:
+            return updates[card]
+        return user_cards[card - 1] if card <= len(user_cards) else ""
+
+    spans = []
+    for card in sorted(updates):
+        if spans and card - spans[-1][1] - 1 <= max_gap:
+            spans[-1][1] = card
+        else:
+            spans.append([card, card])
+
+    # Card rows start at 2, below the headings
+    return [{"range": f"{col_letter}{start + 1}:{col_letter}{end + 1}",
+             "values": [[value(card)] for card in range(start, end + 1)]}
+            for start, end in spans]
+
+
+def write_ranges(worksheet, ranges, batch_ranges=IMPORT_BATCH_RANGES,
+                 bucket=_write_bucket, progress=None):
+    """
+    Writes ranges with as few batch_update requests as possible, waiting
+    between requests when the write quota is used up
+
+    Parameters:
+        worksheet (object): Worksheet to write to
+        ranges (list): Ranges from import_ranges
+        batch_ranges (int): Max ranges in each request
+        bucket (TokenBucket): Write requests allowed
+        progress (func or None): Called with the number of the request
+            and the number of requests before each is sent
+    Returns:
+        requests (int): Number of requests sent
+    """
+    batches = [ranges[start:start + batch_ranges]
+               for start in range(0, len(ranges), batch_ranges)]
+    for number, batch in enumerate(batches, 1):
+        wait = bucket.wait_time()
+        if wait:
+            time.sleep(wait)
+            bucket.refill()
+        bucket.tokens -= 1
+
+        if progress:
+            progress(number, len(batches))
+        worksheet.batch_update(batch)
+    return len(batches)
+
+
+def summarise_import(plan):
+    """
+    Returns a message for each kind of result of an import
+
+    Parameters:
+        plan (dict): Plan from plan_import
+    Returns:
+        messages (list): (message, colour) for each kind of result
+    """
+    def cards(count):
+        return f"{count} card" if count == 1 else f"{count} cards"
+
+    messages = [(f"Read {plan['entries']} entries\n", "white")]
+    if plan["added"]:
+        messages.append((f"Added {cards(plan['added'])}\n", "green"))
+    if plan["removed"]:
+        messages.append((f"Removed {cards(plan['removed'])}\n", "green"))
+    if plan["unchanged"]:
+        messages.append((f"{cards(plan['unchanged'])} already up to "
+                         "date\n", "white"))
+    if plan["rejected_count"]:
+        more = plan["rejected_count"] - len(plan["rejected"])
+        messages.append((
+            f"Not found: {', '.join(plan['rejected'])}"
+            + (f" and {more} more" if more else "") + "\n", "red"))
+    return messages
+
+
+def benchmark(num_entries=200000):
+    """
+    Plans an import of a large generated CSV file, to check the time
+    taken and that memory use does not grow with the file
+
+    Parameters:
+        num_entries (int): Number of entries in the file
+    Returns:
+        results (dict): Entries per second and peak memory in KiB
+    """
+    card_nums = tuple(str(num) for num in range(1, 103))
+    card_names = tuple(f"Pokemon {num}" for num in card_nums)
+    index = catalog_index(card_nums, card_names)
+    user_cards = ["No"] * 102
+
+    def lines():
+        yield "number,name,owned\n"
+        for num in range(num_entries):
+            card = num % 110 + 1
+            yield f"{card},,{'yes' if num % 3 else 'no'}\n"
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    plan = plan_import(iter_entries(lines()), index, user_cards)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    ranges = import_ranges(plan["updates"], user_cards, "F")
+    return {
+        "entries_per_second": plan["entries"] / elapsed,
+        "peak_kib": peak / 1024,
+        "updates": len(plan["updates"]),
+        "ranges": len(ranges),
+    }
+
+
+if __name__ == "__main__":
+    results = benchmark()
+    print(f"entries/s:   {results['entries_per_second']:.0f}")
+    print(f"peak memory: {results['peak_kib']:.0f} KiB")
+    print(f"updates:     {results['updates']} cells "
+          f"in {results['ranges']} ranges")
@@ -0,0 +1,278 @@
+"""This module provides token bucket throttling of login attempts and a
+global limit on concurrent password verifications. The buckets and
+verification slots are kept in files so every run.py process, one for
+each websocket, and the API server share the same limits."""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks on Windows, limits then only apply within a process
+    fcntl = None
+
+# Burst size and refill rate (tokens per second) for each username
+USERNAME_BURST = int(os.environ.get("LOGIN_USERNAME_BURST", 5))
+USERNAME_RATE = float(os.environ.get("LOGIN_USERNAME_RATE", 1 / 30))
+
+# Burst size and refill rate (tokens per second) for each connection
+CONNECTION_BURST = int(os.environ.get("LOGIN_CONNECTION_BURST", 10))
+CONNECTION_RATE = float(os.environ.get("LOGIN_CONNECTION_RATE", 1 / 10))
+
+# Max password verifications running at once and how long to queue for one
+MAX_CONCURRENT_VERIFICATIONS = int(
+    os.environ.get("LOGIN_MAX_VERIFICATIONS", os.cpu_count() or 1))
+VERIFICATION_TIMEOUT = float(os.environ.get("LOGIN_VERIFICATION_TIMEOUT", 2))
+
+# Idle buckets are dropped once the store grows past this many entries
+MAX_STORED_BUCKETS = 10000
+
+# Directory shared by every process holding the buckets and slot locks,
+# and how often to check for a free slot while queuing
+STATE_DIR = os.environ.get("LOGIN_THROTTLE_DIR", ".login_throttle")
+SLOT_POLL_INTERVAL = 0.05
+
+
+class TokenBucket:
+    """
+    A class representing a token bucket rate limiter.
+
+    Attributes:
+        capacity (int): Max number of tokens (burst size)
+        rate (float): Tokens added per second
+        tokens (float): Tokens currently available
+        updated (float): Time tokens were last refilled
+    """
+
+    def __init__(self, capacity, rate, clock=time.monotonic):
+        """
+        Initialise a full instance of the TokenBucket class.
+
+        Parameters:
+            capacity (int): Max number of tokens (burst size)
+            rate (float): Tokens added per second
+            clock (function): Returns the current time, wall clock time
+                for buckets shared between processes
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+
+    def refill(self):
+        """
+        Adds the tokens earned since the last refill
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        now = self.clock()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self):
+        """
+        Returns how long until a token is available
+
+        Parameters:
+            None
+        Returns:
+            seconds (float): 0 if a token is available now
+        """
+        self.refill()
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def is_idle(self):
+        """
+        Checks if the bucket is full, meaning it can be dropped safely
+
+        Parameters:
+            None
+        Returns:
+            bool: True if the bucket is full
+        """
+        self.refill()
+        return self.tokens >= self.capacity
+
+
+class LoginThrottle:
+    """
+    A class that throttles logins per username and per connection using
+    token buckets, and limits concurrent password verifications.
+
+    The buckets are stored in a JSON file and the verification slots are
+    lock files, both in a directory shared by every process, so the
+    limits hold across reconnects. Connections are told apart by the id
+    passed to attempt, the bridge passes the clients address. Without
+    file locks, on Windows, everything is kept in memory and only limits
+    the current process.
+    """
+
+    def __init__(self, state_dir=STATE_DIR):
+        """
+        Initialise an instance of the LoginThrottle class.
+
+        Parameters:
+            state_dir (string): Directory holding the shared state
+        """
+        self._state_dir = state_dir
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._verifications = threading.BoundedSemaphore(
+            MAX_CONCURRENT_VERIFICATIONS)
+        self._shared = fcntl is not None
+        if self._shared:
+            try:
+                os.makedirs(state_dir, exist_ok=True)
+            except OSError:
+                self._shared = False
+
+    def attempt(self, username, connection_id=None):
+        """
+        Takes a token for a login attempt from both the username and
+        connection buckets, only if both have one available
+
+        Parameters:
+            username (string): Username the attempt is for
+            connection_id (string or None): Connection the attempt came
+                from, None when connections cannot be told apart so only
+                the username is limited
+        Returns:
+            wait (float): 0 if the attempt is allowed, otherwise
+                seconds until the user can try again
+        """
+        with self._lock, self._bucket_store() as store:
+            buckets = [self._get_bucket(store, f"username:{username}",
+                                        USERNAME_BURST, USERNAME_RATE)]
+            if connection_id is not None:
+                buckets.append(self._get_bucket(
+                    store, f"connection:{connection_id}",
+                    CONNECTION_BURST, CONNECTION_RATE))
+            wait = max(bucket.wait_time() for bucket in buckets)
+            if wait == 0:
+                for bucket in buckets:
+                    bucket.tokens -= 1
+            return wait
+
+    @contextmanager
+    def verification_slot(self, timeout=VERIFICATION_TIMEOUT):
+        """
+        Waits for a free verification slot, giving up after the timeout
+        so users see a busy message rather than an unbounded wait
+
+        Parameters:
+            timeout (float): Seconds to wait for a free slot
+        Returns:
+            acquired (bool): True if a slot was acquired
+        """
+        if not self._shared:
+            acquired = self._verifications.acquire(timeout=timeout)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    self._verifications.release()
+            return
+
+        deadline = time.monotonic() + timeout
+        slot = self._take_slot()
+        while slot is None and time.monotonic() < deadline:
+            time.sleep(SLOT_POLL_INTERVAL)
+            slot = self._take_slot()
+        try:
+            yield slot is not None
+        finally:
+            if slot is not None:
+                # Closing the file releases its lock
+                slot.close()
+
+    def _take_slot(self):
+        """
+        Locks the first free slot file, a slot held by a process that
+        exits is freed by the system
+
+        Parameters:
+            None
+        Returns:
+            slot (file or None): Locked slot file, None if all are taken
+        """
+        for number in range(MAX_CONCURRENT_VERIFICATIONS):
+            slot = open(os.path.join(self._state_dir, f"slot{number}.lock"),
+                        "a")
+            try:
+                fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                slot.close()
+                continue
+            return slot
+        return None
+
+    @contextmanager
+    def _bucket_store(self):
+        """
+        Yields the stored buckets by key, locking the shared file while
+        they are used and saving them afterwards
+
+        Parameters:
+            None
+        Yields:
+            store (dict): Token buckets by key
+        """
+        if not self._shared:
+            yield self._buckets
+            return
+
+        path = os.path.join(self._state_dir, "buckets.json")
+        with open(os.path.join(self._state_dir, "buckets.lock"),
+                  "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            store = {}
+            try:
+                with open(path, encoding="utf-8") as file:
+                    saved = json.load(file)
+            except (OSError, ValueError):
+                # Missing or damaged, start with full buckets
+                saved = {}
+            for key, (capacity, rate, tokens, updated) in saved.items():
+                bucket = TokenBucket(capacity, rate, time.time)
+                bucket.tokens = tokens
+                bucket.updated = updated
+                store[key] = bucket
+
+            yield store
+
+            temp_path = f"{path}.{os.getpid()}"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({key: [bucket.capacity, bucket.rate,
+                                 bucket.tokens, bucket.updated]
+                           for key, bucket in store.items()}, file)
+            os.replace(temp_path, path)
+
+    def _get_bucket(self, store, key, capacity, rate):
+        """
+        Returns the bucket for a key, creating it and pruning idle
+        buckets if the store is full
+        """
+        bucket = store.get(key)
+        if bucket:
+            return bucket
+
+        if len(store) >= MAX_STORED_BUCKETS:
+            for idle_key in [stored_key
+                             for stored_key, stored_bucket in store.items()
+                             if stored_bucket.is_idle()]:
+                del store[idle_key]
+
+        bucket = TokenBucket(capacity, rate,
+                             time.time if self._shared else time.monotonic)
+        store[key] = bucket
+        return bucket
@@ -0,0 +1,182 @@
+"""This module provides bcrypt password hashing on a bounded worker pool,
+with the cost factor calibrated to a target latency on the host"""
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+# Maximum number of hashes computed at the same time
+MAX_WORKERS = int(os.environ.get("BCRYPT_MAX_WORKERS", os.cpu_count() or 1))
+
+# Time a single hash should take on this host
+TARGET_MS = int(os.environ.get("BCRYPT_TARGET_MS", 250))
+
+# Calibrated cost is saved per host so each session does not recalibrate
+COST_FILE = os.environ.get("BCRYPT_COST_FILE", ".bcrypt_cost.json")
+
+# Range the calibrated cost is kept within, the minimum is the fixed cost
+# used before calibration so calibrating only ever makes hashes stronger
+MIN_COST = 12
+MAX_COST = 16
+
+# bcrypt releases the GIL while hashing, so threads give real parallelism
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                               thread_name_prefix="bcrypt")
+_cost = None
+_cost_lock = threading.Lock()
+
+
+def calibrate_cost(target_ms=TARGET_MS):
+    """
+    Finds the highest cost factor whose hash time stays within the target
+
+    Parameters:
+        target_ms (int): Time in milliseconds a hash should take
+    Returns:
+        cost (int): Cost factor to use on this host
+    """
+    # Each extra round doubles the work, so time a cheap hash and scale up
+    rounds = 8
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=rounds))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    cost = rounds
+    while cost < MAX_COST and elapsed_ms * 2 <= target_ms:
+        cost += 1
+        elapsed_ms *= 2
+
+    return max(cost, MIN_COST)
+
+
+def get_cost():
+    """
+    Returns the cost factor for new hashes, calibrating it on first use
+    BCRYPT_COST overrides calibration when set
+
+    Parameters:
+        None
+    Returns:
+        cost (int): Cost factor to use for new hashes
+    """
+    global _cost
+
+    with _cost_lock:
+        if _cost:
+            return _cost
+
+        if os.environ.get("BCRYPT_COST"):
+            _cost = int(os.environ["BCRYPT_COST"])
+            return _cost
+
+        host = socket.gethostname()
+        try:
+            with open(COST_FILE, encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            saved = {}
+
+        saved_cost = saved.get(host, {})
+        if saved_cost.get("target_ms") == TARGET_MS:
+            # Costs saved before the minimum was raised are raised too
+            _cost = max(saved_cost["cost"], MIN_COST)
+            return _cost
+
+        _cost = calibrate_cost()
+        saved[host] = {"cost": _cost, "target_ms": TARGET_MS}
+        try:
+            with open(COST_FILE, "w", encoding="utf-8") as file:
+                json.dump(saved, file)
+        except OSError:
+            pass
+        return _cost
+
+
+def hash_password(password):
+    """
+    Hashes given password using a generated salt on the worker pool
+
+    Parameters:
+        password (string): Password to be hashed
+    Returns:
+        hashed_pass (string): String representing the hashed password
+    """
+    salt = bcrypt.gensalt(rounds=get_cost())
+    hashed_pass = _executor.submit(
+        bcrypt.hashpw, password.encode(), salt).result()
+
+    # Returned as strings for storage in gsheets
+    return str(hashed_pass)
+
+
+def check_password(password, stored_hashed_pass):
+    """
+    Checks a password against a stored hash on the worker pool
+
+    Parameters:
+        password (string): Password entered by the user
+        stored_hashed_pass (bytes): Hash read from gsheets
+    Returns:
+        bool: True if the password matches
+    """
+    return _executor.submit(
+        bcrypt.checkpw, password.encode(), stored_hashed_pass).result()
+
+
+def needs_rehash(stored_hashed_pass):
+    """
+    Checks if a stored hash was made with a lower cost than we now use
+
+    Parameters:
+        stored_hashed_pass (bytes): Hash read from gsheets
+    Returns:
+        bool: True if the hash should be upgraded
+    """
+    # Hashes are stored as $2b$<cost>$<salt and hash>
+    try:
+        stored_cost = int(stored_hashed_pass.split(b"$")[2])
+    except (IndexError, ValueError):
+        return False
+    return stored_cost < get_cost()
+
+
+def benchmark(seconds=5):
+    """
+    Measures password checks per second using every worker in the pool
+
+    Parameters:
+        seconds (int): How long to run the benchmark for
+    Returns:
+        results (dict): Cost, workers, logins per second and per core
+    """
+    stored_hashed_pass = bcrypt.hashpw(
+        b"benchmark", bcrypt.gensalt(rounds=get_cost()))
+
+    logins = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        futures = [_executor.submit(bcrypt.checkpw, b"benchmark",
+                                    stored_hashed_pass)
+                   for _ in range(MAX_WORKERS)]
+        logins += sum(1 for future in futures if future.result())
+    elapsed = time.perf_counter() - start
+
+    cores = min(MAX_WORKERS, os.cpu_count() or 1)
+    return {
+        "cost": get_cost(),
+        "workers": MAX_WORKERS,
+        "logins_per_second": round(logins / elapsed, 2),
+        "logins_per_second_per_core": round(logins / elapsed / cores, 2),
+    }
+
+
+if __name__ == "__main__":
+    results = benchmark()
+    print(f"Cost {results['cost']}, {results['workers']} workers: "
+          f"{results['logins_per_second']} logins/s, "
+          f"{results['logins_per_second_per_core']} logins/s per core")
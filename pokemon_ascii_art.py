@@ -1,2434 +1,14 @@
-"""This module provides the ability to print pokemon ascii art """
-
-pokemon_art = {
-        "pikachu_banner": r"""
-                    ⠈⢿⣿⣷⡖⠦⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⣶⣭⣿⠀⠀⠀⠀
-                    ⠀⠀⢻⣿⡇⠀⠠⡑⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⠒⠉⢸⣿⣿⠏⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠙⣷⡀⠀⠀⠑⢌⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⣪⠔⠁⠀⠠⣼⡿⠋⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠈⠣⡄⠀⠀⠀⠱⡈⢢⠀⠀⠀⠀⢀⣀⣀⣀⣀⡀⠀⠀⠀⢀⠔⠁⠈⠀⠀⠀⠀⣰⠟⠀⠀⠀⠀⢀⣠⡤⠤
-                    ⠀⠀⠀⠀⠀⠀⠈⠒⢄⠀⠀⠀⠀⠱⠔⠂⠉⠁⠀⠀⠀⠀⠈⠉⠐⠶⠁⠀⠀⠀⠀⣀⠴⠊⠀⣀⠠⠔⠒⠉⣁⡠⠂⡇
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⡢⢤⠖⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⢤⠔⢊⡡⠔⢒⡉⠄⠒⠀⠉⠉⠀⠀⢠⠇
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⣤⡤⢤⠀⠀⠀⠀⠀⠀⠀⠀⡤⠤⣄⠀⠀⢿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡇⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⢺⣿⣧⣼⠂⠀⠀⠀⠀⠀⠀⠘⣷⣴⣿⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡴⠿⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣏⣄⡈⠙⠛⠁⠀⠀⠀⠈⠁⠀⠀⠀⠈⠉⠁⠀⢀⡘⡆⠀⠀⡤⠄⠒⠒⠉⠁⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣿⣟⣿⣦⠀⠀⠐⠢⠤⠒⠑⠢⠤⠂⠀⠀⢠⣾⣿⣿⡇⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⣿⣿⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⣿⣿⡽⢇⠀⠀⠀⠀⠱⣄⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠣⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡨⢽⠁⣀⠽⠂⠀⢀⣀⡬⠗⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡞⠀⠀⠉⠲⠄⠀⠀⠀⠀⠀⠀⢀⡤⠒⠋⠀⠀⡏⠀⢠⠤⠒⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢐⠄⠀⠀⠀⠀⠀⠸⡄⠀⣳⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⢀⠞⠀⠀⠀⠀⠀⠀⠀⠀⢳⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⠘⡍⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⡶⣏⢏⠳⢄⠀⠘⡆⠀⠀⠀⠀⠀⠀⠀⡇⠀⣾⠀⠀⠀⠀⠀⠀⡸⠀⠀⠀⡇⠔⣖⡄⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠑⣗⡏ ⠀⣁⠀⠸⡄⠀⠀⠀⠀⠀⠀⡇⠀⣇⠀⠀⠀⠀⠀⡰⠁⠀⠠⣊⠀⣸⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠈⠢⡀⠀⠑⣄⡘⢄⠀⠀⠀⠀⢸⠀⢀⣹⠀⠀⠀⠀⡰⠁⠀⡠⠊⢀⡶⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                    ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⣀⡨⠧⠬⢷⣀⣀⡤⠞⠉⠉⠹⢄⣀⣀⠾⢄⣰⣀⣠⠔⠋⠀
-        """,
-        # alakazam
-        "1": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢖⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡆⠙⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡀⠀⠳⣄⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠔⠊⣡⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡤⣄⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠈⢓⡤⠤⠤⣤⡤⠔⠊⠁⠀⢀⠞⠁⠀⠀⠀⠀⠀⠀⠀⣀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢰⣟⠂⠁⠑⠠⢄⡀⠀⠀⠀⠀⠀⠀⡇⢠⠎⠁⠀⠀⠀⠀⠀⠀⠀⢀⡔⠁⠀⠀⠀⠀⠀⠀⣀⡠⠊⠛⠦⢤⣤⠀
-                ⠀⠀⠀⠀⣾⡯⠀⠀⠀⠀⠀⠀⠈⠓⢶⠒⠈⡡⠔⠃⡤⡀⠀⠀⠀⠀⠀⡀⠀⢠⠋⠀⠀⠀⠀⢀⡠⠒⠉⠀⠀⠀⢀⣴⠟⠀⠀
-                ⠀⠀⠀⠰⢭⣄⠤⠤⠤⠤⠄⣀⡀⠀⠀⠹⡵⢕⠤⣀⢳⡙⠂⠀⢀⡠⡎⠀⠀⠀⢳⡒⠓⡲⠚⠁⠀⠀⠀⠀⠀⠠⣾⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⠤⠤⣀⣀⣀⣀⣀⣹⣖⢤⡘⢌⡆⠈⢣⠙⠆⢰⠛⠂⣁⠤⠤⠄⢐⡧⠊⠀⣀⠤⣤⠀⠀⠤⣰⠒⠋⠀⠀⠀⠀
-                ⣀⡄⣴⢋⢈⢓⠩⢝⠒⠒⢆⠀⠀⢸⠤⠒⠿⠶⠽⡒⠚⡿⠀⣇⡤⠊⠸⠤⠴⣚⡡⣤⠖⡟⠡⢀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣧⣈⡻⠂⢸⠅⢀⡎⠀⢀⠏⣦⠶⠿⠤⢀⠀⠀⠀⠹⣄⡙⠼⠔⠉⠉⠉⡙⢭⣰⣮⣄⣈⠗⠒⠛⢶⠴⣤⠤⠤⣀⢀⡀⠀⠀⠀
-                ⠈⠁⢇⣀⢼⠉⢻⠀⠀⣼⣅⠀⠀⠀⠀⠀⢱⡄⠀⢀⣸⡉⠁⠒⠒⠀⢘⡖⡩⠔⠒⠒⠛⠤⡀⢠⡗⠠⠀⡏⠉⣥⠄⠘⡄⠀⠀
-                ⠀⠀⠀⠉⠉⠀⠀⠛⠱⠏⠘⢝⣢⣤⣠⠤⠚⠁⢀⠾⡄⠉⠒⠒⠒⠒⣛⣆⣇⠀⠀⠀⠀⠀⣈⠵⢷⠀⠀⣶⣶⢾⠀⠀⣏⣹⠇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠚⠉⢻⠀⠒⠋⠁⠀⢳⠀⠀⢀⠔⠉⠀⡰⠐⢉⡐⠒⠲⣏⠀⣠⠿⣅⣨⠗⠊⠻⠭⠖⠁⠁⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠓⢀⡀⠀⠣⡐⠊⠉⠉⠸⣄⠀⣾⣤⠒⠉⢧⡔⡁⠀⠉⠚⢹⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢎⠑⠉⠈⢳⡴⠃⠀⠀⠀⠀⠀⠙⠉⠁⠀⠀⠀⢧⠀⡐⡭⢝⡆⠹⣄⡠⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⡠⠾⡍⠒⠂⢒⡡⢄⠀⠀⠀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡆⢃⢇⡽⣈⡉⠁⠀⣞⠉⣇⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠘⠁⠶⣅⡐⢤⢗⣢⢀⠱⠄⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠁⠸⡀⠀⠀⠀⠀⠀⣰⠋⠉⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠉⣎⠚⠁⠀⢱⠁⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡀⠀⢡⠀⠀⠀⠀⣸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠘⣇⠀⠀⠀⡇⢰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⡄⢸⠀⠀⠀⡰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢤⠠⣤⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⣈⠤⣤⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠢⡼⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # blastoise
-        "2": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⠠⠤⠤⠒⠚⠻⠆⢉⢲⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⢿⣶⠄⠀⢰⣶⣖⠶⠜⠘⢋⠉⠉⠳⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡼⠃⠀⠀⠈⡁⠀⠀⠀⠀⢈⡩⠮⢍⠇⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠇⠀⠀⠰⠚⠢⠤⠤⠄⠒⠁⠀⠀⡸⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣠⠄⠀⢄⠀⠀⠀⠀⠀⠀⠀⣀⡠⠤⠐⠚⠛⠓⠒⠩⠭⣑⠢⣄⠀⠀⠀⠀⢀⡴⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢸⡁⠀⠀⠀⠳⣠⠶⢢⡤⣒⣉⣀⣀⡀⠀⠀⣀⡠⠤⠓⣒⠉⡏⡳⣗⢦⣤⠖⢋⣀⡀⠤⢤⡀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠱⡀⠀⡴⠊⢀⠴⠋⠁⠀⠀⠀⢀⡔⢹⠉⢀⠀⠀⢴⠂⢸⢀⡷⢌⡣⡝⠉⠁⠀⠀⠀⣾⣽⡄⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣻⠎⢀⡴⢁⠄⠀⠀⠀⠀⠂⠉⠀⡇⠊⠉⠠⠔⠁⠀⡇⠸⠀⠀⠈⢇⠀⠀⠀⠀⠀⠘⣇⡇⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢰⠃⣠⠋⢠⠃⢠⠂⠁⠀⠀⠀⠀⠈⢆⠀⠀⠀⠀⠀⢰⠁⡇⠘⣄⡔⠉⢢⠤⠤⠤⡶⣶⡉⠀⠀⠀⠀⠀
-                ⠀⠀⠀⡰⠹⡴⠁⠀⠁⠐⠁⠀⠀⠀⠀⠀⠀⠀⠈⢆⣀⠀⠀⠀⠸⡈⢿⠋⠀⠀⢀⠇⠀⠀⠀⡇⠀⠱⣄⠀⠀⠀⠀
-                ⠀⠀⠸⡇⢸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠁⠈⠉⠒⢤⡀⢣⠘⡇⠀⠀⢸⠀⠀⠀⡼⠀⠀⠀⢸⠑⡄⠀⠀
-                ⠀⠀⠸⢾⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠁⠀⠀⠀⠀⠀⠀⠬⡢⣇⢹⡄⠀⢸⢀⡠⠊⠀⠀⠀⠀⡸⠀⢸⡆⠀
-                ⠀⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡼⠁⢰⠀⢸⠥⣀⣀⠀⢀⣠⠔⠁⣠⢾⡼⠆
-                ⠀⠀⢀⠟⡦⠤⠄⠀⠠⠤⠤⢴⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⠀⠀⢀⣧⡇⠀⡏⠀⠀⠈⠉⠙⠛⠊⠙⠃⠀
-                ⠀⢀⣼⡸⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠴⠋⠀⠀⠀⡜⠀⢻⡼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⡜⠘⡇⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⣠⠖⠁⠀⠀⠀⢀⠴⢏⠒⢼⡃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣸⠀⠀⣇⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⢀⠞⠁⠀⠀⠀⢠⠔⠁⠀⠀⢣⠀⠘⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢸⠃⠀⡟⣄⣀⠤⠤⠤⣀⠀⠀⠀⢣⠀⢀⡠⠔⠁⠀⠀⠀⠀⡔⠁⠀⠀⠀⠀⠀⢣⠀⠈⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢼⠆⠀⢇⠈⢀⡀⢀⣀⠀⠉⠒⠐⠚⠉⠁⠀⠀⠀⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⠀⠸⡄⠀⡏⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠸⣀⣀⣨⠞⠁⠀⠀⠀⠉⠐⢦⡀⢀⣀⠤⠤⠠⠤⠄⡞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡔⠁⡴⠁⠀⠀⠀⠀⠀⠀⠀⢠⠋⠁⠀⢀⣀⡠⡤⠔⢳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣧⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢉⠟⠀⠀⠀⠀⠀⠀⠀⢀⡴⠋⠉⠉⠉⠀⠁⠀⠀⠀⠀⢡⡠⢄⣀⠀⠀⠀⠀⠀⣸⢝⡢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢎⣀⣀⣀⣀⡀⢤⠔⠎⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣼⣁⣀⣀⡠⠵⠤⠤⠄⠒⠓⠦⠬⠞⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # chansey
-        "3": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡀⠤⠤⠤⠤⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⠒⠉⠀⠀⠀⠀⠀⠀⠀⠈⠑⠢⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣾⠒⠢⠤⣀⣀⣀⣠⣄⡀⡴⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡤⠤⢤⣄⣿⣄⣀⣀⣀⣀⡠⠤⠒⠈⠀⠀⠀⣴⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠀⠀⠀⠹⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢷⠀⠀⠀⠀⠀⠀⣀⣀⠠⠄⠚⠀⠀⠀⠀⠀⢃⠀⠀⠀⠀⠸⠇⠀⠀⠀⠀⠀⠈⢆⠀⠰⣄⠘⠦⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⡗⠉⠉⠉⠉⠀⠀⠀⢀⡤⠊⠀⠀⠀⠀⠀⠈⣑⢒⠒⠒⠁⠀⠀⠀⠀⠀⠀⢀⠀⠣⡀⠈⠑⢄⡀⠀⠈⠉⠀⠀⠒⠒⠒⢢
-                ⠀⠈⠲⠦⠤⢤⡤⣶⠏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢆⠀⠈⠢⣄⠀⠉⠒⢄⣀⠀⠀⣀⣀⡤⠞
-                ⠀⠀⠀⠀⠀⠀⢀⡏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢦⠀⠀⠈⠑⢄⡀⠀⠀⠉⠒⠋⠭⠄⣀
-                ⠀⠀⠀⠀⠀⠀⡾⠀⠀⠀⠀⠀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢄⡀⠀⠀⠈⠲⢄⡀⠀⠀⠀⣀⡼
-                ⠀⠀⠀⠀⠀⢰⠇⠀⠠⠀⡀⠀⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⡤⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠲⠤⣀⠀⠀⠉⣿⠉⠁⠈⠀
-                ⠀⠀⠀⠀⠀⣾⠀⠀⠀⢳⠱⡀⠀⣇⠤⠐⠒⠠⢄⡀⢀⠔⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⢹⡏⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣿⠀⠀⠀⠀⠑⢦⠤⠇⠀⠀⠀⠀⠀⠙⡎⠀⠀⠀⣀⠴⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡃⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢹⠀⠀⠀⠀⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠉⢣⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠘⡇⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡟⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠙⡄⠀⢸⢎⡢⣀⠀⠀⠀⠀⠀⠀⠀⠀⣠⢷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠛⠃⠉⠉⣽⠇⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠸⢄⠈⡆⠈⠀⠉⠑⠒⠒⠒⠒⠒⠉⠀⡸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠁⠀⣀⡴⠛⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠘⠦⡸⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣎⡤⠖⠋⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⡰⠮⠦⣑⢄⡀⠀⠀⠀⠀⡠⠔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠴⣾⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⡜⠋⠀⠀⠀⠀⠉⣺⠭⣕⣈⠉⠀⠀⠀⠀⠀⠀⠀⢀⣀⡠⠤⡖⠋⠀⠀⠈⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠓⠒⠀⠀⠖⠖⠉⠉⠀⠀⠁⠉⠉⠉⠁⠀⠀⠉⠉⠁⠀⠀⠀⠙⢆⠀⠀⠀⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠦⠄⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # charizard
-        "4": r"""⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢄⠀⢸⣨⣭⣤⣈⠙⠿⣳⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⡠⠤⠤⠄⠰⣩⠊⠀⠀⢇⢄⠁⠀⠉⠑⢎⢀⣉⠢⢄⡀⠀⠀⠀⠀⠀⠀⢔⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⢤⡪⠴⠒⠊⡹⣢⢡⠀⠀⠀⠈⠑⠫⠤⣀⡀⠀⠈⣧⠉⠒⠁⠀⠀⠀⠀⠀⠀⠈⡦⢳⢄⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⡔⡪⠛⠁⠀⠀⠀⠀⡇⠏⡎⡆⠀⠀⠀⠀⠀⠀⠘⡼⡀⠀⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀⣜⠞⣿⠉⠪⡱⡀⠀⠀⠀⠀
-                ⠀⠀⡜⡜⠀⠀⠀⠀⠀⠀⠀⡸⡆⠸⡸⡄⠀⠀⠀⠀⠀⠀⠇⠃⠀⠀⡇⠀⠀⠀⠀⠀⠀⢀⢾⢇⢀⠇⢰⠀⠘⠾⡦⡀⠀⠀
-                ⢀⣜⠎⠀⠀⢀⣀⣀⠀⠀⠀⢻⠀⠀⠑⢪⣵⣢⢄⡀⠀⠀⠀⠀⢣⠀⢰⠀⠀⠀⠀⢀⡠⢮⠏⡎⢸⠀⠈⡄⠀⠀⠈⠺⣵⠀
-                ⡜⣾⢀⡤⠊⠁⠀⠀⠙⢆⠀⣧⠀⠀⠀⢫⢻⢃⣛⣮⣒⢢⡄⠀⠀⢣⠈⡦⠒⣒⣮⣷⢮⣷⡸⠀⢸⠀⠀⠇⠀⠀⠀⠀⢱⡇
-                ⡇⣯⠎⠀⠀⠀⠀⠀⠀⠀⢣⠾⡴⠒⠋⣑⠖⠋⠛⠛⠁⠙⡦⠀⠀⠀⠁⠉⠒⠯⠿⠧⢼⡧⣁⠀⢸⠀⡰⠋⣲⢤⡀⠀⡀⣿
-                ⢱⡏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠚⢀⠠⠜⢡⠞⠉⢹⡵⢄⠖⣐⠤⠄⠀⠤⣀⢠⣶⠒⠑⢄⠑⢄⣣⣇⠞⠀⠀⡇⡜⢫⠢⣁⣿
-                ⠀⠛⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⣽⠆⣠⡈⡆⢀⠜⠁⢠⠊⠁⠀⠀⠀⠀⠈⠫⣧⠀⠀⡔⢁⠀⣎⡛⡄⠀⣠⡟⣧⡜⡆⢿⡇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠛⠙⠻⢃⠎⠀⢰⠁⠀⠀⠀⠀⠀⠀⠀⠀⠹⡄⠀⠑⠟⠷⠝⠉⠀⢀⣿⣆⠟⡿⣧⢸⡿
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠠⠤⠤⣀⣠⠎⠁⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡷⣀⠀⠀⠀⠀⠀⠀⠀⡯⠙⠄⢘⣭⡏⠁
-                ⠀⠀⠀⠀⠀⠀⢀⠔⠉⠤⠦⠤⠤⡲⠁⡄⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠇⠉⠳⡀⠀⠀⠀⠀⠀⠣⣤⣿⠞⠉⠀⠀
-                ⠀⠀⠀⠀⠀⢠⠊⠀⠀⠀⠀⠀⢰⢁⠠⠃⢀⠔⢁⠇⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⠀⠀⠈⣦⠀⣀⡠⢤⣾⠟⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠼⣀⣀⣀⣀⣀⠤⡆⠘⠀⠰⢁⠴⣁⣀⠀⠀⠀⠀⢀⣀⠤⢶⣥⣀⠠⡀⠰⠤⢾⠤⢐⡪⠕⠁⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠑⠦⣀⣀⣀⣠⢣⡀⠀⣠⡧⠤⠤⠐⠒⠒⠊⠉⠉⠒⠒⠀⠤⠤⡇⠠⢤⠤⡺⡉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡗⣣⢟⣴⢣⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠒⠣⢿⠭⣾⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # clefairy
-        "5": r"""
-                ⠀⠀⠀⠀⢰⡒⠒⠒⠤⢄⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣿⣧⠀⠀⠀⠀⡰⠋⠒⠤⣀⠀⠀⠀⠀⣀⡤⠐⠚⠒⠓⠢⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣻⣿⣆⠀⢠⠞⠀⠀⠀⠀⠈⠑⠢⣠⠊⠁⠀⠀⠀⠀⠀⠀⠀⠈⠢⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢻⣿⣿⣰⠃⠀⠀⠀⠀⠀⠀⢀⢴⠃⠀⠀⠀⠀⢀⣀⣀⠀⠀⠀⠀⠈⣦⠖⠐⠒⠒⠒⠛⠓⢲⠒⠂⠤⠤⢄⣀⠀
-                ⠀⠀⠀⢀⠈⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⠁⢸⠀⠀⠀⠀⠰⠋⠀⠀⠉⢆⠀⠀⠀⠘⠷⡄⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⣠⡾⠀
-                ⠀⠀⢰⡋⠲⣿⣷⠘⡆⠀⠀⠀⠀⠀⠀⠀⠈⣆⠀⠀⠀⠸⠀⠀⠀⠀⢸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢱⠀⢀⣾⣿⠃⠀
-                ⣤⠒⡏⠓⠚⠈⠉⡿⣱⠆⠀⠀⠀⠀⠀⠀⠀⠘⢢⡀⠀⠀⠀⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⣰⣿⣿⠃⠀⠀
-                ⠘⡦⠇⠀⠀⠀⠀⠱⡇⠀⠀⠀⠀⠀⠀⠀⡠⠄⡀⠈⠑⠒⠀⠒⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣼⣿⣿⡃⠀⠀⠀
-                ⠀⢣⠀⠀⠀⠀⠀⠀⠘⣦⠄⠀⠀⠀⠀⢸⠁⢸⡾⠀⠀⠀⠀⠀⠀⢰⡆⠑⡄⠀⠀⠀⠀⠀⠀⠀⢢⣠⣿⠟⣻⠏⠀⠀⠀⠀
-                ⠀⠘⡄⠀⠀⠀⠀⠀⠀⠘⠂⠀⢀⠠⠤⢀⡑⠘⠃⡀⠀⠀⠀⠀⠀⢿⠏⢀⡇⠀⠀⠀⠀⠀⠀⠀⠈⡏⢀⡾⠃⡠⡀⠀⠀⠀
-                ⠀⠀⠳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠐⠒⠒⠁⠀⠀⠉⠉⠁⠲⣶⠆⠀⠀⡥⠤⠤⢄⠀⠀⠀⠀⠀⢀⣳⡿⠤⠚⠀⠱⡤⠠⣶
-                ⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡄⠀⢀⠎⠀⠀⠀⠉⠉⠀⠉⠀⠀⠐⠛⠋⠁⠀⠀⠀⠀⠀⠀⠓⣺⠋
-                ⠀⠀⠀⠈⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣔⣹⡇
-                ⠀⠀⠀⠐⡇⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⠞⠁⠀
-                ⠀⠀⠀⠠⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠔⠊⠙⣇⠀⠀⠀
-                ⠀⠀⠀⠀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⡸⡇⠀⠀⠀⡇⠀⠀⠀
-                ⠀⠀⠀⠀⢹⠀⠀⢠⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢇⠇⠀⠀⠀⡇⠀⠀⠀
-                ⠀⠀⠀⠀⠘⡄⠀⠀⠳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣜⡜⠀⠀⠀⢰⡅⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣧⠀⠀⠀⠈⠢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠋⠀⠀⠀⣠⠓⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⣆⠀⠀⠀⠀⠈⠓⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠁⠀⠀⢀⡴⠃⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠈⠑⢢⡤⢀⣀⣀⣀⣀⣀⡠⠤⠔⠊⠀⠀⠀⠀⠀⡴⠁⢀⣠⠶⠋⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠙⢆⢀⣀⣀⡀⠀⢀⣴⠟⠀⠀⠀⠁⠈⠈⢆⠀⠀⠀⠀⠀⠀⠀⢀⡾⠶⠟⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠧⣀⣀⠬⠓⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠱⢶⣊⣉⣁⣲⠾⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # gyarados
-        "6": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⢁⡇⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⡴⡆⠀⠀⠀⠀⡤⣀⡆⢸⠞⡎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢰⢱⠁⠀⠀⠀⠀⢸⠈⠀⣈⣸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠰⡶⡀⠀⠀⢠⠃⡯⠤⠤⢄⣀⡠⢺⡶⠊⠀⠀⠈⠢⡀⡤⡄⢀⡠⣺⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢠⡘⡜⢦⢖⠏⢸⠀⣀⠤⢔⣢⣝⣇⣀⠀⠀⠀⠀⠀⠈⠚⡕⢩⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠘⡷⣼⣨⠊⡐⠊⣉⡤⠒⠡⣄⣀⠤⡔⢀⣠⡴⢀⡠⠤⢔⠁⢑⣲⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡠⢣⡽⠵⡬⣴⣎⣽⠀⠀⢀⣠⣴⡷⠿⠋⡯⢺⠻⡄⠀⣸⠚⠁⠀⠀⠀⠀⠀⠀⠀⠀⢀⢔⡆⠀⠀⠀
-                ⠘⢺⣭⠖⣒⣚⡄⠀⠀⠰⠟⣕⣁⣀⣀⣀⢮⠁⣀⢼⢮⠀⡇⠀⠀⠀⠀⠀⠀⣶⢀⡰⠁⠘⣲⠀⠀⠀
-                ⠀⠸⣥⣧⠈⣿⣼⢀⠎⡠⢤⣊⠀⠀⣠⠒⠋⠉⠀⠀⡗⠉⡰⠀⠀⠀⠀⠀⢸⠘⠎⠀⠀⡴⡁⠀⠀⠀
-                ⠀⠀⢸⣼⡴⠁⣱⢿⢰⠟⠳⣦⠑⢦⣽⠑⠤⠤⠤⠴⡑⡎⡇⠀⠀⠀⠀⢀⣸⣀⢀⣀⠘⡽⠃⠀⠀⠀
-                ⠀⠀⢀⣿⠁⠀⢀⢻⡏⠀⠀⢱⡇⠀⡞⠀⠀⠀⠀⠀⡇⠓⡅⠀⢀⠔⠊⠉⠙⢦⡀⢈⡹⡀⠀⠀⠀⠀
-                ⠀⠀⢾⠿⣤⣦⢮⠋⠁⠀⠀⢸⡇⠀⡷⡀⠀⠀⠀⢰⢁⢴⠁⢀⣎⣀⠀⡠⢢⠀⡧⠔⢁⢟⢆⠀⡠⣤
-                ⠀⢀⣀⠉⣷⠒⠊⠀⠀⠀⠀⣘⠃⡸⠀⠈⠉⠀⠈⢩⢣⡼⡔⠉⠀⠀⠙⣄⢎⠞⣟⡰⢾⠚⣸⠉⠾⡅
-                ⠀⠸⣧⣴⠏⠀⠀⠀⠀⠀⢠⡟⢀⣇⠀⠀⠀⠀⠀⡜⢀⠟⠒⢄⡤⠊⡇⢸⢎⡜⠈⢲⠒⢻⢽⣀⣻⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡧⣸⡏⠢⠄⣀⠀⢴⢗⢹⣇⣀⡀⠱⡼⡑⢱⠁⠀⠀⢨⠦⠼⣾⡆⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⠀⠀⠀⠀⠀⠸⡈⠊⡇⣠⠇⣀⡷⡱⠃⠀⠀⠀⠈⡦⣠⣷⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢧⠀⠀⠀⠀⠀⡇⡜⣉⠵⠊⣰⠋⠀⠀⠀⠀⠀⣀⣇⣠⡟⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠢⠄⣀⠴⠊⠉⢀⡠⠔⠁⠀⠀⠀⠀⣠⠾⢻⠁⣮⡇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠀⠀⠀⠀⠀⠀⣠⠞⠁⢀⠇⡜⢹⡇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣼⢵⣠⣄⢎⠞⠀⢸⠇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠓⠋⣇⡄⣾⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢱⠇⠀⠀⠀⠀
-        """,
-        # hitmonchan
-        "7": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⡀⢠⠋⠛⣦⠀⠀⠀⠀⠀⠀⠀
-                ⠀⢀⡀⠤⠒⠒⠂⠤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣸⠁⠸⣇⠃⠀⢠⠃⣀⢄⠀⠀⠀⠀⠀
-                ⣤⠋⠀⠀⠀⠀⠀⠀⡞⣧⠀⠀⠀⠀⠀⠀⠀⠀⢠⠊⡿⠀⠀⡏⠀⠀⣼⠞⠁⠈⡆⠀⠀⠀⠀
-                ⡇⠀⠀⠀⠀⠀⢠⡴⠗⠋⡆⠀⠀⠀⠀⠀⠀⠀⢸⠂⠀⠀⠀⠀⠀⠀⠁⠀⢀⣞⣡⠀⠀⠀⠀
-                ⠱⣀⣀⣀⠤⢚⣯⣀⣀⠼⠤⣄⣠⣴⣮⣍⠐⠂⢼⢰⢣⡀⠀⠀⠀⠀⢀⠄⠋⠁⣸⠆⠀⠀⠀
-                ⠀⠀⠉⠛⠟⠓⠚⠗⢍⣀⠀⠀⠨⡉⠉⠛⠷⡄⢸⠸⣸⡇⠀⢀⣠⡤⢲⠀⢀⣼⠃⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠛⠤⣤⣀⣀⢸⠀⠳⣀⣁⡀⠀⠛⣳⠞⠉⠉⠐⢬⠑⠢⡄⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢿⣎⢸⠀⠀⢨⠢⠬⠕⣼⡇⠀⠀⠀⠀⠀⡇⠀⠘⡆
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠻⠳⠣⠔⠁⠠⣀⡀⢱⢧⣀⠀⠀⢀⡀⡕⠖⠋⠁
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⡀⠀⠀⠀⠀⠀⠈⠦⢹⡵⣲⣾⣷⡇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⢒⡒⠙⠿⣿⣷⣶⣄⣀⣴⠏⢻⣼⠀⢘⡃⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⣣⠔⠁⢀⠄⠀⠀⠈⠁⠀⠸⡙⠲⢜⢇⣀⣸⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢆⠀⡰⠃⠀⡧⡎⠁⠠⠀⠄⠈⢶⠋⠀⠀⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢙⡏⢲⣊⠎⠀⠀⢠⠃⢸⠀⣠⠵⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠇⠀⡸⠐⠒⠒⣼⣀⡘⡏⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣄⢰⠃⠀⠀⡸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢢⡿⡀⡄⠸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡀⠀⠀⢷⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⢸⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠠⣇⣀⠀⢸⠸⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠎⠀⠀⠣⠾⡼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠁⠀⠀⠀⠀⠀⢠⡃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⠤⣀⣀⣀⡠⠔⠉⠀⠀⠀⠀
-        """,
-        # machamp
-        "8": r"""
-                        ⠀⠀⠀⠀⠀⡠⠔⡉⠲⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⣠⠖⡉⠰⡀⠙⢦⢀⣱⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢧⠀⠱⡀⢘⡴⢾⠒⢹⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⢴⠒⠒⡢⠄⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠘⡷⢴⣓⢽⠂⡌⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⢸⠀⢸⠀⢸⠀⢱⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢡⠀⠈⠈⠀⠘⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡵⠤⠧⡼⢤⡼⠤⣾⠁⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠘⡄⠐⠀⠀⠀⢸⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠀⠀⠀⠀⠈⠒⠒⣯⠉⢪⠙⠘⡅⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢗⠀⠐⠤⠔⠁⢔⠋⠉⠉⠲⢄⣀⣠⠒⠦⡋⠀⠱⣄⣀⠀⠀⠀⠀⣼⠀⠀⠇⠀⠸⡀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠉⠢⣄⠀⠀⠈⠃⠀⠀⠀⠀⠀⡸⠤⣀⠸⣷⡄⢱⢘⡦⠒⠉⠉⠹⡄⠀⢸⡀⠀⢣⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⡩⠒⠉⠉⠉⠑⠐⠂⠉⡤⢄⢈⠷⡽⣾⢸⣸⢇⠀⣄⠠⠄⠉⠒⠚⠁⢀⡿⠀⠀⠀⠀⠀
-                        ⠀⠀⢀⡠⠒⠋⠉⢁⣠⠤⠤⠤⠄⠐⡅⠀⠀⡇⢳⢝⡚⠿⡇⣾⡿⣀⡀⠀⠀⢀⡠⠴⠞⠛⠉⠀⠀⠀⠀⠀⠀
-                        ⠀⡜⠁⠀⠀⠉⣦⠉⠀⠀⣀⠀⢀⠔⠋⠑⠾⣦⡸⡀⠈⠳⣌⡭⢺⡁⠈⠑⢾⡁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢳⡄⠠⡀⠀⣈⢧⠢⡎⢢⢻⢹⠀⠀⠀⠀⠀⢑⢮⠝⠛⠛⠱⣄⠁⠢⢤⣀⠻⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠈⢞⣆⠨⠖⠿⡝⠴⠡⣫⣮⠈⢆⠀⠀⠀⠀⢸⡄⠀⠀⠀⠀⠬⣥⣀⠀⠈⢠⡀⠉⠉⠐⢤⣄⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠈⣦⡈⣀⣜⣀⡀⠓⢬⠑⢄⢙⡒⠒⢒⡃⠤⣀⣀⡠⠜⣠⠋⠈⠑⡄⠀⠉⠒⢄⠀⠈⠙⢦⡀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠁⣀⣿⢷⣶⣾⣿⢯⢫⣵⣶⡖⠛⠁⠀⠀⠀⠈⠒⠤⢌⡀⠋⠀⠀⡀⡌⣦⡄⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠉⠀⠀⠙⢎⣯⣿⣿⣾⠿⠛⠑⠢⢄⡀⠀⠀⠀⠀⠀⠀⡼⠀⠠⡀⠳⡈⢪⠻⡆
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⣴⠅⠀⠀⠀⠀⡠⢺⣿⣿⣿⠏⠙⠒⠠⣀⠀⠈⠳⣄⠀⠀⠀⠀⠈⠑⠢⠨⠢⣈⣲⣑⡇
-                        ⠀⠀⠀⠀⠀⠀⢀⣼⠁⠀⠀⡠⠤⠊⣠⠛⠛⠛⠙⠤⣀⠀⠀⠀⡷⢄⡀⠸⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡜⠋⠸⢠⠤⢾⣤⠶⠚⠀⠀⠀⠀⠀⠀⠀⡝⠋⠙⠃⠀⣠⠜⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡗⠀⠀⠁⠀⣸⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡆⡄⠀⣾⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡰⠀⠀⢠⠖⠛⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⡀⠀⢀⡈⠢⢄⡀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢀⡠⠖⢁⠀⠢⡰⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⣀⣈⣱⠤⠄⡽⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⣎⣁⣠⢦⡊⢉⣲⠏⠁⠀
-        """,
-        # magneton
-        "9": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡤⢖⡶⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣴⣏⠀⠀⢙⢄⠀⠀⠀⠀⠀⠀⣀⡤⢄⣠⡀⠀⠀⠀⠀⠀⢀⡤⠛⠙⢮⢢⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣀⠔⣹⣤⡀⠈⠻⣦⡚⠁⠀⠳⣄⠀⠀⠀⣞⡉⠉⠧⠏⠙⠳⡀⠀⢀⠴⠋⠳⡄⢀⣴⡷⠛⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢸⡵⠊⠀⠙⣷⣆⠀⠉⢾⢆⠀⠀⠘⣆⠀⠀⠀⢹⣿⢗⣶⡖⠛⢁⡖⠁⠀⠀⣠⣾⠟⠋⠀⣠⣖⡒⢄⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⠢⡤⠊⠀⠑⢿⢄⠼⢃⠇⠀⠀⣸⡤⠓⠉⠉⠓⠿⠿⠳⢤⡞⠀⠀⢀⠞⡏⠁⢀⣴⣾⡋⠁⠈⢢⣧⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠈⠢⡀⠀⠀⠉⠐⠉⠀⠀⡠⠃⠀⠀⠀⠀⠀⠀⠀⠐⡄⠹⡀⠀⠈⠢⣑⡲⠓⠁⠀⠈⣢⡴⠊⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠒⠤⣀⣀⣀⡴⡾⠁⠀⠀⠀⠀⣀⡀⣀⠀⠀⠀⠀⠑⣄⠀⠀⠀⠀⠀⢀⡠⠚⠁⠀⠀⠀⠀⠀⠀
-                ⠀⠀⡴⠑⠒⡠⠤⢀⣀⡀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⢠⠋⠀⠀⠀⠉⢆⠀⠀⠀⣿⠉⠒⠶⠲⠊⢁⣀⠤⠔⠺⡉⠁⢧⠀⠀
-                ⠀⠰⢇⣀⢰⠁⠀⠀⠈⠙⢗⢦⡀⠀⠀⠀⣵⣀⣀⠀⢃⠀⠀⠈⠀⠀⢸⠆⠀⢀⡟⠀⠀⢀⡴⡿⠉⠀⠀⠀⢀⣳⠤⠼⠂⠀
-                ⠀⠀⠀⠈⠈⠙⠒⢄⠀⠀⠘⡄⣧⡠⠤⢴⣋⡾⣬⢳⠈⠢⢄⣀⣀⠔⠃⣠⠒⣺⢤⠤⠆⣸⡀⡇⠀⠀⣴⠊⠁⠀⠀⠀⣀⠀
-                ⢠⠏⠚⠢⠦⣀⣄⡼⠀⠀⡼⠋⠁⠀⠀⠀⠛⠽⠷⢮⣄⣀⠀⠀⠀⢀⣠⢇⢻⡹⡾⠀⠀⢄⠉⠣⡀⠀⠹⠦⠤⠔⠲⡉⠀⢧
-                ⠾⣄⡀⠃⠀⠀⠀⠀⠀⡞⠀⠀⠀⠀⠀⠀⠀⠱⠀⠀⠹⡎⠉⠉⠉⡿⠁⠀⠉⠉⠀⠀⠀⠈⠂⠀⠘⡄⠀⠀⠀⠀⠀⣳⠤⠚
-                ⠀⠀⠈⠑⠒⠶⢤⣤⣺⠀⠔⠂⠲⡄⠀⢠⣶⣒⣢⠀⠀⣇⠀⠀⢠⡇⢀⣤⢤⡀⠀⢀⡠⠤⢄⡀⠀⢸⣶⠶⠶⠛⠉⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⡼⠀⠰⠀⠈⡄⠚⢾⣿⡺⠀⠀⣿⠀⠀⠀⣇⣿⢿⣗⣇⢠⠃⠀⠀⠀⢸⠀⣼⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⣧⡀⠀⠀⡇⠀⠀⠠⡎⠉⣺⡅⠀⠀⡾⡁⢸⠹⡉⠀⢧⠀⠀⠁⣠⠃⣴⣃⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⣼⢿⣥⣊⣀⣀⣀⡇⣗⠒⡏⡇⠀⠀⢿⢇⡠⡇⢧⢀⣀⢉⣒⡩⡴⢿⢋⣶⡿⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣿⣾⡽⡟⠉⠀⠀⠀⢸⡇⡏⠉⣷⡇⠀⠀⠈⡼⡀⢹⡸⡆⠀⠀⠀⠀⠀⠘⠚⠛⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠛⠓⠃⠀⠀⠀⠀⠘⢣⣇⣠⣿⠇⠀⠀⠀⣿⡧⠼⢇⢷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⢸⠀⠀⣿⠀⠀⠀⠀⠈⣧⠤⢼⢸⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⢸⠚⢻⡗⠀⠀⠀⠀⠀⢹⡍⠙⣼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⣿⣀⣸⡇⠀⠀⠀⠀⠀⠐⠷⠴⠻⠀⠀⠀⠀⠀⠀
-        """,
-        # mewtwo
-        "10": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⠉⢲⠀⠀⠀⡄⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡇⠀⠸⡉⠒⠾⡀⢰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⠀⠀⠱⠀⠀⠈⢸⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢨⠀⠀⠀⠰⣄⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡤⠒⠲⡄⠀⠀⠀⠈⣢⣄⠀⠹⣟⢱⡸⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠧⣀⡠⠟⡄⣀⣀⢸⠁⣰⣷⢰⣤⡀⢀⢀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⣀⢟⠆⠀⠉⣢⠬⢟⠛⠢⡌⠛⠽⡋⠻⡅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⣀⣀⣀⠀⠀⡇⠀⢸⣂⡀⠀⠀⢠⣇⠀⣨⡤⡄⠘⡀⠀⢸⢆⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⡔⡉⡤⢄⡀⠙⠢⡈⠉⠉⠀⠈⠋⠘⠁⠀⠉⠁⠑⣌⠀⢇⠀⢸⣘⣠⠏⠲⣤⡀⠀⠀⠀⠀⠀⠀⠀
-                ⢰⡁⣸⠀⠀⠈⢢⡀⠘⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢢⡀⠑⠉⠀⢯⠑⠦⢄⡈⠳⡄⠀⠀⠀⠀⠀
-                ⢸⠃⡿⠀⠀⠀⠈⢣⠀⠈⢳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠇⠀⠀⠀⠈⢆⠀⠀⠙⣆⠈⢦⠀⠀⠀⠀
-                ⠸⡀⢸⠀⠀⠀⠀⠈⢣⠀⠀⠙⣄⠀⠀⠀⠀⠀⠀⣠⠔⠉⠉⠑⡄⡔⠉⠚⢗⢄⠀⠈⣷⠀⠱⣄⠀⠀
-                ⠀⢣⠀⢧⠀⠀⠀⠀⠘⢆⠀⠀⠈⠣⢤⠀⠀⢀⡔⠁⠀⠀⠀⠀⢰⡇⠀⠀⠀⢇⠳⡀⡏⢰⣤⠸⡳⡀
-                ⠀⠈⢆⠀⠳⡀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠉⠑⡞⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⢸⠀⠃⠷⣫⡟⣁⡷⣸
-                ⠀⠀⠈⣆⠀⠈⠒⢤⡀⠀⠘⢆⠀⠀⠀⠀⢠⠁⠀⠀⠀⠀⠀⠀⡌⠀⠀⠀⠀⡜⠀⡤⠀⠀⠉⠈⠉⠁
-                ⠀⠀⠀⠈⢢⠀⠀⠀⠈⠲⡀⠈⠢⡀⠀⠀⠸⠀⠀⠀⠀⠀⢀⡔⠁⠀⠀⢀⠞⠀⣰⠃⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠑⣄⠀⠀⠀⠘⣆⠀⠈⠲⢄⣀⠂⠀⢀⡠⠖⠉⢀⣀⠤⠚⡁⣀⠞⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⠓⢄⣀⣀⡟⠀⠀⠀⢠⠊⠀⡰⠋⠁⠉⠉⠁⠀⢸⠀⢹⡃⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠀⠀⠀⠀⣠⠃⠀⡰⠁⠀⠀⠀⠀⠀⢀⠎⠀⢸⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⢱⢠⣼⠀⠀⠀⠀⠀⠀⢠⠚⠢⡄⠈⠳⣄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠃⠀⠇⡿⡄⠀⠀⠀⠀⠀⠘⠦⠤⠣⢄⠀⠀⠁⠶⠤⡖⢦⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⠯⢶⣣⢴⣓⡷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠂⠤⠤⠰⠓⠉⠀
-        """,
-        # nidoking
-        "11": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⡟⢆⠀⠀⠀⠀⠀⠀⠀⠀⢠⢴⢀⡼⠃⠧⠄⠒⣲⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⠻⣭⠓⢢⡑⢄⡀⡤⣄⠀⠀⠀⣞⠜⢋⣤⣒⠂⠒⢼⡇⠀⢀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠹⡀⢸⠈⢢⢹⣿⡈⠓⠶⠙⡹⡶⠋⠀⠀⢱⠀⢸⢫⠔⢁⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⢣⠀⢣⡿⢡⠀⠀⢠⡿⠀⠀⠀⢀⡜⢀⠞⠃⠀⣾⠀⠀⠀⢀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠠⡖⣆⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⣀⠀⢱⣄⣑⣞⠠⠃⠀⠀⠃⠃⠐⠢⣴⡫⣖⡡⠒⠉⠉⢛⣲⣔⣎⠥⠚⠛⠶⢄⡀⠀⠀⠀⠀⢰⠃⠘⡇⠀
-                ⠀⠀⠀⠀⢀⣀⠨⠽⠖⠤⣄⡀⠀⠀⠀⠀⡀⢀⣴⠀⢀⣀⠤⣖⠃⡠⠀⢠⠋⠀⠀⡇⠀⠀⠀⠀⠀⠈⠢⡀⠀⠀⣾⣁⣀⢱⠀
-                ⠀⢠⠖⠊⠁⠀⠀⠀⠀⠰⣁⢸⡑⢆⠀⠀⣇⡾⠛⢱⣼⣀⡷⠽⡀⠁⠀⠈⢆⣂⡤⠧⡀⠀⠀⣰⡏⢪⠂⣈⢆⢠⣏⣀⡀⠹⡅
-                ⢀⢧⢠⢲⡄⠀⠀⠀⢀⡠⠴⢻⡘⣄⠆⠀⢀⡠⠔⣻⡣⡟⠀⠀⠑⠤⠄⢀⠤⠚⠱⢰⠉⠲⡀⠈⠑⠊⠸⡁⢹⣏⣀⠀⠈⢆⠅
-                ⣜⣼⣘⠜⠁⠀⣠⠎⠁⠀⠀⠀⠑⢾⡙⠚⠻⢦⣶⡿⠟⠀⠀⠀⠀⠀⠀⡜⠀⠰⠀⠘⠒⠒⢛⣄⠀⣀⡠⣜⠂⠀⠀⠑⡄⢸⠃
-                ⠉⠁⠉⢧⡶⠚⠁⠀⠀⠀⠀⠀⠀⠀⠈⢢⣄⣀⠤⠥⠤⣀⣀⣀⣀⡠⠊⠘⣄⣀⣁⡀⠘⣴⠻⠿⣛⠣⠞⠀⠉⠢⡀⠀⢰⠏⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⢤⡞⡇⢠⠔⠈⠁⠒⢄⡀⠀⠀⢀⣰⢋⣀⢀⣋⡐⣯⢣⠀⠈⠱⡀⠀⠀⠀⢡⢀⡞⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠁⠀⠀⠘⡅⠁⠀⠀⠀⠀⠀⠈⠑⠒⠉⡇⡎⠀⠀⠀⠙⣄⢣⡇⠀⠀⢹⠀⠀⠀⡼⠋⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠰⡃⠀⠀⠀⡠⠓⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠁⠀⠀⠀⠀⠘⡕⡗⠀⠀⢸⠀⡠⠊⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠧⣀⣀⡜⠁⠀⠀⠑⠤⣄⣀⠀⠀⠀⠀⣀⢼⡆⠀⠀⠀⠀⢀⠃⠘⡄⣠⡷⠋⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠚⠉⠉⠲⡄⠀⣀⡤⠞⠁⠈⠘⠛⠋⠥⢤⣼⠈⠦⣀⣀⣐⠝⠀⠂⢏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠃⠀⠐⠒⠒⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣇⠀⢀⠔⠒⠒⢤⡀⠀⢈⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠺⢄⠀⠀⠀⢱⠖⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠐⠉⠀⠀
-        """,
-        # ninetales
-        "12": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⢠⡄⠀⠀⠀⠀⠀⠀⣀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠄⠒⠒⠒⠒⠂⠤⡀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠒⠭⠓⠒⠛⢒⠒⠒⠒⠒⣊⠝⠁⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⠴⠮⣀⡀⠀⠀⠢⠀⠀⠢⡈⠢⡀⠀⠀⠀⢀⠞⠁⣶⣄⠀⠀⠀⠀⠀⠐⠲⠶⣉⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⡠⠔⠉⠀⠀⠀⠀⠀⠈⠑⢤⡀⠀⠀⠀⠀⠀⠘⡄⠘⢖⢪⠀⢀⡏⡎⢆⠀⠀⠒⠲⣆⠤⠄⣀⠑⢦⡀⠀
-                ⠀⠀⠀⠀⠀⢠⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⡄⠀⠀⠀⠀⠀⢹⠢⡀⡫⢗⡍⠓⠇⠈⢆⣀⠀⠀⠈⡳⡀⠀⠉⠢⣝⢄
-                ⠀⠀⠀⠀⢀⠇⢀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⣸⠤⠛⠑⢛⠁⠀⠀⠀⠈⠆⠙⢦⠀⠘⡾⠆⠀⠀⠀⠙
-                ⠀⠀⠀⡠⠚⠉⠀⠀⠀⠉⠒⢄⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠐⣧⣤⠔⠒⠁⠀⠀⠀⠀⠀⠘⣄⠀⠱⡀⢈⠀⠀⠀⠀⠀
-                ⠀⢠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⠀⠇⠀⠀⠀⡰⠁⠀⠉⣏⢲⡀⠀⠀⠀⠀⠀⢹⠀⠀⢃⠏⠀⠀⠀⠀⠀
-                ⠀⡇⠀⠀⠀⡀⠀⠀⠀⠀⠀⠀⠀⢱⠀⠀⠀⠀⠀⡸⠀⠀⠀⡰⠁⠀⠀⡰⠹⣼⡇⠀⠀⠀⠀⠀⠈⡆⠀⠈⠀⠀⠀⠀⠀⠀
-                ⠀⡇⠀⠀⠀⡀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⢀⠃⠀⠀⡜⠀⠀⠀⡰⠁⢠⠃⠁⠀⠀⠀⠀⠀⠀⢡⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⢇⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀⢱⠀⠀⠀⡸⠀⠀⡜⠀⠀⢀⠞⠀⢀⡎⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠸⣄⠀⠀⠘⢆⠀⠀⠀⠀⠀⠀⠀⢸⡀⠀⠀⡇⠀⠸⠀⠀⡴⠁⠀⢀⠎⡇⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠘⢢⡀⠀⠈⢦⠀⠀⠀⠀⠀⠀⠀⠇⠀⠀⡇⠀⡇⠀⡜⠀⠀⡠⠃⢠⠣⣷⠀⠀⠀⠀⠀⠀⢰⡎⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢀⡩⠦⠤⠀⠑⠦⠤⢄⣀⠀⠀⠘⡄⠀⢇⠀⡇⠸⠁⢀⡔⠁⠀⢸⠀⠈⢾⡸⠀⠀⣄⡾⡹⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⡔⠊⠐⠈⠁⠀⠀⠀⠀⠀⠀⠀⠉⠒⢤⡙⡄⠘⡄⢇⡇⡰⠋⠀⠠⡄⢸⠀⠀⠈⡇⣠⠾⠋⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡘⠀⠀⠀⠀⠀⠀⠀⣀⠤⠔⠒⠒⠒⠠⠤⢈⣙⠦⣘⢼⠊⠀⠀⠀⠀⢸⠀⡀⠀⢰⠙⡇⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢡⠀⠀⠀⠀⠀⢠⠪⠔⠐⠉⠀⠀⠀⣀⠤⠤⠐⠚⡩⢫⡀⠀⠀⣀⡀⠬⠒⠃⠉⠉⠁⠀⠀⠉⠉⣒⡢⢄⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠣⡀⠀⠀⠀⡇⠀⠀⠀⠀⢀⠔⠉⠀⠀⠀⠀⠀⡇⠀⠀⠉⠉⠀⠀⢀⠤⠀⣀⡤⢰⠒⠒⠖⠒⠊⠤⣀⠉⢢⡀⠀⠀⠀⠀
-                ⠀⠀⠈⠒⠠⠄⢣⠀⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⠘⠢⢄⣀⠀⠀⢀⡠⣶⠉⢰⠓⡅⠀⢸⠀⠀⠀⠀⠀⠑⠢⣱⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠓⢄⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⣓⡢⢇⡀⢸⠀⡇⠀⠘⢄⡀⠀⠀⠀⠀⠀⠘⡇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠊⠣⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢋⠀⠀⠀⠈⠚⢇⠓⠤⠧⠷⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠀⠀⠀⠀⠉⠉⠉⠉⠉⠉⠁⠐⠒⠠⢄⡱⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # poliwrath
-        "13": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣔⢖⡒⣤⠤⠤⠤⠤⢔⠝⣉⡽⢕⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠟⠃⡤⡱⠀⠀⠀⠀⠀⢧⠺⠀⠀⢸⠈⠷⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡤⠋⠦⡀⠵⠁⠀⠃⠀⠈⠀⠀⣉⣒⣊⡁⠀⠀⠀⠑⠢⡀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⢃⠆⢀⠔⠊⠉⣩⡭⢽⣿⣛⠿⢦⣄⡀⠀⠈⠢⡀⠀⠀⠀⠈⠳⣤⠞⢁⡀⠀⣈⡒⣆⠀⠀
-                ⠀⠀⢀⣀⡀⠠⠤⠄⡀⠀⣀⠎⠀⡎⢠⠃⠀⣠⡟⣡⢞⣫⠽⢭⣟⢶⣌⠻⣆⠀⠀⢡⠀⠀⠀⠀⣠⢼⡔⠁⠀⠀⠀⠀⠙⣧⠀
-                ⠀⡴⠋⠀⢸⠀⠀⠀⠘⡷⠯⢀⢸⠀⢸⠀⢠⡟⢸⡇⣾⢱⡾⢶⡌⣧⢹⡆⢹⡆⠀⢸⠀⢀⠀⠘⢠⢻⠂⠀⠀⠀⣀⡀⡀⢸⡆
-                ⢠⡇⠀⠀⠘⢄⠀⠀⢀⣷⠀⠈⢻⠀⠘⡄⠘⣷⠘⣧⠻⢦⣤⡾⣣⡟⢸⡇⣸⠇⢀⡎⠀⠀⣳⣄⠸⡀⠳⡤⠚⠁⠀⠀⠉⢠⠃
-                ⡞⠱⡀⠀⠀⠀⢉⠖⢁⠎⠀⢀⣰⢧⠀⠘⢄⠘⢧⣈⠛⠶⠶⠞⢋⣴⢏⣴⠟⣠⠊⠀⠀⢀⠿⠈⠢⢵⣄⣧⠀⠀⠀⢀⡠⠏⠀
-                ⠘⢄⡈⠐⠒⣨⣧⠴⠯⠔⠒⠉⠁⠀⠣⡀⠀⠑⠢⢍⣛⠒⠒⠛⠋⢁⣈⠯⠊⠀⠀⠀⢀⠞⠀⠀⠀⠀⠈⠉⠉⠀⠈⠉⠀⠀⠀
-                ⠀⠀⠈⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⡆⠀⠀⠀⠀⠈⠉⠉⠉⠁⠀⠀⠀⠀⠀⢰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠃⠀⠀⣀⠴⠋⠀⠒⠒⠒⠒⠢⡀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠃⠀⠀⡴⠁⠀⠀⠀⠀⠀⠀⠀⠀⠘⣆⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠔⠚⠚⠁⠀⠀⠀⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⠀⠀⠀⠘⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢰⡏⠀⠀⠀⠀⠀⢀⣠⡔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⠔⠊⠉⠑⠒⠤⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠒⠒⠂⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠂⠄⣀⠀⠀⠀⠀⢀⡸⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠋⠀⠉⠉⠀⠀⠀⠀⠀
-        """,
-        # raichu
-        "14": r"""
-                        ⠀⠀⠀⢤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢫⣢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠤⡲⡾⠟⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢸⢱⠙⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⡤⠚⣡⠔⠋⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢰⡟⡷⡊⠀⢇⠘⡄⠀⣀⡠⠤⠤⣀⡀⡎⢤⡜⠁⠀⢈⡲⠶⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠁⠀⠙⡄⢸⡠⣛⡉⠀⠀⠀⢀⣤⡌⠑⢾⣀⣀⠴⠋⠀⠶⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠈⣞⡹⠿⠁⠰⠶⠀⢈⠛⡣⠢⡌⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠃⢸⠀⠉⠉⠉⠉⠉⠀⡇⠀⢸⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢧⠜⠀⠀⠀⠀⠀⠀⠀⠈⠑⠁⠈⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢀⡀⠤⡤⠤⠤⠼⠀⣀⠤⠒⠒⠂⠄⡀⠀⠀⠈⠉⢑⡒⢢⠤⣀⠀⠀⠀⠀⠀⡤⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠻⣒⠁⡚⠁⠀⢀⠞⠁⠀⠀⠀⠀⠀⠘⢆⠀⡀⠀⠈⢷⠀⠑⣂⠇⠀⠀⠀⠀⠈⢢⠀⠉⠒⠠⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠈⠑⠒⠤⢄⡌⠀⠀⠀⠀⠀⠀⠀⠀⠈⡄⣨⡭⢵⢭⣩⣭⣤⠄⠀⠒⠒⠒⠒⠀⠵⠀⠀⠀⠀⠈⠑⠢⣄⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢰⠀⠀⠀⠀⠀⠀⠀⠀⠀⠰⡁⡍⢆⠈⠆⢃⠀⠀⠉⠉⠐⠢⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠢⣀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠈⠂⠀⠀⠀⠀⠀⠀⠀⠀⠗⡀⠙⣄⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠈⠑⢤⡀⠀⠀⡏⠒⠒⠤⠄⣀⠀⠈⠳⣄⠀
-                        ⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⡘⡄⠀⠈⣆⣶⠲⣱⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⡀⠘⡄⠀⠀⠀⠀⠈⠁⠒⠬⢳
-                        ⠀⠀⠀⠀⠀⠈⣇⣄⠀⠀⠀⠀⠀⡀⠔⢁⣀⣀⣀⠘⡕⠥⢻⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⣱⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⢮⠋⠢⣉⠉⠂⠉⢁⠴⠋⢻⡇⠀⠀⠀⠑⠄⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⣎⠇⠀⠀⠀⠑⡦⠀⠘⡆⠀⣾⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡿⡄⠀⠀⠀⠀⡇⠀⠀⣇⣾⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠑⢝⠦⢄⣀⣠⠁⢀⣰⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠉⠉⣼⡟⡺⡁⡼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠙⠴⠯⠕⠁⠀⠀⠀⠀
-        """,
-        # venusaur
-        "15": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⣀⣀⡀⠀⠀⠀⠀⣀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣤⣒⣉⣓⣊⣀⢡⣥⣼⢶⠳⣞⢯⢄⠮⡰⣉⡑⠢⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢀⡠⠖⣉⣣⠄⢊⣀⠤⡤⣄⣲⠛⠿⢌⡉⠉⢈⣡⠿⠭⡭⠷⣂⣉⠭⡉⠲⢖⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢠⠛⠰⣯⣶⠿⠋⠁⡔⠉⢀⠇⡠⠒⢢⣤⣽⣾⣥⣄⠉⠉⠀⠀⢔⣢⠉⠚⠧⣉⡤⡀⠳⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢸⡴⢻⡟⠁⠀⠀⠀⠣⠔⠊⠀⣽⢾⣿⡿⣿⣿⡿⣻⡗⢄⠂⠀⡩⠾⡄⠀⠀⠈⠙⢦⢌⡇⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠺⠄⣀⠀⢀⠀⠀⢠⠞⢁⣾⣿⣯⣿⣿⣿⢿⣿⠀⠣⡸⢄⠴⠁⠀⠀⢀⣲⠞⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣀⢀⡀⣠⠬⠽⡢⢤⣯⣍⠑⢣⣰⣄⣤⣭⣀⢆⡘⠓⡹⣷⣀⣰⠤⣔⣊⣁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⡰⠭⠍⠓⢂⣉⣳⣤⡥⠤⠅⠤⠴⣶⣿⠹⠷⠚⠔⡥⠕⠚⣓⣮⠭⠷⠶⢶⣷⡥⣤⢈⣈⡹⠓⠶⠤⡀⠀⠀⠀⠀
-                ⠀⢰⡭⠍⠉⠀⢰⠊⠉⠞⡄⠈⢻⡯⡉⠉⠓⡧⠒⢋⡄⠀⢠⠁⠀⠀⠢⣌⡏⠉⢉⠴⣞⢇⠈⠳⠕⠈⢫⡓⠉⠉⡒⠢⢄⣀
-                ⡎⣉⠄⣠⠎⢠⡏⢀⠆⣼⣀⣰⠏⣷⡨⠶⠀⠑⢟⢁⣤⠆⠉⢀⠐⢦⡢⡔⠁⠐⠡⢴⡽⠼⢆⣈⣦⡘⣄⠱⣄⠣⣌⠳⢖⠊
-                ⠀⠑⠚⠛⠒⢪⠃⠉⢩⡱⠋⢀⠞⠁⢠⡔⠒⢠⠈⠹⣥⠎⢰⡈⣳⠼⢋⡄⠀⢒⡆⠀⠈⢆⠀⠀⢠⠈⡍⠉⢇⠁⠚⠑⠉⠁
-                ⠀⠀⠀⠀⠀⡷⠂⠀⢸⠁⢠⠃⠀⠀⠸⡙⡶⢤⡇⠀⠈⠑⠎⠛⠁⠀⠸⣤⠺⠗⡅⠀⠀⠀⢣⠀⠀⡇⡇⠀⠈⢆⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢰⡀⡄⠀⡌⠀⠘⢄⠈⠦⣀⣉⠒⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣉⣉⣤⠤⠊⢀⠎⠀⠀⢻⠀⠀⢀⢸⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢣⠁⠀⣶⠀⠀⠈⠉⠺⢎⢳⢻⠉⠉⠒⠤⠆⠀⠀⠤⠒⠉⠁⢱⣹⢩⠞⠊⠁⠀⠀⠀⡘⠠⠄⢉⠎⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣷⠢⢭⢆⢠⠀⠀⠀⠈⠪⡻⢧⣄⡀⠀⠀⠀⠀⠀⠀⣠⢶⠗⡡⠃⠀⠀⠀⣠⠄⢀⢇⣀⣴⠋⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⠉⠁⠣⠛⢣⡁⡀⠐⠂⠀⢈⣵⠽⣛⣉⣩⣍⣉⣉⣽⣛⡵⠋⠀⠇⠀⠀⠀⠀⢀⠾⠽⠚⠓⠃⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⣻⣒⢴⡒⣝⡎⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠓⠃⡰⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠀⠈⠓⠋⠀⠁⠀⠀⠀⠀⠀⠀⠀⢀⣋⢇⡠⠚⡄⢠⢶⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠚⠉⠉⠙⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # zapdos
-        "16": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠
-                ⢠⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢶⣄⠀⠀⠀⠀⢸⡇⠀⠀⠀⠀⠀⣠⠗⠀⠀⠀⠀⠀⢀⣴⠂⣀⠀⠀⠀⠀⣀⠤⠔⠂⣩⠖⠁
-                ⠀⠑⠮⡉⠒⠢⢄⣀⠰⢦⣄⡈⢎⠳⣄⠀⠀⠀⡜⡀⠀⠀⡠⢊⠎⠀⠀⠀⠀⣠⢔⣵⣵⠞⣋⠠⠔⠂⠉⠀⢀⡠⠚⠁⠀⠀
-                ⠀⠀⠀⠈⠲⢄⠀⠀⠉⠑⠛⠿⣿⣦⠸⡣⣿⢆⡇⢱⢀⠔⢁⠎⢀⣠⣤⡴⠊⢠⠾⠛⠋⠉⠀⠀⠀⠀⢀⣴⣿⣶⣶⡶⠖⠀
-                ⠀⠀⠀⠀⠳⢶⣷⣤⡀⠀⠀⠀⠀⠈⠁⠘⢄⠀⠱⠀⠋⣠⠎⢉⠴⠟⢓⡲⠞⠁⠀⠀⠀⠀⠀⠀⣠⣾⣿⣿⠿⠉⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⠙⠿⢦⣄⠀⠀⠀⠀⠀⠈⣆⢸⡀⣠⡎⠀⢀⡠⠒⠁⠀⠀⠀⠀⠀⠀⠀⣠⠾⠛⠉⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠛⠩⠍⣁⠀⠀⠈⠓⠀⠀⠀⢠⡞⢤⣞⢞⡟⠀⣀⠀⠘⢆⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⢉⣉⠭⠭⠛⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠁⠒⠢⠤⣀⣀⠀⠐⡻⣰⠛⠉⠢⣧⡉⠐⠊⠧⠀⠀⢀⣀⠤⠄⠒⠊⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡔⠉⠀⡰⣱⣽⡄⠀⠀⠠⢤⣄⡀⠀⠀⠙⢅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⡥⠷⡛⡿⡵⢹⠋⢻⠂⠀⢽⠁⠘⡆⠉⡶⡭⣀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠛⠻⠯⣓⠥⢷⡡⢓⣆⢼⡂⠀⠘⡦⢼⡝⣴⢱⢁⡤⢻⣥⠷⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⣺⠕⠒⠣⢄⢞⠁⠀⣠⠗⡄⠀⠋⠐⢽⡲⠉⠱⠯⡕⡦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢘⡺⡠⠊⣀⠄⠀⠀⠀⢀⣎⡖⠫⡉⠀⠀⠉⠛⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡿⢶⣿⡏⢀⣎⠀⣷⡈⠚⣿⣦⢌⣢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠛⡹⢠⣿⣿⠀⢿⣿⢄⢣⠈⠃⠈⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡷⠁⠛⠺⣸⠀⠉⠈⢪⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠛⠀⠀⠀⠀⠈⠀⠀⠀⠀⠀
-        """,
-        # beedrill
-        "17": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡷⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡔⠒⠤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⡜⡄⠀⠀⢀⡠⠔⠒⣒⠖⠢⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠑⣤⡏⠩⣭⠐⣒⣢⠀⠀⠀⠀⠀⠀⡇⢠⠘⣆⠊⠁⣀⠔⠊⠀⠀⠀⣸
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡧⣤⣌⠢⠤⠈⣶⠟⠁⠀⠀⠀⠀⠀⠀⡇⠀⢆⠈⢗⠊⠁⠀⠀⢀⠔⠊⠀
-                ⠀⠀⠀⠀⠀⠀⢀⡠⢊⡵⡎⢱⡹⡄⠀⣠⡯⠧⠤⢄⡀⠀⠀⠀⡜⡇⠀⠈⠀⠈⢎⢆⡤⠊⡇⠀⠀⢰
-                ⠀⠀⠀⠀⠀⠀⠸⠔⠉⠀⢷⣸⠙⡽⠏⠘⢂⡤⢴⢄⠈⢆⠀⡜⠀⡇⠀⠀⢀⠀⠈⢞⠆⠀⠸⡠⠖⡙
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡈⣾⠀⠆⢠⣋⠨⠥⡼⠀⡸⡜⡠⠔⡇⠀⠀⠈⠀⠀⡸⣠⠔⠉⠀⢠⠃
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢡⣿⡀⠀⠘⠤⠔⠊⣀⠴⠵⣋⠀⠀⠈⢢⢤⣄⡠⠞⡏⠀⠀⠀⢠⠃⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠞⣗⠣⣀⠤⣴⣮⠏⠀⠀⠘⠫⣅⣒⣚⣡⣤⡃⡸⡸⠀⠀⣀⠔⢯⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⣀⣀⢔⡥⠜⠀⠙⢍⡁⢣⠘⡆⠀⠀⠀⠀⠀⠗⠂⠤⠬⣭⣤⠇⠒⠉⠀⠀⠈⣆⠀
-                ⠀⠀⠀⠀⢠⠊⠁⠈⠑⢝⡄⠀⠀⠀⠇⢙⡪⠦⣸⣦⣀⣀⣐⣾⡑⠢⢄⠀⠀⠀⠉⠉⠒⡖⠠⠤⢸⠀
-                ⠀⠀⠀⢠⠃⠀⠀⠔⠀⠀⡇⠀⠀⠀⠸⠉⡦⢾⣿⡡⢴⠒⠒⠚⣕⣤⣀⠱⡤⣀⡀⠀⢰⠀⠀⠀⣸⠀
-                ⠀⠀⢀⠇⠀⠀⠀⠀⡠⠚⠀⠀⢀⠤⢒⣩⣴⢻⡯⠔⠊⠉⠉⠉⠚⠪⡻⣷⣽⡀⠈⠉⠚⡄⠀⣠⠃⠀
-                ⠀⠀⡎⠀⠀⢀⠴⠊⠀⠀⠀⠀⢞⢪⠁⠀⠙⠞⢁⠴⠒⠒⠒⠲⢤⣀⠈⠻⣟⢇⡀⠀⢀⡸⠖⠁⠀⠀
-                ⠀⡜⠀⣠⠖⠁⠀⠀⠀⠀⠀⡸⠄⡘⠀⠀⠀⢰⢁⠤⠒⠒⠒⠲⢿⣿⣷⡄⢸⢳⢻⠉⠀⠀⠀⠀⠀⠀
-                ⡰⡠⠊⠁⠀⠀⠀⠀⠀⠀⢠⠃⢀⠇⠀⠀⠀⠀⢫⠀⠀⠀⠀⠀⠀⠙⣿⣿⠃⠈⡆⠱⡄⠀⠀⠀⠀⠀
-                ⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠁⡎⠀⠀⠀⠀⠀⠀⠑⡎⠉⠀⠢⡀⡠⠟⠁⠀⠀⠘⡄⠘⣆⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⢸⠀⠀⠀⠀⠀⠀⠀⠀⢃⠀⠂⡠⠋⠀⠀⠀⠀⠀⠀⢱⠀⠘⡄⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡜⠈⡄⠀⠀⠀⠀⠀⠀⠀⢸⠀⡜⠁⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⢣⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢠⢐⡲⠭⠒⠒⠁⠀⠀⠀⠀⠀⠀⠀⠸⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⢸⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠓⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⢸⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡘⡄⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢱⡅⠀⠀
-        """,
-        # dragonair
-        "18": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡟⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣕⢤⡀⠀⠀⠀⠀⠀⠀⠀⣰⠀⠏⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣆⠱⡆⠀⠀⠀⠀⠀⢠⠃⡸⢠⢹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣹⡄⢱⠖⠊⠉⠉⢒⠏⠠⢃⠎⣼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⢶⠁⠀⠀⠀⠀⢸⢰⠲⡄⢼⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢯⣙⡱⢀⢠⢾⣎⢎⣲⡷⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡆⠀⠈⢸⣾⡼⠀⢸⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠈⠁⡴⢫⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢖⣠⣴⡋⠀⡞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣗⣳⠇⣼⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠁⡎⢰⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⣠⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⠀⡘⢠⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣠⣺⢟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠊⠀⠰⠁⡮⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣴⣺⡶⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠁⠀⢀⠇⣸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠳⢮⡽⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠁⠀⠀⡘⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢸⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠁⠀⠀⠀⠇⢸⡄⠀⠀⠀⠀⠀⠀⠀⢀⡠⠄⠒⠉⠉⠉⠈⠉⠉⠒⠤⡀⠀⠀
-                ⠀⡎⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠇⠀⠀⠀⢸⠀⢸⡀⠀⠀⠀⢀⡤⠔⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠀⠀⠈⢇⠀
-                ⠀⢱⡈⢦⣀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠈⡄⠈⣇⠤⠔⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠖⠉⠀⠀⠀⡰⠘⡆
-                ⠀⠀⠑⢦⣈⠓⠢⠤⠠⣠⣀⣀⠄⠀⠀⠀⠀⠀⠱⡀⠘⢄⡀⠀⠀⠀⠀⠀⢀⣀⠤⠐⠊⠁⠀⠀⠀⢀⠤⠊⠀⠀⠇
-                ⠀⠀⠀⠀⠑⠫⢖⣂⠤⠤⠤⠤⢼⠀⠀⠀⠀⠀⠀⠘⠦⡀⠉⠒⠒⠒⠒⠉⠁⠀⠀⠀⢀⣀⠤⠐⠊⠁⠀⠀⠀⣸⠃
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠐⠒⠒⢣⠀⠀⠀⠀⠀⠀⠀⠈⠉⠒⠒⠂⠀⠒⠒⠒⠈⠉⠀⠀⠀⠀⠀⠀⠀⣠⠼⠃⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⡤⠤⠴⠖⠉⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠤⢄⣀⣀⣀⣀⣀⣀⠤⠤⠒⠚⠋⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # dugtrio
-        "19": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠤⠤⠤⠤⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠊⠁⠀⠀⠀⠀⠀⠀⠀⠉⠲⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡤⠋⠀⠀⢠⣿⠀⠀⠀⠄⣯⡇⠀⠀⠈⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢨⠃⠀⠀⠀⠘⠞⣀⣀⣀⣠⢿⠀⠀⠀⠀⠀⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡘⠀⠀⠀⠀⢰⡉⠀⠀⠀⠈⠙⡄⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⠤⢀⣀⣀⣇⠀⠀⠀⠀⠀⠙⠒⠤⠤⠤⠒⠁⠀⠀⠀⢸⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠔⠊⠁⠀⠀⠀⠀⠀⠈⠉⠲⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢠⠞⠁⠀⠀⠀⠀⣤⡀⠀⠔⢀⢄⠀⠈⠣⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⠏⠀⠀⠀⠀⠀⠀⣿⡇⠀⠀⠸⣿⠀⠀⠀⢳⠀⠀⠀⠀⠀⠀⣀⡀⠤⠤⠤⣀⣿⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣾⠀⠀⠀⠀⠀⠀⠀⠙⣃⠤⠤⠤⣙⡀⠀⠀⠘⡆⠀⠀⢀⡴⠋⠀⠀⠀⠀⠀⠀⠀⠙⠣⣄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣀⠀⠀⠀⠀⠀⠀⠀⣞⠁⠀⠀⠀⠀⢹⠀⠀⠀⡇⠀⢠⠋⠀⠀⢠⣿⠀⠀⠀⠀⡀⠀⠀⠈⢢⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣷⠀⠀⠀⠀⠀⠀⠀⠈⠒⠠⠤⠔⠒⠏⠀⠀⠀⡇⢠⠃⠀⠀⠀⠿⠃⠀⠀⠀⣼⠇⠀⠀⠀⠀⣧⡀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣇⠏⠀⠀⢀⠖⠎⠑⠒⠤⡸⠞⠀⠀⠀⠀⠀⢸⡇⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢿⠀⠀⠀⠀⠳⣔⡀⠀⠀⣸⠀⠀⠀⠀⠀⠀⣸⡃⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠀⠀⠀⠀⠀⠀⠊⠉⠉⠁⠀⠀⠀⠀⠀⠀⡿⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠃⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠏⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣀⠔⠛⣇⣠⠤⠤⢄⡀⠀⠀⠀⠀⠀⡤⠄⣀⠀⠀⠀⢸⠙⠲⣤⡤⠒⠉⠙⠒⢤⡀⠀⢀⣀⣀⡞⢝⢧⠀⠀⠀⠀⠀
-                ⠀⢀⡖⡲⠋⠀⡴⠋⠀⠀⠀⡼⠙⠢⢴⠋⣹⠊⠀⠀⣸⠉⠉⠓⠚⠀⠀⠈⠀⢀⣀⠀⠀⠀⠙⠓⠉⣄⠀⠙⡌⠳⡇⠀⠀⠀⠀
-                ⢀⡿⠋⠀⠀⠈⠳⠤⠤⢤⡾⢤⠀⠀⠈⠋⠈⠦⠤⠚⠁⠀⠀⠀⠈⠂⠀⠀⠀⠘⢌⣣⠀⡀⠀⠀⠀⠀⠉⠒⠊⠀⠱⡶⣄⠀⠀
-                ⠾⣀⣠⣊⡇⠀⠀⠈⠀⠸⢄⠞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠠⣄⠀⠀⠀⠀⠀⠁⢸⠉⠳⣄⠀⠀⠀⠀⡠⠖⠤⣀⠈⢳⠀
-                ⠀⠀⠈⠀⠘⠉⠒⠂⠐⠒⠖⠦⠤⡠⠤⠤⣀⣀⡤⡤⠤⢤⡘⠀⠀⣸⠀⠀⣀⣀⣀⣀⠘⡄⠀⠈⡦⡤⠖⠋⠙⠳⠒⠒⠚⠞⠁
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠒⠞⠓⠒⠞⠁⠀⠀⠀⠉⠉⠈⠛⠁⠀⠀
-        """,
-        # electabuzz
-        "20": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⢀⠄⡒⡢⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⠛⢱⡀⠘⠀⡇⠸⡈⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⢻⢘⡄⢠⡦⢇⣀⣁⡴⡥⡎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣾⠀⣎⢿⣿⣼⢰⠔⠊⡝⢠⠏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⠻⣿⣆⢿⣷⡾⢻⠈⡄⡜⢀⠎⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢀⢎⠀⠉⠛⢋⠀⣱⢸⡀⣷⢡⠎⠤⢄⣀⣰⡁⠈⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠘⠹⢰⣣⢀⣤⣯⣻⡟⠣⠈⣡⣶⠆⢒⠝⠚⠫⣍⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⢻⠟⣋⣾⢣⣴⣿⠟⠀⠀⠀⠀⠃⠀⠀⢱⠀⠀⡤⠤⢠⢦⣀⡀⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⣧⢷⣿⠟⣡⣪⠇⣀⣀⠀⠀⢀⣤⣋⣀⣸⠾⠂⣴⣕⡭⡴⣩⣛⡿⠓⡒⠒⠢⠤⡀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢷⣎⣦⠤⠒⠋⢲⢧⣠⢖⣿⡟⣾⡼⣟⢄⡈⠉⣾⣿⠱⠛⢩⠄⢸⠀⠀⢰⠀⠈⡢⡀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡔⢱⠧⢀⡀⣀⣾⡾⠃⠈⢿⡿⠝⠛⠉⠁⠈⠉⠚⠛⠣⢴⡉⠀⣿⠀⠀⡸⠀⢠⠃⣼⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣪⠶⣿⣿⣶⣾⣾⠟⠀⠀⢀⠏⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢦⡀⠙⣠⣔⠃⢀⠎⠀⣿⠁
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠋⠀⠸⣿⣿⣿⣿⣇⣀⣀⡀⠀⠀⢡⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠀⠀⠉⠑⠒⠘⠚⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠗⠒⠂⠈⢉⣽⣿⣿⣿⡿⠟⠋⠁⢀⣼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⢀⣴⣿⣿⡿⠛⠁⠀⣀⣤⣾⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⣰⣿⡿⠋⠁⠀⢀⣤⣿⣿⡿⠟⠉⡎⠀⠀⠀⠀⠀⠀⠀⠀⣠⣾⣍⡳⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣶⣧⡟⠁⠀⠀⠀⠈⠙⠋⠉⠀⠀⠀⠲⡁⠀⠀⠀⠀⠀⠀⣠⣊⠙⢿⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢠⡎⠀⠙⢿⠿⠢⢄⡀⠀⠀⠀⠀⠀⠀⣀⣴⣏⡻⠧⢄⠀⣀⡔⠚⣿⡿⠔⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣀⢿⣿⣷⡶⡋⠀⠀⠀⠀⠉⠉⠉⠻⢿⣿⠗⢺⣯⢀⢀⡰⣏⣿⠿⠒⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢀⣤⠒⠉⠀⠀⠈⠁⣀⠿⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⢉⣹⣶⣶⣷⡃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣰⠭⠤⡼⠒⠊⡆⢀⡴⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⢟⠁⠀⠉⠉⠈⠉⠒⢠⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠘⠂⠀⠈⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⠄⢀⣰⠉⠒⢢⠧⢈⣑⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠼⠀⠀⠈⠁⠀⠀⠀⠀⠀⠀
-        """,
-        # electrode
-        "21": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣤⣤⠶⠶⠟⠛⠒⠒⠚⠛⠻⠶⠤⣄⣤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⠴⠚⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠛⠶⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⠞⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠿⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⡶⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠻⣄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣰⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⣤⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢠⡿⠁⠀⠀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⣷⡀⠀⠀⠀
-                ⠀⠀⢐⡞⠀⠀⢀⠞⠛⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠖⠉⠉⠹⢶⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣷⡀⠀⠀
-                ⠀⢠⡽⠀⠀⣠⠋⠀⠀⠘⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠋⠁⠀⠀⠀⠀⠀⠈⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣥⠀⠀
-                ⠀⣴⠁⠀⢠⠇⠀⠀⠀⠀⠈⣧⠀⠀⠀⠀⠀⡀⠀⠀⢀⡴⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⠇⠀
-                ⠀⡏⠀⠀⠸⠂⠀⠀⠀⠀⠀⠘⣆⠀⠀⠀⠀⡇⢀⣠⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀ ⠈⡿⠀
-                ⢠⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠀⠀⠀⠀⣇⡞⠅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⣿⡄
-                ⣿⡇⠀⠀⠀⠀⠀⠀⠀⣴⠀⠀⠀⠀⠀⠀⠀⠉⠀⠀⠀⠀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⣿⠁
-                ⠻⡇⠀⠀⠀⠀⠀⠀⠀⢹⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴ ⣿⡆
-                ⢸⣧⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠛⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠴⠋⢀ ⣯⠀
-                ⠀⢳⠈⠑⠲⢤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⠤⠒⠉⠀⠀⠀⢸⡆⠀
-                ⠀⠈⣇⠀⠀⠠⣀⠈⠉⠓⠒⠦⠤⢄⣀⣀⣀⣀⣀⢀⡀⣀⡀⣀⣀⣀⣀⣀⣠⠤⠤⠴⠒⠒⠋⠉⠁⠀⠀⠀⢠⠿⠀⠀
-                ⠀⠀⠛⣆⠀⠀⠈⠙⣖⠤⠤⣄⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡤⠆⠀⠀⠀⠀⠀⠀⠀⢀⠎⠁⠀⠀
-                ⠀⠀⠀⠘⣦⠀⠀⠀⠈⠲⣀⠀⠀⠀⠉⠉⠉⠉⠛⠓⠒⠒⠒⠒⠒⠒⠒⠒⠛⠉⠉⡵⠃⠀⠀⠀⠀⠀⠀⠀⢠⡾⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠹⣷⡀⠀⠀⠀⠈⠓⠦⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠀⠀⠀⠀⢀⡠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠟⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠻⣦⡀⠀⠀⠀⠀⠀⠉⠙⠒⠦⠼⣄⣀⣀⣀⣸⣀⡠⠤⠞⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠊⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠈⠻⣶⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⠾⠋⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠻⢶⣤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⣴⠾⠛⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠛⢷⣶⢦⣤⣤⣄⣀⣀⣀⣤⣤⡤⢶⡶⠿⠛⠉⠀⠀
-        """,
-        # pidgeotto
-        "22": r"""
-                        ⠀⠀⢠⠚⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⣀⠀
-                        ⠀⢀⣸⠀⠹⣢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⢔⡲⠝⠓⠉⣀⠴⠁
-                        ⠀⠇⠙⢆⢀⠱⣣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠔⣪⠵⠚⠋⢹⣠⠴⠞⠓⠉⡹
-                        ⠀⣸⡀⠈⡇⠑⢜⢵⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⣊⠕⠉⠀⢀⣠⠾⢭⠀⠀⣀⣤⣪⡀
-                        ⠀⡇⠑⡔⠺⣄⠀⠱⢿⡄⡀⠀⣀⢤⣀⣀⢀⡀⠀⠀⠀⠀⠀⢠⢊⠞⠁⠀⠀⠂⠉⠀⡠⠯⠒⠉⠁⠀⡰⠁
-                        ⠀⠘⣄⠘⣄⠈⠢⠀⠘⣵⣧⢞⡕⠒⢂⣉⠥⠬⠵⣤⠀⠀⠀⡇⡎⠀⠀⠀⠀⣀⠴⠚⢲⢀⣀⣤⠶⢭⠀⠀
-                        ⠀⠸⡙⠲⡍⠒⠄⢰⢉⢳⣫⣪⢎⣩⠤⠒⠲⡔⠫⢔⠻⡲⡼⡜⠀⠀⠀⠀⠁⢀⡠⠔⠋⠉⠀⢀⡠⠊⠀⠀
-                        ⠀⠀⠑⢄⠸⡦⢄⣸⢼⢸⠱⡵⣯⣷⡲⡄⠀⠱⠀⠀⢑⡼⡕⠁⠀⠀⠀⠒⠉⢉⢆⣀⣤⣐⠊⠁⠀⠀⠀⠀
-                        ⠀⠀⠀⠰⡛⠓⡦⠄⠉⡻⠓⣵⠋⠀⢸⠇⠀⠀⢇⡠⡪⠊⠀⠀⠀⠠⠀⢲⡎⠁⠀⠀⢀⠜⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠉⠲⠬⢗⣂⠳⠛⣜⡀⣠⠎⠀⣀⠔⠡⠊⠀⢀⠀⠒⢲⠒⠒⠛⠒⠒⢢⠉⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠘⢲⠒⠲⣠⣠⠓⠠⢅⣀⠀⠙⢀⠇⠀⠠⢄⠨⡋⠉⠑⠒⢶⠒⠒⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠉⠫⠼⡏⠀⠀⠀⠈⠑⠤⠊⠀⢽⢩⠑⢄⡈⠙⣴⠒⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠠⠃⠀⠀⡎⠢⡗⠐⠋⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⠀⠀⠀⠀⠀⢀⢄⡒⢒⣧⡄⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⠎⠘⡄⠀⠀⠀⠀⡇⢿⡽⣼⠷⡇⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⣠⢮⣉⠒⡄⠀⢸⠀⠀⠁⣀⠀⠀⠀⠣⡀⡇⠉⢸⡸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠚⣺⠮⡙⠃⢘⢍⡉⢈⣶⠢⠬⠓⠦⢄⣀⡈⢳⡆⢀⢇⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠈⠁⠀⠈⠢⢄⣘⣆⠀⠀⠀⠀⠀⠀⠀⡟⡞⡟⢷⢺⡄⠉⠲⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣜⣲⡼⠀⠀⠀⠀⠀⠀⢰⡁⡇⡇⠈⡏⠘⢄⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠸⡇⢱⠀⠸⡀⠈⠣⡀⠀⠈⢣⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢡⠈⡦⢄⢣⠀⠀⠹⡦⣰⡂⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⢧⡼⡀⡰⡘⠋⠳⡀⣄⣱⠈⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠛⠑⣴⢄⠙⠃⠀⠀⠀⠀
-        """,
-        # arcanine
-        "23": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣾⢀⡴⡿⢋⣽⡅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣸⣷⡟⣥⢿⠏⠀⠀⠊⡾⣆⣠⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠸⡳⡿⠈⢀⡏⠀⠀⠀⠀⠘⠈⠁⢉⠔⢛⣨⠟⠀⠀⠀⠀⠀⠀⢀⠤⠚⠋⢋⡜⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢤⢀⣀⣀⡿⢅⠀⠈⢋⠉⠀⠀⠀⠀⠀⢀⣴⠮⠉⢩⢍⡿⠀⠀⠀⣀⠔⠊⠁⠀⠀⠀⠝⣫⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠈⢪⡢⡀⠈⣑⡗⠦⡀⠣⠀⠀⢀⡠⡒⣺⣁⣀⡰⡣⣾⡄⠀⣠⠞⠁⠀⠀⠀⠀⠀⠀⠀⠈⠑⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠙⣶⡓⠂⠹⣐⠿⢦⣀⣠⠾⢗⡡⠋⠉⠉⠹⠦⣛⡷⢠⠃⠀⠀⠀⠀⠀⠀⠀⠶⡄⠀⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢺⠇⠀⠀⠀⢄⠉⠙⠽⠿⠉⠁⡠⡄⠀⠀⠀⣀⡹⣃⡏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⡄⠀⠀⠀⠀⠹⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠐⠃⠘⣯⠀⠀⠀⢷⡒⠈⠐⢲⠋⠀⠀⢀⢀⣷⠚⠆⢛⡷⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡀⠀⠀⠀⠀⠱⡆⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠛⠷⣾⠀⠀⠈⠍⠉⠁⠀⠘⠲⣾⢿⢆⠀⢀⣤⡼⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠹⠶⠆⣀⣀⠀
-                ⠀⠀⠀⠀⢠⡴⠹⡢⡦⠃⠀⠀⠀⠀⠀⣹⡟⠲⣗⠳⢞⡻⠶⡬⠶⠄⠒⠢⡤⣀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⢚⣻⣦
-                ⠀⠀⠀⠰⢾⠂⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣸⣗⠤⣈⢑⠺⣆⠀⠀⠀⡇⢈⢷⡀⠀⠀⡧⡀⠀⠀⠀⠀⠀⠰⣾⡏⠀⠀
-                ⠀⠀⠀⠐⠓⢿⢤⣀⠀⠀⠀⠀⠀⠀⠀⠀⣐⡟⠀⠉⠑⡢⠉⠑⣄⠀⠀⠸⠖⠊⡜⢱⠀⡼⠀⠈⠑⠢⣿⡍⠉⣩⡍⠁⠀⠀
-                ⠀⠀⠀⠀⠀⢺⡔⣯⠄⠀⠀⠀⠀⠰⡏⠙⢿⡻⣄⠰⠋⢀⡴⢋⠀⠀⠀⠀⢀⠞⠀⡼⣟⠁⢀⣤⠀⡠⢿⠵⢊⣾⠇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢹⣤⠻⣆⡄⠀⠀⠀⢢⣗⠀⠀⠹⡬⢃⡴⠁⣀⡞⣆⡀⢀⡔⠁⡠⠊⡰⢻⡜⠏⠷⠊⠀⠀⠀⠘⡿⠂⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢵⠀⠈⠱⣦⡀⠀⢌⡄⠀⠀⠀⠘⢮⣦⠺⠋⠉⡽⡀⠟⠊⢉⣤⠊⢀⠜⣄⠀⠀⠀⠀⠀⢀⡾⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⡄⢀⡔⢁⢿⠋⠺⣧⡀⠀⢠⠾⢺⠁⠀⠀⢸⢃⣑⡤⣀⠀⠉⠉⠁⣶⠛⠏⠀⠀⠀⢀⢾⡴⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⡟⠊⢃⢾⣸⠀⠠⣾⡝⠴⡇⢴⡇⡀⠀⠀⠉⣵⠋⠀⢸⠉⠑⠒⠙⠀⠀⠀⠀⠀⠀⣀⡾⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣷⣠⠋⠸⢻⡞⠉⠙⣷⠐⢡⠎⢠⡇⠀⣀⠼⠇⠀⡬⠟⢆⡀⠀⠀⠀⠀⠀⠀⣠⡞⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢠⠃⠁⠀⠀⠘⡀⠀⠀⡇⠣⠃⠀⠘⠳⡉⡔⠁⢀⣠⡇⣀⢼⡉⢒⡒⠀⣤⠤⠴⠛⠓⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⡖⡵⠂⡔⠂⠀⢠⠀⢀⣠⠃⠀⠀⠀⠀⡏⠙⠛⠉⠁⠀⢸⡱⡁⢰⠉⠀⣀⠜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠁⠓⠒⠓⠒⠂⠉⠀⢼⢰⡋⠀⡜⠀⢀⡗⠀⠀⠀⠀⠀⠀⠉⠉⠘⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # charmeleon
-        "24": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠊⢑⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡠⠔⠪⠁⠀⡠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠈⠉⢀⠄⠀⢀⠀⠪⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢠⡔⠉⠀⠀⡀⠀⠀⠀⣀⠁⠀⠱⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠈⣎⡇⠀⢰⡙⠀⣤⡏⢹⠀⠀⠀⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⡿⠀⠀⠈⠣⠾⠿⠝⠘⠃⠀⠀⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⣫⠀⢀⠀⠀⠀⠀⠀⠁⢀⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠳⣀⣋⠴⠒⠒⠒⠂⠀⠉⠀⢀⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡕⢆⣀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠒⠂⡟⠓⠀⠀⠈⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡆⠱⠓⡤⡀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠤⠚⣀⠈⠑⠒⠀⠺⠤⢄⠀⠀⠀⠀⠀⠀⠀⠀⣀⣹⡆⣄⡘⠹⣄⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢀⠤⠤⠒⠊⠁⣰⠎⠁⠉⢢⡀⠀⠀⠀⠀⠑⠢⢄⣀⠀⠀⠀⠀⠐⡟⠷⡌⠃⢣⢈⢿⢆⠀
-                        ⠀⠀⠀⠀⢠⠞⠁⠀⢠⠔⠂⡹⠁⠀⠀⠀⠀⢣⠀⠀⠉⠙⡖⠤⣀⠀⠉⢢⠀⠀⠀⢹⠳⢸⠀⢦⠎⠊⡹⡄
-                        ⠀⠀⣀⠔⠁⠀⠀⡰⠁⠀⢰⠁⠀⠀⠀⠀⠀⠈⡄⠀⠀⠀⠱⡀⢸⠀⠀⠀⢣⠀⠀⣾⡱⡈⢠⠈⣎⢂⠇⣳
-                        ⠀⣰⣁⠀⡔⢲⡴⠁⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⠃⠀⠀⠀⠀⢣⢨⠀⠀⠀⠈⢆⠀⠀⠹⡍⠈⠐⠈⡞⡞⠁
-                        ⢰⢿⠀⣳⡷⠊⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠸⣸⡀⠀⠀⠐⠘⡄⠀⠀⠓⠦⡤⡥⠟⠁⠀
-                        ⠀⠓⠧⠷⠀⠀⠀⠀⠀⡰⢇⠀⠀⠀⠀⠀⠀⠀⠸⡄⠀⠀⠀⠁⠙⡇⣱⡏⠉⡗⢱⠀⠀⠀⡰⢡⠇⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⡠⠊⠀⠈⢆⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠳⡯⣇⣼⠖⠁⣀⠠⠚⣠⡟⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢀⠞⠀⠀⠀⡠⠈⠣⣀⠀⠀⠀⠀⠈⠀⠀⠀⠀⠀⠀⠀⡜⠀⠀⠀⠀⠀⣀⢔⠟⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠸⣀⠀⠀⠘⠀⠀⠀⢈⡱⠦⠄⣀⣰⠀⠀⠀⠀⠀⢠⠀⡗⠂⠀⠐⢒⡩⠔⠁⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢫⡃⠉⠀⠀⠀⢐⠁⠀⠀⠀⠀⠈⢦⡀⠢⡀⠀⠀⠀⡗⠒⠒⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⣠⣞⡀⠀⠀⠀⢀⣸⠀⠀⠀⠀⠀⠀⠀⡹⠃⠁⢀⡠⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠘⣟⢥⣊⠬⠆⠐⠊⠁⠀⠀⠀⠀⠀⠀⠀⡔⠱⣀⠖⢆⢠⠒⢄⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠈⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠋⠉⠙⣤⠞⠉⠣⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # dewgong
-        "25": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠗⠢⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠔⠊⠀⠀⠙⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣾⠁⠀⠀⠰⡀⠀⠈⢣⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⢲⡀⠀⠀⠀⠀⠀⠀⢀⡜⠀⠀⠀⠀⠈⢦⡀⠀⠙⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣀⠤⠔⠒⠛⢻⠎⠀⢸⡇⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⠙⠦⡀⠀⠑⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣠⢎⠀⠀⠀⠀⠀⠀⠀⠀⠘⠈⠢⣄⠀⠀⠀⠀⢣⡀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠄⠀⠑⢦⣀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢀⣼⣷⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣄⠀⠀⠀⠀⡣⢀⠔⠒⠂⠈⠉⠉⠉⠉⢀⣐⣀⣑⣤⡈⠙⢆⡀⠀⠀⠀⠀
-                ⠀⢠⠎⠁⠙⢋⣀⠀⠀⠀⠀⢀⣖⢭⡆⠀⠀⠀⠀⢸⡄⠀⠀⠀⡇⠀⠀⠀⣀⠔⠊⣁⡔⠚⠉⠁⠀⠀⠁⠹⡄⠀⠑⢤⠀⠀⠀
-                ⠀⠘⡦⣀⠀⠀⠉⠛⠀⠀⠀⣾⠿⣿⠇⠀⠀⠀⠀⠀⣇⠀⠀⠀⠈⠲⢤⡀⠁⢀⠎⠁⠀⠀⠀⠀⠀⠀⠀⠀⢰⠀⠀⠈⢧⠀⠀
-                ⠀⠀⢣⣼⡈⠑⠢⡀⠀⠀⠀⠀⠈⠉⠀⠀⠀⠀⠀⠀⠸⡄⠀⠀⠀⠀⠀⠳⠤⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠁⠀⠀⠈⣦⠀
-                ⠀⠀⠀⠀⠱⣆⡀⠈⡗⠤⣀⣀⠴⠀⠀⠀⠀⠀⠀⠀⠀⠙⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠃⠀⠀⠀⠀⢸⡄
-                ⠀⢠⢤⡀⠀⠀⢩⠒⠣⠚⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠦⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠊⠀⠀⠀⠀⠀⠀⢸⠀
-                ⠀⢸⠀⠙⠢⠤⣼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠂⠠⠤⠤⠤⠐⠒⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀
-                ⡴⠃⠀⠈⠑⠒⢺⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠀
-                ⠘⢄⡀⠀⠀⠀⠈⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⢀⠀⡀⠠⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠃⠀
-                ⠀⠀⢻⡄⠀⠀⢀⣣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡀⢣⠈⠢⣕⠵⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠁⠀⠀
-                ⠀⠀⠀⠙⠒⠚⠢⠼⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⢣⠀⠀⠑⠢⢄⡉⠉⠐⠒⠒⠒⢲⡀⠀⠀⠀⠀⠀⠀⠀⠀⡔⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠘⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠱⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢆⠀⠀⠀⠀⠀⡠⠞⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⣄⠀⠀⠀⠀⠀⠀⠀⠈⢢⠀⠈⢦⡠⣀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠀⠀⢀⡤⠊⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠤⡀⠀⠀⠀⠀⠀⠀⠱⡀⠀⠙⢬⡑⢤⡀⠀⠀⠀⠀⠀⣅⠤⠒⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠢⠤⢀⡀⠀⠀⠈⠢⡀⠀⠉⠀⠈⠑⠂⠤⠄⠀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠁⠐⠒⠚⠢⡀⠀⠀⠀⠀⠀⡴⠎⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠓⠤⣀⣀⠼⠃⠀
-        """,
-        # dratini
-        "26": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡤⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣧⠹⣄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠘⣄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢆⠈⠑⠢⣀⠀⠀⠀⠀⢀⠤⠔⠒⠛⠚⠢⢄⠸⡤⡄⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢆⠀⠀⠈⠱⣄⣠⠊⠁⠀⠀⠀⠀⢞⣕⠄⢻⢆⡇⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢇⡀⠀⠀⠈⢣⠀⢰⡏⠳⡄⠀⠀⠈⠀⠈⢿⢷⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⢅⠀⠉⠭⣒⠤⢣⠸⣿⣦⣿⡆⣀⠔⠊⠉⠉⠉⠢⡀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠆⠀⠀⢹⢸⠀⠫⣛⡻⡗⠁⠀⠀⠀⠀⠀⠀⣹⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⣀⡗⠁⠀⠀⠀⠀⡅⠀⠀⠀⠀⠀⢀⡴⠋⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠖⠋⠙⢆⠀⠀⠀⠀⠈⠒⡤⠤⢴⡚⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⡀⠀⠀⢀⠊⠀⠀⠈⢧⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⡄⠀⢸⠀⠀⠀⠀⠈⢆⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠈⡄⠀⠀⠀⠀⠈⢣⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠺⡀⠰⠀⠀⠀⠀⠀⠀⢳⡀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢱⠀⢣⠀⠀⠀⠀⠀⠀⢧⠀⠀
-                ⠀⠀⠀⠀⢀⣠⣠⣄⡀⣀⣄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇ ⠀⠀⠀⠀⠀⠀⠈⣇⠀
-                ⢠⡖⠊⢉⣀⣀⣀⠀⠀⠀⠀⠀⠈⠉⠓⠢⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⠀⠀⠀⠀⠀⠀⠀⠀⢸⡄
-                ⠀⠀⠀⠀⠀⠁⠀⠈⠙⠒⠤⣄⡤⠄⣀⠀⠀⠀⠈⠑⠢⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠇⠀⠀⠀⠀⠀⠀⠀⠀⢸⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠢⢌⡑⠒⠤⣀⠀⠀⠈⠑⠓⠢⠤⠀⣀⣀⣀⣀⣀⠠⠔⠁⠀⢀⠇⠀⠀⠀⠀⠀⠀⢸⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠓⢤⡀⠉⠒⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠃⠀⠀⠀⠀⠀⠀⣰⠋⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠱⢤⣀⠀⠉⠑⠒⠂⠀⠀⠀⠀⠂⠀⠉⠀⠀⠀⠀⠀⠀⠀⢀⡴⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠒⠤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡴⠋⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠐⠒⠢⠤⠤⠤⠤⠐⠒⠚⠋⠉⠀⠀
-        """,
-        # farfetchd
-        "27": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠙⠳⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⢀⣀⡀⠀⠀⠀⠀⠀⢀⡔⠙⣦⡀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡔⠁⠀⠹⡊⠉⠉⣦⡀⢸⠀⠀⠹⣧⡀⠀⠀⡴⠊⠹⣼⠀⠀⠀⣧⠔⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠱⡀⠀⠀⢣⠀⠀⠟⣇⡈⢇⠀⠀⠙⣷⡄⠀⠑⡄⠀⢻⠀⠀⢰⠃⢀⡼⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⢷⡀⠀⠈⢧⠀⠀⡇⠱⣜⣆⠀⠀⠘⡝⣆⠀⣸⣦⠀⠁⠀⠜⡰⠛⠤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠑⡄⠀⠈⢆⠀⡇⠀⠈⢿⣆⠀⠀⠘⢮⠟⣇⠀⠀⣀⣴⠟⠁⠀⠀⠈⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠈⢦⠀⠈⠗⢣⠀⠀⠀⠻⣆⠀⢀⠏⣀⢹⣷⣾⡿⢋⠞⠩⣢⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠳⡀⠀⢸⣆⠀⠀⠀⠈⠓⢼⢸⢰⣃⢻⣟⠀⣌⠀⢸⡇⡆⠀⠀⠸⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢱⠀⠀⡿⡷⡄⠀⠀⠀⠈⣞⣀⠿⠉⠀⠉⠣⢄⣘⣇⡇⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⣧⠀⠹⠈⠛⢦⣤⠒⠊⠉⠀⠀⠀⠀⢀⣀⣀⡨⢽⠆⠀⠀⣼⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠙⣆⣀⠧⠔⠊⠁⠉⠑⠒⠴⣒⡉⣉⠁⠀⠤⠚⠁⠀⠀⠀⠳⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣞⣀⣀⣀⣀⣀⣀⡀⠀⠀⠀⠀⠈⠉⠉⠐⠒⠒⠲⡀⠀⠀⠀⠙⢄⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢼⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠑⠒⠒⠠⠤⣀⠀⠀⠀⠈⠫⡁⠂⠀⠀⠻⡀⠀⣀⠤⢊⡇
-                ⠀⠀⠀⠀⠀⠀⢻⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠢⠄⠀⠀⠘⢖⠁⠀⡼⠃
-                ⠀⠀⠀⠀⠀⠀⠈⠉⡖⠒⠤⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠆⣸⠃⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠰⣄⠀⠀⠀⠈⠉⠒⠢⠤⠤⠄⠒⠒⠒⠒⠒⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⣖⠢⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠤⠔⠋⠀⠀⠀⣠⠞⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡄⠀⣧⠙⠒⠦⢤⡤⠤⠒⠒⠊⠉⠁⠀⠀⠀⠀⢀⣠⠞⠉⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠘⡇⠀⠀⠀⠈⠱⡖⠤⣤⣀⠀⣀⣤⠤⢲⠉⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⢱⡄⠀⠀⢀⡴⡇⠀⣿⠀⠀⠀⢹⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡠⠤⢀⣷⠉⠉⠀⠀⠀⢀⣈⣑⣤⢀⡰⠆⠀⠗⣤⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠲⠾⠕⢷⣠⡔⠒⠋⠁⠀⢀⡴⠊⠀⠀⠀⢀⡀⠙⠲⡀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠚⠂⠉⠙⢆⡠⠟⠂⠉⠀⠺⠀⠀
-        """,
-        # growlithe
-        "28": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⣺⡦⠤⣴⠖⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠊⠁⠀⠀⠤⠾⠅⠠⠤⠤⣄⡀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⣶⠏⠁⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢘⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⢄⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⢤⡼⣄⠔⠈⠀⠐⠒⠢⢤⣠⢔⣒⠿⡉⠙⠛⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡾⡻⠋⠀⠀⠀⠀⠀⣀⡀⠀⢎⡔⠁⠀⠉⠪⣢⡀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣯⢱⡁⣀⣀⠀⣠⣾⡇⠀⢡⠀⠀⠘⡄⠀⠀⠀⠙⡽⡀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡝⠳⠶⠟⠁⠉⠉⠛⠓⠒⠚⠒⢤⡀⣧⠤⠀⠠⣔⡵⠃⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢇⢠⠤⣀⠀⠀⠀⠀⠀⠀⡀⠀⠀⠱⠀⠉⠉⡏⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢳⡀⠀⠈⠑⠒⠂⠐⠊⠀⠀⠀⣰⣀⠠⠤⣿⠆⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠀⠀⠘⣢⣄⡀⠀⠀⠀⠀⠀⠀⠒⠁⠀⠀⠛⠿⠧⣀⣀⠀
-                        ⠀⠀⣠⣤⠐⠊⠉⠉⠁⠉⠉⠐⠢⣤⡯⡀⠈⠙⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⢤⡶⠋⠀
-                        ⠀⣤⣻⠁⠀⡠⠀⠀⠀⠀⠀⠀⠀⡨⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠨⡝⡇⠀⠀
-                        ⢀⠜⠁⠀⢰⠁⠀⠀⠀⠀⠀⠀⣨⠎⢩⡻⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠣⣀⠀
-                        ⠛⠚⣿⠆⡇⠀⠀⠀⠀⠀⣠⠚⣿⢀⣷⢕⣧⢠⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢷⠚⠂
-                        ⠀⣰⢋⠀⡇⠀⠀⠀⡠⠊⠀⠳⠟⢾⡅⡄⠈⠁⡇⣴⣰⡀⠀⠀⠀⠀⠀⠀⠀⠈⢻⠗⠀
-                        ⠼⠗⠿⠞⢻⡀⠀⡜⠋⣿⠆⠀⠀⢎⡸⡇⠀⠀⠘⠀⠉⢣⠀⠀⠀⠀⠀⠀⣧⡏⣾⠷⠀
-                        ⠀⠀⠀⠀⠀⠑⡼⢖⡩⣤⠄⠀⠀⠈⡆⡇⣄⠀⠀⠀⠀⠘⡄⠀⠀⠀⢀⢰⠀⠀⡏⠀⠀
-                        ⠀⠀⠀⠀⠀⢸⡷⠋⢀⠜⠃⠀⠀⠀⡃⡿⣙⠉⠒⢄⣀⡴⡇⠀⡠⡄⡾⠾⣤⢞⡇⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣇⠔⠁⠀⠀⠀⠀⢀⠇⢱⠈⠑⢤⡂⠈⠁⣿⢺⠀⠙⠳⣄⢀⢾⡇⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢹⡀⠀⠀⠀⠀⡠⠊⠀⠸⡰⠀⠀⠈⠓⠎⠈⣾⠀⠀⠀⠈⠋⢸⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢹⠒⡔⠐⠚⡔⣄⣀⡤⡇⠀⢀⡀⠀⠀⠀⢱⠀⡠⡄⠀⠀⡸⣇⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠘⠒⠓⠂⠈⠉⠁⠀⠀⠻⠤⢏⣘⡤⠤⠴⣅⣹⡢⠼⠒⠾⠒⠨⠆⠀
-        """,
-        # haunter
-        "29": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠙⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡏⠀⠈⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡼⠀⠀⠀⠈⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠇⠀⠀⠀⠀⠈⠓⠒⠒⠒⠢⠤⣀⣀⢀⣀⣀⣀⠤⠤⠤⠒⠒⢒⣶
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀ ⠀⠀⡺⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⠀⠀⠀⣀⠔⠋⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢫⠉⢱⠃⢠⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠊⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⣼⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠔⠉⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡝⢿⠙⡄⠀⠃⠀⠀⠀⠀⠀⠀⣀⡠⢴⠇⠀⠀⠀⠀⠀⠀⡠⠾⠥⠤⠤⠀⠀⣀⣀⣀⡀
-                ⠀⠀⠀⢀⠔⠒⠒⠢⠤⠤⠀⣀⠀⢸⠸⣔⢣⡀⠀⢀⠀⢀⣠⠖⠋⠁⠀⢸⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠖⠋⠁
-                ⠀⢀⠔⠁⠀⡠⢀⠤⠀⡀⠀⠈⣇⠀⠿⡦⣍⠐⠉⠐⠿⠽⠭⢀⣀⣀⣠⠃⠀⣠⠆⠀⠀⠀⠀⠀⠀⠀⣀⠤⠚⠉⠀⠀⠀⠀
-                ⣀⢴⠎⢀⣤⡶⠃⠀⠀⢀⠤⡴⠋⠀⠀⠸⣿⡖⠻⡄⡠⠤⢤⠤⡍⡠⠒⠒⡽⠁⠀⠀⠀⠀⠀⢀⠴⠮⠥⢤⡄⠀⠀⠀⠀⠀
-                ⠻⡄⢣⡸⠉⢣⠀⢀⡾⠃⠀⠀⠀⠀⠀⠀⠹⡳⣤⡙⠁⠀⠀⠠⠜⠁⡀⡰⠁⠀⠀⠀⠀⠀⠀⠀⣀⠤⠖⠉⠀⠀⠀⠀⠀⠀
-                ⠀⠉⠚⠁⠀⠀⠑⠼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢭⡣⢿⣸⣆⠀⢀⡤⡞⠁⠀⠀⠀⠀⠀⠀⠤⡎⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠭⣈⣉⣃⣀⠤⣶⠋⠑⢦⡀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡠⠊⠀⠀⡖⠉⠀⠀⠀⠈⢧⡀⠀⠀⢻⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡎⠀⢀⣀⡸⠀⠀⠀⠀⠀⠀⠘⡦⣀⠀⠀⢣⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⣴⠃⡰⠁⠀⢀⡴⢺⡄⠀⠀⡼⠀⠉⠒⠠⢕⣄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠟⠀⠀⡗⠀⡰⠇⠀⢸⠁⠀⡰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣤⠃⠀⠀⣸⠉⡴⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # ivysaur
-        "30": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡀⣀⣯⠳⠴⢶⠤⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠣⠋⡿⢻⠀⠀⠀⠀⠑⠤⡀⠀⠀⠀⠀⠀⢰⠒⠒⡦⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⢸⠁⡘⠀⠀⠀⠀⠀⠀⠈⠳⣄⡠⠊⢣⡸⠀⠀⠁⡧⠄⢒⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⢸⢠⠃⠀⠀⠀⠀⠀⠀⢠⡦⣌⢧⠀⠀⠓⠀⠀⠀⠀⣠⣼⢀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⢸⣸⠀⠀⠀⠀⠀⠀⡰⢷⣄⠈⠙⠆⠀⠀⡴⠁⠀⠀⠀⠀⡘⠀⠀⠀⠀⠀⠀
-                ⠀⠀⣀⢯⠀⠀⢣⢏⠉⠐⡄⢰⠢⠧⣄⡀⠀⠐⡇⠀⠀⠀⠀⠀⡰⡁⠀⠉⠓⠀⠀⣠⠎⠀⠀⠀⠉⢛⠇⠀⠀⠀⠀⠀⠀⠀
-                ⢠⢄⡑⡌⠣⠀⠀⢻⡀⠀⠘⣼⠀⠀⠃⢱⡸⢲⣷⠤⡀⠀⠀⢠⣟⠛⠒⠒⠤⠤⣾⠣⠤⠤⠤⠤⡤⠼⢖⡊⠉⢢⠀⠀⠀⠀
-                ⠸⢄⡈⠙⠂⡀⠀⠀⠁⠀⠀⠘⠀⠀⡀⠈⡇⠀⡟⠀⠈⡇⠀⢸⣸⣷⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⢤⡈⢓⠢⣇⠀⠀⠀
-                ⠸⡅⠀⠀⣀⠄⠉⠑⠢⠤⢄⣀⢀⠀⡇⠀⠁⠀⠀⠀⢀⡟⢦⣸⢿⣿⠜⠁⠀⠀⡰⠂⡤⣀⠈⠲⡘⢏⢃⠉⠊⠀⠈⣷⡀⠀
-                ⠀⠈⠲⡛⢁⡠⠀⠀⠀⠀⠀⠈⠙⠫⢟⣦⣀⠀⡀⠀⠘⠀⠠⢿⠜⠁⠀⠀⠀⠀⡇⠀⡆⢸⣿⢦⡱⠀⠉⠀⠀⠀⠀⢯⣷⡀
-                ⠀⠀⠀⠈⠛⠤⣀⣀⣴⠋⠀⣠⠄⠠⢒⠭⡓⠷⣻⣄⠀⢀⡴⢻⠀⠀⠀⠀⠀⠀⢇⡠⠷⠒⠓⠉⠁⠀⠀⠀⠀⢠⠀⢘⠽⢧
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠚⠥⣄⣠⡴⠊⢀⡄⠈⣹⠕⠋⠘⡞⠀⠀⠀⠀⠀⠀⠀⢀⡤⡒⠖⠈⠉⠉⠉⠉⠑⠢⢥⠤⡖⡾
-                ⠀⠀⠀⠀⠀⠀⠀⢀⡠⠔⠊⠉⠈⠈⠓⢖⡹⢖⠟⡁⡹⡢⡔⠁⠀⠀⠀⠀⠀⠀⠘⠁⠙⠚⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠛⠁
-                ⠀⠀⠀⠀⢀⡠⠒⡡⠀⠀⠀⡎⠀⢀⢔⠕⡡⡞⠀⠇⡗⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠞⠀⠀⠀
-                ⠀⠀⠀⠀⠘⢔⠞⣡⠀⠀⣼⡇⢠⠋⠉⣸⡌⢣⣈⠴⠃⠀⠀⠀⠀⠀⠀⠀⠠⣀⡀⠀⠀⠀⠀⠀⠀⣀⡠⠔⡏⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠘⠲⣏⠠⠴⠁⠤⡎⠀⠀⠛⠁⠀⠀⠀⠀⡇⠀⠀⢀⡤⣀⠀⠘⣆⠈⠉⠉⠉⠉⠉⡁⠀⢀⣀⢸⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠙⢆⠀⠀⠀⠀⠀⠀⠀⢱⠀⠀⢸⠀⠈⠓⢄⠘⡄⠀⠀⠀⣠⠞⠀⠀⢸⠀⠉⡇⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⢈⡆⠈⠳⣄⠀⠀⠀⠘⡄⠀⠀⠳⣄⣀⠏⠀⢃⡀⠔⠺⡀⠀⠀⢸⣌⢣⡀⣃⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠑⠤⠊⡠⠀⠀⠈⡵⠤⣀⡀⢱⠀⠀⡎⢢⡄⠀⠀⢸⠀⠀⠀⢣⠀⠀⠛⠋⠀⠉⢸⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠐⠀⢈⠀⣀⠀⡜⠀⠀⠀⠉⠁⢣⡀⠙⠉⠀⠀⠀⠸⠄⠀⠀⠀⠱⡀⠀⣀⣀⢄⡦⡀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠒⠽⠚⠭⠖⠛⠀⠀⠀⠀⠀⠀⠱⢄⣰⠲⣜⣉⢾⢵⠀⠀⠀⠀⠈⠉⠒⠛⠒⠛⠉⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠁⠀⠈⠀⠀
-        """,
-        # jynx
-        "31": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠖⠒⠠⣄⠤⠐⠒⠢⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠁⠀⢀⣀⠀⢁⠤⢄⠀⠀⠀⠈⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡰⠁⠀⠀⡔⣣⠬⢧⠧⠾⢝⣓⡄⠀⢀⠀⠙⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⢁⠆⠀⣞⠝⡢⡀⠀⢀⢔⢤⠈⠙⡄⠈⢆⠀⠈⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⢀⠎⠀⡸⠸⢄⢵⠧⠠⡸⣌⡸⠀⠀⢱⠀⠈⡆⠀⠈⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠃⡜⠀⢀⠇⠀⠀⡎⢸⡇⢱⡄⠀⠀⠀⠈⡆⠀⢰⠀⠘⡘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣄⠃⠀⢸⢀⣀⡀⠸⣌⣁⠎⣀⣀⣀⠀⠀⡏⠀⠈⠀⠀⡇⢇⠀⠀⠀⠀⠀⡠⢄⠀⠀⠀⠀
-                ⠀⠀⠀⠀⡴⢤⠀⠀⠀⠀⠀⠀⣦⢸⠀⡄⢸⠟⠒⢬⡓⠤⠴⢋⠤⠒⠢⢍⢢⠁⠀⠀⠀⠃⠇⢸⣠⠤⡀⠀⡜⢁⣾⠴⢢⡄⠀
-                ⠀⣖⠒⢄⢡⠀⣇⠀⡠⠔⣄⠀⠃⡎⡄⠈⠈⡆⠀⠀⢱⠀⢠⠃⠀⠀⠀⠀⡝⠀⠂⢰⠀⡄⡸⢸⠱⢄⠹⠒⠃⠿⢋⡴⠚⠀⠀
-                ⢀⣀⣑⡦⠉⠁⡈⠋⣢⣴⡋⣀⣰⢡⢣⠀⠀⢣⢀⡠⠎⠀⠈⢆⡀⠀⠀⡰⠁⠀⠀⡜⢀⠃⣇⠼⠤⣼⡀⢸⠄⠀⠘⣁⣉⣱⠄
-                ⠓⠢⣠⡄⠀⠘⢀⡠⠂⠉⠉⠉⠉⢫⢎⢆⢆⠈⢖⠒⡟⠉⠉⡖⠨⠥⡼⠁⠀⢀⡜⠀⡜⢰⠁⠁⠀⠀⠙⣢⠤⢤⡌⢣⠀⠀⠀
-                ⠀⠫⠤⠚⠂⠈⠉⠑⢶⡉⠉⠉⣑⡾⣿⡾⡾⣦⣈⢦⡇⠠⢠⠇⡠⠊⣀⢔⡥⡞⢀⢜⢠⡗⠒⠒⠒⣤⠞⠁⠀⠀⠙⠒⠃⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠁⠘⣋⠴⡟⠀⠀⠈⠀⡝⠁⠀⢸⠘⠂⠙⠉⠁⡾⢔⡯⠚⣇⣼⠗⠒⠚⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠚⢁⡼⠁⠀⠀⠀⢰⠁⠀⠀⡎⠀⠀⠀⠀⡰⡀⠀⠀⠀⠈⢧⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢓⠼⠋⡝⠁⠀⠀⠀⣠⠃⠀⠁⢸⠁⠀⠀⠀⠀⠑⠱⡀⢣⡀⢀⡀⠑⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢀⡠⠤⠒⢊⡡⠞⠋⠀⠀⠀⣀⠔⠁⠀⠀⢀⠇⠀⠀⠀⠀⠀⠀⠀⠁⠀⠱⡀⠘⣵⣲⠷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⡴⠉⠀⠀⠀⠁⠀⠀⠀⢀⠔⠊⠁⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠤⣈⡎⠑⠢⢄⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠉⠚⠙⠛⠉⠒⠢⢄⡀⣏⠀⠀⠀⠀⠀⠀⠀⢀⣇⡠⠄⣀⠀⠀⠀⠀⠀⠀⠀⣀⣀⡀⠁⠀⣠⠤⠛⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠓⠒⠒⠒⠒⠒⠒⠋⠀⠀⠀⠀⠉⠒⠤⠤⠤⡔⠊⠁⠀⠈⠉⠉⠀⠀⠀⠀
-        """,
-        # kadabra
-        "32": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠒⣆⣀⠎⠉⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⣷⠀⠘⡀⠈⢢⠀⢱⣤⠠⠄⠒⠛⠓⠢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠘⢧⠤⣴⡯⠡⢋⣉⣣⡤⠛⢳⡶⣄⡀⠀⠀⠀⢈⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⠉⢉⡇⠀⠉⠒⠷⢽⡆⠈⠙⠛⠛⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⡀⢸⠨⣑⠦⣀⠀⠀⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⡁⣸⢆⠈⠑⢌⠑⠦⡥⢝⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡎⢹⠈⢆⠀⡠⠃⠀⠑⡤⣈⢳⡄⠀⠀⠀⠀⢠⣄⠀⣸⣁⣸⠇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⣳⠈⢯⡿⢅⠀⠀⠀⠀⠑⠛⠵⢜⢆⠀⠀⠀⢸⠼⢳⠿⠞⠉⠢⡴⠒⡆
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⡟⣂⡚⠘⢦⢕⣄⣀⢀⡀⠤⢐⡲⠑⢕⣄⠀⠀⠑⡍⠀⢸⠀⢸⡫⡔⠁
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡰⡇⢇⠀⠀⣠⠊⠀⡨⠗⠁⣠⡖⠓⠺⡗⡬⢾⠀⠀⠀⢸⠲⠶⣤⠤⠚⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⠤⠒⠉⠁⠈⢇⠀⠀⠉⠀⢠⠎⠀⡠⠊⠀⠈⠳⡄⠈⣡⠘⣆⠀⢰⠏⠀⡰⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢀⠔⠁⠀⠀⠀⠀⠀⠈⠲⢄⣀⣰⡗⢁⠜⠃⠀⠀⠀⠀⠈⢆⣿⠀⣏⣉⣹⣄⠴⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢠⠃⠀⠀⠀⠀⠀⠀⢀⠤⠊⠙⣤⡿⢠⠋⠀⢀⣀⡤⠔⠒⠒⢺⡏⣼⠃⠀⠈⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠇⠀⠀⡁⠀⡎⠀⡔⠁⢀⠔⠉⠉⢣⢷⡒⠈⠁⢀⠤⠔⣆⣠⢾⡷⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢸⠀⠀⠀⢣⠀⡇⡜⠀⡔⠁⠀⠀⠀⠇⣀⡨⠧⡚⠃⢩⠥⣬⢣⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠘⡄⠀⠀⠀⠑⣿⠀⡜⠀⠀⠀⠀⣠⣋⠀⠀⠀⢈⡆⢸⢣⡾⣹⡎⠑⠢⠄⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣄⠀⢇⠀⠀⠀⠉⠹⡄⡇⠀⠀⣠⠔⠁⠀⡌⣀⠤⡺⠇⠸⡻⢝⣾⣃⣀⣀⡠⠎⣸⠆⠀⠀⠀⠀⠀⠀⠀
-                ⢸⠈⠣⢼⡄⠀⠀⠀⠀⠙⣧⢠⠋⠁⠀⠀⣰⠊⠀⠉⠲⣒⡩⠚⢁⠟⠀⠇⠀⠀⢠⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠈⢢⠀⠀⠇⠀⠀⠀⠀⡴⠃⢹⠀⠀⢠⠞⠁⠀⠀⠀⠀⠀⢀⣴⠃⠀⠀⠑⢦⡀⠀⢇⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠑⠢⢤⣀⡠⠔⠚⠁⠀⣼⠃⠀⣞⣶⠤⠤⠤⠤⠔⠒⠃⠀⠀⠀⢠⣏⡁⣁⡀⠀⠙⠉⠭⣝⠢
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠜⠀⠀⠀⠈⠛⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⠀⠀⠈⠉⠉⠲⢤⠘⣶⢤⣎⣇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣼⢌⣑⡞⠈⠉⠘⣄⢤⡳⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⠖⠋⠀⠈⠉
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢻⣰⠟⠁⠀⠀⠀⢹⣰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # kakuna
-        "33": r"""
-                                ⠀⠀⠀⠀⠀⠀⠀⣀⠤⠒⠒⠒⠒⠒⠒⠢⠤⣀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⡠⠖⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠲⢄⠀⠀⠀⠀
-                                ⠀⠀⡠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⡄⠀⠀
-                                ⠀⡼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀
-                                ⣰⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣤⣄⡀⠀⠀⠀⠀⠀⠀⠸⡀
-                                ⣿⢻⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣾⣿⣿⣿⣿⣦⠀⠀⠀⠀⢀⢴⠃
-                                ⢿⣯⣧⠀⠀⠀⠀⠀⠀⢠⠪⢀⡿⠟⢛⣉⡭⠟⠁⢀⡠⠖⣡⠃⠀
-                                ⠀⠹⣦⢄⡄⠀⠀⠀⠀⠙⠛⠋⠉⢉⣁⡠⠤⠀⠀⢀⡤⢾⠁⠀⠀
-                                ⠀⠀⢈⢷⠉⢳⠲⠶⣀⠉⠉⠉⠉⢀⣀⣀⠤⠔⠊⠁⠀⢀⠱⡀⠀
-                                ⠀⠀⡎⠈⢇⠸⠀⠀⢀⠝⠋⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄
-                                ⠀⠀⢳⣲⠾⣣⡣⡰⠻⡕⠢⢤⣀⣀⠀⠀⠀⠀⣀⠠⠤⠔⣒⡝⠁
-                                ⠀⢠⠏⠀⢀⠇⢸⠁⠀⢧⠀⠀⠈⠑⠛⠓⠒⠀⠀⠈⠉⠉⢀⡧⠀
-                                ⠀⢸⢀⣀⣼⠀⢸⠆⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⢀⡤⠒⡙⠀⠀
-                                ⠀⠀⢳⠉⡆⠀⢸⠀⠀⠀⢹⡲⢄⡀⠀⢀⣠⠴⠊⠁⠀⠀⡇⠀⠀
-                                ⠀⠀⢸⠀⢹⠀⢸⠀⠀⠀⢀⡇⠀⠉⠓⠋⡞⠀⠀⠀⠀⢰⠁⠀⠀
-                                ⠀⠀⠸⠀⠘⡆⢸⠀⠀⢀⣾⡀⠀⠀⠀⡸⠀⠀⠀⠀⠀⡏⠀⠀⠀
-                                ⠀⠀⠀⣧⢠⣿⣸⠀⢠⠞⠀⠙⢦⠀⢠⠃⠀⠀⠀⠀⡸⠀⠀⠀⠀
-                                ⠀⠀⠀⠸⡿⠃⠱⣧⡏⠀⠀⠀⠀⠳⣇⠀⠀⠀⠀⡰⠃⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠘⣧⡞⡏⠉⠉⠓⢤⡀⠀⠘⣆⠀⠀⡴⠁⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⢻⠀⢐⠀⠀⠀⠀⠙⢦⠀⢸⢁⠎⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⠀⢇⡸⡦⢤⡀⠀⠀⠈⢧⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⠀⠈⢧⢣⠀⠙⢆⠀⡴⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⠀⠀⠀⠹⣤⣀⠼⠊
-        """,
-        # machoke
-        "34": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡠⠔⣒⣈⡉⠉⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠟⣱⡕⢉⣠⡤⡌⠑⠪⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣼⡁⢠⢀⠀⠀⠉⠉⠙⠁⠀⠀⠌⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⣯⠟⠛⠛⠛⠭⠵⠶⠢⠤⠊⠀⢿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡈⢢⣄⡀⡀⠀⠀⠀⠈⠀⠀⠀⠘⠣⣄⣀⣀⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⠔⠊⠉⠡⣊⡈⠉⠢⠀⠀⣀⡠⠄⠒⢒⡔⠉⠀⠀⠀⠉⠑⢄⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣠⣴⢶⣋⡥⠆⠀⡰⠁⠀⠈⠑⠲⠐⠋⠀⠀⠀⠀⡜⠑⠢⢄⣀⣀⡀⢀⠨⣳⣦⣀⠀⠀⠀⠀
-                        ⠀⠀⣠⣴⠞⢩⠾⠓⣩⡴⠟⢹⠁⠀⠀⠀⠀⢠⠀⠀⠀⠀⠀⠰⡁⠀⠀⠰⢤⡾⢓⣴⡶⠤⢙⣻⡢⠤⡄⠀
-                        ⠀⢸⣙⠰⠀⣆⢦⠈⠙⢄⠀⢸⡀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠙⢢⣀⡀⠀⢀⡽⡫⣴⠝⣊⢥⠴⢂⢎⡇
-                        ⠀⣼⠟⡇⠀⠿⡀⠇⠀⢸⡤⠶⠕⣄⣀⡠⣤⣭⡥⣤⣀⡀⠀⠀⡠⢈⣠⠾⡶⣫⡮⢊⣔⠟⡊⠁⠤⠊⢰⡇
-                        ⢘⡿⢃⢣⣆⠼⠓⠃⢀⡏⠀⠀⠀⣿⣷⠹⡿⠿⠚⡎⡎⡏⢻⡿⠋⠁⠐⠊⠘⠡⠞⠋⠀⠉⠀⠀⣀⣠⠞⠀
-                        ⠀⢳⡿⠈⠀⠀⠀⠀⢠⠙⢤⠀⢠⡿⢿⣜⢝⣶⣶⡣⣣⣳⣸⠁⡰⠃⠀⡄⠀⠀⠀⢠⠒⣂⠤⠖⠋⠁⠀⠀
-                        ⠀⢰⢣⠀⡆⠀⢢⠀⠀⢣⣼⠴⠫⣄⠃⠀⠏⠁⠀⡩⠁⠀⡨⠳⣧⡀⢸⠀⢸⠀⢸⠏⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠘⠢⣇⣘⣄⣈⣦⡠⠜⠂⠤⣀⠈⢳⡄⠀⠀⣴⡃⢠⡞⠀⠀⠀⠈⠉⢏⠈⢻⡉⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣹⡻⠀⠀⠀⢀⡠⠲⠁⠘⡄⣀⠀⠀⣏⠈⠢⡀⠀⠀⠀⠈⢆⠀⢳⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣰⡱⠁⠀⢀⠎⠁⠀⠀⠀⣠⠏⠉⠉⠛⠛⣦⠀⠈⠢⡀⠀⠀⠀⠁⠄⡇⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡷⠁⠀⠀⡸⡄⠀⣀⣠⠞⠃⠀⠀⠀⠀⠀⠀⠑⢄⡀⢘⠀⠀⠀⠀⢡⠙⢄⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢠⢧⠀⠀⡔⠁⠈⠹⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢧⠱⡀⠀⠀⠀⣧⠀⢳⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢸⡌⠄⢸⠀⠀⠀⢀⡿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠑⠒⡄⠀⠀⠀⢸⡇⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣷⠀⠀⠀⠀⢠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠓⠤⣀⠀⠀⠀⠀⠈⣧⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡠⠋⠀⠀⠀⠄⠹⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⣳⠀⠀⠀⠀⠀⣧⠀⠀⠀⠀
-                        ⠀⡴⡶⢎⢄⠤⡠⠤⠤⠀⣀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣟⢀⠀⠀⠀⠀⠈⢧⠀⠀⠀
-                        ⠀⠑⠳⠶⠾⠦⠵⠤⠤⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣅⢀⣹⣁⣩⣀⣏⣩⣀⡇⠀⠀
-        """,
-        # magikarp
-        "35": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⢲⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠀⠀⠀⠀⠀⢠⠎⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠑⡄⠀⠀⡰⠁⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠈⢦⠞⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡆⠀⠀⠃⠀⠀⠀⠀⢸⠒⠒⠒⢒⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡒⠳⣄⡀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢀⡠⠔⠒⠈⠉⠁⠀⠀⠀⠘⡄⢉⡑⢖⠤⡀⢀⡤⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢀⠔⠁⡠⠀⠀⢀⣀⡀⠀⠀⠀⠀⢳⠻⢴⣋⡀⠈⠝⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢀⡰⠁⠀⠀⠀⡠⠊⠁⡀⠈⢢⠀⠀⠀⠸⡀⠀⠱⡌⠑⠂⠢⠌⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠰⣁⠙⠢⡀⠀⠀⡇⠀⠀⠁⠀⠀⡧⠀⠀⠀⣇⡀⡜⠁⠀⠀⠀⠀⠈⡗⣄⠀⠀⠀⠀⠀⠀⠀⣀⠠⢤⣒⡒⡶⠆
-                        ⠀⠀⢏⡆⢣⠀⠀⠱⢄⡀⠀⢀⠜⠀⣀⠴⣒⣓⣒⣓⣒⣒⣒⣒⣒⣒⡓⠾⡆⠀⠀⣀⠤⢒⡭⠒⠋⠁⠀⢠⠁⠀
-                        ⠀⠀⢸⣵⢸⠀⣖⠲⢄⠈⠉⢁⣤⢞⡿⠋⢀⣀⡀⠠⠤⠤⠤⡠⠚⠁⡇⠀⠸⡠⠊⡡⠞⠁⠀⠀⠀⠀⠀⡘⠀⠀
-                        ⠀⢠⣿⡜⢠⠄⠈⠹⢆⢳⡀⠸⢰⠯⠒⠉⠁⠀⠀⠀⠀⡠⠊⠁⠀⢀⠇⠀⠀⣧⡮⠅⠒⠊⠉⠉⠉⠁⡩⠃⠀⠀
-                        ⠀⡇⡧⡬⢯⡀⠀⠀⠈⡇⢇⠀⠈⠫⢍⡉⠒⠂⠄⠀⡜⠁⠀⠀⠀⡸⠀⠀⢀⡏⠀⠀⠀⠀⠀⠀⢠⠞⠁⠀⠀⠀
-                        ⠀⡟⡄⠘⢆⠙⠢⡀⠀⢱⢸⠀⠀⠀⠀⡸⠶⣄⡀⠀⡇⠀⠀⠀⢠⠃⠀⣀⢼⢇⠀⠀⠀⠀⠀⢰⠁⠀⠀⠀⠀⠀
-                        ⠀⢰⢱⠀⠀⠙⠢⢬⠗⢺⢸⣄⣀⢀⡔⠁⢀⡅⠉⠲⠇⠀⠀⣠⣃⠤⠊⡇⢸⠈⢦⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠳⣳⠀⠀⠀⠀⠈⢹⢸⡦⠴⠭⠕⣚⣉⣀⢠⠤⠤⠔⠚⠉⠀⠀⠀⢸⠘⡄⠀⠱⡀⠀⠀⡇⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠹⣇⠀⠀⠀⠀⠘⡄⡇⠀⠀⠀⠀⠀⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠀ ⢣⠱⡀⠀⠈⠓⢴⠁⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢫⢆⠀⠀⠀⣜⣣⠸⡀⠀⣄⠀⠀⠀⠀⠀⠈⠣⡀⠀⠀⠀⠀⠀⠀⢣⠳⡀⢀⠴⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡞⡄⠀⠀⠉⠈⢧⠱⡜⠈⠢⡀⠀⡔⠢⠤⣀⣙⡄⠀⠀⠀⠀⠀⠀⠑⢕⡏⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡇⡇⠀⠀⠀⠀⠀⢣⡱⡄⠀⠘⠶⠁⠀⠀⠀⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢠⡝⠀⠀⠀⠀⠀⠀⠀⠑⢌⡳⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⢍⣒⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # magmar
-        "36": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⠀⠀⠀⠀⠀⠀⠀⣶⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢬⠌⠑⢴⠀⠀⠀⣴⠊⠀⢳⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠒⠁⢠⣼⠂⢀⣀⡹⠀⠀⠼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠤⡄⠀⠈⢹⡀⢹⠀⠀⠀⠀⠳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠚⠁⢀⡠⠔⠛⠉⢀⠀⡀⣤⡒⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⡜⠀⠀⠀⠀⠁⢉⠸⢺⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡀⠱⢄⡀⢀⣱⢄⣀⠀⣀⣠⠆⠀⠀⣳⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢢⡈⠉⢚⡣⠥⠊⠙⠳⠦⣤⡊⠀⣀⡼⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⢀⠀⢈⡦⠜⠴⢦⡤⢤⢒⣥⣒⠡⣼⠛⠀⠒⠦⣀⣀⣠⣀⣀⠀⠀⠀⠀⣀⡀⠀
-                ⠀⣦⠀⠀⣀⠀⠀⠀⢤⠤⢀⣀⣠⠴⣿⣂⠝⢏⠏⣹⣂⡀⠘⠫⢵⢿⣿⣿⠧⠟⠑⢄⠀⠀⠘⣜⡀⢇⢌⣶⢦⠶⠾⢽⢓⠇
-                ⠀⡇⢣⡴⢻⠀⠶⢖⣒⡳⠢⠊⠀⡑⡏⣬⡆⠏⢠⠈⣡⡿⠀⠀⢈⠀⠀⠀⠀⠀⠀⠀⠳⡀⣰⠧⠀⢸⠶⠀⠈⡆⠀⠀⡿⣀
-                ⡘⠁⠀⠁⠘⣆⢤⡶⢽⡀⠀⠀⢸⡉⢇⣤⢯⣒⡏⣰⠦⠃⠀⣠⠎⠀⣀⣀⠀⠀⠀⢀⢤⢷⡥⠾⢇⣼⣒⡦⠾⠤⠴⠎⠀⠘
-                ⠑⠤⡀⢰⠀⠀⢹⠄⠓⠊⠉⠋⠉⠚⠻⠫⢎⡉⢉⠇⠉⠉⠉⠀⣀⠏⠀⢥⡀⠀⠀⠳⡄⠉⡇⠀⠀⠀⠈⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⣷⢎⠣⠀⠫⡀⠀⠀⠀⠀⠀⠐⢖⠲⠤⣭⡾⠤⠄⠤⣀⠘⡅⠀⠀⢠⠃⠀⠰⣏⠀⠀⡜⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⣇⠀⠁⣀⡴⠋⠀⠀⠀⠀⠀⠀⠀⢑⠞⠁⠀⠀⠀⠀⠈⢫⠁⠀⠀⠈⠷⢆⡔⠚⠀⢀⠇⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠈⠑⠚⢫⠢⡀⠀⠀⠀⠀⠀⠀⢀⡎⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠉⠁⠀⢀⠎⠀⠀⠀⡟⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⠣⡈⠢⣀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⢀⠴⠃⠀⠀⠀⣴⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠱⣄⠀⠉⠒⠠⠤⠄⢸⣄⠀⠀⠀⠀⠀⣀⠜⠤⠤⠤⢤⠔⠚⠉⠒⠂⣴⣶⢹⣿⡄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠓⢄⡀⠀⠀⢀⣾⢣⣿⣶⡖⠒⠉⠀⠀⠀⢀⠔⠁⠀⠀⠀⠀⡞⠙⠛⠬⠟⠋⠲⢄⡀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⡶⠛⠧⠿⠿⠟⣇⡀⠤⠤⠒⠚⠁⠀⠀⠀⠀⠀⠀⠳⢄⡀⠀⠀⠀⣀⣀⢸⠓⢤⡀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡫⣄⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠤⢐⣄⣈⢳⡓⠢⠽⠄⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡞⣀⣜⣀⣀⡎⢈⡶⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠈⠉⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠀⠀⠀⠈⠣⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # nidorino
-        "37": r"""
-                        ⠀⠀⢠⠿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⡾⠀⡆⠀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⡧⠀⣯⡾⡹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡔⡕⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⢡⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢠⠃⠀⠙⠃⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣼⠀⡷⠀⠀⠀⠀⠀⠀⢀⡠⠋⣰⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡼⠀⠀⠀⠀⢻⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠇⢸⡇⠀⢀⣤⠀⠀⡴⠊⠀⣰⠁⢀⣀⣀⡠⢤⠀⠀⠀⠀⠀⠀
-                        ⠀⡇⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⢰⡏⡆⠀⡜⠀⢸⣆⡴⠋⡼⣠⠞⠀⠀⠀⣙⠋⠁⡰⠃⣰⠋⠀⠀⠀⠀⠀⠀
-                        ⢸⠀⠀⠀⠀⠀⠀⠘⣄⠀⠀⠀⠀⢘⠁⢣⣸⠁⠀⠈⡏⠀⡠⠟⠁⠀⢀⣀⡁⠀⢠⠊⠀⡼⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠉⡄⠀⠀⠀⠀⠀⠀⠈⠲⣀⠀⠀⢀⠀⠘⡏⠀⠀⠀⠀⡞⠀⣀⠔⠊⠁⠈⡆⢠⠃⠀⣾⠁⣀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⡟⠀⠀⢸⠀⠀⠹⠂⠀⠀⡸⢁⠜⠁⠀⠀⠀⠀⡇⡜⠂⠈⠳⡀⣽⠃⠀⠀⠀⠀⠀⠀
-                        ⠀⠇⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⣀⢾⠀⠀⠀⠀⢀⠜⡠⠋⠀⠀⠀⠀⠀⠀⠰⡇⠀⠀⠀⠸⣧⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⣆⠀⠀⠀⠀⠀⠀⠀⢸⣄⠜⠁⠊⠀⠀⠀⡰⠋⡔⠁⠀⠀⠀⠀⠀⠀⠀⡇⡇⠀⠁⠢⠀⠉⠓⢆⡀⠀⠀⠀⠀
-                        ⠀⠙⢦⡀⠀⠀⠀⠀⠀⡼⠁⠀⠀⠀⠀⠀⡏⠀⡸⠀⠀⠀⠀⠀⠀⢀⢤⡲⠕⠃⢸⠙⡄⠱⣠⡄⠀⢣⠀⠀⠀⠀
-                        ⠀⠀⠀⠉⠳⡀⠀⢀⠞⠀⠀⠀⢰⠋⢃⠀⢇⠀⡇⢀⣀⠀⢀⣤⡮⠓⠉⠀⠀⠀⠀⡇⢱⢀⡿⡴⠀⡆⠹⡀⠀⠀
-                        ⠀⠀⠀⠀⠀⠻⡰⠋⠀⡀⠠⠀⠀⠑⠼⠀⡼⠂⡷⠛⢿⣴⠟⠁⠀⠀⠠⠊⢢⠀⠀⠘⠚⢸⠀⠀⣰⠁⠀⠱⡀⠀
-                        ⠀⠀⠀⠀⢠⠏⠀⠀⡰⠁⠐⠀⠀⠀⠀⠼⠃⢀⢡⠀⠈⢋⠀⠀⠀⠀⠘⢄⣸⠀⢠⣤⠀⡼⣀⠔⠁⠀⠀⣠⢧⡀
-                        ⠀⠀⠀⠀⠈⡆⣠⠊⠀⠀⠀⠀⠀⠀⠀⠀⢠⡆⠀⠀⠀⠐⣆⠀⠀⠀⠀⠀⣡⠤⡈⠋⣰⠋⠉⢳⣁⡵⠔⠓⠢⠷
-                        ⠀⠀⠀⠀⡠⠋⠁⠀⠀⠀⠀⠀⢰⠁⢀⣼⠃⡣⠀⠀⠀⠀⡇⠀⠀⢀⡴⠋⠀⠀⠈⣶⠃⠀⠀⠀⠉⠀⠀⠀⠀⠀
-                        ⠀⢀⡠⣊⣤⣤⡖⠊⠉⠛⠀⠀⢷⠀⡮⠟⠊⠁⢀⡤⠔⡒⠃⠀⡴⠛⠁⠀⠀⠀⣠⢾⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠈⠉⠉⣸⠛⠇⠀⠀⠀⠀⠀⠀⠁⠀⠀⢊⠾⡁⣧⣎⣀⣀⣎⣀⣀⡀⠤⢔⡪⠣⡈⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⣠⣇⡦⢸⢀⠀⠀⠀⢀⠃⠀⠀⢠⠏⣴⠟⠃⠀⠀⠀⠀⠘⣆⠀⠀⠀⠰⡀⢃⠸⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⣠⢋⣨⢦⡎⣻⡄⠀⢀⠎⣀⡤⡶⠵⠞⠁⠀⠀⠀⠀⠀⠀⠀⠈⢷⡀⣖⢄⠈⠊⠀⢻⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠈⠁⠀⠀⠉⠉⠑⠦⠤⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣳⣮⠙⡠⠤⣀⣏⣢⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⠚⠒⠣⣠⠏⠁⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # poliwhirl
-        "38": r"""
-                ⠀⠀⠀⠀⣀⡀⠤⠤⢠⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⡠⠒⠉⠀⠀⠀⠀⠀⠈⠑⢦⠀⠀⠀⠀⢀⣄⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠸⠀⠀⠀⠀⠀⢀⠤⠀⠰⠦⠈⣆⢠⣴⣝⣢⠀⠀⠉⠢⡀⠀⠀⠀⠀⣀⠤⠤⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢿⡀⠀⠀⠀⢀⣸⠀⠀⠀⠀⢠⢳⢳⣱⣧⡽⠔⠐⠀⠉⠉⠉⠑⠿⡿⣪⠍⢭⣶⡀⠙⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠈⠣⣊⠉⠁⠈⠑⠒⠒⠢⣞⢸⡧⠋⠁⡆⠀⣠⠀⠀⠀⠀⠀⢸⠠⣿⣦⣴⣿⡇⠀⢸⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠈⠁⠒⣖⠀⠀⢀⣠⢟⣡⠤⠒⠒⠒⠲⠤⢄⡀⠀⠀⠀⠀⠣⣻⠯⢠⡼⠁⠀⢸⡃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠉⠛⠯⣡⠟⣡⣔⠮⠛⠛⠛⠷⢦⣄⡈⠒⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠘⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⢃⡾⠋⣠⣤⡶⠶⣤⣄⡀⠉⠻⣦⡀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠤⣈⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣎⡞⢠⡾⢋⣤⣤⣤⣄⡈⠙⢶⡀⠈⢷⡄⠈⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⡩⠓⠒⢄⠀⣀⣀⡀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢸⣿⢀⡿⣰⠟⣡⣤⣤⡉⢻⣆⠈⣿⡄⠘⣿⠀⠀⡇⠀⠀⠀⠀⠐⠢⢄⡞⠀⠀⠀⠊⠁⠀⠀⠈⠑⢦⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠸⣿⢸⡇⣿⢸⣏⢠⡌⣿⠀⣿⠀⢸⡇⠀⣿⡇⠀⢸⠀⠀⠀⠀⠀⠀⠀⣇⣀⠄⠀⠀⠀⠀⠀⠀⠀⠀⢹⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢿⡎⣷⠹⣧⣙⣛⣡⡟⢀⡟⠀⢸⡇⠀⣿⡇⠀⢸⠀⠀⠀⠀⠀⠀⠀⢀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠸⣿⡜⠷⣌⣉⣉⣉⣴⡟⠁⢠⡿⠀⢠⣿⠁⠀⡆⠀⠀⠀⠀⠀⠀⢀⡾⣇⠀⠀⠤⢄⡀⠀⠀⠀⢀⡾⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢟⢶⣌⡉⠉⠉⠀⣀⣴⡟⠁⣠⣿⠃⠀⡰⠁⠀⠀⠀⠀⠀⣠⡞⠁⠉⢦⡀⠀⠀⢹⣀⡠⠴⠋⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢌⡙⠛⠛⠛⠋⢁⣠⣾⠟⠁⢀⠜⠁⠀⠀⠀⠀⢀⠔⠃⠀⠀⠀⠀⠈⠉⠐⠉⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠒⡤⣀⠀⠛⠉⣀⡠⠔⠁⠀⠀⠀⠀⢠⠚⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⣳⠈⠙⣗⠒⠒⠒⠒⠊⢳⡀⠀⠸⣅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠄⠒⠂⠉⠈⠀⠀⠀⢱⡄⠀⠀⠀⣰⠇⠀⠀⠉⠑⠶⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⣀⠤⠚⠁⠀⠀⢰⠁⠀⠀⠀⠀⠀⠀⠈⢳⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠒⠶⠒⠒⠒⠊⠉⠀⠀⠀⠀⠀⠀⠈⠢⣄⠀⠀⠀⠀⠀⠀⣸⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠑⠲⠒⠲⠊⠁⠀⠀
-        """,
-        # porygon
-        "39": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⢒⣧⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⢸⢸⡇⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠔⠊⠁⠀⠉⠉⠑⢻⠧⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠀⡀⢸⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠜⠋⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⠙⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠇⠀⠇⢸⠆⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢀⠜⠁⠀⠉⠐⠒⠂⠤⠤⣄⣠⠃⠀⠀⠀⠀⠑⣄⠀⠀⠀⠀⠀⠀⠀⡞⠀⢸⠀⣸⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢠⠎⠀⠀⠀⠀⠀⠀⣖⠒⠉⠉⠉⠻⣆⠀⢀⣠⠴⢺⡇⠀⠀⠀⠀⠀⣴⠁⠀⡇⠁⣿⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣠⠃⠀⠀⠀⠀⠀⠀⢠⡇⠀⣠⣄⠀⢀⣬⡯⠁⠀⠀⡎⠀⠀⠀⠀⠀⢀⡇⠀⢰⠀⠀⣟⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⡶⠁⠀⠀⠀⠀⠀⠀⠀⣼⠀⠀⠙⢛⠔⠉⡸⠀⠀⠀⢠⡇⠀⠀⠀⠀⠀⡾⠀⠀⡜⠀⠀⡇⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢀⡜⠀⠀⠀⠀⠀⠀⠀⢠⡼⠋⢦⣀⣔⣁⡠⠤⠇⠀⠀⣠⠾⠂⠀⢀⣀⣀⣠⣃⣀⠀⡇⠀⢸⡅⠀⠀⠀⠀⠀⠀
-                ⠀⠀⡎⠐⠒⠤⠤⣀⣀⠀⣠⠞⠀⢠⠞⠁⠀⠀⠀⠀⠀⣠⠔⠓⢒⣉⠭⠭⠛⠛⠁⠀⠙⠻⣅⠀⢸⡇⠀⠀⠀⠀⠀⠀
-                ⠀⢠⠁⠀⠀⠀⠀⠀⠀⡹⠓⢤⠜⠁⠀⠀⠀⠀⠀⢀⠖⢳⡏⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⢈⢷⢸⠅⠀⠀⠀⠀⠀⠀
-                ⠀⡜⠀⠀⠀⠀⠀⢀⠜⢀⠔⠁⢇⠀⠀⠀⢀⣠⠔⠁⠀⠘⡌⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠋⠸⣞⠀⠀⠀⠀⠀⠀⠀
-                ⣠⠇⠀⠀⠀⠀⢠⢎⡴⠋⠀⢀⣘⣦⢖⠋⠉⠀⠀⠀⠀⠀⢇⠀⠙⢦⠀⠀⠀⠀⠀⣀⣞⡤⠴⠒⠋⠓⠲⢄⡄⠀⠀⠀
-                ⠛⠦⢄⣀⠀⣠⣴⣋⢤⠲⠊⠉⢠⠃⠀⠙⠦⡀⠀⠀⠀⠀⢸⡀⠀⠀⣧⠀⠀⢀⣼⠋⠒⠤⣀⠀⠀⠀⠀⠀⠈⠉⣒⢦
-                ⠀⠀⠀⠉⠉⠙⠁⠀⠀⡇⠀⢀⡎⠀⠀⠀⠀⠈⢢⡀⠀⠀⠀⡇⠀⢸⠀⠀⣠⠊⢸⠀⠀⠀⠀⠉⠒⠤⣀⢀⡤⠊⠁⡎
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⠃⠀⡼⠀⠀⠀⠀⠀⠀⠀⠉⠢⡀⠀⢸⠀⡇⢠⠾⠁⠀⡇⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⠀⢀⠇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢾⠀⠀⠙⠫⣕⡒⠠⠤⠤⠄⣀⣀⡀⠢⡈⣶⡱⠋⠀⠀⢰⠃⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⡞⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⢤⣀⠀⡇⢉⡷⠤⣀⠀⠀⠀⠀⠉⠉⢻⡁⠀⠀⠀⡸⠀⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⡼⠃⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠳⠊⠀⠀⠈⠙⠢⣄⡀⠀⠀⠀⠳⡀⠀⣠⡇⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⡼⠃⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠛⠒⠢⡤⣱⣴⣿⠁⠀⠀⠀⠀⠀⠀⢸⠁⠀⡸⠃⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⣿⡀⠀⠀⠀⠀⠀⠀⡇⠀⡰⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠿⢭⣒⠢⠤⣀⣸⠀⣰⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⢢⢬⣶⠃⠀⠀⠀⠀⠀⠀
-        """,
-        # raticate
-        "40": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡎⢧⣱⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣀⡀⠀⠀⠀⠀⠀⠀⠀⢀⠴⢁⢜⣧⡹⣀⡠⠔⣲⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠈⠫⡢⡀⠀⠀⠀⠀⢀⣸⠤⠎⠀⠀⠋⠀⠀⠀⠀⠐⣳⠆⢀⣀⠤⠤⠤⠤⢤⡤⠤⢄⠀⠀⠀⠀⠸⣒⢤⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠘⢌⠢⡀⣴⠊⠁⠀⠀⠉⠀⠀⠀⢀⣀⣀⡉⠁⢠⠋⢉⡠⠖⠊⠉⠉⠉⡏⡱⠋⠀⠀⠀⠀⠀⠈⠓⣍⠢⡀⠀⠀⠀⠀
-                ⠀⠐⢶⡬⢷⡽⣇⢉⣽⠱⣀⣀⠐⠛⠿⠧⣀⣱⠀⠀⠀⢰⡋⠀⠀⠀⠀⠀⠀⡏⢢⡀⠀⠀⠀⠀⠀⠀⠀⠈⠣⡙⢄⠀⠀⠀
-                ⠀⠀⠀⣈⣻⢐⡬⠭⠥⠤⡀⠀⠈⠉⠦⣀⣀⣀⣀⣀⣀⣀⣇⣀⡀⠀⠀⠀⠰⢁⠔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⡌⢣⠀⠀
-                ⠀⠘⠛⠉⠹⡀⡆⠀⠀⢠⢷⠀⠀⠐⠪⡥⠴⠶⠶⠒⣒⣒⣲⣖⡒⠛⣋⠕⢡⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⢣⠀
-                ⠀⠀⠀⠀⠀⢣⢇⡇⠀⡏⠀⢧⠀⠀⠀⢝⡫⢍⡉⠉⠉⠉⠉⠈⠒⠥⠤⠔⠋⠷⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⣇
-                ⠀⠀⠀⠀⠀⢸⢸⢹⠙⡀⠀⠘⡄⠀⠀⠀⠈⡗⠬⣓⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠦⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡖⢺
-                ⠀⠀⠀⠀⠀⢸⢸⠀⠀⢣⠀⢠⠃⠀⠀⠀⠀⢰⠀⠀⠉⠚⠳⠦⠀⠀⠀⠀⠀⠀⠀⢰⣏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⣓⣺
-                ⠀⠀⠀⢀⠤⠤⡑⢵⡢⠤⠷⠃⠀⠀⠀⠀⠀⢈⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⠀⢸
-                ⠀⠀⢰⣡⡶⢇⠜⣫⢺⠱⣘⡕⢄⠀⠀⠀⡠⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⢸
-                ⠀⠀⠀⡎⢡⢎⣉⣉⠟⠀⠀⠈⠉⠀⠀⠀⠈⡱⣄⡰⢊⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡄⠀⠀⠀⠀⠀⠀⣠⡃⠀⢢⠇
-                ⠀⠀⠀⠳⠃⠀⠀⠀⠇⠀⠀⠀⠀⠀⠀⠀⢸⣰⣗⠓⠊⠘⣶⠒⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⣠⡔⠁⠈⣦⠋⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣾⠀⠀⠀⠀⠀⠀⠀⠈⠀⠈⡢⠤⠤⣧⠞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣧⡤⢤⡒⠻⡄⠘⣄⡴⠃⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠙⠺⡗⠀⠢⠀⢄⣀⡀⢠⠅⠀⠀⠀⠈⢳⠄⠀⠀⠀⠀⠀⠀⠀⠀⣸⠀⢱⠀⡁⢀⡧⠜⠉⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣀⣔⣒⣵⢄⠀⠀⠈⠁⠈⠉⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⣰⠣⠤⠇⠒⠋⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢠⠊⢀⡠⠒⠒⠂⠑⠢⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⡆⠀⠀⠀⠀⠀⣠⢾⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠲⠊⢡⣣⠚⠉⠉⠉⠉⠉⠉⠑⠂⠤⢄⣀⣠⣤⣊⣀⣀⠠⠤⠒⠉⡠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡔⢉⡴⠊⠁⣙⠀⢀⠔⠲⢀⠞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠓⢹⡴⠊⠉⠈⠉⠇⣠⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠴⠃⠀⠀⠀⠀⠀⠀
-        """,
-        # seel
-        "41": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⠄⠒⠒⠢⢄⣀⠀⠀⠀⠀⠀⣠⡤⠐⠒⠉⠉⠙⠒⠢⢄⡀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠮⠒⠒⠀⠀⠀⠀⠈⠢⣀⠀⣠⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢳⡄⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡶⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⡾⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠒⠤⡀⢳⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣇⢀⠤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⢀⠀⠀⠀⠀⠸⣸⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⠃⠀⠀⢀⡤⠒⠒⠤⡀⠀⠀⠀⠀⡠⠒⠒⠒⢤⡀⠀⠀⠉⢢⡀⠀⢀⠇⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⢤⠔⠉⠀⠀⠀⠀⢸⠀⠀⠀⠀⡁⠀⠀⠀⠀⠘⣄⠀⠀⠀⡷⠒⠋⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠏⠀⠀⠀⠀⢷⡀⠀⠀⠀⠀⠈⠑⠒⠊⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣴⠎⠀⠀⠀⠀⠀⠈⢷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠒⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣶⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⢱⠁⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠡⡆⠀⠈⢖⠒⠢⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡇⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠋⠀⠐⠃⠀⠀⠀⠀⠀⠀⠈⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠃⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⢊⠞⠙⡄⠀⠀⠀⠀⢠⠂⠑⢄⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡆⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣀⠄⣠⡄⢤⠇⢠⣮⡇⠀⠀⠀⠀⠀⠀⣞⣱⡌⠀⠀⠀⠀⢱⠀⠀⠀⠀⠀⠀⠀⢀⠞⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⡠⠔⠊⠑⠀⠀⠀⠀⢸⠠⠬⠟⣃⠀⢀⠀⠀⠀⣀⣹⣿⠃⠀⠀⠀⠀⠀⡇⠀⠀⠀⠄⣀⣠⠞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢀⠼⠓⠒⠀⠀⠀⠀⠀⠰⢁⣄⠀⠀⠀⠙⠷⠿⠊⠉⠀⠀⢀⣈⠑⢦⠀⠀⢀⠇⠀⠀⠀⠀⠀⠀⠉⠉⠉⠉⠉⠯⠉⣉⠒⣄⠀
-                ⢪⠀⠀⠀⠀⢀⡀⠤⠒⠻⣸⠈⢢⡀⣠⠤⢤⠄⣀⠀⠀⢠⠊⠸⠀⠀⠇⠀⡜⠠⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢺⠀
-                ⠈⠉⠀⠒⠉⠉⠀⠀⠀⠀⠈⠣⣀⣸⠂⠀⠎⠀⠀⠩⢂⢇⠀⢰⠁⢠⡧⠞⠒⠈⠉⠈⠑⠠⣀⠀⠀⠀⠀⠈⠉⠉⠑⡄⠀⣸⠄
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠳⢄⣀⣀⣠⠴⠞⠚⠛⠳⠒⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠤⢄⣀⣀⣀⡠⠗⠋⠀⠀
-        """,
-        # wartortle
-        "42": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠠⠛⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀   ⢀⡀⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢠⡇⠐⡈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⢀⡠⢊⠁⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⡷⠀⠀⢃⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⡴⢋⠔⠁⠀⣼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⢸⠀⡇⢀⣀⠤⠤⠀⠀⠤⠤⣀⠀⢠⠎⡔⠁⠀⠀⠜⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢱⠀⠀⢸⡠⠓⠉⠀⠀⠀⠀⠀⠀⠀⠀⢉⠃⢰⠀⠀⠀⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢸⠉⠓⢠⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠀⡇⠀⠀⠀⢀⠜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠣⣠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠐⠃⠀⠀⠀⠏⠀⠀⠀⠀⠀⠀⠀⠀⣀⡀⠤⢀⣀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⢰⡀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⢫⠀⠑⠤⣀⣠⠜⠀⠀⠀⠀⠀⠀⢀⠔⠉⠀⠀⠀⠀⠀⠑⡄⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠘⣸⢸⣆⣀⠀⠀⠀⡄⣠⢾⣥⣧⠈⡆⠀⠀⠀⡇⢇⠀⠀⠀⠀⠀⠰⠃⠀⠀⠀⡞⠉⠢⠀⠀⢹⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣏⡾⡻⡈⠀⠀⠀⠉⠁⠸⡻⣿⢀⣇⡀⠀⣰⠡⠼⠭⠦⠀⣀⣀⡇⠀⠀⠀⠀⢣⡀⠀⠀⣠⠞⠀⠀
-                ⠀⠀⠀⠀⣀⡠⠤⠒⠒⢿⣅⣈⢡⡀⢀⠀⠀⠀⠀⠉⠑⣙⡲⢟⡴⠁⠀⠀⠀⠀⠀⠀⠀⠉⢉⠶⢄⠀⠀⡏⠏⠉⢳⠀⠀⠀
-                ⠀⣠⡆⢹⠂⠀⠀⠀⠀⠀⠉⠛⡭⣢⣔⠒⠒⠒⠂⣉⣉⣷⠗⠉⢧⠀⠀⠀⠀⠀⠀⠀⠀⢠⢼⣦⢸⢱⠄⡇⠀⠀⠀⡇⠀⠀
-                ⠐⢅⡷⡡⠔⢲⠀⠀⠀⠀⠀⢰⠁⠀⠈⠙⠿⣟⡻⠿⠋⠀⠀⠀⠈⢆⠀⠀⠀⠀⠀⠀⠀⢳⡤⠝⠉⠁⢰⡔⠉⠉⠉⠚⢄⠀
-                ⠀⠀⠉⠛⠲⠥⠤⣀⣀⣀⣀⣸⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠑⠤⠤⡤⢒⠖⠉⢹⠀⠀⠀⢠⠃⡆⠀⠂⢢⠀⠈⡆
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⡇⢆⢸⡀⠀⠔⠁⠀⠈⠒⠒⠁⠀⠀⡇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡗⠤⣀⠀⠀⠀⢣⠀⠀⠀⠀⠀⢀⣀⠤⠖⠋⠹⡀⠸⡄⢸⠇⠀⠀⠀⠀⢀⡆⠀⠀⠀⢠⠃
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⡀⠀⠈⠉⠉⠙⡄⠀⠉⠉⠉⠀⠄⠀⠀⣠⠔⠋⠒⢜⣾⠀⠀⠀⠀⡠⠊⠀⠀⠀⢠⠊⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⠁⠙⢄⠀⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⠀⡜⠁⠀⠀⠀⠀⠙⣆⠠⠔⠉⠀⠀⠀⢀⠔⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⠀⠀⠈⠳⢄⡀⡠⠒⠉⠐⠂⠤⠄⣀⡜⠀⠀⠀⠀⠀⠀⠀⠘⣖⠈⠀⣀⠤⠚⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⢉⡲⠤⣀⣀⠀⠀⠀⣀⡳⡀⠀⠀⠀⠀⠀⠀⠀⠘⡎⠉⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⡄⠀⠀⠀⠀⠀⣠⠊⠀⠀⠀⠀⠉⠉⠉⠈⠉⠙⡄⠀⠀⠀⠀⠀⠀⠀⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠘⠒⢲⠀⣀⢤⠀⡴⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠀⠀⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠤⠒⠒⢄⣀⠔⠁⠒⠚⠀
-        """,
-        # abra
-        "43": r"""
-                                        ⣀⠤⠤⠤⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠉⠁⠒⠂⢤⠤⠒⠈⠉⠉⠉⠛⠉⢀⡤⠊⢡⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡐⠀⠀⡔⠁⠀⠀⠀⠀⠀⠀⠀⠠⡋⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⣀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡶⡄⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠐⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⠈⡆⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠠⣌⠢⡀⠀⠀⠀⢀⠔⠁⠀⠀⠀⠀⣨⡆⠀⠀⠀⠀⠀⠀⠀⠀⢰⠁⠄⢸⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⢄⡀⠱⡀⠀⠀⠠⠇⠀⣀⣤⣶⠶⠯⢍⡀⠀⠀⠀⠀⠀⠀⠀⢀⡌⢸⠀⢸⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡯⠲⡀⠤⢀⠀⣴⣾⣿⠋⠀⠀⠀⠀⠈⢢⡀⠀⠀⠀⠀⠀⡞⠒⠠⡀⢸⠆
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡮⠀⠀⠈⢳⠞⠚⠛⠻⣿⡄⠀⠀⢀⣦⣶⣶⡽⠀⠀⠀⣀⠞⠉⠑⠢⡉⣾⠀
-                ⠀⠀⠀⠀⠀⡤⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⢤⠄⣎⣀⠀⣀⡂⠈⠛⡖⠒⠱⠛⠛⠉⠀⠀⢀⠔⠁⡠⠊⠀⠀⢰⠇⠀
-                ⠀⠀⠀⠀⠀⠑⢄⠈⠣⣄⠀⠀⠀⢀⣀⠀⠀⠀⠀⢠⢇⡜⠁⠘⠀⠀⠀⢩⠖⠡⢄⡇⠀⢀⣀⠤⠒⠁⠀⠀⠀⠀⠀⣰⠋⠀⠀
-                ⠀⡤⠒⠒⠢⡀⢸⡆⠀⢸⠀⢠⡰⢇⡈⣆⣀⣀⣼⣡⢼⠀⠀⢀⣴⢞⡿⠃⠀⣀⠤⠯⠭⢅⡀⠀⠀⠀⠀⠀⠀⢀⡜⠁⠀⠀⠀
-                ⠾⠠⡴⠣⣀⠘⠋⠃⠀⠘⡼⠁⠀⠀⠙⢸⠀⠀⠀⠀⣿⠀⡠⠼⠋⠁⠀⢀⠎⢀⡠⠤⡬⢕⠌⢢⠀⠀⠀⢀⡴⠋⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠈⢣⠀⠀⠀⠀⢣⠀⠀⠀⠀⠈⡖⠢⢤⣀⢻⠿⣹⣠⠔⠒⠒⠚⠉⠁⠀⣁⣇⢀⣱⠞⢀⣠⠔⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢣⣀⢀⡀⢈⣠⠤⠤⣀⡰⠐⠚⠛⠸⣿⣠⠗⠓⠲⡀⠀⠀⠀⠀⠀⢇⣨⡵⠾⠚⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣠⠇⠀⡡⠚⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠁⣀⠠⠴⢁⣀⣀⡀⠀⢀⣀⣀⡀⠙⡢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠛⠀⠐⠚⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠒⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠒⠒⠛⠀⠀⠀⠀⠀
-        """,
-        # bulbasaur
-        "44": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠋⢆⡠⠒⡆⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠤⠤⠤⠤⠤⠤⠤⠤⠤⠒⠊⠀⢀⠞⠀⢸⠒⣲⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡤⠒⠉⠁⠀⠀⠀⠀⠀⢀⣀⡀⠤⠀⠀⠒⠊⠁⠀⠀⡇⢠⠃⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠁⠀⠀⠀⠀⠀⠀⢠⠖⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠘⡄⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⡰⠋⠀⠈⣉⡶⠤⠤⠀⠀⠀⠘⠥⠤⠤⣀⣀⡠⠴⠒⠋⠙⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⢳⡀⠀⠀⠀
-                ⠀⠀⠀⠀⢰⠁⡀⠒⠉⠀⠀⠀⠀⢀⣀⡀⠤⢤⠀⠀⠈⠁⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡀⠀⠱⡀⠀⠀
-                ⠀⠀⠀⢀⡶⠊⠀⠀⠀⢀⡠⠒⠉⠁⠀⢀⡴⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢱⠀⠀⠱⡄⠀
-                ⠀⠀⢀⠞⠀⠀⠀⠀⣀⠀⠑⢤⣀⠤⠒⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⢱⡀
-                ⠀⢀⢎⠔⡽⠀⡆⢸⣼⠀⠀⠀⠀⠀⠀⠀⠀⡴⠀⠀⡠⣶⠢⣄⠀⠀⠀⠀⠈⡟⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⢇
-                ⠀⣜⡎⡸⠸⡇⡇⠀⠀⠀⢀⡴⠋⡇⠀⠀⡼⠀⢠⠊⠸⠁⡔⡌⢆⠀⠀⠀⠀⢃⠀⠙⣦⡀⠀⠀⠀⠀⠀⠀⠀⠘⠀⠀⠀⢸
-                ⢠⢻⠀⡇⡇⡇⠀⠀⠀⠀⠘⠦⣀⠇⠀⠀⠁⢠⠃⠀⡇⢸⠀⢸⠸⡀⠀⠀⠀⢸⠀⢮⠁⠈⠳⢄⡀⠀⠀⣠⠞⠀⠀⠀⠀⢸
-                ⢸⠘⢄⣣⢱⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⢧⠀⠓⠃⢀⡇⠀⠀⠀⠈⠀⠀⢣⠀⠀⠀⠉⢿⢍⠀⠀⠀⠀⠀⠀⡏
-                ⢸⡰⣀⠈⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠂⠀⠘⠒⠒⠊⠉⡄⠀⠀⠀⠀⠀⠀⠀⢣⣀⣀⣀⣸⠀⠳⣄⠀⠀⣠⠞⠀
-                ⠀⠑⢬⡙⠲⣤⢌⣀⠀⠀⠛⠀⠀⠀⠀⠀⠀⣀⣀⣀⣀⣤⡴⠒⠉⠀⠀⢠⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢦⠟⠁⠀⠀
-                ⠀⠀⠀⠈⠓⢬⡙⠣⢍⡉⠉⠉⠉⠉⠉⠉⠁⠀⣀⡤⠚⠉⠀⠀⠀⣠⠔⠁⠀⠀⠀⠀⠀⢰⠀⢀⠔⠁⠀⠀⠀⠈⢆⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡏⠑⠢⠬⣉⣒⠒⠒⠒⠒⠊⠉⢁⣀⣀⠠⠴⡲⡹⠂⠀⢀⡀⠀⠀⠀⠀⢸⡴⢁⠴⠊⠹⠀⠀⠀⠘⡄⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡇⢀⡠⠔⡆⠀⠉⠫⡉⠉⠉⠉⠁⠀⠀⠀⠀⡟⠁⣀⡘⣅⣱⠀⠀⠀⠀⣼⠀⢇⠀⠀⠀⡇⠀⠀⠀⡇⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢹⡋⠀⠀⣸⠀⠀⠀⠈⠑⢦⢄⣀⡀⠀⠀⢰⠗⠉⢀⠇⠀⠀⠀⠀⠀⣰⠃⠀⠈⠢⣄⡰⠇⠀⠀⠀⡇⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢳⠠⠔⠁⠀⠀⠀⠀⢠⠊⠀⠈⢫⡉⠉⡏⠀⠀⡜⠀⠀⠀⠀⠀⣰⢟⡄⠀⠀⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢧⡤⡀⢀⡀⠀⡰⠃⠀⠀⠀⠀⠛⢺⠑⠒⠚⠁⠀⠀⠀⢀⠔⠁⠀⠱⣄⡀⢀⡀⠀⠀⠀⣠⠃⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠙⠒⠙⠓⠚⠉⠀⠀⠀⠀⠀⠀⠀⠮⠧⣔⢲⣤⢶⣤⠔⠉⠀⠀⠀⠀⠛⠚⠪⠽⠺⠭⠒⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠁⠀⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # caterpie
-        "45": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⠤⠒⠒⠂⠉⢉⣲⠶⢆⡤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣠⠊⠉⠙⠢⢄⠀⠀⡠⠔⠋⠀⠀⠀⢀⡠⣔⢮⡓⠬⠃⠀⢱⠀⠉⠒⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠹⡀⠀⠀⠀⠀⠉⠺⢤⣀⣀⣠⠤⠚⠁⠚⠊⠁⠀⠀⣀⡠⢎⠠⠤⠤⠤⡉⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠈⠑⠒⢤⠤⣀⡀⠀⠀⠀⠀⠀⢀⡤⠤⠒⠒⠊⠉⠁⡔⠁⣤⡖⠒⠒⢬⡳⡵⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⡎⠀⠀⠉⢳⠀⠀⢠⠎⠁⠀⠀⠀⠀⠀⠀⢰⠀⢸⣿⣷⣄⣀⢈⣷⢸⠱⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢸⠀⠀⠀⠀⠈⢦⣀⠜⠀⠀⠀⠀⠀⠀⠀⠀⠘⡀⢸⣿⣿⣿⣿⣿⣿⢨⠁⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢸⠁⠀⠀⠀⣀⣠⠤⠤⠤⢄⣀⠀⠀⠀⠀⠀⠀⠱⡀⠛⢿⣿⣿⣿⢏⡜⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠈⣇⢀⡔⠋⠀⠀⠀⠀⠀⠀⠀⠉⠢⣀⠀⠀⠀⠀⠈⠓⠤⠌⠠⠔⠋⠀⠀⡯⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠘⡞⠀⠀⣀⠤⠤⠤⢄⡀⠀⠀⠀⠈⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠀⠙⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢇⢀⠞⠁⠀⠀⠀⠀⠈⠓⣄⠀⠀⠀⣷⣀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠁⠀⠀⠸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠘⣼⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⣼⣿⣿⣷⡤⣀⣀⣀⠤⠔⠋⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⠷⣄⡀⠀⠀⠀⠀⢀⣼⠤⠚⠛⠿⣿⡿⠀⠀⠀⠀⠀⠀⢀⠄⣒⡢⡄⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⡟⠉⠉⠙⠉⠉⠀⠀⠀⢄⠀⠀⡇⠀⠀⠀⠀⠀⡰⡱⠋⠀⢘⢸⢀⠃⠀⠀⠀⠀⠀⠀⠀⢀⠔⠲⣄
-                ⠀⠀⠀⠀⠀⠀⠀⠀⡰⠴⢄⠀⠀⠀⠀⠀⠀⠀⠀⣁⡤⢧⡀⠀⠀⠀⠀⡇⡇⠀⢀⢜⢇⠎⠀⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⢸
-                ⠀⠀⠀⠀⠀⠀⠀⠠⡇⠀⠀⢳⠀⠀⠀⠀⠀⢀⡞⠁⠀⠀⠘⣆⠀⠀⠀⠘⠊⠍⠓⣡⠎⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⡸
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠣⡀⠀⡸⠀⠀⠀⠀⠀⠘⡆⠀⠀⠀⠀⡜⠲⠤⢄⣀⡠⢤⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⡟⠀⠀⢠⠃
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⡽⠢⠤⣀⣀⣀⡠⠬⠲⠤⠔⠛⢢⠀⠀⣠⠶⣆⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⢀⠎⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⣘⡇⠀⢿⣤⢿⠟⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣹⣠⠎⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠰⡟⢄⠀⠀⠀⠀⠀⠀⡜⠁⠀⠀⠹⡆⠀⢀⡠⠋⡠⣬⢗⢤⣀⠀⠀⠀⠀⢀⣀⢔⠢⡼⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠤⣙⡲⢤⣄⣀⣀⣧⡀⠀⢀⡰⠓⢞⠉⠀⠀⢟⢄⣱⡇⢱⠉⡉⣤⣛⢯⡸⠗⡱⠁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢄⠀⠀⠉⠉⠉⠀⠀⠀⢑⣤⣀⠀⠉⠉⠀⢸⠀⠻⠶⠟⢀⣇⡴⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠲⢤⣀⣀⣀⡤⠔⠋⠁⠈⠉⠒⠒⡤⠧⠤⠤⠖⣒⡯⠋⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠒⠢⠤⠄⣀⣀⣠⣤⣚⣁⠤⠤⠒⠊⠁⠀⠀⠀⠀⠀⠀
-        """,
-        # charmander
-        "46": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⠤⠔⠒⠈⠉⠐⠒⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢠⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠈⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡰⠁⠀⠀⠀⠀⠀⠀⠀⠀⡠⠀⣀⠀⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡷⡀⡆⠀⠀⠀⠀⠀⠀⠀⠧⡜⠸⣷⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢰⣇⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⣴⣿⣇ ⢰⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢸⠻⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⢯⠛⣃⠯⠈ ⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⡌⠉⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠀⡄⠀ ⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀  ⣤⡀⠀⠀⠀
-                        ⠀⠀⠀⡇⠢⣄⣀⠰⠂⠀⠀⠚⠀⣀⡠⠤⡔⡾⠁⢠⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢰⡏⠻⡆⠀⠀
-                        ⠀⠀⠀⠈⠢⣌⠙⢭⣒⡒⢚⠩⠉⠀⠀⣦⠟⠀⢠⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡞⣿⠁⠀⡇⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠉⠒⠬⢑⡢⠤⠤⠤⠚⠁⠀⠠⢎⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠃⠘⡀⡶⣷⡀⠀
-                        ⠀⠀⠀⠀⠀⣀⡠⠔⠚⢡⠀⣨⠍⠭⢄⠀⠀⠀⠀⠀⠉⠑⠢⠄⣀⠀⠀⢀⡀⠀⠀⠀⠀⣼⢠⢀⣀⡇⢳⢹⡆
-                        ⣀⣤⠖⠒⠈⠁⠀⠀⠀⣆⠜⠁⠀⠀⠀⠑⣄⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠡⠧⣤⠀⠀⡴⢣⠟⢫⣿⡟⣀⣿⡇
-                        ⠑⢤⡀⠀⠀⠀⠀⠀⢠⠏⠀⠀⠀⠀⠀⠀⠈⢲⢀⡀⠀⠀⠀⠀⠀⢌⣢⣀⠼⠆⠀⠘⣧⡀⠀⡞⠁⢀⠏⢱⠇
-                        ⠀⠰⠕⠒⠒⠒⠒⠒⢺⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠉⠉⠲⡒⠒⠒⠈⠉⠀⠀⠀⠀⠀⠈⢻⡀⠀⣀⢮⠀⣯⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⠘⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⢱⢺⠓⠋⠁⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠀⠀⠀⠈⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠋⢸⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⡠⠖⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠏⠀⠀⠀⠀⢣⡀⠀⠀⠀⠀⠀⢀⠴⠃⢠⡟⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⠜⠁⠀⠀⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⢱⠤⠤⠤⠐⠊⠁⠀⡰⡟⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡜⠀⠀⠀⠀⠀⠳⣄⠀⠀⠀⠀⠀⠀⠸⡀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⢀⡠⣺⠎⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠑⠂⣤⣄⣀⠀⠀⢣⡀⠀⠀⠀⠀⠀⠀⢧⠤⠄⣒⠭⠚⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢀⢬⢢⣀⠀⠀⠀⠀⢴⠉⠉⠀⠀⠀⠈⠉⠉⠑⢄⠀⠀⠀⠀⠀⢰⠊⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⡔⡵⢃⡕⣓⡤⠄⠒⠒⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢆⠀⢀⡀⢠⢬⡳⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠓⠫⢌⣷⠤⠽⠍⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # diglett
-        "47": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡴⠖⠚⠛⠉⠉⠉⠉⠛⠒⠢⠤⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠦⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠋⠀⠀⠀⢰⢲⠀⠀⠀⠀⠀⠀⢠⢶⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢴⠇⠀⠀⠀⠀⣿⣿⠀⠀⠀⠀⠀⠀⣾⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⡾⠀⠀⠀⠀⠀⢧⠎⠀⠀⠀⠀⠀⠀⢻⣩⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢷⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⡇⠀⠀⠀⠀⣀⠤⠖⠒⠒⠒⠒⠲⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⡇⠀⠀⠀⢸⡉⠀⠀⠀⠀⠀⠀⠀⠀⠈⢷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⡇⠀⠀⠀⠸⣄⠀ ⠀⠀⠀⠀⠀⠀⢀⡞⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠈⠉⠒⠒⠒⠔⠒⠒⠚⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠃⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠿⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡇⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⣇⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢀⠖⠈⡱⠶⢼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡟⠦⡀⠀⠀⠀⠀⠀
-                ⠀⠀⡴⠁⣠⠋⠀⠀⠘⡇⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⡇⠀⠙⠍⠓⢶⡄⠀
-                ⠀⢠⡷⠊⠁⠀⠀⢠⠜⠉⠀⢨⢧⡀⠀⠀⠀⠀⣀⣀⣀⠀⠀⠀⠀⠀⠀⣀⣀⣀⣀⣀⡀⠀⠀⣴⢾⣛⠓⠦⣄⠀⠀⠐⣿⠀
-                ⣴⡏⠀⢀⣀⠀⡰⠁⠀⠀⣠⠎⠘⡟⢏⡙⣦⡏⠀⠀⠈⠉⢳⣤⣀⠶⣏⠁⠀⠀⠀⠀⠈⠓⢖⠁⠀⢰⡭⢝⡚⠀⠀⠀⠘⢆
-                ⣼⣀⣠⣋⡼⠰⣗⣤⠔⠊⠀⠀⠀⠙⠂⠘⠃⠳⡀⠀⡞⠱⡄⡇⠉⠀⠈⠑⠒⠤⣀⣔⠒⠦⡬⠇⠀⠀⠨⡗⠛⠠⢄⢀⡤⠼
-                ⠀⠀⠀⠀⠛⣷⡀⠀⠀⠀⢀⠥⣄⣠⣀⠀⠀⠀⠙⠦⠵⣄⡽⠀⠀⠀⡀⠀⠀⠀⠀⠀⠉⠉⠁⠀⠀⠀⢀⣈⣑⣢⣤⣽⠁⠀
-                ⠀⠀⠀⠀⠀⠈⠈⠋⠒⠒⠉⠀⠀⠈⠈⠳⢤⣤⣄⡀⣀⡤⠶⠤⢾⣉⣀⣩⠇⢀⡤⢤⠤⢤⣏⣢⣀⣠⡮⠀⠁⠀⠈⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠀⠀⠀⠀⠀⠀⠉⠉⠉⠀⠀⠀⠀⠈⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # doduo
-        "48": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⢺
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢎⢤⠃⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢿⠃⡜⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣤⡤⠶⠶⡿⠃⢠⠃⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⠀⡀⠀⠀⠀⠀⡾⠋⣮⡇⢸⠁⢠⣿⡀⠀⠀
-                        ⢀⣀⣀⣀⠀⠀⠀⠀⢰⠴⠊⠉⠉⠓⢢⣀⠀⠰⡗⠀⠀⠀⠈⠉⠁⢑⡇⠀⠀
-                        ⠉⠀⠒⠦⣭⣁⡒⠒⠛⣄⢠⣲⠀⠀⠀⢱⡆⠘⣷⢀⠀⠀⠀⠀⠀⣸⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠉⠚⠭⣴⠞⠈⠉⠀⠀⠀⣨⠗⠀⠈⠛⠓⣿⢳⠰⠓⠃⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠘⢶⣄⣀⣀⣀⡼⠛⠀⠀⠀⠀⢰⡝⣼⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⢑⡼⡀⠀⠀⠀⠀⢀⣮⢱⠃⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢷⡳⡠⠞⠛⠒⣾⣲⢿⢤⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣰⡞⠻⣽⣆⠀⠺⠷⠇⠀⠈⠳⡄⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠇⠀⠐⠃⠀⠀⠀⠀⠀⠀⠀⠀⠩⡇⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠂⠀⠀⠀⠀⠀⠀⠀⠀⡂⠀⠀⢸⠇⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡆⠀⠀⠀⠀⠀⠀⠀⠀⠁⠀⠀⣸⠁⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⣄⡀⠀⠀⠀⠀⠀⠀⠀⣀⣼⠋⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠱⣴⣤⣤⠴⡖⠛⢆⡻⣀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠬⡦⠽⣖⡭⠄⠞⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡾⢪⣶⡇⣯⠖⠤⣵⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢬⢴⡿⡻⢇⢱⠀⠀⠈⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣻⠟⠁⠸⢝⣇⡀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⡎⣠⣴⡶⢃⡤⠒⠒⠢⠽⢦⡄⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠊⠉⢉⣞⡰⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # drowzee
-        "49": r"""
-                        ⠀⡠⣦⠖⡹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢰⠁⣧⠀⠿⠒⡶⠀⠀⠀⠀⢀⡠⠆⠒⠉⠉⠀⠀⠈⣑⣢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡌⠀⠘⠃⠀⢜⣃⡴⢄⡠⠒⠁⣀⡀⠀⠀⠀⠠⠊⠁⠀⣀⣙⢆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡇⠀⠀⠀⠀⢸⠀⢌⡷⢼⣠⡪⠿⠙⠀⠤⠤⠄⡀⠊⠉⠀⠀⠹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡇⠀⠀⠀⠀⠀⢗⠊⠀⠈⣁⠀⠀⢀⡠⠒⠛⠓⢦⠁⠊⠉⠉⢑⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡇⠀⠀⠀⠀⠀⠈⢆⠀⠀⠀⠉⠉⠳⡖⠒⠒⠢⣄⣷⡖⢤⡤⠝⠀⠀⠀⠀⢀⣀⣀⠴⠒⣲⠀
-                        ⢰⠀⠱⡀⠀⠀⠀⠈⠣⡀⠀⠀⠀⠀⠈⢢⡀⠀⠀⢻⣿⠀⠀⠀⠀⣠⠔⠊⠡⡐⠒⢦⠾⡁⠀
-                        ⠈⡆⠀⢡⠀⠀⠀⠀⠀⠑⣄⡀⠀⠀⠀⠀⠈⠑⠒⣉⠞⠒⠚⠊⠉⠀⠀⠀⠀⠀⠟⡩⢤⠬⠆
-                        ⠀⠺⡀⠀⠁⠀⠀⠀⠀⠀⠘⠑⠀⠀⠀⠑⠒⠒⠉⠁⠀⠀⢄⠀⠀⠀⠀⠀⠀⢀⠜⠁⠀⠀⠀
-                        ⠀⠀⢱⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⡀⠀⠀⢀⡴⠇⠀⠀⠀⠀⠀
-                        ⠀⠀⠈⣧⠀⠀⠀⠘⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢤⠚⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⡇⠑⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢆⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢐⠇⠀⠀⣀⠤⢄⡀⠀⠀⠀⢀⡠⠤⢄⠀⠀⠀⢀⡠⠤⢄⠀⠀⡜⣇⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⣿⣄⣀⠜⠁⠀⠀⠙⠤⣀⠴⠋⠀⠀⠀⠙⠢⠔⠋⠀⠀⠀⠑⠒⠁⡿⣆⠀⠀⠀⠀⠀⠀
-                        ⠀⢰⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠇⠘⣧⠀⠀⠀⠀⠀
-                        ⠀⡸⠀⠀⠀⠀⠀⠀⠀⠀⠰⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣄⠀⠀⠀⠀
-                        ⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠏⠀⠀⠀⢹⠀⠀⠀⠀
-                        ⣻⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠃⠀⠀⠀⠀⢸⠀⠀⠀⠀
-                        ⢃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡆⠀⠀⠀⠀⠀⠀⠀⣀⡠⠔⠉⠀⠀⠀⠀⠀⠀⣸⠀⠀⠀⠀
-                        ⢿⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⠋⠑⠒⠒⠒⠒⠉⠋⠉⠒⢄⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⠀⠀
-                        ⠘⣇⠀⠀⠀⠀⠀⠀⡠⠖⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠦⣤⣀⡀⠀⠀⣛⣄⠀⠀⠀⠀
-                        ⠀⣿⡠⠤⠄⠠⢄⡸⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠛⠭⣀⡈⣷⠀⠀⠀
-                        ⠀⠳⣄⣘⣄⣀⠤⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠀⠀
-        """,
-        # gastly
-        "50": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠚⠑⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢅⣀⡠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠤⣄⡀⠀⡠⠛⠒⢄⠀⠀⠀⠀⠀⠀⡀⢄⠀⠀⠀⠀⢀⡠⠄⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⠀⠀⠉⠀⠀⢀⡼⠀⠀⣠⠤⠄⠊⠀⠀⠙⠢⡀⠀⡇⠀⠀⠀⢑⡄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣤⠊⠁⠀⠀⠀⠀⠀⠀⠀⠘⠆⠤⠤⡤⠃⠀⠀⠀⠀⠀⠀⠀⠈⠈⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⡆⠀⠀⠀⠀⠀⢀⣀⣀⣀⣀⣀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡀⠀⠀⡼⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡠⠒⠆⠀⠀⠀⡔⠉⠉⠀⢀⣠⠴⠚⠉⠁⠀⠀⠀⠀⠀⠀⠉⠉⠒⠦⣀⠀⠀⠀⠀⠠⡋⠀⠙⠒⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢇⣀⣖⣐⣶⡰⠃⠀⢀⠴⠋⠀⠀⠀⠀⠀⠀⠀⢀⣼⣿⣿⣿⣷⡄⠀⠈⠑⢦⡀⠀⠀⠱⢄⠠⠔⠉⠉⢢⠀⠀⠀⠀⠀⢀⡀⠀
-                ⠀⢸⠁⠀⢹⡄⢀⡴⠃⠀⣾⣿⣿⣦⣤⣤⣤⣶⣾⣿⣿⣿⣿⣿⣿⣦⣀⠀⠀⠙⢄⠀⠀⠀⠀⠀⠀⠀⠀⠉⢆⠀⠀⡎⠀⢙⠄
-                ⢠⠇⠀⢠⠃⠹⡟⠀⣠⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⣶⣶⡈⢧⠀⠀⠀⠀⠀⠀⠀⠀⡃⠀⠠⠊⠰⢏⠀
-                ⠈⢢⠀⣮⠀⠀⢳⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠛⠉⣿⣿⣷⡈⣇⠀⠀⠀⠀⠀⡠⠔⠀⠀⠰⣀⠀⢀⡃
-                ⠀⠐⠤⡇⠀⠀⠀⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠛⠁⠀⠀⠀⢹⣿⣿⣷⢸⡀⠀⠀⠀⢰⠁⠀⡀⢀⡠⣄⠉⠉⠀
-                ⠀⠀⠀⡇⠀⠀⠀⠀⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠟⠁⠀⠀⠀⠀⠀⠀⠈⣿⣿⣿⡀⡇⠀⠀⠀⠸⡄⢸⠆⠀⠀⠀⢑⡄⠀
-                ⠀⠀⠠⡇⠀⠀⠀⠀⢠⠻⡿⣿⣿⣿⣿⣿⣿⡿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣿⣿⣿⠁⡇⠀⠀⠀⠀⠈⠁⠀⠀⠀⠀⠘⡀⠀
-                ⠀⠀⣀⢿⡀⠀⠀⠀⠊⠀⣿⣿⣿⣿⣿⡟⠁⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⣿⣿⡿⢸⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢑⠄
-                ⠀⢸⠀⠀⢳⡀⠀⠀⠀⣰⣿⣿⣿⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⣿⣿⣿⢃⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠊⠀
-                ⠀⠈⡇⠀⠀⠙⢦⣤⣶⣿⣿⣿⣿⣿⣿⣿⣷⣄⡀⠀⠀⠀⠀⠀⠀⢀⣼⣿⣿⢿⢃⡾⠀⠀⠀⠀⠀⠀⠀⠀⠀⡔⠋⠐⠁⠀⠀
-                ⠀⠀⠈⠉⠳⡀⢸⣩⠿⣿⣿⣿⣿⣿⣿⣿⣿⣾⣿⣶⣦⣤⣤⣴⣾⣿⣿⠟⠋⣠⠏⠀⠀⠀⠀⠀⠀⢀⠀⠀⣰⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⡇⠘⠁⠀⠙⢦⣌⠉⠛⠛⠛⠛⠛⠋⢯⣀⣿⣿⡿⠛⠉⠀⣠⠞⠁⠀⠀⠀⠀⠀⠀⠚⠉⠉⠉⠁⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠑⠠⠤⠋⠒⢄⠙⠷⣶⣤⠤⢤⣤⣶⣿⠿⠿⢋⣀⡤⠖⠋⠀⠀⠀⠀⠀⠀⠀⠀⢼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠉⠉⠛⠒⠒⠒⠚⠉⠉⠁⠀⠀⢀⢄⡀⠀⠀⠀⠀⠀⣀⠤⢟⠁⠈⡆⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢆⣀⠀⠀⠀⠀⠀⠶⡄⢰⠀⠀⠀⠀⡠⠟⠀⠘⣄⠀⠀⢰⠎⢠⠤⠈⠐⠊⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢄⢀⣀⠄⠤⠃⠈⠓⠒⠐⠊⠀⠀⠀⠀⠀⠉⠐⠁⠀⠈⠘⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # koffing
-        "51": r"""
-                ⠀⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⣠⠞⠉⠁⠈⠓⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣰⡇⠀⠀⠀⠀⠀⠁⠙⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠖⠉⠃⠐⢦⠀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀
-                ⣸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⠀⠀⠀⠀⢿⠀⠀⠀⠀⣘⠄⠀⢀⡴⠚⠀⠀⠙⠉⠳⣆⣀⠀⠀
-                ⡽⡄⠀⠀⠀⠀⠀⠀⠀⢀⠴⡏⠀⠀⠀⠀⠀⠀⣰⣎⠁⠀⣈⠷⢀⣀⣀⠈⠳⢀⣄⠤⠟⠀⠀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠈⢳⡀
-                ⢷⠀⠀⠀⠀⠀⠀⠀⡀⠀⢀⡕⠀⠀⣀⠴⠒⠈⠁⠀⠀⡀⠀⠀⠀⠀⠉⠑⠦⣄⠀⠀⠀⠀⡮⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⢨⠇
-                ⠈⠓⠤⠄⠤⠜⠒⠒⠑⠺⢦⡷⠋⠛⠁⠀⢀⡠⠆⠦⢤⡘⠆⠀⠀⠀⢀⠤⡤⢄⡙⢦⠤⣄⣣⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣹⠀
-                ⠀⠀⠀⣠⠖⠞⠉⢢⠀⠀⣼⠄⠀⠀⠀⠀⣎⠠⠤⠤⠤⠧⠀⠀⠀⠀⠷⠥⠤⠀⣹⠀⠀⠈⢻⣃⢴⠀⠀⠀⠀⢀⠀⠀⡠⠊⠀
-                ⠀⠀⠀⢏⡀⠀⠀⣠⠇⣐⠏⠀⠀⠀⠀⢄⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣠⠀⠐⣼⠇⠀⠙⠲⠦⠔⠋⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠑⠀⠚⠉⢀⡞⠀⢰⠀⠀⠀⠀⠈⠶⣃⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠷⠃⠀⠀⠀⢹⠀⠀⠀⠀⣀⢄⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣼⠁⠀⠈⠀⠀⠀⠀⠀⠀⠀⠉⠑⠒⠒⠒⠒⠒⠒⠉⠀⠀⠀⠀⣄⠀⠈⡇⠀⠀⠀⠢⠾⠂⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢺⠁⠀⠀⠀⢰⠊⠀⠀⠀⠀⠀⠀⠀⢀⡤⠤⠒⠒⠤⣄⠀⠀⠀⠀⠙⡄⠀⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠸⢆⠔⠂⠀⠘⠤⡀⠀⠀⠀⠀⠀⠀⢎⠀⣖⠉⠉⣳⠀⡇⠀⠀⠀⠴⠃⠐⢏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⠛⠾⣲⣄⣍⡡⣠⣺⠟⢙⡇⠀⠀⠀⠀⢸⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢧⠀⠀⢠⠆⠀⠀⠀⠀⠈⠉⠲⢤⡉⠒⠒⣩⠔⠊⠉⠀⠀⠀⡤⠔⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⡀⣀⠀⠀⠈⠳⡀⠀⠳⠴⠂⠀⢀⠔⠒⢊⡁⠤⠒⠢⢌⡉⢉⡕⠀⢰⡞⢁⡠⣤⠤⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢠⡞⠁⠀⠀⠈⠱⣆⠀⢸⡀⠀⠀⠀⠀⠀⠓⠒⠁⠀⠀⠀⠀⠀⠈⣡⢄⣠⡼⢳⡇⠀⠀⠀⠀⠙⣆⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢸⡅⠀⠀⠀⠀⠀⠐⠣⠀⠙⠓⠒⠑⠒⠤⢤⣀⣀⠀⠀⡠⠔⠒⠛⠀⠀⠀⠀⣯⠁⠀⠀⠀⠀⢀⡿⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⢀⡼⠂⢀⣀⡀⠀⠀⠀⠀⠈⠓⠒⠛⠃⠀⠀⠀⠀⠀⠀⠀⠙⠄⣀⠀⠀⣠⠜⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠑⠤⠤⢄⠀⣠⠞⠀⠀⣿⡀⢼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # machop
-        "52": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠴⠛⠣⡴⠊⠲⣄⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠋⠀⠀⠀⢪⢆⠀⢟⡏⠉⢆⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡧⠒⠒⠢⡀⠀⢏⡆⠈⣾⠀⣼⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠊⠀⠀⠀⠀⠘⢄⠸⢸⠀⡇⠀⣿⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢀⣄⣀⣀⠔⠊⠑⠲⣄⠀⠀⠀⡼⠃⠀⠀⢀⣠⡀⠀⠘⡄⢿⢀⣿⢰⣾⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⣀⡤⠋⠀⢰⡀⠀⠀⠀⠀⢬⢷⡀⣼⠁⠀⠀⢀⢎⡆⡟⡄⠀⠱⠿⣼⣧⣟⢸⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⣠⠋⠀⡆⠀⠀⠀⡇⠀⠀⠀⠀⢸⠸⣗⢿⡀⠀⡀⡜⣼⢧⢣⠁⠀⠀⠀⠀⢩⢳⣿⠀⠀⠀⠀⠀⠀⠀
-                        ⡾⢡⠀⠀⡇⠀⠀⠀⡇⠀⠀⠀⠀⢘⠀⠹⣄⢳⡀⢣⡈⠒⠮⠎⠀⠀⠀⠀⠀⣞⣷⠙⢫⠲⣄⠀⠀⠀⠀
-                        ⣇⠘⡄⠀⢰⠀⠀⠀⢇⠀⠀⠀⠀⢸⠀⠀⢈⠆⢣⢸⠈⠢⣄⠀⠀⠀⠠⡀⣠⠉⣸⠐⠆⠀⠈⠢⡤⡀⠀
-                        ⠈⠑⠷⢄⣈⢆⡀⠀⠘⡄⠀⠀⠀⡎⠀⠀⡎⠀⠀⢣⣧⡀⠀⠉⣹⣽⠋⠉⠑⠊⠛⠦⣀⠀⠀⠀⠀⢱⡄
-                        ⠀⠀⠀⠀⠉⠉⠉⠒⠒⣏⠉⠉⠉⠀⢀⡸⡀⠀⠀⠀⠉⠚⠓⠒⠉⣧⠀⠀⠀⠀⠀⠀⡏⠁⠀⠀⠀⢘⡇
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠢⠶⠚⠋⡿⢀⡪⠥⠤⠉⠁⠀⠰⢄⡀⢹⠀⠀⠀⠀⠀⠀⠘⠄⣤⣤⠤⠾⠁
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡸⠃⠀⠉⠉⠉⠀⠀⠀⠀⠵⣪⡝⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⢂⡶⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠘⣆⠀⠀⠀⠀⢀⢤⡚⠉⢉⣑⣦⠀⠀⠀⠀⠀⠀⣾⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢸⡁⠀⠙⠉⠀⢈⡾⠉⠁⠀⠀⡼⠀⠀⠀⠀⠀⢰⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠙⠢⢄⣀⣠⠞⠁⠀⠀⠀⣨⠃⡀⠀⠀⡤⣰⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡶⠁⠀⠁⠐⢋⡼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡜⠀⠀⠀⠀⠀⡾⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡼⠀⠀⠀⠀⠀⠀⠳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⠄⣀⣀⣀⣁⣉⡡⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # magnemite
-        "53": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⣀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⠤⢶⢤⡀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⠞⠉⢁⣀⡀⠀⠈⣧⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⠴⠒⠈⢹⠀⠀⠈⡌⡇⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⣅⣀⢮⣯⣳⣾⣶⠋⠁⠀⠀⠀⠀⠀⢀⡴⠊⠁⠀⠀⠀⠀⣈⡦⠤⠖⣳⣇⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⢻⣟⠽⠴⠿⠤⠤⣀⡀⠀⠀⣀⠏⠀⠀⢀⡠⠒⣊⡩⠄⠞⠚⠉⠉⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠖⠉⣀⣀⣀⠀⠀⠀⠀⠈⠑⢶⡟⠀⠀⠀⡾⢰⠏⠉⠀⠀⠀⣀⡀⠴⡦⡀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠞⢁⠔⠉⠀⠀⠀⠉⠢⡀⠀⠀⠀⠀⢱⠀⠀⠀⠘⠼⠦⠄⠒⠊⠉⡆⠀⠀⢸⢱⠀
-                ⢀⣶⡤⠤⢄⣀⣀⣀⠀⡀⠀⠀⠀⠀⢠⡏⠀⡎⠀⠀⢀⡀⠀⠀⠀⠸⠀⠀⠀⠀⠀⠣⡀⠀⠀⠀⠀⠀⠀⠀⣀⣁⡤⢤⣚⠾⠆
-                ⢿⡀⠑⡄⠀⠣⡀⠀⠉⠉⠐⠂⠤⡀⢺⠁⠀⡇⠀⠀⠀⠀⠀⠀⠀⢠⠇⠀⠀⠀⠀⠀⢹⡳⢆⣠⣐⣒⡪⠭⠗⠒⠋⠁⠁⠀⠀
-                ⠀⠱⣤⠞⠑⠒⡺⠠⠤⠤⢄⡀⠀⠈⢺⠀⠀⠘⢆⡀⠀⠀⠀⠀⡠⠋⢀⠖⣾⣑⣢⠀⢸⠇⠀⠈⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠉⠉⠛⠉⠁⠐⠒⢦⠈⡆⠀⠈⣇⣀⣀⠀⠈⠁⠒⠈⠉⠀⠀⢸⠸⢿⣽⢣⠇⡾⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢀⠔⠹⡉⠉⢌⠈⠓⠁⠀⢀⢎⣷⣧⠱⡆⠀⠀⠀⠀⠀⠀⠀⠑⠒⠓⢉⡼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠈⢢⠀⠘⢄⣀⡱⣀⣀⣀⣠⣿⣳⢇⣰⡁⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠣⠴⠭⠤⠾⡤⡤⠔⠚⠁⠀⠀⠈⠙⠓⠂⠤⠤⡤⠤⠖⠚⠋⠀⠀⠀⠀⠀⠀
-        """,
-        # metapod
-        "54": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⠤⠊⠑⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⡰⠁⠀⠀⠀⠸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢠⠃⠀⠀⠀⠀⠀⢳⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⢧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⠈⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⡠⠒⠒⢷⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⣜⡀⠀⠀⠀⠀⠀⠀⠀⡼⠓⢢⣄⡀⢻⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⣰⡅⢱⠀⠀⠀⠀⠀⠀⣰⢧⠀⠹⠿⠟⢻⠄⠉⠢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡇⠀⠀⣧⡀⠀⠀⣀⠞⠁⠈⠳⣀⣀⣰⠞⠀⠀⠀⠈⠑⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢸⢳⣀⠔⠁⠈⠒⣼⡁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠢⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⣸⢠⠁⠀⠀⠀⡼⠀⠈⠳⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⣿⠀⡀⠀⠀⢰⠁⠀⠀⠀⠀⠑⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡇⡇⠃⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠉⡶⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠸⡸⣄⣀⣸⠁⠀⠀⠀⠀⠀⠀⠀⡰⠁⠀⠀⠀⠀⠀⠀⠀⠀⠰⣠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠙⢽⣄⠈⠑⢤⡀⠀⠀⠀⠀⡰⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠉⠓⣤⠤⠬⠷⢤⣀⡜⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠘⢵⡄⠀⠀⠈⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⠫⣦⡀⠀⠀⢣⠀⠀ ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡗⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⣄⠀⠀⠳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⠑⢦⣀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠦⣀⡈⠒⠤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢮⠀⠀⠀⢸⠈⠢⢄⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠒⠦⠬⣉⣒⠢⣄⠀⣀⡤⠖⠁⠈⠳⠤⢤⣎⠀⠀⠀⡗⠢⢄⡀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠀⠉⠛⠥⣈⠒⠒⠤⣄⣀⠴⠋⠈⠓⠂⣶⠁⠀⠀⢨⠆
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠙⠫⠥⣍⣒⣒⣶⣞⣁⡠⢴⠞⠁⠀
-        """,
-        # nidoran_m
-        "55": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠒⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠁⢠⡃⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⢤⡄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠋⠀⠀⠀⠈⢠⠃⠀⠀⠀⠀⠀⠀⢀⣀⠀⢀⡠⠒⠉⢀⠞⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⠀⠀⡠⠊⠀⠀⠀⠀⠀⠀⠸⡀⠀⠀⠀⠀⢀⡴⠋⡼⠖⠁⠀⢀⣀⠉⢣⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠘⢣⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⡀⠀⠀⡠⠋⡠⠀⠃⣠⠔⠊⠁⠘⡇⠀⣉⠵⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢱⣠⠎⢀⠎⢀⡴⠊⠀⠀⠀⠀⠀⡇⡜⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⢀⡔⠁⠀⢀⠔⠉⠀⠀⠀⠀⠀⠀⢸⢡⠃⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⣆⡇⠛⠄⢀⠔⠁  ⠀⠀⠀⠀⠀⠀⠀⡞⠸⡄⠀⠀⠀⣠⠔⡆⠀⠀
-                ⠀⠀⠀⢀⣘⡟⠁⠀⠀⠀⠀⠀⠀⠀⠀⢰⡀⡑⢤⡴⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⣠⠊⠀⢀⡠⠊⠁⡜⠁⠀⠀
-                ⠀⠀⠀⠈⣇⠙⠂⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠇⡜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⢡⠃⢀⠴⠋⠀⢀⠞⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠸⡀⠀⠀⠀⠀⠀⣀⠤⠤⠤⡇⠠⣸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⢃⡮⠞⠅⠀⠀⢠⠋⠀⠀⢀⣀⣀
-                ⠀⠀⠀⠀⠀⢧⠀⢀⠴⠊⠉⠀⠀⠀⡀⡇⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⢁⡞⠁⠀⠀⠀⠀⡧⠐⠒⠉⠁⡠⠊
-                ⠀⠀⠀⠀⠀⢘⢔⡡⠀⠀⠀⠀⠀⠀⠀⡇⢸⠀⠀⡠⠄⠀⠀⠀⠀⢀⠞⡡⢋⣀⠤⠔⠚⣩⠃⠁⠀⠀⡠⠊⠀⠀
-                ⠀⢀⡠⠤⠒⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⡇⢸⣠⠎⢠⠇⠀⢀⡠⢚⡵⠊⠉⠉⠀⠀⠀⣰⣃⣠⢤⠀⡞⠁⠀⠀⠀
-                ⠘⠥⠦⣤⠤⢀⣀⣀⣨⠀⠀⠀⠀⠀⢐⠃⠞⠁⢀⡮⢔⡪⠕⠊⠁⠀⠀⠀⠀⠀⠀⠀⠃⠀⣠⣟⣀⠉⢒⡆⠀⠀
-                ⠀⠀⢰⠁⠀⡇⠃⢠⠃⠀⠀⠀⠀⢀⣤⡂⠀⠀⠉⠀⢩⠁⠀⠀⡴⠒⢦⠀⠀⠀⠀⠀⠀⠀⠈⠠⣼⡜⠁⠀⠀⠀
-                ⠀⠀⢸⠀⠀⠑⠒⠁⠀⠀⠀⢠⢾⣻⣿⡇⠀⠀⠀⠀⢸⠀⠀⠀⢇⠀⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⡄⠀⠀⠀
-                ⠀⠀⠀⢇⠀⠀⠀⠀⠀⢀⣔⣁⣘⣎⣻⠇⠀⠀⠀⠀⣸⠀⠀⢄⠈⠑⠉⢴⠎⠀⠀⠀⠸⠁⠉⠳⡈⡄⠈⢆⠀⠀
-                ⠀⠀⠀⢸⠀⠀⠀⢀⠔⠀⠀⠀⠀⠤⠊⠀⠀⠀⢀⣠⠇⠀⠀⠁⠀⠀⠀⡎⠀⠀⠀⠀⠀⠑⠒⢄⡇⢸⠀⠘⡆⠀
-                ⠀⠀⡠⢧⡀⣀⡘⠃⠀⠀⠀⠀⣀⡠⢴⡖⠊⠉⡁⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠀⠀⡇⠀
-                ⠀⣰⣩⠎⣹⡷⣍⠑⡦⠤⠒⠉⡡⠜⠉⠀⠀⠀⠈⠁⠀⠀⠀⠀⠀⢀⣀⠹⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠁⠀
-                ⠀⠀⠈⠉⠀⠀⠈⠉⠁⠀⠀⡸⠋⡢⠲⡄⠀⠀⠀⣀⠤⠒⠋⠉⠀⠀⠀⠈⠉⠓⠦⣤⣀⣀⣀⣀⡠⣠⠞⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⢓⣎⡠⠤⠗⠒⠊⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠓⠅⠀⠚⠊⠉⠀⠀⠀⠀⠀
-        """,
-        # onix
-        "56": r"""
-                ⠀⠀⠀⠀⠀⣠⡴⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⢻⠒⠒⠚⠛⣣⡀⠀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢻⡇⣧⠀⠀⠀⠀⠀⠀⠀⠀⣶⠉⠀⠀⠀⡕⠒⠤⠘⠁⠙⢏⠉⠙⡶⣀⡀⠀⢀⣄⣤⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣸⡇⢹⠄⠀⠀⣀⠤⠦⠴⠾⠬⢦⣀⠀⠀⣇⡀⠀⠀⠀⠀⠀⢹⠉⠉⡼⡗⠚⠓⠠⡀⠈⠓⠦⣤⡀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠘⡇⢸⣠⡖⠋⠀⠀⠀⠀⠀⠀⠀⠈⠑⡯⡀⠉⠢⣄⠀⢀⡄⢸⠀⠈⣆⢱⠀⠀⠀⠱⡀⠀⠀⢀⢳⠀⠀⠀
-                ⠀⠀⠀⠀⠀⡆⠁⠘⡟⠱⡀⠀⠀⠀⠀⠀⠀⠀⣠⢮⡀⠱⡀⠀⠘⣄⠜⠈⣺⢤⡠⠊⢼⠀⠀⠀⠀⠱⣀⡀⣼⠘⣇⠀⠀
-                ⠀⠀⠀⠀⠀⣇⠀⡔⣇⡴⠋⠑⠒⠲⡋⠑⢲⠊⠀⠀⠈⢱⡇⠀⠀⠀⢀⠜⠁⠀⢀⡶⠛⢆⠀⠀⠀⠀⠇⠀⠀⣁⣿⠀⠀
-                ⠀⠀⠀⣀⠔⣇⢠⠃⠘⡌⠉⠙⢦⡀⠑⠤⠼⠀⠀⠀⢀⡎⣇⡀⣠⡤⠛⠤⣤⡒⠉⠀⠀⠀⠑⠲⠤⣀⡀⢀⠜⣹⡏⠀⠀
-                ⠀⢀⡞⠁⢠⢻⢸⡠⠖⠁⣰⠐⢲⠙⢆⠀⠀⠀⢀⡴⠃⢀⠇⠀⠀⠀⠀⠀⠀⠓⢄⠁⠀⠀⠀⠀⠀⠀⠓⠁⡼⠛⠷⡄⠀
-                ⠀⡯⡏⠀⢸⣸⠎⠀⠀⠀⠱⣠⠇⠀⠀⠙⡍⠉⢩⢄⡶⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠒⡖⠤⢄⣀⡤⠒⠉⠀⠀⠀⢻⠀
-                ⢸⢁⠇⠀⠀⠀⠀⠀⠀⠀⠀⡝⠀⠀⠀⠀⡜⣥⠽⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢷⠒⠁⠀⠓⠤⣀⢀⣀⢴⡟⠀
-                ⢸⣷⢤⣠⠃⢸⠀⣀⡠⠤⡲⠓⣇⠀⠀⢀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢧⣀⡀⠀⠀⡸⠁⢀⡾⠁⠀
-                ⢸⡇⠓⡛⠀⢸⢙⠇⠙⠚⠁⡤⠀⠉⠢⣞⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠋⢩⠗⢺⡊⠉⠉⢷⡄⠀
-                ⣼⡇⠀⡇⠀⣎⠎⠀⠀⢀⢞⣴⠲⣹⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⢖⢏⠶⣡⡄⠀⠑⠢⡄⠀⣹⠃
-                ⠹⣗⠀⡇⢠⡏⠀⢀⡠⢊⣿⠇⣷⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣖⡡⠜⢏⠀⢉⢤⣀⣠⠞⠀⢠⡟⠀
-                ⠀⠀⠙⢗⣘⣪⣯⡵⣪⠝⢉⡼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠶⣉⣽⠀⠀⠀⡜⢶⣃⠀⠀⠀⢀⡴⠋⠀⠀
-                ⠀⠀⠀⠀⠙⠤⠬⢭⣥⠞⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⠤⣇⡨⢄⠘⢿⡒⠤⠓⠉⠀⠉⡏⠋⠉⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣴⡋⠀⡰⣏⣀⢀⣣⠜⠑⠶⣤⠤⠒⠛⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣿⠑⡊⢀⠏⠳⣍⣀⣀⣀⡴⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡇⣘⡷⡛⠁⠀⠀⢀⡼⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢐⡇⢉⣀⡠⠎⠈⢒⡖⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⣥⡀⠀⢀⣀⢾⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠧⣈⣾⣹⣖⠒⣒⣶⣶⣒⢶⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⠟⠮⣁⣤⣔⡾⠤⠞⠀⠀
-        """,
-        # pidgey
-        "57": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⢲⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣀⡔⣆⡠⠚⠁⢰⡗⢒⣾⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡰⠏⣴⢋⡰⠀⠀⢠⣒⣴⠡⢤⡤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢠⣣⠊⣀⠥⠖⠛⠉⠁⠀⠀⠀⠈⠑⠢⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢀⠄⠒⠚⠓⢾⠳⣦⣾⡟⢉⣿⣿⣯⡉⠉⠙⡔⠚⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠷⠶⡒⠤⣀⠀⢧⠀⠉⠒⢾⣿⣿⣿⣿⣆⠀⢃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠈⣦⠞⢑⣾⠀⠀⠀⠀⠙⣿⣿⣿⠟⠀⠸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⣴⠧⠔⢉⠎⠀⠀⠀⠀⣼⡿⠛⠁⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢸⠉⠁⠀⠀⠀⠀⠸⠋⠀⠈⠀⠀⠀⠐⠂⠧⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⢇⠀⠀⠆⢀⠀⠀⠀⠀⠀⠀⠈⠑⠢⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠈⠢⡀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠢⡙⢢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡘⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢺⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢈⣯⠀⠀⠀⠀⣠⠔⠉⠉⠉⠉⠒⠤⡀⠀⠀
-                        ⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠠⣸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣻⣆⢤⡶⠊⠁⠀⠀⠀⣀⣠⠤⣄⠈⣓⠄
-                        ⢸⢸⠀⠀⠀⡆⠀⠀⠀⡀⠀⢰⠀⡇⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⣻⠙⣞⠀⢀⡤⠖⠚⠉⠀⠀⠀⠀⠙⢦⡀
-                        ⠘⣼⡄⠀⡄⡇⡆⠰⠀⢷⠀⠀⣇⡇⢹⡀⠀⠀⠀⠀⠀⠻⣦⣰⢄⣼⡏⠙⠐⡜⡞⠁⠀⢀⣀⣀⣀⡤⠤⠔⠒⠉⠀
-                        ⠀⠁⢣⣁⣧⢷⣹⡀⠀⠸⣦⢀⡏⠁⠀⠱⡀⠀⠀⠀⠀⠀⢱⡈⠁⠉⠀⡀⢆⠱⢣⠀⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠙⢍⡙⠑⠒⠒⠃⠉⠀⠀⠀⠀⠈⠢⣻⡦⣶⠤⠾⠃⠀⠢⠰⡈⠈⢆⢟⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⠲⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠈⠒⠤⣀⠀⠈⠑⢄⠀⠀⠈⢞⡃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠢⡤⣀⣀⡀⠀⠀⠀⠀⣀⣀⠠⠝⠓⠂⠤⢝⣢⣀⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⣠⠤⠤⢄⣤⣤⣔⠮⠃⠀⠧⢍⡉⣩⠏⠙⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢀⢞⣉⣇⡼⠋⣆⣀⣴⠐⠐⠒⠒⢒⣉⠞⠀⠀⠀⠙⢏⢐⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠈⠁⠀⠀⠗⠋⢹⢉⣠⠧⢤⠞⢫⠉⠁⢀⠔⠉⠉⠉⠋⠉⠙⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠁⠀⠀⣇⠔⠚⠂⠈⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # pikachu
-        "58": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣾⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢀⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣾⠟⠁⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⣀⠀⠀⠀⠀⠀⠀   ⣠⠔⠙⡄⠀
-                ⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠤⠐⠒⣸⣿⣿⣿⣿⡿⠋⠀⠀⠀⠀ ⡠⠊⠁⠀⠀⢱⠀
-                ⠀⠀⠀⠀⠀⠀⠘⠀⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠔⠊⠁⠀⠀⠀⢠⣿⣿⣿⠿⠋⠁⠀⠀ ⢀⡴⠊⠀⠀⠀⠀⠀⠈⡆
-                ⠀⠀⠀⠀⠀⠀⢸⣀⠤⠒⠉⠉⠉⠉⠉⠉⠁⠒⠔⠁⠀⠀⠀⠀⠀⠀⣠⡿⠟⠋⠁⠀⠀⠀⢀⡴⠋⠀⠀⠀⠀⠀⠀⠀⠀⢣
-                ⠀⠀⠀⠀⠀⡠⠊⠁⠀⠀⠀⠀⢀⣎⣽⣦⠀⠀⠀⠈⠰⡀⠤⠔⠒⠉⠁⠀⠀⠀⠀⠀⠀⡴⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                ⠀⠀⠀⠀⣼⣯⡝⠀⡤⠀⠀⠀⡈⠻⠟⠋⡠⠤⡀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⡠⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⠚
-                ⠀⠀⠀⢸⣘⠛⠠⠤⡤⠤⠔⢺⠀⠀⠀⡎⡀⠀⠘⠀⠀⠀⠸⡀⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠴⠊⠁⠀⠀
-                ⠀⠀⠀⠸⡈⡆⠀⠀⠹⡀⡠⠜⠀⠀⠀⢣⡠⢀⡼⠀⠀⠀⠀⢱⠀⠀⠀⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⣀⠔⠊⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠱⣼⠀⠀⠀⠙⠥⠰⠀⠀⠀⠀⠈⠉⠀⠀⢀⣀⡀⠀⢣⠀⠀⠀⠀⠀⠀⠱⡀⠀⢀⠔⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⣈⠳⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⡺⢵⣷⡄⠀⠀⣧⡀⠀⠀⠀⠀⢀⠵⠀⠈⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣀⣖⢒⠈⠁⠀⠀⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⢏⠦⣼⡩⠇⠄⠀⠈⠓⡄⠀⡠⠖⠁⠀⢀⡠⠚⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢾⡀⠑⠂⠀⠀⠀⠀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢦⡀⠀⠀⠀⠀⠀⠀⠘⢆⠑⢄⢀⠲⡉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠉⠉⠁⠒⠒⠒⠂⠠⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢷⡀⣱⠕⠛⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⢀⠤⠔⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⣎⣢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡄⠀⠀⠀⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠒⠤⢄⣀⠤⡔⠉⠁⠀⠈⠉⠒⠢⠤⠤⢤⠤⠒⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣥⢃⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢼⡸⣰⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠁⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # poliwag
-        "59": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡠⠤⠤⠤⣀⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣀⡤⠒⠉⠀⠀⠀⠀⠀⡾⢿⣯⣗⠦⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢀⣶⣻⣿⠟⢳⡄⠀⠀⠀⠀⠹⣶⠿⢿⡆⠙⡝⢦⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⣴⢳⠱⣿⣿⠷⢾⡇⠀⣠⠔⠒⠒⢬⡙⠋⠥⠐⠃⠀⠙⢆⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢰⠃⢸⠀⠻⣅⠠⡺⠁⢰⢁⠐⠉⠁⢠⠗⠤⠤⣀⠀⠀⠀⠈⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡇⠀⠀⠓⠒⠒⠋⢀⡤⠊⠑⢒⣒⣮⣥⣤⣀⡀⠀⠙⢢⡀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢸⠀⠀⠀⠀⠀⠀⡰⠋⠀⡠⡺⠕⠉⢁⣀⣈⠉⠛⢷⣄⠀⠙⡄⠀⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢸⠀⠀⠀⠀⠀⢰⠁⠀⣼⠎⢀⣴⠾⣛⣉⣙⠻⣷⡀⠹⣧⠀⢹⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢸⠀⠀⠀⠀⠀⡇⠀⢰⡟⠀⣾⡏⣼⠟⠉⢛⣷⠘⣷⠀⣿⠀⢸⠀⠀⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠸⡀⠀⠀⠀⠀⢣⠀⠸⣷⠀⢿⡅⢿⣄⠰⠾⢏⣼⠏⢠⡿⠀⡸⠀⣰⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢣⠀⠀⠀⠀⠈⢆⠀⢻⣆⠈⢷⣤⡙⠛⠛⠛⣉⣴⠟⢁⡴⠁⣰⣏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠣⡀⠀⠀⠀⠈⠢⡀⠙⢷⣦⣍⠛⠛⠛⠛⠋⢁⡤⠊⣠⠎⠀⠀⠙⠳⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠘⠢⡀⠀⠀⠀⠈⠑⠢⠤⠥⠤⠤⠤⠒⠊⣁⡴⠞⠹⣆⠀⠀⠀⠀⠈⢷⣀⠤⠤⠤⠤⠤⠴⠦⢄⣀⡀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠈⠓⠒⠤⡤⠤⠠⠤⣤⠤⠤⢖⣊⡉⠈⠳⢤⡤⠚⠳⢄⡀⠀⣀⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠓⢤⡀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢷⠀⠀⠀⠹⡄⠀⠀⠀⠈⠙⢶⡢⠬⣑⡲⠤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢄⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⡄⠀⠀⠀⠈⢳⡀⠀⠀⠀⠀⠹⢦⡀⠈⠉⠒⠪⠭⢖⣢⡤⠤⢀⣀⣀⣀⣀⣀⣀⣀⡀⠀⠀⠀⢸⡁
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⡀⠀⠀⠀⠀⣿⠀⠀⠀⠀⠀⠀⠈⠒⢤⣀⠀⠀⠀⠀⠈⠉⠉⠑⠒⠒⠒⠒⠉⠉⠀⠀⠀⢀⡼⠁
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠤⣀⣀⠴⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠒⠤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠴⠚⠁⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠑⠒⠒⠒⠒⠒⠒⠚⠉⠀⠀⠀⠀⠀
-        """,
-        # ponyta
-        "60": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⣷⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣀⣤⡤⠀⠐⠒⠂⠤⢀⡬⠹⠁⢹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⡴⠋⠊⠁⠀⠀⠀⠀⠀⠀⢀⠐⠀⠀⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢀⡎⠀⠀⠀⠀⠀⠀⠀⠉⠀⠉⠀⠀⢀⣜⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢸⠁⠀⠀⠀⠀⠀⢀⠔⠒⠂⠤⢤⣬⠓⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠸⡆⢠⠔⠒⣒⡊⠃⠤⡒⣒⣪⡿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡠⠊⠈⠒⣢⣺⣿⠇⠀⠀⠹⢛⠹⢷⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⣤⠀
-                        ⠘⠀⡀⠀⠀⠀⠉⠁⠀⠀⠀⠀⢸⠰⢯⠁⠀⠀⠀⠀⠀⣠⠴⣤⡞⠛⠶⠒⠀⠲⢤⡀⠘⢢⠈⣱
-                        ⠘⠬⠅⠠⠤⠒⠙⡉⠁⠀⠀⠀⠀⡆⠙⢋⣓⡆⠀⠀⠀⠈⢳⡙⠀⠀⠀⠀⠀⠀⠀⠉⠶⠊⢀⡿
-                        ⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠸⡄⣌⣽⣡⢤⣤⣄⠀⣼⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⠆
-                        ⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠘⠾⣛⡀⣀⣘⡋⢛⣙⡂⠀⠀⠀⠀⠀⠀⠀⣠⠤⠤⠇⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⡄⠀⠀⠀⠀⠀⣼⠁⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢠⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣶⣆⡄⠀⣠⡟⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣸⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠼⠓⣷⣟⡏⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠹⡀⠈⢆⠀⢠⠀⠀⠀⠀⣀⡀⡔⡆⠀⠀⠀⠀⢼⡀⠈⠋⠀⡵⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢡⠀⠈⠲⣌⡆⠀⠀⣸⠁⠈⠑⡥⣴⠀⠀⠀⢸⠀⠀⠀⢿⠁⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠘⡄⠀⠀⡇⣡⠀⠀⡪⠀⠀⢯⢸⠀⠣⡀⠀⠘⢤⠀⠰⣯⡄⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢡⠀⠀⣠⡿⣤⠀⢹⣀⣸⠁⢸⠀⠀⠉⠢⡀⠘⠴⡾⠃⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢸⡀⠀⡗⠀⢹⡆⠀⣿⠇⢀⡼⠀⠀⠀⠀⡇⠀⣠⠃⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⡜⠀⠸⠀⠀⢸⠋⢸⠏⠀⡎⠀⠀⠀⠀⢰⠁⢠⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢠⠃⠀⡏⠀⠀⡆⠀⢸⣀⣸⠆⠀⠀⠀⢀⠇⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢀⠎⠐⢤⠇⠀⢠⠥⡀⢀⠗⠃⠀⠀⠀⢀⡞⡒⢠⠚⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⠑⠀⠁⠀⠀⣜⣔⣊⣾⠀⠀⠀⠀⠀⠈⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # rattata
-        "61": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠤⠤⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡏⠀⠀⣠⣄⡀⠉⠲⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀⠀⠓⠁⠈⢢⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⣄⠀⠀⠀⣸⠉⠢⣄⠈⠳⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠀⠀⠀⠀⠳⡄⠱⡄⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢎⢦⡀⠉⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡄⢱⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡞⡜⠀⢣⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⡀⠤⠒⠒⠒⡄⠀⠀⠀⠀⠀⠀⠀⠀⠸⡀⢇⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢀⠀⠀⠀⠀⠀⡇⣇⡤⠚⠉⠉⠀⠈⠉⠉⠒⠤⣀⠔⠉⣀⡠⠔⠲⡄⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⢸⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠈⠛⢶⢄⡀⢀⠕⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⠃⢠⠞⠉⠀⠀⠀⠁⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⢸⠈⡄⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⡑⠭⠋⠀⠀⠀⠀⠀⠀⠀⠀⣀⠤⣤⠀⠀⠈⡇⠀⠀⠀⠀⡆⢰⠁⢀⡠⠤⠤⠄⣀⠀⠀⢸⢀⠇⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⢀⣤⢲⡏⡇⠀⣸⠀⠀⠀⢇⡀⠀⠀⢰⠃⡾⠮⠅⠀⠀⠀⠀⠀⠙⢢⡇⡸⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢣⡀⠐⠋⠉⠉⠁⠒⠋⠑⠛⠚⠀⠴⢇⣀⣀⣒⡤⠨⠭⠵⠥⠼⠀⣀⣀⣀⡀⠀⠀⠀⠀⠀⠱⡃⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣀⡟⠒⠈⠉⢩⠳⢄⠀⠀⠀⠀⠀⠨⠭⠲⡒⠒⠒⠀⠈⠉⠉⠉⠉⠉⠉⠉⠁⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀
-                ⢀⠤⠤⢴⣊⡉⠀⡇⡆⠀⢤⠳⡄⡈⠳⣄⠀⠀⠀⠀⠀⠀⠱⠀⢀⠆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀
-                ⠀⡩⢂⠈⠢⢸⠀⠑⠣⠤⠃⠀⠘⢆⡜⠀⠑⣄⠀⠀⠀⠀⠀⡢⠋⠀⠀⠀⠀⢀⠀⠀⡀⠤⠔⠠⡄⠀⠀⠀⠀⠀⢣⠀⠀⠀
-                ⠘⠊⠉⠉⠉⠉⠁⠀⠀⠉⠉⠉⠉⣽⠀⠀⠀⡸⠀⠀⢀⣤⡴⠁⠀⠀⠀⠀⢀⠎⠁⠀⠀⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⠑⠤⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⢄⣀⠴⢃⠤⠚⢁⡞⠀⠀⠀⠀⠀⢠⣿⡤⠄⣀⣀⠠⠤⠒⠋⠙⠦⣀⠀⠀⠀⢀⡄⢸
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠒⠊⠁⠀⠀⡜⠀⠀⠀⠀⠀⣰⣛⢡⣚⠹⠞⠁⠀⠀⠀⠀⠀⠀⠀⠉⣽⠈⠉⡀⢸
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠼⠀⢄⡀⠀⣠⠞⠉⠀⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⣫⠊⣩⠏⣠⠇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠞⡖⢁⡴⢀⡤⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠞⠫⠚⠁⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠒⠛⠓⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # sandshrew
-        "62": r"""
-                        ⠀⠀⢠⣖⠒⠢⠤⢄⡠⢔⣲⣖⣉⡑⠒⠢⠤⣀⣀⡀⠤⠤⠤⢤⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠸⢛⡆⢁⡤⠒⠉⠀⠀⠀⠀⠈⠉⡲⠦⣁⠀⢀⣀⠴⠊⣏⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢿⡾⢃⠇⠀⠀⠀⠀⠀⠀⢀⠜⠁⠀⠀⠑⢌⠣⡀⢰⡝⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⡘⠀⢸⠀⣀⣠⠤⠤⠤⣀⡎⠀⠀⠀⠀⠀⠀⢣⠑⢷⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⣃⡠⠚⠉⠀⢸⠀⠀⠀⠀⠈⠑⠢⡤⢤⣄⠀⠈⡄⠈⣗⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢸⠁⡇⠀⠀⢀⣸⣀⣀⡀⠀⠀⠀⡜⠀⣸⣿⡇⠀⡇⠀⢸⠀⠳⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠸⣷⣼⡠⠊⠁⠀⠀⠀⠈⠑⠢⡜⣿⠾⣿⣿⠁⡸⠀⠀⡞⠢⡀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠙⣯⡷⢄⠀⠀⠀⠀⢀⡤⠊⠀⠧⠴⠋⣸⠔⠁⠀⡰⠁⠀⠈⢆⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⡠⠊⠈⢆⠀⠉⠒⠒⠈⠁⠀⠀⠀⢀⡠⠚⢁⡳⠄⠰⠥⡀⠀⢢⠈⡾⢡⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡼⢲⠒⠀⠒⠳⢄⠀⠀⠀⠀⣀⠔⠊⠁⠀⢰⠃⠀⠀⠀⠀⠈⢣⡀⡵⠁⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢠⠁⢸⠀⣀⣀⣀⢸⠑⠢⠤⠔⠁⠀⠀⡠⠒⠉⠉⠉⣒⣄⠀⢠⠃⡏⢣⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⢹
-                        ⠘⡄⡜⠉⠀⠀⠀⢻⠀⠀⠀⠀⠀⢀⡎⠁⠉⠑⢶⠊⠀⠈⡖⠁⢠⠇⠸⡀⡠⡇⠀⠀⠀⠀⠀⠀⢀⡠⠴⣁⠀⡸
-                        ⠀⢳⡁⠀⠀⢠⢴⣍⡆⠀⠀⠀⠴⣩⠃⠀⠀⠀⠀⡇⠀⠀⡇⡠⣊⣀⣤⡋⢠⠧⣀⣀⠠⠤⠴⢞⡉⠀⠀⠀⢳⠇
-                        ⠀⠀⠙⢢⢄⣧⢤⡵⠀⠀⠀⠀⠠⢎⡠⢵⠀⠀⡰⣁⡠⣼⠞⠉⠀⠀⠀⠈⠙⢦⡀⠙⢦⠀⣀⣠⠬⢢⠀⡰⡟⠀
-                        ⠀⠀⢠⠃⠀⠘⡅⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠉⠁⠀⡔⠁⠀⠀⠀⠀⠀⠀⠀⠀⡱⡄⠀⢫⠀⠀⠀⠈⣎⠞⠀⠀
-                        ⠀⠀⣎⡀⠀⣀⣘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⣀⠀⠀⠀⠀⠀⠀⣀⠠⢞⠁⢹⠀⠘⠀⠀⠀⡰⠋⠀⠀⠀
-                        ⠀⠀⡇⢠⠀⠀⠀⠈⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠄⠀⠉⠉⡏⠉⠉⠁⠀⠀⠸⠀⢸⠒⢺⢀⡠⠊⠀⠀⠀⠀⠀
-                        ⠀⠀⠘⡼⣄⣀⣀⣀⠠⠽⠢⢄⡀⠀⠀⠀⠀⠀⠀⢸⡀⠀⠀⢣⠀⠀⠀⠀⠀⢀⡠⣺⠤⠗⠉⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢀⡨⠖⠤⠄⠀⠀⢀⣀⢤⡞⠑⠒⠠⠤⠤⠤⠤⠣⡑⠒⠨⠦⠤⠤⠤⠒⠋⢠⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢀⡔⡩⠚⠉⢲⠀⢀⣀⡠⠔⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠢⢄⡀⠀⠀⠀⠀⡠⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠸⠮⠤⠄⠒⠊⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⢉⠤⢄⡠⠤⡈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⡀⠀⡇⠀⣸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠢⣧⡰⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # squirtle
-        "63": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠤⠒⠒⠉⠉⠒⠒⠠⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⡖⠁⠀⠀⠀⠀⠀⠀⢀⠀⠀⠀⠈⠲⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⡇⠃⠀⠀⠀⠀⠀⠀⠘⡥⠒⢢⡀⠀⠀⠈⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢠⣳⠃⠀⠀⠀⠀⠀⠀⠀⣼⣿⣦⣾⡇⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣸⡝⠀⠀⠀⠀⠀⠀⠀⠠⡿⣿⠟⢹⡇⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢰⠹⠁⠀⣤⠀⠀⠀⠀⠀⠀⠑⠒⠒⠳⠃⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠘⡍⠢⠤⠔⠊⠁⠐⠒⠒⠒⠠⠤⠤⠤⠴⠂⠀⠀⠀⡜⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠈⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠜⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣉⠦⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣔⡋⢸⠘⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣀⠤⠒⠋⠁⢀⠔⠁⠈⠉⠒⠒⠢⠤⠄⢒⠖⠋⠁⠀⠈⠙⣤⣄⠱⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⢀⡀⠀⠔⠊⠀⠀⠀⠀⢠⠫⣀⠀⠀⠀⠀⠀⠀⠀⢠⠏⠀⠀⠀⠀⠀⠀⠸⡄⠙⢿⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠈⢆⢀⡞⠀⠀⠀⠀⢠⠇⠀⠀⠉⠑⠒⢢⡤⠤⢤⠏⠀⠀⠀⠀⠀⠀⠀⢰⢣⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⣔⣁⠀⠉⠁⠀⠀⠀⣾⠀⠀⠀⠀⠀⠀⡆⠀⠀⡸⢀⢖⢳⠀⠀⠀⠀⢀⠎⢸⠀⠀⠸⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠉⠉⠉⠉⠉⡏⢆⠀⠀⠀⠀⠀⣇⠀⡴⠁⠀⠁⠈⠐⠂⣴⣴⠋⠀⡎⠀⠀⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⡇⢸⠤⠄⣀⣀⣀⠃⠀⠈⠉⠑⠒⡤⠔⠒⠉⢸⠆⠀⡷⠀⠀⣸⡀⠀⠀⠀⢀⣀⡠⢀⣀⡀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣧⡎⠀⠀⠀⠀⢸⠉⠉⠉⠉⠀⠉⢣⡀⠀⠀⠸⡄⠀⡇⢀⡔⡹⠀⢀⠔⠋⠀⠀⠀⠀⠀⠈⠲⡀⠀
-                        ⠀⠀⠀⠀⠀⠀⢀⠎⠀⢧⠀⠀⠀⠀⠘⠀⠀⠀⠀⠀⠀⠀⡵⠚⠉⠉⠉⠲⣽⠋⢠⠇⡠⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⠀
-                        ⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⠳⡀⠀⠀⢈⣆⠀⠀⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⠘⣇⣮⠞⠀⠀⠀⠀⡴⠋⠉⠉⠣⠀⠀⠀⠇
-                        ⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠙⠶⡉⠁⠈⠑⠢⠤⣀⡎⠀⠀⠀⠀⠀⠀⠀⠀⢹⠀⠀⠀⠀⠀⠰⡃⠀⠀⠀⠀⠀⠀⠸⠀
-                        ⠀⠀⠀⠀⠀⢸⡀⠀⠀⠀⠀⠀⠀⡸⠓⠂⠤⠤⠤⣤⣽⡀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠳⣄⠀⠀⠀⢀⡰⠃⠀
-                        ⠀⠀⠀⠀⠴⡥⠂⢀⠀⠀⠀⢀⡠⠁⠀⠀⠀⠀⠀⠀⠀⠹⡀⠀⠀⠀⠀⠀⠀⢸⠒⠠⠤⠄⣀⣀⣀⣀⡩⠵⠒⠉⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠃⠉⠧⠔⠒⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠇⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⠔⠒⠤⣀⡴⠒⠠⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # starmie
-        "64": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠎⡆⠈⢳⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣤⣖⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠃⢠⠁⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⢀⡠⠔⠊⣡⠔⢹⡄⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢿⠈⢆⠀⠉⠒⢄⡀⠀⠀⠀⠀⠀⡰⠁⠀⢸⠀⠀⠀⠘⡇⠀⠀⠀⢀⡤⠔⠊⠁⠀⡠⠊⠀⢀⡾⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠘⢇⠀⠣⡀⠀⠀⠈⠓⢦⡀⠀⣼⠁⠀⠀⡇⠀⠀⠀⠀⢹⡤⠔⠊⠁⠀⠀⠀⡴⠊⠀⠀⠀⡼⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠺⡄⠀⠱⡄⠀⠀⠀⠀⠈⢱⠃⠀⢰⠉⢹⠀⠀⠀⠀⠀⢇⠀⠀⠀⢀⡴⠋⠀⠀⠀⠀⡼⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢷⠀⢀⠈⢆⠀⠀⠀⢀⠇⠀⠀⡧⠀⡆⡆⠀⠀⠀⠀⠸⡄⢀⡴⠋⠀⠀⠀⠀⢀⡼⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠸⣇⢨⠀⠀⡷⠑⢤⡞⠀⢀⣰⠁⠀⡇⠣⢄⣀⠀⢀⠴⠋⢑⡆⠀⠀⠀⠀⢀⡞⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⡄⠀⠀⠹⣄⠀⠻⣎⣥⠸⠶⠶⠧⡤⡢⣠⠟⠁⡠⢞⠏⠑⠦⣀⠀⢠⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢱⡠⠔⠋⡹⠳⣵⠏⠀⣀⡀⢠⣜⠀⠈⠪⡢⡊⠀⢧⠀⠀⠀⠈⠙⠿⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⡠⠔⠉⠀⠀⣰⠁⡰⠁⢠⠎⢀⠔⠉⠀⣱⡤⠒⠚⡞⢀⣀⡳⡀⠀⠀⠀⠀⠈⠙⠤⣀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⠴⠋⠀⠀⡠⠤⠐⠓⠀⡷⠀⢸⠞⢁⡤⡺⠟⠁⣿⠀⠀⡇⠊⠀⠈⠉⠉⠉⢹⣀⡀⠀⠀⠈⠲⢆⠀⠀⠀⠀
-                ⠀⠀⠀⣠⠔⣁⡠⠤⠒⠊⠧⠶⠶⡎⢸⣧⠔⠛⢔⠁⠀⠀⢀⠜⠑⠂⣄⣷⠉⠉⢩⠍⠙⠛⠚⠀⠉⠉⠑⠒⠢⠤⣑⢦⡀⠀
-                ⠀⠀⣰⡙⠉⠀⠀⠀⠀⠀⠀⠀⠀⠙⡌⠻⣦⡀⢸⠋⠉⡩⠻⡀⠀⣠⣾⠟⠀⢠⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⣡⠇⠀
-                ⠀⠀⠀⠈⠉⠉⡱⠒⠒⠒⠲⠤⡤⠀⡽⠃⢘⠟⠾⠤⠉⢀⣀⡧⡪⢊⠀⠑⣤⡃⠀⠀⠦⠲⡖⠒⠒⠈⠉⠉⠙⣆⡁⠀⠀⠀
-                ⠀⠀⠀⠀⣰⠞⠀⠀⢀⡠⠖⢉⢇⠜⠀⣰⡷⠤⣀⢰⠀⠈⡏⠉⠀⣈⠵⣄⠈⠳⡄⠀⠀⠀⣏⠓⠦⣀⠀⠀⠀⠈⠳⡄⠀⠀
-                ⠀⠀⢀⠞⠁⢀⡠⠒⠁⠀⠀⣸⠈⠢⠞⡹⠀⠀⠈⠹⡀⠀⡇⡖⠉⠀⠀⠈⠻⡔⠁⠀⠀⠀⢸⠀⠀⠀⠙⠢⢄⡀⠀⠙⣦⠀
-                ⢀⡔⢁⡤⠚⠁⠀⠀⠀⠀⠀⡇⠀⠀⡰⠁⠀⠀⠀⠀⡇⠀⢃⡇⠀⠀⠀⠀⠀⠙⣄⠀⠀⠀⠈⡆⠀⠀⠀⠀⠀⠉⠒⠤⡈⢢
-                ⢸⣚⣁⣀⣤⠤⠤⠐⠒⠒⢒⠇⠀⢠⠃⠀⠀⠀⠀⡠⠚⢲⠚⠉⠢⣄⠀⠀⠀⠀⠈⢦⠀⠀⠀⢻⠉⠒⠒⠒⠂⠤⠤⣤⣈⡽
-                ⠀⠀⠁⠀⠀⠀⠀⠀⠀⠀⢸⠀⢠⠃⠀⠀⠀⣠⠞⣧⠀⠘⡄⠀⠀⢈⡗⢤⡀⠀⠀⠀⠳⡀⠀⠸⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⢀⠎⠀⠀⣠⠞⠁⠀⠈⣇⠀⡇⠀⢀⡞⠁⠀⠘⠢⣄⠀⠀⠙⣄⠀⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣇⡜⠀⡠⠞⠁⠀⠀⠀⠀⠈⢦⣁⣠⠞⠀⠀⠀⠀⠀⠈⠑⠦⡀⠈⠃⢻⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠓⠛⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠲⠚⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # staryu
-        "65": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⡎⠲⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡜⢸⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠜⠀⡆⠀⠀⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⢀⠇⠀⠀⠀⠘⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⠀⢸⠀⠀⠀⠀⠀⢡⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣄⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⠀⠀⡎⠀⠀⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⢀⣠⠤⠐⠚⣉⠥⠒⠈⡇
-                ⢰⠢⢄⡚⠒⠲⠶⢤⣀⠀⠀⡠⠔⢦⡎⠀⠀⠠⢁⠇⠀⠀⠀⠀⠀⣀⠼⢤⡀⣀⠤⠔⠒⠉⠁⢀⡤⠒⠉⠀⡴⠁
-                ⠘⡄⠀⠈⠒⢤⡀⠀⠀⠈⠉⢿⡀⠈⢻⠦⠒⠒⠚⠒⠒⠒⠤⢴⠞⠁⢀⣴⠃⠀⠀⢀⡡⠔⠊⠁⠀⠀⢀⠜⠀⠀
-                ⠀⠹⡄ ⠀⠀⠈⠓⠤⣀⠀⢸⠞⡄⠀⢣⠀⠀⠀⠀⠀⣀⠔⠁⢀⠔⢡⠃⣀⠤⠊⠁⠀⠀⠀⠀⠀⠀⠀⢠⠊⠀⠀⠀
-                ⠀⠀⠹⡄⠀⠀⠀ ⠀⠀⡱⠃⠀⠹⢝⠤⣓⣭⠥⠤⣘⠁⣠⠾⠓⠀⠀⠻⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠃⠀⠀⠀⠀
-                ⠀⠀⠀⠘⡄⠀⠀ ⠀⢰⠁⠀⢀⢠⢪⣾⠁⢈⠎⣑⡜⢣⠱⣀⡀⠀⠀⠀⠱⡀⠀⠀⠀⠀⠀⠀⢀⡜⠁⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠘⡄⠀⢠⠒⠃⠉⠉⠉⢎⢈⣿⠹⠉⠞⠋⠛⠈⠆⡀⠀⠉⠉⠉⠉⠉⢳⠀⠀⠀⠀⢠⠎⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠘⢆⠘⠶⡖⠈⠉⠉⠹⡘⣌⠣⠬⠄⠀⣀⡜⡰⠁⠉⠉⠉⠉⠁⠶⢾⣀⠀⠀⡰⠃⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠸⣦⠔⢺⣄⠀⢀⠔⠁⢀⢍⣒⣒⣚⣭⠀⠑⣄⠀⠀⠀⠀⣠⣀⡀⠀⠉⢺⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⠇⠀⠀⢈⡶⠃⠀⡔⠁⠀⠀⠀⠀⠀⠳⡀⢈⢦⡀⣠⠊⠀⠀⠉⠑⠲⠞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡝⠀⠀⠀⡜⠀⣠⡪⢄⡀⠀⠀⠀⠀⠀⠀⢈⢧⠀⠙⡆⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⠃⠀⠀⢄⡜⠓⠋⠀⠀⠈⢣⠀⠀⢠⠏⠩⠁⠉⠓⠺⡁⠀⠀⠀⠀⠀⠀⢹⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⡸⠀⠀⢀⠎⠀⠀⠀⠀⠀⠀⠘⡄⠀⠸⡀⠀⠀⠀⠀⡐⠘⢆⠀⠀⠀⠀⠀⠈⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢐⠇⠀⢀⠎⠀⠀⠀⠀⠀⢀⠴⠋⠈⠉⠉⠉⠲⣄⠀⠀⠁⠀⠈⠣⡀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢾⠀⢀⠎⠀⠀⠀⠀⣠⠖⠁⠀⠀⠀⠀⠀⠀⠀⠈⠑⢄⡀⠀⠀⠀⠙⣄⠀⠀⡀⠸⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⡇⢀⠎⠀⠀⢀⡤⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠢⣄⠀⠀⠈⢦⠀⢣⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢣⠞⠀⣀⠔⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⢤⡀⠀⠱⡄⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠁⠒⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⠦⣈⣂⡇⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # tangela
-        "66": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⠀⠀⠀⠀⠀⢀⡠⠤⠒⠒⠒⠤⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⠖⢹⠃⠀⠀⢀⣔⡭⠤⠤⠤⠤⠤⣄⡀⠑⢄⢀⡤⠖⠉⠉⠉⠉⠺⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⡎⠀⢸⡄⡤⠞⠋⠀⠀⠀⠀⠀⠀⠀⠀⠉⠳⡬⠛⠒⠉⠓⠒⠢⣄⠀⠀⢻⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣄⡠⣇⠀⢠⠏⠀⠀⢀⣔⢚⠟⠉⠹⡓⠦⣄⠀⠀⠙⡆⣀⠤⠒⠉⠉⠉⠉⠓⠲⢿⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢀⡰⠊⠁⠀⣸⠖⡎⠀⠀⣰⡃⠀⠙⢦⢠⡎⠉⠉⢪⡇⠀⠀⣽⠁⠀⠀⣀⣤⠤⠤⣤⡀⠀⠙⣖⠶⢦⡀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⣸⡥⠒⠋⢹⠃⠀⢇⠀⠀⢇⠉⢧⠀⠈⡏⢱⡀⠀⠀⢷⠀⢀⡇⠀⠀⢈⠀⡞⠀⠀⡇⢙⣆⣀⣘⡆⠀⠉⢢⡀⠀⠀⠀
-                ⠀⠀⣰⠋⠀⣠⢤⠼⢇⠀⠘⣄⡤⠼⠒⠚⠒⠦⠧⠞⠁⠀⠀⣸⣶⣿⣧⠀⠀⠈⠉⠓⠒⠉⠉⠀⠀⠀⠀⠉⠙⠢⣄⠱⡀⠀⠀
-                ⠀⣼⠁⡴⣏⣴⠏⢀⡬⠗⠋⠀⠀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣴⣿⣿⣿⣿⣷⣦⣄⣀⣀⣠⣴⣾⠉⠙⡏⣹⠲⡤⣀⠀⠻⣇⠀⠀
-                ⠀⣀⡼⠀⡟⢸⠔⠉⠀⣀⢴⡚⠉⠣⣰⣿⣿⠟⠋⠉⣉⠛⢿⣿⣿⣿⣿⠛⢉⠙⠻⣿⣿⣿⠏⠀⢀⣷⣁⠣⢳⠈⠳⣄⠘⣆⠀
-                ⢠⠋⠁⣰⢳⠏⠀⢀⡞⠡⠔⠳⡀⠀⢻⣿⡏⠀⠀⠀⠛⠀⠈⣿⠿⠛⡇⠀⠉⠀⠀⠈⣿⡟⠀⠀⣞⡀⠈⠳⡏⠀⢠⣿⣆⢸⡁
-                ⣸⠀⠀⡇⣸⠀⠀⣯⡀⠀⠀⢀⡇⠀⢸⣿⡇⠀⠀⠀⠀⠀⠀⡿⠀⠀⢳⡀⠀⠀⠀⠀⣿⡇⠀⠀⢧⢱⠀⠀⢹⣴⠋⠀⠉⠉⠁
-                ⢿⡀⠀⡜⢻⠀⠀⡇⠈⠉⠙⡷⠃⠀⣼⣿⣿⣦⣀⢀⣀⣠⣾⣥⣀⣀⣀⢑⣦⣤⣤⣾⣿⠿⡀⠀⠈⠻⣄⣀⡾⢄⣠⣀⠀⠀⠀
-                ⠀⠑⢼⠁⢸⡄⠀⠹⣑⡦⠚⣡⠖⠋⠉⠉⠉⠙⠻⢿⣿⠟⠉⠀⠀⠀⠈⠙⠻⡟⠛⠻⢅⡀⣙⡦⣀⠀⠀⠉⠉⠉⢁⣾⠀⠀⠀
-                ⠀⠀⠺⡄⢸⣹⡴⠊⠁⠀⡜⠁⠀⣠⢴⠒⠢⢤⡀⢰⠃⠀⠀⣴⠒⠲⢄⠀⠀⢹⡄⠀⠀⠹⣦⡀⠈⢻⣵⣲⠶⠯⢥⣏⠀⠀⠀
-                ⠀⠀⠈⢱⣄⡟⠀⣀⡴⠚⠁⠒⠺⢅⢸⠀⠀⢳⢨⠇⠀⠀⡜⠸⡄⠀⠈⢧⡀⡼⠈⢦⠀⠀⣧⡇⢀⡼⠋⠀⠀⠀⠀⠘⣆⠀⠀
-                ⠀⠀⠀⠀⣿⠀⢰⠋⠀⠀⠀⠀⠀⠀⠻⣦⣀⠼⠃⠀⢀⡜⠀⣀⠟⢄⡀⠀⠈⠑⠒⣺⠃⠀⡿⠛⡟⠀⠀⠀⠀⠀⠀⠀⢡⠀⠀
-                ⠀⠀⠀⠀⠘⢇⢸⠀⠀⠀⠀⠀⠀⠀⠀⠘⣆⣀⣠⣔⠋⠈⠉⠁⢀⡠⠟⡖⠤⣄⠴⠃⠀⢠⠃⠈⠀⠀⠀⠀⠀⠀⠀⠀⣼⠀⠀
-                ⠀⠀⠀⠀⠀⠈⢿⡀⠀⠀⠀⠀⠀⠀⠀⠀⠘⡏⠲⣄⡉⠛⠛⠛⠛⠒⠒⠓⠉⠁⠀⢀⡴⠻⡀⡆⠀⠀⠀⠀⠀⠀⠀⢠⡋⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⣧⡀⠀⠀⠀⠀⠀⠀⠀⠀⣷⠤⠤⠝⣷⠖⠤⢤⡤⠤⡤⠤⠔⠺⠥⣈⣲⠸⡇⠀⠀⠀⠀⠀⠀⡠⠟⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠈⢷⣄⠀⠀⠀⠀⠀⠀⢀⡿⠀⠀⠘⠓⠒⠒⠋⠁⠀⠀⠀⠀⠀⠀⠀⠁⠀⠻⣤⣀⣀⣠⠴⠏⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠓⠢⣤⠤⠤⠔⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠈⠁⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # voltorb
-        "67": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⣀⠤⠤⠤⠤⠴⠶⢦⣠⣀⠀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⣠⠶⠚⠋⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠛⠻⢤⣄⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣠⡴⠞⠉⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠧⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⡴⠋⢀⠐⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠑⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣀⡼⠋⠀⠀⢆⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠹⣆⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢰⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢿⠄⠀⠀⠀⠀⠀
-                ⠀⠀⣠⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢳⡀⠀⠀⠀⠀
-                ⠀⢠⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢧⠂⠀⠀⠀
-                ⢀⡞⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡽⡹⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢻⣆⠀⠀
-                ⣼⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠻⣲⣝⠢⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠆⠀⠀⠀⠀⠀⠀⠀⢹⡀⠀
-                ⢿⠙⣶⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡍⠳⢦⣄⠀⠀⠀⠀⠀⠀⠀⠀⠘⣆⠀⠀⠀⠀⠀⠀⠀⢧⠄
-                ⢸⠀⠀⠙⠲⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣎⠀⠀⠀⠙⢦⡀⠀⠀⠀⠀⠀⠀⠀⢸⡆⠀⠀⠀⠀⠀⠀⢸⠀
-                ⣿⠀⠀⠀⠀⠈⠛⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⠀⠀⠀⠀⠀⠙⣦⡀⠀⠀⠀⠀⠀⢸⠁⠀⠀⠀⠀⠀⣠⠯⠀
-                ⢹⡆⠀⠀⠀⠀⠀⠀⠈⠓⠦⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡄⠀⠀⠀⠀⠀⠀⠓⠙⢦⡀⠀⠀⣼⠊⢀⡆⠀⠀⣠⣾⡏⠀⠀
-                ⠘⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠓⠤⣄⡀⠀⠀⠀⠀⠀⠀⠙⠒⠲⠦⢤⣄⣀⣀⠀⠀⡳⣆⡼⠃⢀⣜⣠⡶⠋⢹⣿⠃⠀⠀
-                ⠀⠹⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠙⠲⠤⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠁⠈⠀⠀⢻⡋⠈⣠⡴⣻⡇⠀⠀⠀
-                ⠀⠀⠸⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠑⠒⠦⠤⣄⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠁⣰⠋⠀⠀⠀⠀
-                ⠀⠀⠀⠛⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠓⠒⠒⠒⠒⠒⠒⠒⣺⠟⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠙⠷⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡾⠋⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠈⢲⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡞⠋⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠘⠗⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⠾⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠗⢦⣤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣤⣶⠟⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠛⠖⠒⠶⡶⠶⢶⡖⠲⠚⠋⠛⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # vulpix
-        "68": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⠤⠤⠤⢄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⡄⣀⡀⠀⠀⠀⡔⠁⡔⠁⠀⢀⡠⠄⠚⠲⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⡟⡄⠉⠑⠤⣀⣇⣀⡇⠀⢀⠎⠀⠀⣠⢤⡀⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⡇⢱⡀⣴⠝⠒⠂⠀⠈⠑⠺⡀⠀⢜⠰⠼⠃⢸⠇⠀⠀⠀⠀⠀⠀⢀⡠⠤⠀⠀⠤⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢿⠙⡿⢁⠔⠈⢀⠔⣂⣉⣀⠜⠒⠉⠉⠉⠉⣉⣩⠥⠶⠦⣄⢀⠖⠁⠀⠀⠀⡀⠀⣀⠽⠖⠒⠒⠤⢄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠘⡷⢱⡜⢠⡔⠉⠁⠀⠀⠁⠀⠀⣠⠴⠊⠉⠀⢀⠀⢠⣾⢷⠃⠀  ⠀⢀⠞⡠⠊⠀⠀⠀⠀⡰⠀⠀⠑⢆⠀⠀⠀⠀⠀
-                ⠀⣀⠴⠁⠀⠑⠁⠀⢠⢚⡏⠉⢢⠀⠚⢉⠭⣿⠃⠊⢁⠔⡹⠁⡇⠀⠀⠀⠀⠏⡜⠁⠀⠀⠀⠠⣪⠄⠀⠀⠀⠀⢇⠀⠀⠀⠀
-                ⢟⠿⠿⠀⠀⠀⠀⠀⠳⢍⣀⣀⠜⠀⠀⠀⣾⣄⣤⠞⡫⢪⠃⠀⣇⠀⠀⠀⠀⢷⠁⠀⠀⠀⠀⡰⠁⢀⣀⣀⣀⡀⢸⠀⠀⠀⠀
-                ⠈⢆⠀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸⠁⢰⠁⠘⡄⠀⠘⢦⠀⠀⠀⢸⠀⠀⠀⠀⢀⡵⠊⠁⠀⠀⠀⠈⠙⢤⡀⠀⠀
-                ⠀⠀⠑⣄⠻⣢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⠁⠀⠘⡆⠀⠱⡄⠀⠀⠱⡄⠀⠈⡆⠀⠀⢠⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠱⡀⠀
-                ⠀⠀⠀⠈⠲⠬⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠣⠄⣀⢀⠈⢲⣤⣌⠓⣄⡀⠘⡠⠀⡇⠀⡠⠃⠀⠀⠀⢠⠞⠉⠉⠳⡄⠀⠀⢱⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠉⡗⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠀⠀⠀⠀⠉⠲⣅⠜⣠⠞⠁⠀⢀⣀⡠⢸⣀⠀⠀⢀⡇⠀⠀⢸⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⡗⠉⠙⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢪⣁⠤⠒⠉⠁⠀⠀⠀⠀⠉⢢⡀⠀⠀⢀⡎⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣿⡀⠀⠀⢱⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⡆⠀⠀⠀⢀⠤⠒⠢⣄⠀⠀⢱⢀⣤⠎⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠻⡑⣄⠀⠈⡆⠀⠀⠀⠀⠀⢀⣀⠠⢼⠀⠀⠀⠀⠀⠀⠀⡇⠉⠲⢄⡃⠀⠀⠀⢸⠀⠀⢸⡅⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠳⡈⠢⣄⢱⠀⠀⠀⠀⠀⢸⠀⠀⠘⡄⠀⠀⠀⠀⠀⢠⠇⠀⠀⠀⢷⣀⠀⠀⠁⠀⣠⠋⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢧⠀⠀⠉⡇⠀⠀⠀⠀⣦⠤⣶⠉⠑⢄⡀⠀⠀⠀⠈⢆⠀⠀⠀⠀⠈⠉⠒⠒⠛⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢨⡔⠤⠄⣷⠰⡀⠀⢀⠇⠀⡇⠀⡀⢸⠏⢳⡀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠇⠀⠀⡆⠀⠀⠀⡼⢱⡾⢀⠄⢠⡇⠀⡘⠁⢀⠀⡌⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠰⣽⣰⢠⢲⠁⡀⠀⡰⠁⠈⠑⠚⠒⠉⢠⢲⢑⡖⠄⣰⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠁⠉⠒⠤⠧⠒⠁⠀⠀⠀⠀⠀⠀⠈⠺⠼⠤⠶⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # weedle
-        "69": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⢺⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠊⠀⡄⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⠞⠁⠀⠰⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣀⠄⠒⠉⢁⠐⣕⠀⠀⠀⠀⠀⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⡠⣺⣳⠀⠀⠂⠁⠀⠀⠉⠁⠒⠒⠐⠃⠙⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⡠⠔⠓⠫⠥⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡞⡄⠀⠀⠀⠀⠀⠙⢆⠀⠀⠀⢠⡶⣦⠀⠀⠀⠀⠀⠀⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠘⣄⠀⠀⠀⠀⠀⠀⠈⡆⠀⠀⠘⠿⠟⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢸⠓⠤⢀⣀⣀⣀⠴⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠈⢇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠈⢢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⣹⠦⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⡔⠲⠁⠀⠈⠙⠒⠢⠤⠤⠤⠤⠴⠒⡏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢇⣇⠀⠀⠀⠀⠀⠀⠀⣀⡀⠀⠀⠀⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠘⣄⠀⠀⠀⠀⠀⡎⠉⢘⡆⠀⢀⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠶⡀⠀
-                        ⠀⠀⠀⠀⠈⢲⣄⡀⠀⠀⠙⠚⠚⢁⡠⠊⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀⢱⠀
-                        ⠀⠀⠀⠀⠀⣼⠀⠉⠙⠒⠒⠒⠊⠁⠀⠀⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠋⠀⠀⢸⠄
-                        ⠀⠀⠀⠀⠀⢯⣧⠀⠀⠀⠀⡾⠋⠲⡀⣰⠃⠑⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⡼⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠙⠢⠤⢀⣳⡤⠾⠚⠁⠀⠀⣑⠒⢄⣀⣀⠀⣀⠀⢀⣀⠔⠒⠚⢆⣀⣀⠴⠁⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢰⢧⠀⠀⠀⣠⢶⢦⡀⣰⠃⠀⠈⡆⠈⠙⢆⠀⠀⠈⢦⠀⠀⠀⢹⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠓⠦⢄⣳⡤⡴⠛⣁⠀⠀⠀⡷⠀⠀⠘⣤⠀⠀⠘⡆⢠⡋⢹⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠵⣌⠁⢸⠡⢙⣦⠾⠁⣠⢤⣰⠉⠰⡩⣽⠒⠊⠉⠉⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠻⠤⣀⣘⣇⣠⠏⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # clefairy_doll
-        "70": r"""
-                        ⠀⠀⠀⠀⠀⠀⣴⣾⣲⠖⠉⠉⠉⠉⠑⠚⢭⡢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡜⣾⡿⠁⠀⠀⠀⠀⣀⣠⡤⠀⢙⡎⠒⠤⣤⣒⣮⣭⣥⣦⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡿⠋⡄⠀⠀⠀⣠⣾⡿⠻⣧⣼⠿⠃⠀⠀⠀⢹⣿⣿⣿⣿⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⡇⠸⣆⠀⠀⠀⠹⠏⠀⣰⠇⠀⠀⠀⠀⠀⠀⠀⣙⣿⠟⣟⡆⠀⠀
-                        ⠀⠀⠀⠀⢸⠀⠀⠋⠻⠶⣶⣢⣴⠾⠋⠀⠀⠀⠀⠀⠀⡠⠊⠟⠁⠀⢏⡆⠀⠀
-                        ⠀⠀⠀⢀⡇⠀⠀⠀⣼⠀⠀⠀⢀⣼⠀⠀⠀⠀⠀⠀⠔⠁⠀⠀⠀⠀⠘⡼⡀⠀
-                        ⠀⠀⠀⢸⠀⠀⠀⢸⡿⠀⠀⠀⢸⡿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⣡⠀
-                        ⠀⠀⠀⡜⠀⠀⠀⠸⠇⠀⠀⠀⠿⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇
-                        ⠀⠀⠀⣇⠀⠀⠀⠀⠛⠿⠿⠷⠖⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                        ⠀⣀⣀⠷⣇⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡸
-                        ⡏⠁⠀⠀⠠⠉⠳⣄⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⣀⡀⠀⠀⠀⠀⠀⣿⡿⠀⡇⠀
-                        ⡇⠐⠤⠂⠀⠀⠀⠈⢢⡀⠀⠀⠀⡤⠊⠉⠀⠀⠀⠉⠲⢤⣀⣠⣼⣿⣷⠟⠀⠀
-                        ⠳⣄⠀⠀⠀⠀⠀⠀⠀⠙⣄⡀⢸⠁⠀⠀⠀⠀⠀⠀⠀⠀⠹⣟⠫⠟⠁⠀⠀⠀
-                        ⠀⠀⠑⠢⡤⠀⠀⢀⣤⠶⡻⠉⠚⣇⠀⠀⠀⠀⠀⠀⠀⠀⣠⠇⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠈⠉⠉⠈⠉⠉⠀⠀⠀⠈⠢⢤⣤⣀⣀⣀⣤⣾⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # computer_search
-        "71": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢈⡏⣭⣭⣭⣭⣭⣭⣭⣭⣭⣭⣭⣭⣭⣭⠉⣳⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⡿⠉⢩⣭⣭⠭⣭⡭⠍⠉⠉⠉⣹⡇⠀⢿⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣼⢀⡇⠀⠸⣿⡟⢗⣛⡋⠑⣲⣒⢢⣿⡇⠀⡼⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⡏⢸⡇⠀⠀⠀⠀⠀⠀⠀⠛⠿⠒⢨⣿⠀⢸⡇⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢠⡇⢸⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⣿⠀⣸⡇⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢰⠁⣿⣷⣦⣀⣀⣀⣀⡀⠀⠀⠀⠀⣼⡇⠀⣏⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠘⠲⠤⣈⣉⣉⠙⡛⠛⠛⠿⠿⠷⣶⣿⡇⢠⢿⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡠⠤⣛⠿⠿⣷⣶⣶⡂⠠⠤⠤⣺⣂⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢀⠔⠒⠉⣀⢠⣐⣆⣀⠀⠀⠀⠈⠑⠒⠖⠂⠀⣤⣭⣕⡢⡀⠀
-                        ⠀⠀⠀⠀⠀⢠⠑⠒⠂⠤⠤⣈⡤⠀⣀⠈⠉⠤⠄⣢⡤⠒⠋⣉⣽⡟⠄⢘⡇⠀
-                        ⠀⠀⠀⢀⡠⡷⠈⠓⠶⢤⣄⣀⠨⡭⣵⣚⣣⠤⢶⣱⣄⣤⣾⣝⢛⣒⣒⣨⢣⡀
-                        ⡤⠔⠊⠡⣼⣉⢉⠀⢰⠐⠠⢭⣁⠛⠛⢿⣿⡇⢡⢸⠉⡏⡞⠓⠛⠻⣿⣿⣿⡈
-                        ⢧⣀⠀⠀⠀⠓⠢⢬⢒⡢⢮⣐⡮⠿⢶⡄⠹⣧⣭⣸⡀⣧⢿⡘⠦⣥⠿⣿⣿⣷
-                        ⠀⠀⠉⠙⠒⠤⢄⡀⠀⠀⠀⠀⠶⣪⣾⣿⣷⠬⡎⠉⠉⠻⡳⣝⣶⣶⣿⣿⣿⣿
-                        ⠀⠀⠀⠀⠀⠀⠀⠈⠉⠒⠢⢄⣈⡉⡛⢋⣡⠞⠁⠀⠀⠀⠈⠢⠭⡏⠉⠙⠁⠀⠀⠀⠀
-        """,
-        # devolution_spray
-        "72": r"""
-                        ⡀⠒⠒⠒⠒⠒⠒⠒⠒⠊⠩⠑⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠙⠒⠂⠀⠒⠦⠤⠄⢠⣀⡀⢀⡀⠈⠁⣶⠤⢄⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠉⠉⠉⠛⠤⢔⣤⡈⢉⠑⠂⠤⡀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠻⣆⢑⢄⢠⠂⢑⢄⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢘⠦⠯⠏⠀⠙⣆⡇⣹⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠔⠊⠉⠁⠀⠀⠀⠀⠀⠀⠈⢳⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠊⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠁⠀⠀⠀⠀⣠⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡘⠀⠀⠀⣀⣴⣚⣉⡀⠀⠀⠀⠀⠀⠀⠀⠀⡇
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⢠⣟⣾⣿⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀⡇
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠈⢙⠻⠛⠀⠀⠀⠀⠀⠀⠀⠀⠀⣇
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠋
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⣄⠝⠁⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢤⣄⣀⠀⠀⠀⣠⣤⣠⠴⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # impostor_professor_oak
-        "73": r"""
-                        ⠀⠀⠀⠀⠀⠀⣠⣤⣰⠋⠉⠿⣅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⡇⠀⠳⣦⠀⠀⠈⠛⠓⠒⠒⠲⠤⣤⢤⣄⡀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢠⣷⣶⠄⡀⠀⢀⠀⣀⣀⣀⠀⠀⠀⠀⠀⠈⠉⠂⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣿⣿⠁⠀⡁⠀⠀⠀⠐⠚⠻⢷⣤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢿⣿⠀⣿⠋⠛⠒⢤⣄⡠⣄⣀⣀⣉⣤⡤⠖⢿⡁⠀⠀⠀⠀⠐⠁
-                        ⠀⠀⠀⠀⠀⢸⣿⡆⣿⣦⢀⠀⠀⠈⢹⣿⡯⣍⠁⠀⠀⠀⠀⣷⠀⢀⣴⡾⡆⠀
-                        ⠀⠀⠀⠀⠀⣾⠛⠻⣿⢹⣼⡆⠀⠀⠈⠛⠟⠋⠀⣁⠀⢠⢀⣿⣦⣿⠟⡿⠁⠀
-                        ⠀⠀⠀⠀⠀⣿⠀⡟⣿⠻⣿⣿⣦⡀⠀⠀⡀⠀⠀⣸⣤⣿⣟⣿⡟⢳⣾⠂⠀⠀
-                        ⠀⠀⠀⠀⠀⠙⣆⠷⣿⠀⠹⣦⣉⠛⢦⣠⣧⡶⠚⠋⢉⡿⠉⣿⣽⢰⡿⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⣷⡟⠀⠀⠀⠀⠀⠀⠈⠀⠀⠀⠀⠀⠀⠀⣿⠏⣰⠃⠀⠀⠀
-                        ⠀⠀⠀⠀⣀⣤⠞⠁⣇⠀⠀⠀⠀⠀⠾⠄⠀⠀⠀⠀⠀⠀⠀⣿⡿⣏⡀⠀⠀⠀
-                        ⠀⢀⣤⠞⠉⠁⠀⠀⠉⠓⢦⣄⠀⠀⠀⢀⣠⠂⠀⠀⠀⣠⠴⠋⠀⠀⠉⢲⡄⠀
-                        ⢸⣏⣀⣀⠀⠀⠀⠀⠀⠀⠀⠈⢙⡦⣤⣀⣀⣀⣠⡖⠛⠀⠀⠀⠀⠀⠀⠀⢸⣧
-                        ⠀⠈⠉⠉⠉⢲⣦⠄⣀⠀⠀⠀⡾⠇⠀⠉⠉⠉⢩⣷⠀⠀⠀⠀⠀⠀⠀⡢⠞⠁
-                        ⠀⠀⠀⣠⠔⠋⠁⠀⢈⡷⠀⠀⡇⠀⠀⠀⠀⠀⢸⡇⠀⣠⠔⠂⠁⠀⠀⠁⠀⠀
-                        ⢀⡴⠋⠁⠀⠀⠀⣴⠉⠀⠀⠀⢸⣅⣀⣀⣀⣤⣼⠀⠀⠻⣄⠀⠀⠀⠀⠀⢠⡀
-                        ⢸⠇⠀⠀⠀⠀⠀⠈⢷⣀⠀⠀⢸⣿⣿⣿⣿⣿⠇⠀⠀⢀⣨⠇⠀⠀⠀⠀⠀⠹
-                        ⣸⠓⠒⠢⠤⣤⡀⠀⠀⠙⢦⡀⢸⣿⣿⣿⣿⡟⠀⣠⠔⠋⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡿⡆⠀⠀⠀⠀⠈⠙⠓⢦⡀⠹⣾⣿⣿⣿⣿⣧⣎⣀⣀⡀⡀⠀⠀⠀⠀⠀⠀⠀
-                        ⡃⢹⡆⠀⠀⠀⣀⠀⠀⠀⢷⣀⣼⠿⠛⠉⠉⠉⠉⠉⢉⡿⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡄⠀⢳⠀⠀⠀⠉⣁⣤⠔⠚⠁⠀⠀⠀⠀⠀⠀⠀⠀⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠓⠦⠘⣧⡀⢀⡞⣹⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠞⠀⠀⠀⠀
-                """,
-        # item_finder
-        "74": r"""
-                ⠀⢀⣀⣀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡤⢤⠤⠴⠶⠒⠛⠱⠟⠏⠀⠙⣦⠤⢤⣀⣒⣲⣦⣭⣷⣿⢿⡇⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣾⡿⠛⠉⠙⠳⢷⣦⣀⣀⣀⣀⣤⣠⣶⡶⠯⠦⠀⣶⣶⠆⢠⢝⠁⣀⣥⣶⣀⣠⡿⠊⠉⠀⠀⠀⠀⠀⢉⣿⢸⣇⣀⣤⣔⣶⣿⣾⣿⣿
-                ⣿⡀⠀⠀⠀⠀⠀⣙⣙⡭⠭⠤⠶⠒⠒⠛⠻⠭⠤⠽⠗⠒⠛⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⣴⣿⣿⣾⣿⣿⣿⠿⠛⠉⠀⣼⢿
-                ⢿⣶⡄⠀⠀⣀⡰⢢⡧⣀⡀⠀⠀⠀⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⣤⣮⣿⣿⣿⣿⣿⣿⣿⡉⠀⠀⠀⠀⢰⡿⡟
-                ⠀⠙⠻⠿⠿⠛⠉⠓⠒⠦⠭⣉⢦⢒⣿⡟⢄⢀⣤⠶⠒⠶⢶⣤⣄⠀⠀⣀⣤⣴⣾⢿⣿⠿⠝⠓⠉⠀⢿⣄⡀⢀⡇⠀⠀⠀⣤⣿⣿⡷
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠀⢸⣦⡧⠀⠀⠀⠀⠀⠈⠙⢿⡿⠿⠟⠛⠉⠁⠀⠀⠀⠀⠀⠀⢸⠉⠛⢉⡇⠀⠀⢸⣿⠉⠛⣽
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⣿⠁⠀⠀⠀⡀⠀⠀⠀⣼⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⢈⡇⠀⠀⢸⡿⠀⢀⣿
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⣆⢧⡀⠀⠀⠀⠀⣴⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠨⡆⠀⠀⣿⠃⠀⣼⠇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠷⣿⣤⣤⣶⡿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠘⡇⠀⢸⣿⢀⢀⡿⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣷⠶⢾⠇⠀⣾⠇⠀⣸⡇⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠁⠀⠀⣿⡀⠀⣿⠀⠀
-        """,
-        # lass
-        "75": r"""
-                        ⠀⠀⠀⠀⠀⠀⣠⣼⡿⠋⠉⢠⣤⣶⠄⠀⠈⠉⠉⢿⣿⣶⣦⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⣴⡟⣡⠇⠀⠀⣼⠟⠁⠀⠀⠀⠀⠀⠀⠀⠘⣿⡄⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⣸⠟⣴⡏⠀⠀⣸⡇⠀⠀⣠⣤⣄⠀⠀⠀⠀⠀⢸⣷⡀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢰⡟⣿⠇⠀⢀⣤⡿⢷⣶⣾⣿⠛⣿⣄⠀⠀⠀⠈⡟⣿⡇⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⢸⣿⣿⣇⣴⣿⣿⣷⢾⣿⣇⠹⣷⣍⢻⣧⠀⠀⠀⠃⣿⡇⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠘⣿⣉⣳⣿⣿⡇⠘⣿⠸⠟⠀⠀⢻⣷⢻⣷⣤⠀⠀⣿⡇⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠙⢻⣟⢿⣷⠀⢹⣧⡀⠀⠀⠘⠟⠘⣿⠁⠀⠀⢹⣇⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⣻⣿⣿⣦⣀⠙⠛⣶⣤⠄⢀⣰⣿⠀⠀⢰⠞⢿⣄⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣼⠏⠀⠈⣿⣿⣿⣿⣿⣿⢿⣿⣿⣿⣦⣀⠀⠁⠀⢻⡄⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣠⣯⣤⣤⣶⡿⠋⠀⠀⠀⠀⣸⠏⠀⢸⣿⠛⢷⣦⣴⣄⢻⡄⠀⠀
-                        ⠀⠀⠀⠀⣠⣿⡻⠟⠛⠻⠇⠀⠀⠀⠀⠀⠀⠀⠀⢈⣿⠀⠀⠉⠻⢿⣼⡇⠀⠀
-                        ⠀⠀⢀⡼⠋⠛⠀⠀⠀⠀⠀⠀⢠⡖⠃⠀⣿⠏⡤⠌⠉⠀⠀⠀⢀⡀⠈⣿⡇⠂
-                        ⠀⣴⡿⠃⠀⠀⠀⠀⣰⣿⠀⠀⢸⣷⠀⣴⣧⡀⠀⣀⣤⣄⣠⠶⠋⠁⠀⠘⢿⣤
-                        ⣾⠟⠀⠀⠀⢀⣠⠞⠛⣿⡀⠀⣸⡟⢲⡏⠉⠻⠛⠁⠈⣿⣷⡀⠀⠀⠀⠀⠀⢻
-                        ⠋⠀⠀⠀⠐⠛⠛⠤⠖⠻⢇⣰⣏⣀⠀⠁⠀⠀⠀⣀⣴⣿⣾⠃⠀⠂⠀⠀⠀⠀
-                        ⠿⣦⣄⠀⠀⠀⠀⠀⠀⠀⠈⠈⢿⣿⣶⣾⣷⠞⠉⠈⠁⠀⠀⠀⠀⠀⠀⠀⣀⣴
-                        ⠀⠀⠉⠛⠶⣦⣄⡀⠞⠛⠁⠀⠀⠈⠉⠀⠀⣀⡀⠀⢀⣀⣠⣤⣤⡶⠶⠚⠛⠋
-                        ⠀⠀⠀⠀⠀⠀⠙⣿⣦⡀⠀⠀⢀⣀⡀⠀⠈⠉⠉⣿⣿⠻⣿⠉⠁⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣴⠏⣽⡿⢶⣴⡏⠀⣡⣤⠀⠄⠀⠀⠻⣧⠘⣧⡀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢠⣾⢇⢷⡿⠃⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⠀⠈⠳⡀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢺⣿⣄⣸⡇⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠀⢸⣆⠀⠀⡀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠈⢻⣿⡿⠿⠿⠛⠛⠛⢿⣿⠿⠛⠻⠿⠿⢿⣿⠟⠋⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⣿⡇⠀⠀⠀⠀⢀⣼⣯⠀⠀⠀⠀⠀⠀⢻⡆⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⣿⠃⠀⠀⠀⠀⠸⣿⣿⣦⠀⠀⠀⠀⠀⢸⣷⡄⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⣿⠀⠀⠀⠀⠀⠀⣿⣿⣿⡀⠀⠀⠀⠀⠘⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # pokemon_breeder
-        "76": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠚⠛⠉⠉⠛⠲⣥⡾⢉⠀⠀⣀⠀⠉⠉⠒⠄
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠏⠁⢀⣀⣀⣀⣀⣀⣈⠻⠿⢷⣿⠻⡆⢶⡉⢷⡄
-                        ⠀⠀⠀⠀⠀⠀⣀⡤⢶⡞⠁⠖⠛⠛⢉⡉⠉⢉⣉⠙⠛⠶⠌⠉⢳⣜⠊⠁⠀⠁
-                        ⠀⠀⠀⠀⠀⠀⣿⡃⠉⢡⣤⡖⠚⠋⠉⠐⠛⠛⠉⠿⢶⣴⣆⣠⡼⠋⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⠉⠉⠹⣄⠀⠀⠀⠀⣀⠀⠀⣠⠊⠃⣸⡟⠉⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣦⣦⣀⡀⢀⣠⠴⠀⣡⡾⠋⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣈⡿⣉⡿⠛⠻⣿⠻⣦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡾⠋⣸⠋⠀⢀⡴⠃⠈⠈⠻⣦⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⡠⠎⢀⡞⠁⠉⠉⠉⠀⣆⠀⠀⠰⣼⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⣠⠞⠋⢤⣀⣾⠃⠀⠀⠀⠀⠀⢸⡆⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⣰⠋⠀⠀⣨⢿⡏⠀⠀⠀⠀⠀⠀⠸⡇⠀⠀⣿⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⣰⠇⠀⣠⠞⠁⢸⡁⠀⠀⠀⠀⠀⠀⠀⣷⠀⠀⢿⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⢀⠞⠁⣠⠞⠁⠀⠀⢸⡗⠒⠚⠛⠛⠒⠶⢶⡇⠀⠀⢸⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⡰⠋⢀⡼⠁⠀⠀⠀⠀⣸⠁⠀⠀⠀⠀⠀⠀⣼⠷⠤⣤⣸⣆⠀⠀⠀⠀⠀⠀⠀
-                        ⣤⠴⠋⠀⠀⠀⠀⠀⢰⡏⠀⠀⢳⡄⠀⠀⠠⡿⠀⠀⣴⣿⢿⡀⠀⠀⠀⠀⠀⠀
-                        ⠁⠀⠀⠀⠀⠀⠀⠀⣿⡇⠀⠀⠀⣿⠀⠀⠀⢷⣄⢀⣀⠘⠛⢷⣄⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣿⠃⠀⠀⠀⣿⠀⣀⢀⣀⣉⠙⢿⣶⡘⠻⣞⢷⡄⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣿⠀⠀⠀⠀⢻⣴⣿⣯⣭⣾⣶⣧⣤⣼⡶⢾⣧⡇⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣯⠀⠀⠀⠀⠘⢿⣏⠀⠀⢀⣠⡤⢤⣶⣆⠀⣿⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠹⣦⡀⣀⠀⠀⢀⣻⠀⠀⣹⢡⣴⠟⢻⣿⣗⡿⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠻⣟⠛⠿⣿⣿⠀⠀⢿⡛⣿⣿⡁⢹⣿⡇⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡇⠀⠀⣿⣿⡇⠀⠈⠛⠻⠿⠛⠛⢹⡇⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠞⠁⠀⢀⣿⣿⡿⠷⢶⣦⣤⣤⣤⣤⡼⠁⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡤⡴⢶⡿⣿⢞⣧⣄⣀⣈⣟⣴⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # pokemon_trader
-        "77": r"""
-                                ⠀⠀⠀⠀⠀⡔⠃⠃⠉⠛⠀⠀⠠⣤⣤⡈⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⢰⣷⡆⠀⠀⢀⢀⣀⣼⣿⣿⡿⣇⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⣠⠞⢉⡟⠛⠛⠛⠛⠛⠛⠻⣿⣧⡈⠛⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⢺⣟⣡⣤⢶⣯⣿⠿⣿⡿⠿⠿⠿⣿⡿⣟⣓⣆⣸⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠹⣿⠀⢈⠁⠹⡄⠀⠀⠀⠀⠀⠘⣇⠈⢻⡄⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠘⢢⡼⠁⠀⢀⣴⠀⠀⠀⠀⠀⠙⣰⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⠻⣄⣄⣀⠀⠀⠀⢀⣀⣠⡿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⡀⠀⣠⣴⠖⠚⣹⠉⢹⡏⠀⡟⠉⢉⣍⡑⠲⢤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⣬⡿⠋⠀⠀⠀⢻⣀⣴⣿⣻⣷⡄⢸⣿⣿⠆⠀⠘⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⢿⡇⠄⣰⠀⠀⠀⣹⡏⣿⣿⢠⣿⠿⠛⠋⠀⢀⠀⢻⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⣾⡃⢸⡿⠀⠀⠀⣿⢀⣿⡇⢸⣿⠀⠀⠀⠀⣿⠀⠘⣷⠀⠀⠀⠀⠀⠀⠀
-                                ⣿⠁⢸⡇⠀⠀⢰⣿⢸⢿⡇⣿⠉⠀⠀⠀⠀⠟⠀⣀⢻⡀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠉⠀⣼⠗⠀⠀⣸⡿⣸⢸⡇⣿⠀⠀⡀⡀⣠⡟⠚⢿⡆⢷⣤⡀⣠⠄⠀⠀⠀⣀
-                                ⡄⠀⣽⢠⣶⣤⣾⡇⡋⢘⡇⣿⡄⢀⣽⣿⠙⢳⡀⢻⣷⠀⠈⣿⠋⠀⠀⠀⢠⡟
-                                ⡗⡤⣿⣼⣿⣿⣿⣧⣿⣸⣧⣿⣿⣿⣿⣿⣆⡈⢷⢸⣿⣇⣼⣻⠀⠀⠀⣰⠏⠀
-                                ⣇⣧⣽⡿⣿⣿⣿⣿⣿⢿⣿⣿⣿⣿⣿⣿⣿⣿⠾⣿⣿⡯⠝⣿⠠⡄⣴⠃⠀⠀
-                                ⢻⡉⢹⣷⣿⣿⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⢰⣶⠚⠢⡀⠀⢻⢖⣳⡇⠀⠀⠀
-                                ⠘⣿⠻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣋⣰⣎⠁⠀⡴⢃⣠⡟⡶⣿⠁⠀⠀⠀
-                                ⠀⢹⡆⠈⠻⣿⣿⣿⣿⣿⠿⠿⠛⠛⠉⠉⠀⠻⣦⣀⣥⣾⡿⢡⣇⡿⠀⢀⡠⠆
-                                ⠀⢸⡇⠀⠀⢸⡏⢻⣼⣿⢻⣿⣿⣿⣟⡓⣶⣤⣼⣿⣩⡿⠁⣼⣽⣛⣛⣩⣤⡀
-                                ⠀⢨⡇⠀⠀⠈⠃⣸⣿⣿⡀⣄⠀⣿⡟⠋⠉⠉⠀⠈⣹⠟⠉⢉⣽⡆⠉⠉⢉⡄
-                                ⠀⠘⡇⠀⠀⠀⢀⣿⣏⣿⡇⠘⢿⣿⡁⠀⠀⠀⢠⠚⣡⡴⠞⠛⠁⠀⠀⠀⢸⣷
-                                ⠀⠀⡇⠀⠀⠀⢸⣿⢸⣿⡧⠀⠈⢿⣧⡀⠀⠀⠼⠛⠁⢀⣐⡶⠶⠿⣁⣴⢿⡿
-                                ⣴⠊⠁⢴⣦⣤⣼⣿⠘⢎⢿⣄⠀⠀⢉⣿⣦⣀⠀⣤⡖⠋⢁⡀⠀⠀⠟⣡⡞⠁
-                                ⢥⡠⣤⣾⣿⣿⣿⣿⣿⠞⣿⠿⣶⣄⣠⣿⣿⡿⠏⠁⢹⡿⠿⢷⡞⠛⠛⠁⠀⠀
-        """,
-        # scoop_up
-        "78": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡴⢆⠀⠀⠀⠙⢦⡀⠀⠀⠙⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡾⠁⠸⠀⠀⠀⠀⠀⠙⠲⣄⡀⠙⣦⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣄⣤⡶⢶⣿⠯⢄⣀⢹⠦⣄⡀⠀⠀⠀⠀⠈⠙⢦⡈⢳⡳⡄⠀⠀⢰⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣀⣤⣤⣿⣟⠃⢐⣯⡈⢳⠀⠈⠙⢳⣄⠉⠳⢤⣀⠀⠀⠀⠀⠉⠳⣿⣦⡀⠀⠈⢧⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢸⣟⠁⠀⠀⠉⠓⣾⢭⡤⠟⠀⠀⠀⠀⢻⠷⢤⣤⣽⣛⣲⣤⣄⣀⠀⠀⠉⠳⢦⣀⠈⢿⠀⠀⠀⢀⣀⣀⡀⠀⠀⠀
-                ⠀ ⠀⠀⠀⠀⠀⠘⠻⣦⣤⣲⣤⣤⡿⠀⠀⠀⠀⠀⠀⠀⢸⠀⠀⠀⠀⠉⠉⠙⠛⠛⠿⠶⠶⠤⠤⠬⢥⣨⣦⡠⠺⠿⣿⣿⣿⡆⠀⠀
-                ⣿⣍⡉⠀⠀⠀⠀⠀⠀⢀⣴⣯⣄⣀⣀⣀⣀⣀⣤⣤⣤⣤⣤⣤⣤⠶⠶⠶⠖⣺⣿⠛⣿⣿⠟⠟⣧⠀⠀
-                        ⣯⣙⣓⣶⣶⣴⣶⣿⣿⣿⣿⣿⣿⠿⠿⠛⠛⠉⠉⠀⠀⣀⣤⡴⠶⢛⣩⢽⠞⠉⠉⠭⠦⠾⠷⡄⠀
-                ⣿⡿⠃⢠⣿⣿⣿⣿⣿⣿⣿⣿⡟⠻⢿⣿⡿⠿⣿⡿⠛⠉⠉⠀⠀⠀⠀⠀⢀⣠⣴⣶⠿⠛⠁⣠⣶⠟⠁⣿⡄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣿⡀⢀⡼⣿⣿⣿⣿⣿⣿⣿⣶⡇⠀⠀⣀⣑⣾⣿⠀⠀⠀⠀⠀⣀⣤⣶⣿⣿⡿⠛⠁⠀⢀⣾⣿⠃⠀⢸⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀
-                ⣿⡀⢀⣧⠽⢿⣿⣿⣿⣟⣹⠋⠀⠀⣀⣷⣾⡿⠃⠀⣀⣤⣶⣿⣿⣿⣿⠟⠋⠀⠀⠀⣴⣿⣿⠃⠀⠀⢸⣿⣿⣿⣦⠀⠀⠀⠀⠀⠀
-                ⡟⠁⠐⢆⣠⣿⢿⣿⡛⠐⣤⡀⠻⢼⣿⣿⣤⣾⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⠀⢠⣾⣿⣿⡏⠀⠀⠀⢸⣿⣿⣿⣿⣷⡀⠀⠀⠀⠀
-                ⣿⣤⣤⡴⠫⠤⠤⣼⡟⠀⣴⣿⣗⣭⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⠀⠀⣰⣿⣿⣿⣿⠀⠀⠀⠀⢸⣿⣿⣿⣿⣿⣿⣦⡀⠀⠀
-                ⣿⣄⠀⠀⣠⡿⠋⠉⢀⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⠀⠀⢀⣾⣿⣿⣿⣿⡇⠀⠀⠀⠀⠀⣿⣿⣿⣿⣿⣿⣿⣿⣦⣤
-                ⣷⣶⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⣄⣀⡀⢀⣀⣠⣿⣿⣿⣿⣿⣿⠀⠀⠀⠀⠀⠀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿
-        """,
-        # super_energy_removal
-        "79": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠠⡤⠤⣀⢀⣤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣀⣠⣤⡀⠀⠀⠀⠀⢀⡤⠒⣒⡶⠆⠀⠀⣀⣀⠈⠙⠚⠛⠟⠛⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⣠⠾⠋⠁⢀⡴⠁⠀⠀⠀⢀⣬⣭⣭⣤⠀⠀⠀⢀⣿⣤⠿⣑⣦⡄⠀⢿⡿⠓⠀⠀⢰⢢⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣠⡾⠁⢀⣠⠶⠋⠀⠀⠀⠀⠀⠿⠶⠶⠋⠁⠀⠀⠀⠈⠉⠉⠁⢈⣍⠻⣦⠀⠀⠀⢀⣀⠸⣼⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⢿⡇
-                ⠀⠻⡷⠖⠉⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⡀⠀⣀⠖⠒⡄⢀⡀⠀⢠⣍⣹⠆⠈⠀⠀⠀⣞⣍⠀⡏⠙⡆⠀⠀⠀⠀⠀⠀⠀⣰⡛⢁⣿⠁
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠃⢸⠛⠉⣹⡔⢊⡤⠜⢇⠐⠂⠉⠛⠒⡀⢀⣠⣾⡿⠚⢛⣫⡿⠁⠀⠀⢀⡤⣶⣶⡴⠳⢛⡿⠃⠀
-                ⠀⠀⠀⠀⢀⠀⠀⠀⠀⠀⠀⠀⠰⠤⢾⣤⣴⢿⣡⠼⣆⢀⠀⠀⠀⠀⢀⡬⠖⡿⣛⠥⣄⡤⠃⠀⠀⢀⣠⢾⠕⠃⣻⠛⠧⠒⣋⣤⣄⠀
-                ⠀⠀⢀⡞⢩⡇⠀⠀⠀⠀⠀⢠⠞⢲⢀⡁⠀⠈⣧⡀⠸⡿⡝⠲⠶⠴⠞⠦⠤⠜⠁⠀⠀⠀⠀⡠⠔⠉⣡⠥⠴⠚⢁⡤⢖⡛⢻⣽⠏⠀
-                ⠀⢀⡞⠀⣸⠁⠀⠀⠀⠀⠀⢸⠀⢸⡄⡘⣆⠀⠀⠉⠢⢵⠊⠀⠀⠀⠀⠐⠚⠛⠉⠀⠀⠀⠾⠖⣒⣩⠤⠶⣶⡶⠫⠀⣉⡽⠟⠁⠀⠀
-                ⠀⢸⡃⢀⡏⠀⠀⠀⠀⠀⠀⠸⣇⣸⠇⠳⣈⡄⠀⠀⠀⠸⢍⡑⠒⠺⡉⠉⠙⢲⣦⡀⠀⠀⣴⡋⠁⢀⣈⣤⠶⠓⠛⠉⠀⠀⠀⠀⠀⠀
-                ⠀⢿⣗⣾⠁⠀⠀⠀⠀⠀⠀⠀⠈⢋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠙⠒⠶⠶⠚⠃⠀⠀⠀⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠈⠛⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⡏⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢳⡄⠈⢧⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # defender
-        "80": r"""
-                ⠰⣶⣦⡀⠀⠀⠀⠀⠀     ⣰⣶⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠘⠻⣿⡣⡀⠀⠀     ⣠⢿⡦⢷⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠈⠻⡊⠲⣄     ⣱⢤⣇⣼⡇⢸⣅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⢢⡈⠷⣦     ⣹⡄⢿⣋⡼⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠙⢦⡈⢻⣧     ⠸⡯⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤⠤
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢆⡙⢷⣶⣶⣶⢶⣶⣶⣶⡖⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠛
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣱⣾⣿⣿⣿⣿⣿⣿⣿⣯⣶⣄⣀⣀⣠⣀⣀⣀⣀⣀⣀⣀⣐⣤⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡛⢿⠛⡟⡟⣟⡟⣻⠉⢩⢻⣿⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢰⣿⣿⠿⡿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠛⠙⠛⠛⠛⢿⣿⣿⣿⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣻⣿⣿⣟⣭⣄⡀⣤⣤⡀⠐⠉⢿⣽⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢹⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣯⣭⣿⣯⣿⡿⢿⡿⣧⣖⣡⣾⣿⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠈⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣹⣷⣿⣯⣿⣷⡿⣿⠎⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠻⣿⣿⣿⣿⣿⣿⣿⣿⣟⠻⠿⠿⣿⣿⣿⠿⠿⠟⠏⠯⠹⠭⠛⠚⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠿⠿⠟⠁⠻⠿⠿⠋⠀⠀⠀⠈⠻⣿⣷⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠛⠛⠊⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # energy_retrieval
-        "81": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣴
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⡶⠞⠋⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣤⣴⠟⠋⠀⣀⣠⠤⠞
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣤⣤⣤⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⣶⠟⠋⠀⠚⠛⠋⣁⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢀⣴⠟⠉⠀⠀⠈⠉⠳⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣴⣾⡿⠛⣁⣤⣤⠤⡶⠖⠋⠉⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⢀⣾⠁⠀⠀⠀⣆⣀⡰⣄⠈⠻⣄⠀⠀⠀⠀⣀⣤⣶⣶⡿⠟⢋⡠⣴⣎⣉⣀⠉⠀⠀⠀⠀⠀⠒⠉⠉
-                ⢀⣶⣶⣶⣆⠀⢸⣇⣀⣀⡀⠀⣸⠄⠀⠈⠛⣦⣼⣦⣶⡶⢿⣟⣛⣋⣥⣶⠒⢛⣉⣉⣉⠽⠭⠥⠤⠤⠤⠶⠶⠖⠀⠀
-                ⠀⠿⣿⡿⠟⠀⢸⣿⣭⣧⣽⠚⢯⡀⠀⠀⠀⢸⣿⣿⠓⠒⠚⠿⠶⢧⣤⣶⣒⣒⣖⣒⡒⠒⠒⠒⠆⠀⠀⢠⣤⣤⣤⣤
-                ⠀⠀⠀⠀⠀⠀⠀⢿⡟⠛⠋⠀⠀⢧⣤⡀⣠⣼⠀⣸⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠙⠛⠛⠻⠿⢿⣷⣒⣆⠀⠈⠀
-                ⠀⠀⠀⣰⣿⣯⣻⡞⢿⡀⠀⠀⠀⠀⠀⠈⠋⡆⢀⡿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠛⠛
-                ⠀⠀⠀⢹⣿⡿⠟⠃⠀⠙⢷⣤⡀⠀⠀⠀⣀⣴⠟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠉⠋⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # full_heal
-        "82": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⠋⣾⡼⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡀⠀⠸⣧⣣⡳⡄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⡋⠉⠛⠷⣄⣌⣿⣷⣎⢦⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡿⠟⠋⠙⢦⡀⠈⢳⣋⣩⣿⣷⡑⢄⡀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡶⠊⠁⠀⠀⠀⢠⣤⡘⢦⠈⠻⣿⡿⣿⣿⣦⣯⣤⣤⡀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⠾⠷⣄⠀⠀⢀⣀⠀⠙⢿⡧⠈⢷⠀⠸⡷⡟⢰⣿⠉⠙⣿⢳
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⣿⠉⡠⠀⠀⣠⡤⢿⣿⡇⠀⠀⣤⣴⣿⡆⠰⢿⣿⣾⣿⣄⠀⣛⡼
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⡛⠉⠀⠀⢀⡴⠊⠁⠀⢆⡈⢁⣴⣿⣿⠿⠋⠇⠀⣸⠈⠹⠯⠽⠿⠿⠇
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣤⠋⠀⠀⠀⣀⠔⠋⠀⠀⣀⣤⣾⣿⣿⡿⢿⢷⡤⠞⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠞⠁⠀⢀⠠⠊⠁⢀⣀⣴⣾⣿⣿⣿⡿⣿⡤⠞⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠞⠁⠀⠀⠀⠀⠀⣤⣤⣿⣿⣿⡿⢟⡻⠕⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠞⠁⠀⠀⠀⣀⣠⣾⣿⣿⡿⢿⣻⠽⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⣞⠁⠀⠀⢀⣤⣾⣿⡿⣟⡯⠕⠛⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠋⠙⢦⣠⡶⠿⢛⡫⠽⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢀⣠⠔⠛⠉⠉⠙⠲⣤⠔⠋⣠⡴⣻⡽⠯⠔⠛⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡾⠁⠀⠀⠀⠀⣠⠞⣁⠴⣫⠷⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠘⠡⠞⠁⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⡄⠀⠀⠀⠀⠀⠀⠀⠀⢠⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠿⣄⠀⠀⠀⢀⠀⠀⣠⢟⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # maintenance
-        "83": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⣿⣉⣷⣶⣦⣤⣤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣾⣿⣿⣟⡾⠟⣻⣉⣍⣿⠿⡆⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡤⠊⠙⣟⡿⠟⠃⠀⠉⠉⠀⢄⣴⣿⣆⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣺⣲⢽⡿⠋⠀⠀⠀⠀⠀⠀⠀⠈⢻⣿⣿⣦⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⡿⠟⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⣿⣿⣷⡄⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣼⠗⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢻⡿⣿⣆⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠄⢹⡿⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⣿⣿⣧⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⣾⣿⣷⣦⡈⠙⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢿⣿⠑
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣴⣆⣠⣴⡿⡋⣻⣿⣿⣿⣿⣶⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⠤
-                ⠀⠀⠀⠀⠀⢀⣠⠶⢿⣿⣾⣶⣏⠛⠾⣷⢞⣿⣿⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣀⣿⣻⣧⡿⠿⣿⠿⣿⣦⡠⢬⡿⣿⣿⣟⣿⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⢀⣰⣚⣿⣾⠟⠋⠀⠀⠳⣤⣬⣿⣽⣯⣽⣿⣿⣾⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⣴⣯⣾⡿⠋⠁⠀⠀⠀⠀⠀⠀⠙⠻⢿⣿⣿⠛⠛⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠉⡉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # plus_power
-        "84": r"""
-                ⠀⠀⠀⠀⣠⡀⠀⠀⠀⠀⠀⢠⣶⠄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠸⢽⣢⣄⠙⢿⡄⣶⡄⠀⢠⢣⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣀⣈⠑⠳⠾⢷⢸⡇⢠⡿⠃⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠛⠓⠛⠟⢻⣢⡠⢵⣿⣁⡾⠟⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠿⠟⠛⠉⣡⡾⢨⣿⠻⣷⣦⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣰⡿⠹⠇⠻⠇⢀⣈⡛⠿⢷⣤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⡔⡻⠁⠀⠀⠀⣠⣿⣿⣿⣄⣼⣿⢿⣿⣶⣄⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⢀⡞⡴⠁⠀⢀⡴⠿⠛⣻⣿⣿⣿⣯⣿⣾⣿⣿⣿⣿⡟⣻⢻⣿⡿⡟⣻⢿⡿⡿⡛⢿⢦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠎⡜⠁⠀⠀⡜⢁⣣⡼⣿⣿⣿⣿⡅⣾⣿⣿⡯⣿⣿⣷⣿⣿⡾⣿⣿⠿⢳⣿⡷⠿⢾⣾⣯⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⡜⠀⠀⠀⢰⡇⣟⠁⡇⣿⣿⣿⣿⡇⣿⣿⣿⣿⣿⣿⣿⣿⣿⣯⢺⣷⡀⠀⠀⠀⠀⠈⠻⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠸⡇⡛⠒⠇⢻⣿⣿⣿⠃⣿⣿⣿⣿⠙⢹⣛⣿⣿⣿⣿⡿⢷⡄⢶⣦⡀⢀⣰⣿⣇⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢻⡀⠀⣀⣼⣿⣿⣿⡠⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣏⣿⣿⡿⠉⠙⠳⢦⣄⡀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⢦⣌⢸⣿⣿⣿⣧⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠛⠁⠀⠀⠀⠀⠈⠙⠳⣦⣄⡀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣿⣿⡿⠁⢻⣿⡿⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠛⠷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # pokemon_center
-        "85": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⣤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣀⣾⣿⡿⣿⣿⣷⣤⣄⡀⠀⢴⣞⠉⠀⠀⠀⠀⠈⢈⣳⣯⣿⣷⣶⣤⣄⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣀⣠⣤⡎⠱⣿⡿⠿⢦⣿⡿⡿⠿⢃⠬⠂⠀⠀⠉⠉⠀⠉⣉⠥⣭⣿⣿⣿⠳⣿⣿⣷⣈⢿⣛⣒⣢⣤⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢻⡀⠻⡁⠀⠉⠂⠺⡝⠛⣛⣣⡌⠉⠤⠴⠂⠠⠤⢤⣀⡀⠘⢆⡘⡜⢿⣻⣿⢶⣿⣿⠿⡆⠇⡸⠀⠀⠈⠉⠛⠲⢤⣀⡀⠀⠀⠀
-                ⠀⠑⣤⣵⡀⠀⠀⢀⣼⡓⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢨⣿⡇⠀⠀⠉⠐⠒⠃⠀⠃⠒⠒⣉⣍⡠⠤⠤⠄⠰⠤⢤⡄⠀⡉⠀⡀⠀
-                ⠀⠀⠈⢷⣾⣶⠒⠀⠙⠫⠥⣤⡤⠀⣠⣤⡤⠄⠒⣺⣿⣾⣿⣿⣿⣶⣤⠀⠀⠀⠀⠀⣾⡏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⠓⠀⠀
-                ⠀⠀⠀⠈⢻⡿⠦⡀⠀⠀⠀⠀⠀⠀⠀⢀⡤⠖⣺⣿⣿⣿⠇⢨⡽⣿⣿⣷⣆⠄⠤⡀⠘⠻⣶⡤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤
-                ⠀⠀⠀⠀⠈⢦⡠⠼⢄⠀⠀⠀⠀⢀⠜⠉⡹⢉⣿⣿⣿⣿⡇⠈⣿⣿⣿⣿⣿⡑⡦⠘⢦⠀⠀⠀⠙⠛⠛⠛⠂⠀⠷⠛⠒⠀⠈⠁
-                ⠀⠀⠀⠀⠀⠈⠣⣀⡬⠧⣄⣀⣀⠺⡓⠋⢧⡘⢿⣿⣿⣾⣿⣶⣿⣿⣿⣿⠿⣃⠧⢤⡼⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠑⠢⠤⠤⠤⠤⠃⠑⠤⢶⠝⠒⠊⠭⡟⢻⡭⠿⠛⠫⣄⢮⣀⡠⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠑⠒⠒⠧⡐⠓⠒⠒⠒⠚⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # pokemon_flute
-        "86": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠤⣀⣀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⢤⣶⣿⣉⣿⣦⡙⢷⡄⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⡀⠀⠀⠀⠀⡀⠀⠀⠀⠀⢀⣠⠴⣒⣭⡈⠻⣿⠈⠻⣿⣿⣿⣼⣿⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠶⠋⡍⠉⠓⢦⡀⠀⠉⠢⢄⣴⠚⣭⣴⡌⠙⠻⠇⠚⣉⣡⣴⣿⣿⣿⣿⣿⣤⣀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⣠⡞⠁⢀⣖⣀⣂⡄⠀⠙⢦⡀⠀⠀⠀⠳⣌⠛⠃⣀⣴⣶⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⡄
-                ⠀⠀⠀⠀⠀⠀⢰⡟⠀⡴⣿⠁⠀⠐⠀⠀⠀⠈⢻⡄⠀⠀⠀⠉⢷⣯⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠀
-                ⠀⠀⠀⠀⠀⢀⣿⣄⡀⣄⠛⠒⠂⣀⢤⣲⣦⣤⣿⣿⣆⠀⠀⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀
-                ⠀⠀⢀⡠⠴⠊⠀⠀⠙⣦⣴⣶⣿⣿⣿⣿⣿⣿⣿⣿⣿⡄⠀⠀⠀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⠀⠀
-                ⢠⣿⣧⡀⢀⣠⠴⠂⠀⠈⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⠀⠀⢰⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⠀⠀⠀⠀
-                ⠈⣿⣿⣷⡀⠀⠀⣠⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠀⢠⡿⠻⠿⣿⣿⠻⠛⣿⡟⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠹⣿⠿⠿⣆⣨⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣠⠟⠁⠀⠀⠀⠀⠀⠠⠈⢷⡄⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠙⣶⣾⣿⣿⣿⣿⡿⠻⢿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⢨⣿⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠈⠻⠿⠟⠋⠁⠀⠀⣠⠾⠋⠙⠛⠛⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⣿⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⣟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣾⠃⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢯⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡀⠀⠀⢀⣀⣀⡤⠶⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠲⠶⠶⠶⠄⠠⠤⠀⠀⠀⠀⠉⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # pokedex
-        "87": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⣤⣶⠾⢿⣛⣿⣿⣿⠄⢀⣀⣤⣤⣤⣀⣀⣀⣀⣤⣤⣶⣾⣿⣿⣆⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢀⣠⣤⣶⣾⣛⣿⣽⣿⣿⣾⣿⣿⣿⣿⣿⣿⣿⣟⢯⠗⣉⣹⣽⡿⠿⠛⠉⠉⢻⣿⣿⣿⣧⡀⠀⠀⠀⠀⠀⠀
-                ⢠⣶⢳⡿⠛⢧⡽⣿⣿⣿⣿⣿⣿⣿⣿⣟⡛⠿⣿⣉⡹⣿⣿⣻⠟⠋⠉⠀⠀⠀⠀⠀⢀⣀⣽⣿⣿⣿⣷⡀⠀⠀⠀⠀⠀
-                ⢸⣿⡹⠶⡥⢟⣱⣿⣿⣿⣿⣿⣿⣛⣃⣭⠷⣶⣿⣿⢃⡹⣿⣿⣧⠀⠀⠀⢠⣴⣶⠿⡟⠛⠋⢉⣿⣿⣿⣿⣄⠀⠀⠀⠀
-                ⠀⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠿⠛⠋⠁⢠⡄⠈⣧⢹⣏⢳⡘⣿⣿⣿⡶⠺⡏⠉⣣⡤⠄⠒⠀⢀⣀⣿⣿⣿⣿⣧⠀⠀⠀
-                ⠀⠘⣿⣿⣿⡿⠟⠋⠉⠀⣀⣠⡤⠶⠊⠁⢳⠀⠘⣧⢻⣆⢷⡘⢿⣿⣷⠀⠻⣆⢀⣠⣤⣶⣾⣿⡿⣿⡼⣿⣿⣿⣷⠀⠀
-                ⠀⠀⢻⣿⣿⣇⠀⢰⡖⣋⠁⠀⠀⠌⠀⡀⡈⢧⠀⠸⣞⢿⣎⢷⡉⣿⣿⣷⣶⣿⠿⣿⣿⣿⣫⣭⡀⢿⣄⣸⣿⣿⣿⣷⡄
-                ⠀⠀⠈⢿⠁⠹⡄⢁⢷⠬⠛⠁⠀⠀⠀⠀⠀⠈⣆⠀⠹⡆⢿⣌⢷⡽⣿⣷⣬⠷⠛⡏⠉⣻⣞⡛⢣⣾⠿⠋⣉⣽⣿⣿⣿
-                ⠀⠀⠀⠸⡇⠀⢳⠀⠚⣇⠀⠀⠀⢀⣀⡴⠖⠛⠉⠀⠀⢹⡌⢿⡌⢯⢻⣿⣿⡃⠤⠚⠋⠉⠙⣿⠙⣷⣾⣿⣿⣿⠿⠟⠁
-                ⠀⠀⠀⠀⢻⠀⠀⢧⠐⣸⠤⠖⠛⠉⠀⠀⠀⣀⣤⠴⣚⡋⠁⠈⣿⣆⠈⢿⣯⢷⡀⠠⠀⣀⣭⣷⣿⡿⠿⠛⠉⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠈⣇⠀⠘⡆⠑⠀⢀⣀⠤⠖⢚⡉⠁⠀⣼⠙⠷⣦⠀⠈⣿⣴⡌⢻⣯⢷⣾⣿⠿⠛⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢹⡀⠀⢹⡖⠋⣉⣠⣴⠾⠛⣧⠀⠘⠧⢶⣼⡏⠀⠀⠘⣿⣿⡼⠟⠋⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⣧⢰⡟⢻⣯⣿⠓⠋⠀⠀⢘⡇⢀⠀⠀⢁⣠⠴⠒⠋⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠸⣆⠙⠟⠂⢸⣀⣀⣴⢶⢛⣡⡾⠗⠋⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢹⣷⣤⣤⣨⣭⡿⠖⠛⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠙⠛⠛⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # professor_oak
-        "88": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⡛⠶⢦⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣻⣅⠀⠀⠈⠙⠲⠶⢤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣀⣤⣶⣿⠛⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠛⠲⢤⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠻⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣤⣤⣌⢷⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⣄⠀⠀⣐⣋⣙⡉⠙⠛⠛⠳⠶⠿⠦⠉⣁⣀⡀⠉⠻⣷⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⢶⠴⠮⠗⠀⣸⠁⠉⠉⢩⠙⠓⣶⡶⠖⠚⠉⠉⠉⠉⢿⠀⠀⣿⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠈⢷⡀⢀⣀⡏⠀⠀⠀⠘⠇⠀⠸⠇⠀⠀⠀⠀⠀⠀⢸⣷⣼⣿⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⣏⣿⠁⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡀⢨⣿⣿⡏⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢿⣿⣴⣿⣷⣄⡀⠀⠀⠀⠀⠀⠀⣠⣾⣿⣿⣽⢻⣿⠇⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣿⣿⣿⣿⡿⠻⢿⣦⣸⡀⢸⣴⡿⡟⠛⠉⣿⠿⡿⣧⣾⣿⡄⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠻⣝⢿⣿⣿⢹⣧⣀⡸⠃⠙⠁⠈⠉⠉⠧⠤⠴⢏⠄⣿⡿⣿⣻⠇⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠲⣍⣿⠀⠀⠀⠀⠀⢠⡆⠀⠀⠀⠀⠀⠀⠈⠀⣿⣷⡿⠁⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢭⠀⠀⠀⠀⠠⠾⠷⠄⠀⠀⢳⡄⠀⠀⠀⣿⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⢦⣄⠀⠶⠖⠒⣚⣛⣓⠲⠶⣿⡆⣀⡴⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠙⢦⣄⠀⠀⠀⠀⠀⢀⣠⡞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⢤⡄⢡⡏⡟⠒⠒⠒⠚⠋⢹⣿⣦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⠴⡾⠋⠁⡞⠀⡞⠀⠈⠓⠂⠀⠀⠀⢸⣿⣿⣧⠈⠳⡄⠤⣄⣀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠴⠾⢭⣡⡞⠀⠀⣸⠃⠘⢧⡀⠀⠀⠀⢀⣀⡠⠼⣿⠻⠻⡄⠀⠻⣀⠀⠉⠉⠲⢤⡀⠀
-                        ⠀⠀⠀⣴⠶⣶⣤⣀⡀⠉⠙⠲⢦⣏⣀⣀⣼⣿⣶⠶⠖⠋⠉⠀⠀⢹⣧⡀⢿⠀⠀⠙⣄⠀⠀⠀⠀⢹⣦
-                        ⠀⠀⢀⣿⣶⣿⣿⣿⣿⣶⣦⣄⠀⠛⣟⣩⠟⠉⣁⣤⣤⠶⠖⠒⡟⠛⣿⣟⢿⣤⡶⠚⠋⠀⠀⠀⠀⣸⠁
-                        ⠀⠀⡟⠁⣿⣿⣿⡇⠈⠙⣿⣿⣿⣷⣬⣥⣴⡿⢿⢿⡄⠀⠀⠀⢷⡀⣿⣿⠛⢦⣄⠀⠀⠀⠀⠀⠀⣿⠀
-                        ⠀⣼⠀⠀⢹⣿⣿⣷⠀⠀⢻⠟⠛⣿⣿⠟⠋⠀⢀⡿⠃⠀⠀⠀⢸⣿⢻⣿⠀⠀⠀⢹⡇⠀⠀⠀⠀⡏⠀
-                        ⢀⠇⠀⠀⠈⣿⣿⣿⣿⣿⣿⣯⢀⡼⠁⢀⣀⣴⣿⣷⣤⣀⣠⣤⣸⣿⣿⣿⠀⠀⠀⣾⠀⠀⠀⠀⢠⢇⠇
-                        ⠀⠀⠀⠀⠀⠉⡉⠉⠉⠉⠉⠉⠀⠀⠀⠈⢉⠉⠉⠉⠉⠉⠉⠉⢉⠙⠛⠋⠀⠀⠀⠉⠉⠉⠒⠀⢈⠉⠀
-        """,
-        # revive
-        "89": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠦⡀⠣⣳⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⠤⣈⠳⡼⠀⢀⡞⡷⣄⠀⠀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⢈⣢⠤⢽⣤⣤⠾⣡⠥⠘⡉⠉⢰⣿⣷⣤⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠸⠥⠀⢸⠺⣧⣄⠸⠁⠀⠀⠀⠀⠺⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢠⠒⠋⣹⠆⠈⣿⠋⠉⠀⢀⠀⣟⣀⣬⣿⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢠⢄⡀⠀⠈⠉⠉⠁⠀⠀⣿⣠⣤⣾⡀⠀⣿⣿⣿⣿⣯⣳⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⢠⣀⠘⢎⡇⢀⣤⣄⠀⠀⠀⠀⠈⢻⣿⣿⣿⣿⣿⣿⣮⢟⡍⠈⠀⢰⢿⢦⡀⠀⠀⣀⠀⠀⠀⠀
-                        ⠀⠀⠈⠺⠵⠀⠀⣾⠀⠙⣷⠤⠴⢲⣄⠀⠈⠉⠁⠀⢿⣛⡻⡄⢀⣀⣠⢏⡞⠀⠙⠉⠉⣩⣷⣄⠀⠀
-                        ⠀⠛⠥⡶⣀⡤⣒⣳⢒⡪⠗⠊⢠⣿⣿⣦⠀⠀⠀⠀⡤⠤⢭⠀⠻⣖⢊⡋⠀⠀⠀⠀⠸⣿⣿⣿⣷⠀
-                        ⣔⡋⠉⣲⠈⠳⣄⠂⠀⠀⠀⠀⠌⠻⣿⡿⠀⠀⠀⠀⠉⠚⣉⡀⠀⢈⡟⡅⠀⠀⠀⢸⠆⢊⣿⣿⡏⠀
-                        ⢀⡠⠤⢬⠀⠀⡜⠀⠆⠐⠠⢌⣤⣴⣾⣷⣄⠀⠀⠀⠰⠭⠴⠋⠀⢸⣁⣀⣤⣀⠈⢸⣿⣿⣿⣿⣧⡀
-                        ⠚⠶⠒⠊⠀⠀⢷⣶⣾⣶⣀⢸⣿⣿⣿⣿⣿⡆⠀⠀⠀⠀⠀⠀⠀⠈⢻⣿⣿⣿⣷⣾⣿⣿⣿⠿⠛⠛
-                        ⠀⠀⠀⠀⠀⠀⠈⢻⣿⡿⣿⣿⣿⣿⠟⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠛⠛⠛⠛⢻⣿⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # super_potion
-        "90": r"""
-                        ⠀⠀⠀⠀⠀⢀⣤⠒⠋⠉⠉⠑⠲⢄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢠⣿⣿⣿⡄⠀⠐⡄⠀⠀⠈⠉⣒⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢸⢹⣿⡟⠙⠢⠄⣁⢦⠀⠐⡆⠀⠀⠑⢤⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠈⢇⣍⣀⢦⣌⠒⠠⠤⣅⠀⠹⡄⢄⠀⠀⠈⠢⡀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢯⠉⠛⠈⠉⠁⠀⣏⡇⢰⠈⠢⡑⠀⠀⠀⠈⢢⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⣿⡇⠀⠀⠀⠀⠀⢡⠇⢸⠀⠀⠚⢦⡀⠑⡄⠀⠱⡀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⢀⠇⠁⠀⠀⠀⠀⣠⠏⢀⡾⠀⠀⠀⠀⠈⠙⠁⠀⠀⠱⡀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⠏⠀⠀⠀⠀⠀⡴⠁⡠⠾⠁⠀⠀⢠⣀⠀⠀⠀⠀⠀⠀⢣⠀⠀⠀
-                        ⠀⠀⠀⣠⡋⠀⠀⠀⠀⡠⠋⣠⠞⠁⡴⠀⠀⡠⠁⠩⠃⠀⠀⠀⠀⠀⡸⠀⠀⠀
-                        ⠀⢀⠜⠉⠀⠀⠀⣠⠊⢀⡴⠁⠀⠀⠀⠀⠀⠻⡀⠀⠀⠀⠀⠀⠀⢀⠇⠀⠀⠀
-                        ⢀⠎⠀⠀⠀⠀⡔⠁⣠⠏⠀⠀⠀⠀⠀⠀⠀⠀⠇⠀⠀⠀⠀⠀⢀⠎⠀⠀⠀⠀
-                        ⡾⠀⠀⠀⢀⣾⠁⡴⠁⠀⠀⠀⡀⠀⠒⠀⠀⠀⠀⠀⠀⠀⠀⠀⡜⠀⠀⠀⠀⠀
-                        ⡇⠀⠀⠀⢸⣸⠀⠀⠀⠀⠀⠀⠀⢸⡟⠉⠀⠀⡄⠀⠀⡇⠀⠀⡇⠀⠀⠀⠀⠀
-                        ⣷⠀⠀⠀⠈⢿⡄⠀⠀⠀⠀⠀⠀⢘⡛⠒⠤⠴⠁⠀⠀⢇⠀⠀⡇⠀⠀⠀⠀⠀
-                        ⢿⠀⠀⠀⠀⠈⢿⣄⠀⠀⠀⠀⠀⡸⠛⠉⠙⠒⢆⣀⠀⢸⠀⠀⠘⢄⠀⠀⠀⠀
-                        ⠘⡾⠄⠀⠀⣀⣀⣻⣆⠀⠀⢀⡀⢀⣀⣀⣀⣀⣀⠈⢹⣣⣄⡀⠀⠈⢆⠀⠀⠀
-                        ⠀⠈⠢⣴⣤⣿⡿⠿⣿⡧⡴⣡⣶⢿⣯⣷⠄⢀⠀⠀⠈⢿⣿⣿⣿⣶⣀⠣⡀⠀
-                        ⠀⠀⣸⢿⡿⠟⠀⠀⠀⢠⣿⣟⣿⣿⣿⣻⡀⠸⠠⣄⣀⠠⠟⢨⣿⡛⣄⡀⠱⡀
-                        ⠀⣰⣿⣿⡇⠀⠀⠀⡴⢟⣿⣿⣿⣿⣿⣿⣆⣻⣏⣿⣯⡤⠓⢾⣿⠳⣾⠿⠦⡽
-                        ⢸⠃⣿⣿⣿⣤⣤⣤⣶⣿⣿⣿⡿⠿⠻⡟⠻⠁⢰⡖⠚⠓⠀⠘⢿⡀⠹⣦⠈⠣
-                        ⣾⣀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣯⣶⣶⣶⣦⣦⣴⣬⣿⣿⡛⠻⠶⠟⠀⠀⠘⣇⠀
-                        ⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣁⣀⣀⣀⣀⣀⠀⢠
-                        ⠘⢝⡿⣿⣿⣿⣿⡿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠿⠿⠛⠛⠋⣉⠴⠋
-        """,
-        # bill
-        "91": r"""
-                                ⠀⠀⠀⠀⠀⠀⢀⣴⡞⠉⠙⠛⠋⠉⠉⠙⢶⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⣠⡿⠁⠀⠀⠀⠀⠀⠀⠀⠀⠈⢳⣽⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⢀⡠⡒⠶⣿⣟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠾⠓⢦⣀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⢸⡏⠁⠀⠀⠀⠉⠀⣰⣶⣦⡀⠠⣄⡀⠀⠀⠀⠀⠀⠀⡿⣆⠀⠀⠀⠀⠀⠀⠀
-                                ⠘⢷⡀⠀⠀⣀⣠⢿⣿⣿⣿⡇⠘⢓⠚⢧⣄⠀⣀⠀⠀⣀⣹⢦⠀⠀⠀⠀⠀⠀
-                                ⣼⠋⠀⠀⣼⣿⣿⣿⣿⣿⣿⣏⣁⣸⣄⠘⠟⡆⠘⠷⠄⠉⣼⣹⣷⠀⠀⠀⠀⠀
-                                ⣇⠀⠀⠀⢻⣿⠀⠉⠁⠀⠀⠙⠛⢿⣿⣷⣶⣶⣄⠀⠃⠀⣿⣿⡃⠀⠀⠀⠀⠀
-                                ⢿⡇⢀⣀⣾⠋⣁⣀⠀⠀⠀⠀⠀⢘⣧⠼⠯⢻⣿⣿⣷⣴⣿⣿⠃⠀⠀⠀⠀⠀
-                                ⣟⣼⣿⣿⣿⣶⠋⠈⠉⣦⠀⠀⠀⠎⠁⣇⠀⠀⢻⡿⡛⣿⣿⡟⠀⠀⠀⠀⠀⠀
-                                ⠛⠩⣽⣏⠉⠹⡄⠘⠦⠇⠀⠀⠀⠀⠒⠒⠂⠀⠈⣷⣧⢸⡿⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠙⢦⣃⣷⠀⠀⠀⣾⠀⠀⠀⠀⠀⠀⠀⣰⠃⣩⣾⠃⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⠙⣿⡀⠀⠀⠷⠶⣤⠔⠀⠀⢀⣼⣿⣫⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⠀⠀⠙⠛⣦⣤⣀⣀⣤⢴⣾⡛⣭⠟⠛⢛⠛⣛⣤⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠀⢀⣀⣠⠞⠉⢹⡏⠉⠀⢸⡀⢉⣯⡠⢶⣉⣙⠿⣼⣄⠀⠀⠀⠀⠀
-                                ⠀⠀⢀⡶⠚⠋⠉⡟⠀⢷⠟⠀⠀⠀⠈⢷⡏⠙⣆⠀⠉⢉⠜⠁⣸⠀⠀⠀⠀⠀
-                                ⠀⢀⡟⠀⠀⠀⠀⣧⠞⣤⢧⠀⠀⠀⢀⣼⡇⠀⣽⡤⠞⠁⠀⣴⡏⠀⠀⠀⠀⠀
-                                ⢰⡸⠁⠀⠀⠀⠀⡿⠷⠈⠻⣧⣀⣰⣿⡟⠁⠀⠀⠀⠀⠀⠀⣨⠷⡄⠀⠀⠀⠀
-                                ⢈⣇⠀⠀⠀⠀⣼⠁⣀⠀⠀⠈⠻⣥⣨⣿⡆⠀⠀⠀⠀⠀⠀⣿⠘⠂⠀⠀⠀⠀
-                                ⠀⢹⣄⣀⣹⠯⠞⠛⠛⢶⡀⠀⠀⠀⣠⠏⠀⠀⠀⠀⣀⣀⡸⠃⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠙⢿⠁⠀⣀⣤⣤⣤⣷⠀⣠⠞⠁⠀⠀⢀⣴⣿⠏⠉⠑⠄⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠸⣧⣺⠁⠀⠀⠀⣧⠞⠁⠀⠀⠀⣠⢾⡿⠉⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                                ⠀⠀⠀⠀⠈⠉⣇⣀⣠⠎⡁⠀⠀⢀⣠⡼⠛⡛⡁⠀⠛⠛⡋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # energy_removal
-        "92": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⢠⡴⠖⠒⠒⠲⠶⠶⢷⣦⣤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠻⣦⣠⣄⣄⣤⣄⣀⣠⣼⣿⣿⣿⡖⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣶⣶⣦⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠉⠉⠉⠉⠉⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢿⣿⣿⣿⣷⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠀⠀⠀⠀⠀⠈⢿⣿⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⣿⣿⣷⣦⡀⠀⠀⠀⠙⢿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠻⣿⣷⣿⣿⢤⣀⠀⠀⠀⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⢀⣀⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⣿⣭⣭⡷⠔⣦⢼⣍⠙⣦⡀⠙⣷⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢀⡤⠞⠉⠀⢠⡇⠀⠀⠀⠀⢀⣠⠤⢴⠤⣄⣠⡖⠀⣀⣁⡴⠋⠙⢦⡱⡇⠹⣷⣤⣿⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⣠⠏⠀⠀⠀⣠⠏⠀⠀⠀⠀⡴⠋⠀⠀⠀⣰⢁⡴⢱⡏⢀⡄⠀⠀⠀⡼⠆⠀⠀⣠⡍⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀
-                ⢰⠃⠀⠀⣠⠞⠁⠀⠀⠀⠀⠀⢷⣤⡤⠴⠋⢻⢿⠀⣸⣧⣰⣷⢺⣿⡏⠁⢴⣶⣾⣿⠇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⠋⠀⡯
-                ⠸⠧⠤⠞⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠖⣿⣼⠀⢿⣼⡜⠛⠸⣿⡯⠿⣿⠿⠷⠛⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠖⠉⠀⣠⠞⠁
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣰⠃⠀⣼⠁⣀⡀⠻⣧⠀⠀⠀⠀⠤⣷⣶⠄⠀⠀⠀⠀⠀⠀⠀⣠⠔⢚⠽⣿⣁⣤⠴⠚⠁⠀⠀
-                ⠀⠀⠀⠀⣾⠛⡇⠀⠀⠀⠀⠀⢠⠶⣿⠦⠔⠁⢸⡁⢳⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠿⠥⠤⠖⣛⡭⣷⣻⣾⣷⠂⠀⠀
-                ⠀⠀⠀⠀⡇⠘⡇⠀⠀⠀⠀⠀⢸⡄⢹⡀⠀⠀⠈⠿⡼⠇⠀⠀⠀⣀⣀⡀⠀⠀⠀⠀⠀⢀⣀⣀⣠⢤⣠⣴⣿⣛⣩⠵⠞⠋⠁⠀⠀⠀
-                ⠀⠀⠀⠀⣷⠀⡇⠀⠀⠀⠀⠀⠈⢧⣸⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠻⣦⡉⠓⢦⡄⠀⠀⠻⠷⠦⠤⠤⠖⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠹⣷⡇⠀⠀⠀⠀⠀⠀⠀⠙⣷⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⠉⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⣿⣷⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⡤⠤⣤⣤⠤⢤⣄⣀⡀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # gust_of_wind
-        "93": r"""
-                ⠈⢒⢤⡀⠉⠢⣄⠀⠙⠷⣄⠀⠀⠀⠀⠀⠀⠘⢾⡄⠀⠀⠠⡄⠀⠀⠀⠀⠀⠀⠀⠀⢀⡞⡱⢁⡼⠁⠀⠀⠀⢠⢞⠔⠁⠀⠀
-                ⠀⠀⠈⠚⠵⡤⣀⠑⠦⣀⠈⠳⣄⡀⠀⠀⠀⠀⠈⢾⡄⠀⠀⠙⣄⢠⡀⣤⠀⠀⠀⠀⡜⢰⢣⠞⠀⠀⠀⢀⣼⠟⠁⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣠⠴⠛⠉⢹⣌⠑⠦⣈⠑⢆⠀⠀⠀⠀⠀⠻⡤⣰⠃⣾⡏⢿⢻⣄⠀⠀⡘⢠⡳⠃⠀⣴⣷⣶⣿⡆⠀⠀⠀⠀⠀⠀
-                ⠀⠀⢀⠼⠁⠀⠀⠀⠀⢳⡕⢦⣈⠑⠦⣝⢦⡀⠀⠀⢠⡿⣿⠀⠀⠀⣠⣾⣿⣧⠀⣡⠟⠀⠀⢀⡼⠛⠋⠛⠁⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠸⣿⢦⣜⠦⠄⠀⠀⡇⠀⠈⠑⠦⢈⡙⠿⣄⠀⢼⡇⠈⣦⣶⣾⡿⠟⣨⣿⡇⠁⠀⠀⠐⠁⠀⠀⠀⠀⠀⣀⡴⣞⠁⠀⠀
-                ⠀⠀⠀⠙⢮⣿⡿⠿⠦⠼⠛⠶⢄⣀⠀⠀⠉⠀⠈⠁⠘⣷⡀⠀⢉⣤⣴⣶⣿⣿⡁⠀⠀⠀⠀⠀⠀⠀⣠⡶⠟⢛⡟⠛⠲⠄⠀
-                ⠀⠀⠀⠀⠀⠋⠀⠀⠀⠀⠀⠀⠀⣠⣍⠒⠀⠀⠀⠀⠀⠙⠿⢿⣟⣁⣴⣾⣿⣿⡇⠀⠀⠀⠀⠀⠀⠉⠀⠀⢀⡎⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⢠⣿⣛⢛⣩⡥⣿⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⡆⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠉⢉⣉⣉⡻⠿⠒⠆⠀⠀⠀⠀⠀⠀⠉⣹⠉⠀⢴⣲⣿⡇⠀⠀⠀⠀⠀⠀⢀⠀⠀⢣⡀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠐⠒⠒⠈⠉⠉⠀⠀⠀⠀⠀⢀⣴⡄⠀⠀⠀⠀⠀⠓⣧⠀⣔⢶⣿⡅⠀⠀⠀⠀⠀⠉⠉⠙⠛⠯⢷⣀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣀⡀⠀⠀⠀⠀⠀⠀⣀⣠⣴⣿⣾⠻⣇⣠⢤⠀⢀⣞⡇⠀⢮⡉⣉⣷⠀⠀⠀⠀⠈⠉⠒⠠⢤⣀⡀⠈⠙⠀⠉
-                ⠀⠀⠀⠀⠀⣿⠁⠈⡆⢀⣠⣴⡶⢟⡫⠟⠉⠀⠛⢿⠉⠁⣾⡶⠋⠸⣧⠀⠘⢿⣿⠋⠀⠐⢦⣀⠀⢀⠀⠀⠀⠈⠉⠛⠷⢶⡀
-                ⠀⠀⠀⠀⢀⡩⢖⣪⡽⠟⠋⡡⠔⠉⠀⠀⠀⠀⣠⠾⠷⡶⢿⡀⠀⠀⣿⡄⢀⣾⠇⠀⠀⠀⠘⣎⣟⠉⢣⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⢀⣀⣤⡵⠞⠋⢁⣠⠔⠉⠀⠀⠀⠀⢀⣠⣾⠋⠀⣴⠃⠈⠛⠳⠛⠋⢻⠟⠁⠀⢆⠀⠀⠀⠈⠻⣤⠀⠑⢤⡀⠀⠀⠀⠀⠀
-        """,
-        # potion
-        "94": r"""
-                        ⠀⠀⠀⠀⠀⠀⣀⠤⠖⠒⠛⠛⠋⠉⠉⠓⠢⢄⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢠⠏⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⠢⣀⠀⠀⠀⠀
-                        ⠀⠀⠀⣠⢿⣿⣷⣶⣄⠀⠀⠀⠀⠀⣰⠊⠓⢦⡀⠀⠈⠣⡀⠀⠀
-                        ⠀⠀⠀⢺⡜⣿⣿⣿⣿⣷⣄⠀⠄⠐⣇⣰⠓⡦⡇⠀⠀⠀⠙⡄⠀
-                        ⠀⠀⠀⠘⢷⠿⣍⣽⣿⣿⣿⣧⠀⠀⠻⡈⠛⣡⠇⠀⠀⠀⠀⡇⡆
-                        ⠀⠀⠀⠀⡿⠁⠀⠀⢹⣿⣿⣿⡇⠀⢀⢈⡙⠻⠞⠃⠀⠀⠀⣹⡇
-                        ⠀⠀⠀⢠⠿⠃⠀⠀⠀⠙⠿⠿⢷⠀⠈⠀⠀⠀⠀⠀⠀⠐⣾⠋⠀
-                        ⠀⠀⢠⡼⠇⠀⠀⠀⠀⠀⠀⠀⡎⠀⠀⠀⠀⣷⡆⠀⠰⣶⠋⠀⠀
-                        ⠀⠀⣸⡓⠀⠀⠀⠀⠀⠀⠀⡴⠁⠀⣠⡞⠀⣿⣿⢠⡴⠛⠀⠀⠀
-                        ⠀⢠⠯⠀⠀⠀⠀⠀⠀⠀⡼⠁⠀⣴⣿⣿⣦⣿⣿⡗⣷⠀⠀⠀⠀
-                        ⠀⣾⠃⠀⠀⠀⠀⠀⢠⠞⠀⠀⣼⣿⣿⣿⣿⣿⣿⡇⣯⠀⠀⠀⠀
-                        ⠘⡏⠀⠀⠀⠀⠀⣰⠃⠀⠀⢠⣿⣿⣿⣿⣿⣿⣿⣿⣌⠣⡀⠀⠀
-                        ⠀⢻⣅⡀⠀⢀⡼⠁⠀⠀⠀⣸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣧⠙⡆⠀
-                        ⠀⢠⣽⠟⠳⢮⡀⠀⠀⠀⢰⣿⣿⣿⣿⡿⠟⠿⣿⣿⣿⣿⣯⣿⡀
-                        ⠀⠈⢿⡄⠀⠀⠙⠳⣤⣠⣿⣿⣿⣿⣿⠁⠀⠀⠹⣿⣿⣿⢛⣟⠀
-                        ⠀⠀⣟⣧⣄⠀⠀⠀⠀⠙⠿⣿⣿⣿⣿⣄⣀⣀⣶⠿⣟⣥⡼⡟⠀
-                        ⠀⠀⠘⢾⣿⣷⣶⣾⣵⣶⣶⣶⣿⣿⣿⠛⠙⣯⠁⢸⣮⣿⣿⠇⠀
-                        ⠀⠀⠀⠀⠙⠺⣟⠿⣿⣿⣿⣿⣿⣿⣿⣽⣷⣿⣿⣿⣿⠏⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⢀⣙⣓⣓⣛⡭⢿⣿⣿⣯⣿⣷⣿⣗⡀⠀⠀⠀⠀
-        """,
-        # switch
-        "95": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢠⣴⣿⣿⣽⣦⣰⣆⠀
-                ⠀⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠲⠶⢶⣿⣻⡗⠒⠒⠒⠒⠒⠒⢀⡶⠖⠛⠓⢶⡀⠀⠒⣾⣿⣿⣿⣿⣿⣿⣽⣿⡗
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⠁⠀⣴⡄⣠⣗⠀⣸⣿⡿⠛⣿⣿⣿⣿⣿⣿⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⣄⣰⢿⠋⠀⠈⣇⣷⣴⡷⣶⣿⣿⣿⣿⣿⠟⠀
-                ⠀⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠒⠲⠶⢶⣿⣻⡗⠒⠒⠒⠒⠒⠒⠒⠲⢖⣶⠾⣿⠻⣷⠀⠓⠋⠀⡘⠿⣿⣿⣿⣿⣿⣿⣿⣿⣶⣶
-                ⠀⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡠⠖⢿⣿⡟⡁⠀⠀⠀⠀⠀⠀⠀⢠⡾⣵⢸⣿⣧⢹⡦⠀⠀⠀⡇⠀⣸⣿⣿⣿⣿⣿⣿⣿⣿⣿
-                ⠀⡇⠀⣀⡠⣶⣶⣶⣤⣀⠀⠀⠀⠀⠓⣎⠹⣿⣿⣖⠀⠀⠀⠀⠀⠀⠀⢸⣧⡗⠈⢿⡏⠀⠛⠤⠤⠜⠁⢚⣽⣿⣿⣿⣿⣿⣿⣿⣿⣿
-                ⢀⣇⣾⣿⣾⣿⣿⣿⣿⣿⣕⢄⠀⣠⠞⠁⠀⠀⠀⠹⡷⡄⠀⠀⠀⠀⠀⠀⠹⣿⣍⡦⠝⠳⣦⣤⣤⡤⢶⣿⣿⣿⣿⠿⠛⠛⠋⠉⠉⠉
-                ⢸⣿⣏⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣇⠀⠀⠀⠀⠀⠀⢳⡸⣶⣶⠶⠶⠶⠶⠶⢾⠿⠿⠷⡶⡶⣶⣶⣶⣾⣿⠿⢿⠯⠴⠶⢶⠶⡶⡦⠦
-                ⢸⣹⣯⣿⣿⣿⣿⣿⣿⡿⣿⣿⣿⣿⣦⡀⠀⠀⠀⢀⣼⢻⠿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣯⣿⣿⢤⣤⠴⣿⣁⣘⣀⡼⡆⠙⠢⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⢸⣿⣿⡛⠻⠿⣿⣿⣿⣿⡿⢿⣿⣿⣿⣋⣀⣀⣀⡠⠴⠚⠁⡰⠁⠀⠀⣿⠶⠶⠶⠶⠶⠶⠶⠶⠶⠶⠶⠶⠦⠴⠶⠶⠶⠶⠦⠴⠶⠶
-                ⠘⣿⣿⡇⠀⠀⠀⠀⠀⠀⠸⢿⠷⠛⠩⡀⠀⠀⠀⠀⠀⣠⠞⠁⠀⠀⠀⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠉⠉⠉⠒⠒⠒⠒⠒⠒⠒⡧⣀⣀⣀⣈⣙⣒⣒⣚⣋⣀⣀⣀⣀⣤⠾⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # double_colorless_energy
-        "96": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⠔⠊⠉⠁⠀⢀⠀⠈⠉⠉⠓⠤⡀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠊⠁⠀⠀⠀⠀⠀⣸⡄⠀⠀⠀⠀⠀⠈⠢⡀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡰⠁⠀⠀⠀⠀⠀⣀⣴⣿⣷⠀⠀⠀⠀⠀⣀⡀⢸
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢰⠁⠀⠀⠙⡿⣩⣿⡿⣹⡟⣭⣷⠶⡾⣫⠗⠁⢸⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡾⠀⠀⠀⢸⠳⣍⡿⠟⣁⣛⣁⣿⢿⡟⠁⠀⠀⠀⢧
-                        ⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⠷⠒⠊⠉⠉⠉⠙⠛⠁⠀⠀⠀⠉⠓⠿⢄⠀⠀⢰⠃
-                        ⠀⠀⠀⠀⠀⢀⠤⠚⠉⠀⠀⠀⠀⠀⠀⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⣆⡠⠏
-                        ⠀⠀⠀⢀⠔⠁⠀⠀⠀⠀⠀⠀⠀⠀⢸⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢇⠀
-                        ⠀⢀⢜⡅⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣾⣿⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⣆
-                        ⣠⢯⠆⠠⣄⡀⠀⠀⠀⠀⠀⠀⠀⣸⣿⣿⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢧
-                        ⡏⠀⠀⠀⠈⠻⢿⣷⣶⣶⣤⣤⣴⣿⣿⣿⣿⣷⣤⣤⣤⣴⠄⣀⠔⠀⠀⢸⡀⠀
-                        ⡿⠀⠀⠀⠀⠀⠀⠙⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣴⠞⠁⠀⠀⠀⠀⢸⠀
-                        ⡇⠀⠀⠀⠀⠀⠀⠀⠈⢻⣿⣿⣿⣿⣿⢿⣿⣿⣿⣿⣿⠁⠀⠀⠀⠀⠀⠀⠀⡇
-                        ⡇⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣆⠀⠀⠀⠀⠀⠀⠀⡇
-                        ⡇⠀⠀⠀⠀⠀⣠⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⣄⠀⠀⠀⠀⡏⠀
-                        ⢳⡄⠀⣀⣴⠾⠿⠛⠛⠉⠉⠉⠙⣿⣿⣿⣿⠏⠉⠉⠉⠉⠛⠛⠿⠦⣸⠀⠀⠀
-                        ⠀⠻⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠸⣿⣿⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⡴⠁
-                        ⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⣿⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠞⠀⠀
-                        ⠀⠀⠀⠀⠑⢤⡀⠀⠀⠀⠀⠀⠀⠀⠸⡏⠀⠀⠀⠀⠀⠀⢀⠀⣠⠖⠁⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⠓⠦⢤⣀⣀⠀⠀⠀⠁⠀⠀⢀⣀⡤⠴⡓⣛⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # fighting_energy
-        "97": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⣀⢤⡒⠫⠙⠚⠛⠋⠛⠛⠙⠓⠫⠵⣢⢀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⢰⠾⠛⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠪⣦⢄⠀⠀⠀⠀
-                        ⠀⠀⠀⢴⡵⣃⣀⣀⡀⢠⣾⣿⣿⣿⣶⠁⣿⣿⣿⣿⡆⢀⣀⣀⣈⡓⢱⡀⠀⠀
-                        ⠀⢀⣮⠁⢸⣿⣿⣿⠀⢸⣿⣿⣿⣿⣿⠀⣿⣿⣿⣿⡇⣿⣯⣿⣿⣿⠈⢫⢆⠀
-                        ⢀⣳⡁⢸⣸⣿⣿⣿⠀⢸⣿⣿⣿⣿⣿⠀⣿⣿⣿⣿⡇⣿⣿⣿⢸⣿⠀⠀⢣⢆
-                        ⣾⣿⠁⢨⣿⣿⣿⣿⠀⣼⣿⣿⣿⣿⣿⠀⣿⣿⣿⣿⡇⣿⣟⢻⣸⣿⠀⠀⠀⣿
-                        ⣿⡏⠀⢸⣻⣿⣿⣿⡇⡿⣿⣿⣿⣿⣿⢀⣿⣿⣿⣿⡇⣿⣿⣿⣿⣿⠀⠀⠀⠙
-                        ⣿⡇⠀⢰⣶⣶⣶⣶⣦⣤⣤⣤⣤⣤⣅⠀⠀⢲⣤⣤⣤⣤⣤⣤⣄⠀⠀⠀⠀⠀
-                        ⣿⡇⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⢰⣿⣿⣿⣿⣿⣿⣿⣿⣷⠀⠀⠀⠀
-                        ⡿⡆⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⣸⣿⣿⣿⣿⣿⣿⣿⣿⣿⠀⠀⠀⢀
-                        ⠘⣣⠀⠀⢻⣿⣿⣿⣿⣿⣿⣿⣥⣤⣤⣽⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠀⠀⢀⠜
-                        ⠀⠘⣻⣆⠀⠈⠻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠀⣰⡗⠀
-                        ⠀⠀⠘⢝⢷⣄⠀⠀⠙⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⡛⠋⠙⠋⣠⢞⠏⠀⠀
-                        ⠀⠀⠀⠀⠑⢋⡷⢶⡄⠀⢨⣽⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⢀⣠⣾⠟⠁⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠈⠒⠫⣗⣚⣺⡿⠷⣿⣿⢾⣿⣓⣷⢶⡲⠟⠊⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # fire_energy
-        "98": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⠴⣒⣊⣭⠽⠿⠿⠿⠿⠿⠿⠟⠻⠒⠾⠯⠉⣍⡒⠦⢤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⠔⢛⣭⡴⠛⠋⠀⠀⠀⠀⠀⢤⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠛⠢⣬⡙⠦⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣠⢛⣤⠾⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠈⢻⣷⣦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠻⣬⡓⢦⡀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣠⢾⣷⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⣿⣿⣷⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⠲⣝⢦⡀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣠⢞⣽⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⣿⣿⣿⣦⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢳⡙⢄⠀⠀⠀⠀
-                ⠀⠀⢀⡼⣱⣿⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣼⣿⣿⣿⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⡎⢧⠀⠀⠀
-                ⠀⢠⢎⣼⡿⠀⠀⠀⠀⠀⠀⠀⠲⠀⠀⠀⠀⠀⠀⠀⠀⣠⣴⣿⣿⣿⣿⣿⣿⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠎⢧⠀⠀
-                ⢀⡎⣼⡿⣄⣀⠀⠀⠀⠀⠀⠀⢀⣴⠇⠀⠀⠀⢀⣠⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⢿⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠘⠊⢧⠀
-                ⣸⣹⡟⠀⡹⢹⠄⠀⠀⠀⢀⣶⣿⠋⠀⠀⠀⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣾⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⠈⣇
-                ⣿⡿⠀⠈⠛⣠⠀⠀⠀⣠⣿⣿⡇⠀⠀⢠⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⣦⠀⠀⠀⠀⠀⠸⣸
-                ⢹⡇⢠⡄⣠⣅⠀⠀⣴⣿⣿⣿⡇⠀⠀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⢀⡾⠹⡇⠀⠀⠀⠀⠀⢳
-                ⠘⠁⠘⢁⣿⣿⡄⣠⣿⣿⣿⣿⣷⡀⠀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠀⠀⠀⠀⣀⣠⣾⣿⣤⣼⣿⠀⠀⠀⠀⠘⣿
-                ⢠⡄⠀⣾⣿⣿⣷⣿⣿⣿⣿⣿⣿⣷⣄⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣧⣤⣶⣶⣾⣿⣿⣿⣿⣿⣿⡟⠀⠀⠀⠀⢸⡇
-                ⢸⡁⠀⠘⠻⣿⣟⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠁⠀⠀⠀⠀⢸⡇
-                ⣸⡇⠀⠀⠀⣼⠋⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠋⠁⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⢀⡄⠀⢸⡇
-                ⣿⣧⠀⠀⠀⣿⡄⠻⠿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠁⠀⠀⠸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠁⠀⠀⣠⣴⣿⠇⠀⠀⣏
-                ⢸⣹⡆⠀⠸⢿⣿⣾⡆⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡀⠀⠀⠀⠀⠙⢿⣿⣿⣿⣿⣿⣿⣿⣿⡿⢋⣁⣀⣴⣶⣿⣿⣿⡏⠀⠀⠀⡿
-                ⠈⢟⢿⡆⠐⠺⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⠀⠀⠀⠀⢸⣿⡿⠋⢉⣴⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡟⠀⠀⢠⢲⠇
-                ⠀⠘⢿⢷⣄⠀⠸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⠙⢻⣿⡟⠀⠀⠀⠀⠸⠋⠀⠀⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠟⠀⠀⢠⣧⡎⠀
-                ⠀⠀⠈⢯⣻⣆⠀⠈⠻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠃⠘⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠋⠀⠀⣰⢏⡎⠀⠀
-                ⠀⠀⠀⠀⠙⢽⢣⡀⠄⠈⠻⣿⣿⣿⣿⣿⣿⡿⠁⠘⠀⠀⠀⢀⡀⠀⠀⠀⠀⠀⠀⠀⢿⣿⣿⣿⣿⣿⣿⡿⠟⠁⠀⣠⣾⡽⠋⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠈⠣⡍⢦⡰⠖⠛⢹⣿⣿⣿⣿⣏⠀⠰⠛⠀⠀⢻⣥⢀⡀⠀⠀⠀⠀⠀⢀⣿⣿⣿⣿⡿⠋⠀⢀⣠⣾⣿⠏⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠈⠲⡙⠀⡀⠀⠀⠉⠛⠻⢿⣷⣶⣾⣀⢸⣠⣉⡌⣠⠀⠀⣀⣠⣴⣾⡿⠟⠛⠁⠀⢀⣤⢟⣭⠛⠁⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⢤⣄⠀⢤⠀⠀⠀⠀⠉⠛⡛⠛⠿⠿⠿⠿⠿⠟⠛⠛⠉⠀⠀⢀⣠⣴⢞⣿⠟⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠲⠶⣿⣶⣄⣀⣀⣂⣀⣄⣀⣀⣀⣀⣀⣀⣀⡀⢴⣾⣿⠽⠟⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # grass_energy
-        "99": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡤⠶⡗⠛⠻⠿⠟⠋⠉⠉⠉⠉⠉⠛⠋⠙⠛⠙⠒⠶⢤⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⢶⣋⡵⠖⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣠⣴⣶⣿⣆⠀⠀⠈⠉⠲⢤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⣠⢔⣫⡴⠛⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⣴⣶⣿⣿⣿⣿⣿⣿⣿⣧⡀⠀⠀⠙⠢⡝⠲⣄⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⡠⢊⡵⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣤⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡄⠀⠀⠀⠀⠐⢄⠑⢤⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⢠⢞⣵⠋⠀⠀⠀⠀⠀⠀⠀⠀⢀⣤⣶⣿⣿⣿⣿⣿⣿⣿⣿⣿⢯⣾⣿⣿⣿⣿⣿⣿⣿⣦⠀⠀⠀⠀⠀⠁⠈⢣⡄⠀⠀⠀
-                ⠀⠀⠀⡴⣫⡾⠁⠀⠀⠀⠀⠀⠀⠀⣠⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⢃⣾⣿⣿⣿⣿⡟⣿⣯⣽⣿⣧⡄⠀⠀⠀⠀⠀⠀⠘⢆⠀⠀
-                ⠀⠀⡼⣱⠏⠀⠀⠀⠀⠀⠀⣀⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡟⢁⣾⣿⣿⣿⣿⣿⣛⣿⣯⣿⣯⣾⢷⡀⠀⠀⠀⠀⠀⠀⠈⢧⠀
-                ⢠⡼⣱⠏⠀⠀⠀⠀⠀⣠⣾⣿⣿⣿⣿⣿⣤⣭⡉⠙⠛⢿⣿⣿⡏⢀⣼⣿⡿⠿⠟⠛⠛⠻⠯⠭⠭⠉⠉⠀⢻⡀⠀⠀⠀⠀⠀⠀⠻⣷
-                ⡸⢳⠏⠀⠀⠀⠀⢀⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⣄⠀⠈⠛⠀⠘⠉⠀⢀⣤⣴⣶⣶⣿⣿⣷⣲⣖⣾⣍⣽⣿⡄⠀⠀⠀⠀⠀⠸⣹
-                ⣷⡟⠀⠀⠀⠀⣠⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⠀⠀⠀⣠⣴⣿⣿⣿⣿⣿⣿⣿⣿⣽⣿⣛⣛⣛⣺⣭⣿⡀⠀⠀⠀⠀⠀⣿
-                ⢹⠇⠀⠀⠀⣰⣿⣿⣿⣿⣿⣛⣋⣉⠉⠙⠛⠿⢿⣿⣿⡏⠀⢀⣾⣿⣿⣿⣿⣿⡿⠿⣿⣿⣿⣿⣿⣿⣭⣿⣯⣽⣿⣷⠀⠀⠀⠀⠈⣿
-                ⢸⠀⠀⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣶⣤⡀⠀⠈⠛⠂⠀⠸⠟⠋⠉⠁⠀⢀⣀⣀⣀⣀⣉⣉⣙⠻⢿⣿⣿⣿⣿⣿⣇⠀⠀⠀⠀⢹
-                ⡏⠀⠀⠀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⡀⠀⠀⠀⠀⢀⣠⣴⣶⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣶⣾⣿⣿⣿⣿⣿⡀⠀⠀⠀⢸
-                ⡇⠀⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⠀⢠⣶⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⠀⠀⣿
-                ⣻⡄⠀⢸⣿⣿⣿⣿⣿⣯⣍⣉⠉⠙⠛⢿⣿⣿⣿⠁⠀⢀⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⠀⢰⡇
-                ⣯⡇⠀⠀⢿⣿⣿⣿⣿⣿⣿⣿⣿⣶⣄⡀⠀⠙⠓⠀⠀⣸⣿⠿⠛⠛⠉⠉⠁⠀⢀⣀⣉⣉⣛⡛⠛⠿⣿⣿⣿⣿⣿⣿⣿⡇⠀⠀⠀⣿
-                ⢹⡡⡀⠀⠸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⡀⠀⠀⠀⠉⠀⠀⢀⣤⣴⣶⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠁⠀⠀⠀⣇
-                ⠈⢣⠱⠀⠀⠘⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡆⠀⠀⢀⣤⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠁⠀⠀⠀⠀⡿
-                ⠀⠈⢣⠀⡀⠀⠀⠙⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⢰⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠿⠋⠀⠀⠀⠀⠀⡘⠁
-                ⠀⠀⠈⠳⡒⣀⠀⠀⠀⠈⠛⠿⣿⣿⣿⣿⣿⣿⣷⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠟⠋⠁⠀⠀⠀⠀⣠⡄⡸⠃⠀
-                ⠀⠀⠀⠀⠹⣼⢷⣄⠀⠀⠀⠀⠀⠈⠙⠛⢿⣿⣿⡆⢸⣿⣿⣿⣿⣿⣿⣿⣿⠿⠿⠟⠛⠛⠉⠁⠀⠀⠀⠀⠀⠀⠀⢀⡼⢋⡜⠁⠀⠀
-                ⠀⠀⠀⠀⠀⠙⠷⣝⠷⣄⠀⠀⠀⠀⠀⠀⠸⣿⣿⣿⣼⣿⣿⡏⠉⠉⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⡴⣫⡽⠋⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠉⠛⢤⣀⠀⠀⠀⠀⠀⠀⣿⣿⣿⣿⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⣖⣫⠟⠋⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠓⠦⣀⠀⠀⠀⠸⢿⣿⣿⣿⣿⣿⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣨⠷⠏⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠉⠒⠦⢤⣀⣀⠉⠉⠉⠛⠇⠀⠀⠀⠀⠀⠀⠀⣀⣠⣴⢶⢊⡋⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # lightning_energy
-        "100": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⢀⠤⠒⠉⠁⠙⠀⠁⠀⠀⡰⠈⠉⠑⠂⢄⡀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⢀⠔⠾⠂⠀⠀⠀⠀⠀⠀⠀⢀⣾⠁⠀⠀⠀⠀⠑⠪⠂⢀⠀⠀⠀⠀
-                        ⠀⠀⢀⣔⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⠇⠀⠀⠀⠀⠀⠀⠀⠈⠀⡀⡀⠀⠀
-                        ⠀⢀⡪⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⣴⣿⡟⠀⠀⠀⠀⠀⠀⠀⠦⢄⠀⠀⠈⢆⠀
-                        ⢠⠃⠁⠀⠀⠀⠀⠀⠀⠀⠀⣠⣾⣿⣿⠁⠀⠀⠀⠀⠀⠀⣀⣀⡴⠀⠀⠀⠈⢶
-                        ⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⣴⣿⣿⣿⠃⢀⣀⣤⣴⣶⡚⢿⢿⡟⠁⠀⠀⠀⠀⢹
-                        ⡿⠀⠀⠀⠀⠀⠀⠀⢠⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡟⠀⠀⠀⠀⠀⠀⢸
-                        ⡇⠀⠀⠀⠀⠀⠀⣰⣿⣿⣿⣿⣿⣿⣿⡿⢿⣿⣿⣿⣿⠏⠀⠀⠀⠀⠀⠀⠀⢸
-                        ⣇⠀⠀⠀⠀⣀⣼⣿⣿⠿⠟⠛⠉⠁⠀⠀⣾⣿⣿⣿⠃⠀⠀⠀⠀⠀⠀⠀⠀⣸
-                        ⡟⡀⠀⠀⠐⠛⠉⠁⠀⠀⠀⠀⠀⠀⠀⢰⣿⣿⡿⠃⠀⠀⠀⠀⠀⠀⠀⠀⠀⢘
-                        ⠘⡵⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿⣿⡿⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈
-                        ⠀⠈⢵⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣸⣿⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⠎⠀
-                        ⠀⠀⠈⠪⡢⡀⠀⠀⠀⠀⠀⠀⠀⣔⣿⠏⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡪⠃⠀⠀
-                        ⠀⠀⠀⠀⠈⠪⢖⢄⠀⠀⠀⠀⠀⣼⠋⠀⠀⠀⠀⠀⠀⠀⠀⢀⠔⠋⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠀⠉⠒⠠⢄⣠⣴⣃⠀⠀⠀⣠⣄⡤⠤⠒⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # psychic_energy
-        "101": r"""
-                        ⠀⠀⠀⠀⠀⠀⠀⣀⠤⠒⠉⠉⠉⠉⠉⠉⠉⠉⠉⠉⠑⠢⠀⠀⠀⠀⠀⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠐⠊⠂⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠑⢄⡀⠀⠀⠀
-                        ⠀⠀⠀⡠⠀⠀⠀⠀⠀⣀⣤⣴⣶⣶⣶⣿⣿⣶⡶⡦⢤⡀⠀⠀⠀⠀⠑⢄⠀⠀
-                        ⠀⢀⣪⠂⠀⠀⣠⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⢄⡀⠈⠙⠢⡀⠀⠀⠀⠣⡀
-                        ⢀⣳⠃⠀⣠⣾⣿⣿⡿⢋⣷⣿⣿⣿⣿⣿⣿⣿⣿⠓⢌⠑⢤⡀⠈⠳⣄⠀⠀⢱
-                        ⣮⠁⢠⣾⣿⣿⡟⠁⣰⣿⣿⣿⣿⣿⣿⠛⠿⣿⣿⡦⠀⢣⡀⠈⢢⡀⠈⢣⡀⠀
-                        ⣿⣰⣿⣿⣿⠋⠀⢀⣿⣿⣿⣿⣿⣿⣿⡇⠀⠈⢻⣿⣷⣄⡇⠀⠀⠙⣦⣾⠷⡀
-                        ⣿⣿⣿⣿⠁⠀⠀⢸⣿⣿⣿⣿⠿⠿⠟⠁⠀⠀⢸⣿⣿⣿⡟⠀⠀⠀⠈⣿⣾⣿
-                        ⣿⣿⣿⣿⣇⠀⠀⠀⢿⣿⣿⣿⣷⣄⣀⠀⣀⣴⣿⣿⣿⣿⠇⠀⠀⠀⣠⣿⣿⡿
-                        ⡿⠈⢻⣿⣿⣷⣄⠀⠈⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠋⠀⠀⣀⣾⣿⣿⠟⠀
-                        ⠹⢣⠀⠙⢿⣿⣿⣷⣤⡀⠉⠻⢿⣿⣿⣿⣿⣿⠿⠛⠁⢀⣠⣾⣿⣿⡿⠋⠀⢠
-                        ⠀⠱⣷⡀⠀⠙⠿⣿⣿⣿⣷⣶⣤⣤⣀⣈⣀⣤⣤⣶⣾⣿⣿⣿⠟⠉⠀⠀⢀⠊
-                        ⠀⠀⠑⢅⠄⠀⠀⠈⠙⠛⠿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠿⠛⠋⠀⠀⠀⠀⡰⠃⠀
-                        ⠀⠀⠀⠀⠑⢄⠀⠀⠀⠀⠀⠀⠈⠉⠉⠉⠉⠁⠀⠀⠀⠀⠀⠀⢀⡠⠋⠀⠀⠀
-                        ⠀⠀⠀⠀⠀⠀⠙⠒⠤⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⠤⣒⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-        # water_energy
-        "102": r"""
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣠⡴⣗⣾⡿⠿⠿⠛⠉⠉⠉⠉⠉⠉⠉⠉⠉⠙⠫⢕⣲⢦⣀⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⡤⢚⣯⠶⠛⠉⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠒⠀⠙⠿⣶⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⢀⣠⢞⣥⠟⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠀⠛⠿⡢⡀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⣠⢏⣴⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⣀⣠⣤⣤⣤⣤⣶⡶⠶⠶⠶⠙⠶⣄⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⣠⢞⣵⠟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢀⣀⣠⣴⣶⣶⣾⣿⣿⣿⣿⣿⣿⠿⠛⠉⠁⠀⠀⠀⠀⠀⠰⡘⢷⡄⠀⠀⠀
-                ⠀⠀⢀⡼⢫⣿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⣤⣶⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻⣧⡀⠀
-                ⠀⢀⡞⣴⡿⠃⠀⠀⠀⠀⠀⠀⠀⣀⣤⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠋⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠁⠸⣶⡀
-                ⢠⡜⣰⡟⠀⠀⠀⠀⠀⠀⢀⣤⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡟⠁⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢹⣷
-                ⢸⢳⣿⠁⠀⠀⠀⠀⢀⣶⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢻
-                ⣾⣾⡇⠀⠀⠀⢀⣴⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                ⢿⡿⠁⠀⠀⣠⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                ⢸⡇⠀⠀⣰⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                ⢸⡇⠀⢰⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸
-                ⢸⡇⢠⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⣄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿
-                ⢸⡇⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣿
-                ⡿⡷⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡇
-                ⢱⡀⣼⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣧⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⢸⡗
-                ⠘⢇⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡆⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡼⠉
-                ⠀⠘⣇⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣷⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡟⠀
-                ⠀⠀⠘⣏⢻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡇⠀⠀⠀⠀⠀⠀⠀⢠⣆⡜⠀⠀
-                ⠀⠀⠀⠘⢿⡻⢿⣿⣿⣿⣿⣿⣏⠀⠀⠀⠀⠉⠉⠻⢿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠁⠀⠀⠀⠀⠀⢀⡴⣯⠞⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠹⣮⡛⢿⣿⣿⣿⣿⣦⡀⠀⠀⠀⠀⠀⠀⠈⠻⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠁⠀⠀⠀⠀⢀⣴⣯⡟⠃⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠙⢾⡛⠻⢿⣿⣿⣿⣷⣦⣄⡀⠀⠀⠀⠀⢸⣿⣿⣿⣿⣿⣿⣿⣿⣿⡿⠋⠀⠀⠀⠀⣠⡄⣻⠞⠁⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⠳⣄⡈⠽⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠿⠟⠋⠁⠀⠀⣀⣤⠔⣸⠵⠋⠁⠀⠀⠀⠀⠀⠀⠀⠀
-                ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠉⠲⠬⣙⣳⡿⣭⣉⣉⣉⣉⡉⣉⣉⡍⣁⣀⣀⣀⠀⣴⣾⣻⠯⠷⠋⡙⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
-        """,
-}
+"""This module provides the ability to print pokemon ascii art
+The art is kept in the art store data file and loaded on demand"""
+from art_store import get_art_for_width
+from bandwidth import LITE_ART, LITE_MODE, trim_art
+from display import get_terminal_width
 
 
 def print_pokemon(string):
     """
-    Prints pokemon art
+    Prints pokemon art, using a smaller version on narrow terminals
+    In lite mode the smallest version is trimmed, or art is left out
 
     Parameters:
         string (string): Key associated with the value to be printed
@@ -2436,5 +16,7 @@ def print_pokemon(string):
     Returns: None
 
     """
-    selected_art = pokemon_art[string]
-    print(selected_art)
+    if not LITE_MODE:
+        print(get_art_for_width(string, get_terminal_width()))
+    elif LITE_ART != "none":
+        print(trim_art(get_art_for_width(string, get_terminal_width(), 0)))
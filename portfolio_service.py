@@ -0,0 +1,752 @@
+"""This module holds the portfolio and account operations behind the app,
+without any terminal input or output. Each operation returns plain data,
+dictionaries and lists, so the terminal app, the command line and
+benchmarks can all call it. The catalog and each users column are read
+with one request and kept for a short time for the views, writes read
+the column again before planning and update the kept copy in place."""
+import os
+import re
+import threading
+import time
+from decimal import Decimal
+from functools import partial
+
+from background import invalidate_when_done
+from commands import CARD_COUNT, plan_updates, update_ranges
+from exporter import (CATALOG_FIELDS, COLLECTION_FIELDS, FIRST_USER_COL,
+                      export, iter_catalog_records, iter_collection_records,
+                      iter_portfolio_records, read_catalog,
+                      read_collections, read_portfolio)
+from importer import (catalog_index, import_ranges, plan_import,
+                      write_ranges)
+from password_hashing import check_password, hash_password, needs_rehash
+from session_tokens import revoke_tokens
+
+# Seconds the catalog, users and their columns are kept before they are
+# read again, so edits made by other sessions are seen
+CACHE_TTL = float(os.environ.get("SERVICE_CACHE_TTL", 60))
+
+# Worksheets holding the cards and the accounts
+CARDS_WORKSHEET = "base_set_shadowless"
+LOGIN_WORKSHEET = "login"
+
+# Row holding the column letter of each user, below the cards
+USER_LETTER_ROW = CARD_COUNT + 2
+
+# Lengths and characters allowed in account details
+USERNAME_LENGTHS = (5, 15)
+USERNAME_PATTERN = re.compile(r"[a-zA-Z0-9_-]*")
+PASSWORD_LENGTHS = (5, 15)
+PASSWORD_PATTERN = re.compile(r"[a-zA-Z0-9_&!-]*")
+PHONE_LENGTHS = (10, 15)
+PHONE_PATTERN = re.compile(r"[0-9]*")
+
+
+class ServiceError(Exception):
+    """
+    Raised when an operation cannot be done, the message can be shown
+    to the user as it is
+    """
+
+
+class UserNotFound(ServiceError):
+    """
+    Raised when there is no account for a username or column
+    """
+
+
+class LoginFailed(ServiceError):
+    """
+    Raised when a password does not match
+    """
+
+
+class ServiceBusy(ServiceError):
+    """
+    Raised when every password verification slot is in use
+    """
+
+
+# ---- ACCOUNT DETAILS ----
+
+
+def check_username(username):
+    """
+    Checks a username is 5-15 letters, numbers, _ or -
+
+    Parameters:
+        username (string): Username to check
+    Returns:
+        None
+    Raises:
+        ValueError: If the username is not valid
+    """
+    if len(username) < USERNAME_LENGTHS[0]:
+        raise ValueError("Username must be at least 5 characters")
+    if len(username) > USERNAME_LENGTHS[1]:
+        raise ValueError("Username can not be more than 15 characters")
+    if not USERNAME_PATTERN.fullmatch(username):
+        raise ValueError("Username can only use letters, numbers, _ or -")
+
+
+def check_password_text(password):
+    """
+    Checks a password is 5-15 letters, numbers, _, -, & or !
+
+    Parameters:
+        password (string): Password to check
+    Returns:
+        None
+    Raises:
+        ValueError: If the password is not valid
+    """
+    if len(password) < PASSWORD_LENGTHS[0]:
+        raise ValueError("Password must be at least 5 characters")
+    if len(password) > PASSWORD_LENGTHS[1]:
+        raise ValueError("Password cannot be more than 15 characters")
+    if not PASSWORD_PATTERN.fullmatch(password):
+        raise ValueError("Please only use letters, "
+                         "numbers, _ , - , & or !")
+
+
+def check_phone_num(phone_num):
+    """
+    Checks a phone number is 10-15 digits
+
+    Parameters:
+        phone_num (string): Phone number to check
+    Returns:
+        None
+    Raises:
+        ValueError: If the phone number is not valid
+    """
+    if len(phone_num) < PHONE_LENGTHS[0]:
+        raise ValueError("Phone number must be at least 10 digits")
+    if len(phone_num) > PHONE_LENGTHS[1]:
+        raise ValueError("Phone number cannot be more than 15 digits")
+    if not PHONE_PATTERN.fullmatch(phone_num):
+        raise ValueError("Please only use numbers")
+
+
+def increment_gsheet_column_value(column):
+    """
+    Used to increment column values from gsheets.
+    Pass in A returns B
+    Pass in Z returns AA
+    Pass in GZ returns HA etc.
+
+    Parameters:
+        column (string): Column to be incremented
+    Returns:
+        incremented_col (string): Value of the next column
+
+    """
+    # Use in the case where we reach Z and need to move to AA
+    if column == "":
+        return "A"
+
+    last_char_in_column = column[-1]
+    other_chars = column[:-1]
+
+    if last_char_in_column == "Z":
+        # Call this function again passing in other_chars
+        # to update the letters before the Z and change the Z to A
+        return increment_gsheet_column_value(other_chars) + "A"
+    else:
+        return other_chars + chr(ord(last_char_in_column) + 1)
+
+
+def record_dict(record, fields=CATALOG_FIELDS):
+    """
+    Returns a record from the exporter as a dictionary
+
+    Parameters:
+        record (tuple): Record from the exporter
+        fields (tuple): Field names and types
+    Returns:
+        record (dict): Field name to value
+    """
+    return dict(zip((name for name, _ in fields), record))
+
+
+# ---- SERVICE ----
+
+
+class PortfolioService:
+    """
+    A class holding the portfolio and account operations. Users are
+    identified by the letter of their column, find_user and login return
+    it. Safe to share between threads, writes are made one at a time.
+    """
+
+    def __init__(self, open_worksheet, throttle=None, cache_ttl=CACHE_TTL):
+        """
+        Initialise an instance of the PortfolioService class.
+
+        Parameters:
+            open_worksheet (func): Returns a worksheet given its name,
+                such as the spreadsheets worksheet method
+            throttle (LoginThrottle or None): Limits the password checks
+                run at once
+            cache_ttl (float): Seconds values read are kept
+        """
+        self._open_worksheet = open_worksheet
+        self._throttle = throttle
+        self._cache_ttl = cache_ttl
+        self._worksheets = {}
+        self._cache = {}
+        # Counts invalidations, a value read while one happened may be
+        # from before a write landed so it is not kept
+        self._invalidations = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+
+    # ---- SHEET ACCESS ----
+
+    def worksheet(self, name=CARDS_WORKSHEET):
+        """
+        Returns a worksheet, opening it on first use
+
+        Parameters:
+            name (string): Worksheet name
+        Returns:
+            worksheet (object): Opened worksheet
+        """
+        if name not in self._worksheets:
+            self._worksheets[name] = self._open_worksheet(name)
+        return self._worksheets[name]
+
+    def _cached(self, key, read):
+        """
+        Returns a value kept in the cache, reading it if it is missing
+        or has expired
+
+        Parameters:
+            key (tuple): Cache key
+            read (func): Reads the value
+        Returns:
+            value (object): Cached value
+        """
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        with self._lock:
+            invalidations = self._invalidations
+        value = read()
+        with self._lock:
+            if self._invalidations == invalidations:
+                self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate(self, col_letter=None):
+        """
+        Drops cached values so they are read again, every value if no
+        column is given
+
+        Parameters:
+            col_letter (string or None): Users column to drop
+        Returns:
+            None
+        """
+        with self._lock:
+            self._invalidations += 1
+            if col_letter is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(("cards", col_letter), None)
+
+    def _read_portfolio(self, col_letter):
+        """
+        Reads the catalog and a users column with a single request,
+        caching both
+
+        Parameters:
+            col_letter (string): Letter of the users column
+        Returns:
+            user_cards (list): "Yes" or "No" for each card
+        """
+        rows, user_cells = read_portfolio(self.worksheet(), col_letter)
+        user_cards = [cell[0] if cell else "" for cell in user_cells]
+        user_cards += [""] * (CARD_COUNT - len(user_cards))
+        with self._lock:
+            self._cache[("catalog",)] = (time.monotonic(), rows)
+        return user_cards
+
+    def catalog(self):
+        """
+        Returns the card catalog
+
+        Parameters:
+            None
+        Returns:
+            rows (list): Name, rarity, number and price for each card
+        """
+        return self._cached(("catalog",),
+                            lambda: read_catalog(self.worksheet()))
+
+    def user_cards(self, col_letter):
+        """
+        Returns a users column, the catalog is read with it
+
+        Parameters:
+            col_letter (string): Letter of the users column
+        Returns:
+            user_cards (list): "Yes" or "No" for each card
+        """
+        return self._cached(("cards", col_letter),
+                            lambda: self._read_portfolio(col_letter))
+
+    def _read_user_cards(self, col_letter):
+        """
+        Reads a users column again, ignoring the cache, so writes are
+        planned against the sheet as it is now rather than a copy
+        another session may have changed since
+
+        Parameters:
+            col_letter (string): Letter of the users column
+        Returns:
+            user_cards (list): "Yes" or "No" for each card
+        """
+        with self._lock:
+            invalidations = self._invalidations
+        user_cards = self._read_portfolio(col_letter)
+        with self._lock:
+            if self._invalidations == invalidations:
+                self._cache[("cards", col_letter)] = (time.monotonic(),
+                                                      user_cards)
+        return user_cards
+
+    def _write_cards(self, col_letter, updates, ranges, progress=None):
+        """
+        Writes ranges of a users column and updates the cached column
+
+        Parameters:
+            col_letter (string): Letter of the users column
+            updates (dict): New value for each card that changes
+            ranges (list): Ranges covering the updates
+            progress (func or None): Passed to write_ranges
+        Returns:
+            None
+        """
+        try:
+            write_ranges(self.worksheet(), ranges, progress=progress)
+        except BaseException as e:
+            # A cancelled or failed write may still land, so the column
+            # is read again rather than patched
+            invalidate_when_done(e, partial(self.invalidate, col_letter))
+            raise
+        user_cards = list(self.user_cards(col_letter))
+        for card_num, value in updates.items():
+            user_cards[card_num - 1] = value
+        with self._lock:
+            self._cache[("cards", col_letter)] = (time.monotonic(),
+                                                  user_cards)
+
+    def _card_names(self):
+        """
+        Returns the name of each card
+        """
+        return [row[0] if row else "" for row in self.catalog()]
+
+    # ---- ACCOUNTS ----
+
+    def users(self):
+        """
+        Returns every user, read with a single request
+
+        Parameters:
+            None
+        Returns:
+            users (dict): (col_number, col_letter) for each username
+        """
+        def read():
+            names, letters = self.worksheet().batch_get(
+                ["1:1", f"{USER_LETTER_ROW}:{USER_LETTER_ROW}"])
+            names = names[0] if names else []
+            letters = letters[0] if letters else []
+            return {name: (col + 1, letters[col])
+                    for col, name in enumerate(names[:len(letters)])
+                    if col >= FIRST_USER_COL - 1 and name and letters[col]}
+        return self._cached(("users",), read)
+
+    def find_user(self, username):
+        """
+        Returns a users account
+
+        Parameters:
+            username (string): Username, case sensitive
+        Returns:
+            account (dict): username, col_number and col_letter
+        Raises:
+            UserNotFound: If there is no such user
+        """
+        users = self.users()
+        if username not in users:
+            # The account may have been made since the users were read
+            with self._lock:
+                self._cache.pop(("users",), None)
+            users = self.users()
+        if username not in users:
+            raise UserNotFound(f"User {username} not found")
+        col_number, col_letter = users[username]
+        return {"username": username, "col_number": col_number,
+                "col_letter": col_letter}
+
+    def username_in_use(self, username):
+        """
+        Returns True if an account has the username
+        """
+        return bool(self.worksheet(LOGIN_WORKSHEET).find(username,
+                                                         in_column=1))
+
+    def phone_num_in_use(self, phone_num):
+        """
+        Returns True if an account has the phone number
+        """
+        return bool(self.worksheet(LOGIN_WORKSHEET).find(phone_num,
+                                                         in_column=3))
+
+    def login(self, username, password):
+        """
+        Checks a users password, upgrading its hash if it was made with
+        an outdated cost factor
+
+        Parameters:
+            username (string): Username, case sensitive
+            password (string): Password entered
+        Returns:
+            account (dict): username, col_number and col_letter
+        Raises:
+            UserNotFound: If there is no such user
+            LoginFailed: If the password is wrong
+            ServiceBusy: If every verification slot is busy
+        """
+        login_worksheet = self.worksheet(LOGIN_WORKSHEET)
+        username_found = login_worksheet.find(username, in_column=1)
+        if not username_found:
+            raise UserNotFound("The username entered is not associated "
+                               "with an account")
+        row_num = username_found.row
+
+        # Slice the b'' from the stored pass and
+        # change type from string to bytes for comparison
+        stored_hashed_pass = login_worksheet.cell(row_num, 2).value
+        stored_hashed_pass = stored_hashed_pass[2:-1].encode("utf-8")
+
+        def verify():
+            if not check_password(password, stored_hashed_pass):
+                return False, None
+            # The upgraded hash is made in the same slot, so upgrades are
+            # held to the limit on concurrent bcrypt work too
+            if needs_rehash(stored_hashed_pass):
+                return True, hash_password(password)
+            return True, None
+
+        if self._throttle:
+            with self._throttle.verification_slot() as acquired:
+                if acquired:
+                    password_matches, new_hash = verify()
+            if not acquired:
+                raise ServiceBusy("The server is busy, please try again "
+                                  "in a moment")
+        else:
+            password_matches, new_hash = verify()
+
+        if not password_matches:
+            raise LoginFailed("Login failed, password incorrect")
+
+        if new_hash:
+            login_worksheet.update_acell(f"B{row_num}", new_hash)
+        return self.find_user(username)
+
+    def create_account(self, username, password, phone_num):
+        """
+        Stores a new account and gives the user the next free column of
+        the cards worksheet, with no cards, then adds a column so one is
+        always ready for the next account
+
+        Parameters:
+            username (string): Username, checked with check_username
+            password (string): Password, stored hashed
+            phone_num (string): Phone number
+        Returns:
+            account (dict): username, col_number and col_letter
+        Raises:
+            ValueError: If a detail is not valid
+            ServiceError: If the username or phone number is in use
+        """
+        check_username(username)
+        check_password_text(password)
+        check_phone_num(phone_num)
+
+        with self._write_lock:
+            if self.username_in_use(username):
+                raise ServiceError("Username already in use")
+            if self.phone_num_in_use(phone_num):
+                raise ServiceError("Phone number already in use")
+
+            bss_worksheet = self.worksheet()
+            self.worksheet(LOGIN_WORKSHEET).append_row(
+                [username, hash_password(password), phone_num])
+
+            # Assign the user the next available column
+            col_letter = bss_worksheet.acell("A2").value
+            bss_worksheet.batch_update([
+                {"range": f"{col_letter}1", "values": [[username]]},
+                {"range": f"{col_letter}2:{col_letter}{CARD_COUNT + 1}",
+                 "values": [["No"]] * CARD_COUNT},
+                {"range": f"{col_letter}{USER_LETTER_ROW}",
+                 "values": [[col_letter]]},
+                {"range": "A2", "values": [[
+                    increment_gsheet_column_value(col_letter)]]},
+            ])
+            bss_worksheet.insert_cols(
+                [[]], col=bss_worksheet.col_count - 1,
+                value_input_option="RAW", inherit_from_before=True)
+
+            with self._lock:
+                self._cache.pop(("users",), None)
+        return self.find_user(username)
+
+    def username_for_phone_num(self, phone_num):
+        """
+        Returns the username of the account with a phone number
+
+        Parameters:
+            phone_num (string): Phone number
+        Returns:
+            username (string): Username
+        Raises:
+            UserNotFound: If no account has the phone number
+        """
+        login_worksheet = self.worksheet(LOGIN_WORKSHEET)
+        phone_num_found = login_worksheet.find(phone_num, in_column=3)
+        if not phone_num_found:
+            raise UserNotFound("The phone number entered is not associated "
+                               "with an account")
+        return login_worksheet.cell(phone_num_found.row, 1).value
+
+    def set_password(self, username, password):
+        """
+        Stores a new password for an account, revoking the tokens issued
+        to it so sessions resumed with the old password end
+
+        Parameters:
+            username (string): Username
+            password (string): New password, stored hashed
+        Returns:
+            None
+        Raises:
+            ValueError: If the password is not valid
+            UserNotFound: If there is no such user
+        """
+        check_password_text(password)
+        login_worksheet = self.worksheet(LOGIN_WORKSHEET)
+        username_found = login_worksheet.find(username, in_column=1)
+        if not username_found:
+            raise UserNotFound(f"User {username} not found")
+        login_worksheet.update_acell(f"B{username_found.row}",
+                                     hash_password(password))
+        revoke_tokens(self.find_user(username)["col_letter"])
+
+    # ---- CARDS ----
+
+    def apply_commands(self, col_letter, commands):
+        """
+        Applies adds and removes to a users column, in order, writing
+        every changed cell with as few requests as possible
+
+        Parameters:
+            col_letter (string): Letter of the users column
+            commands (list): (name, card_nums) for each command
+        Returns:
+            result (dict): updates, the new value of each card changed,
+                results from plan_updates and the card_names
+        """
+        with self._write_lock:
+            updates, results = plan_updates(
+                commands, self._read_user_cards(col_letter))
+            if updates:
+                self._write_cards(col_letter, updates,
+                                  update_ranges(updates, col_letter))
+        return {"updates": updates, "results": results,
+                "card_names": self._card_names()}
+
+    def add_cards(self, col_letter, card_nums):
+        """
+        Adds cards to a users portfolio
+
+        Parameters:
+            col_letter (string): Letter of the users column
+            card_nums (list): Card numbers to add
+        Returns:
+            result (dict): As apply_commands
+        """
+        return self.apply_commands(col_letter, [("add", card_nums)])
+
+    def remove_cards(self, col_letter, card_nums):
+        """
+        Removes cards from a users portfolio
+
+        Parameters:
+            col_letter (string): Letter of the users column
+            card_nums (list): Card numbers to remove
+        Returns:
+            result (dict): As apply_commands
+        """
+        return self.apply_commands(col_letter, [("remove", card_nums)])
+
+    def add_card(self, col_letter, card_num):
+        """
+        Adds a single card, returns True if it was not already added
+        """
+        return bool(self.add_cards(col_letter, [card_num])["updates"])
+
+    def remove_card(self, col_letter, card_num):
+        """
+        Removes a single card, returns True if it had been added
+        """
+        return bool(self.remove_cards(col_letter, [card_num])["updates"])
+
+    def delete_portfolio(self, col_letter):
+        """
+        Removes every card from a users portfolio
+
+        Parameters:
+            col_letter (string): Letter of the users column
+        Returns:
+            None
+        """
+        updates = dict.fromkeys(range(1, CARD_COUNT + 1), "No")
+        with self._write_lock:
+            self._write_cards(col_letter, updates,
+                              update_ranges(updates, col_letter))
+
+    def import_cards(self, col_letter, entries, replace=False,
+                     progress=None, write_progress=None):
+        """
+        Imports entries read by the importer into a users portfolio
+
+        Parameters:
+            col_letter (string): Letter of the users column
+            entries (iterable): (entry, owned) from iter_entries
+            replace (boolean): Flag set to remove cards not imported
+            progress (func or None): Called with the entries read
+            write_progress (func or None): Called before each write
+        Returns:
+            plan (dict): Plan from plan_import
+        """
+        with self._write_lock:
+            # Read first, the catalog is read with the column
+            user_cards = self._read_user_cards(col_letter)
+            rows = self.catalog()
+            index = catalog_index(
+                tuple(row[2] if len(row) > 2 else "" for row in rows),
+                tuple(row[0] if row else "" for row in rows))
+            plan = plan_import(entries, index, user_cards, replace,
+                               progress)
+            if plan["updates"]:
+                self._write_cards(col_letter, plan["updates"], import_ranges(
+                    plan["updates"], user_cards, col_letter), write_progress)
+        return plan
+
+    # ---- QUERIES ----
+
+    def _records(self, col_letter, owned=True):
+        """
+        Makes a record for each card a user has, or is missing
+        """
+        user_cells = [[value] for value in self.user_cards(col_letter)]
+        return iter_portfolio_records(self.catalog(), user_cells, owned)
+
+    def portfolio(self, col_letter, owned=True):
+        """
+        Returns the cards a user has, or is missing
+
+        Parameters:
+            col_letter (string): Letter of the users column
+            owned (boolean): Flag cleared for the missing cards
+        Returns:
+            portfolio (dict): count, percentage of the set and the cards,
+                each with number, name, rarity and price
+        """
+        cards = [record_dict(record)
+                 for record in self._records(col_letter, owned)]
+        return {"count": len(cards),
+                "percentage": round(len(cards) / CARD_COUNT * 100),
+                "cards": cards}
+
+    def needed(self, col_letter):
+        """
+        Returns the cards missing from a users portfolio, as portfolio
+        """
+        return self.portfolio(col_letter, owned=False)
+
+    def appraise(self, col_letter):
+        """
+        Returns the value of a users portfolio
+
+        Parameters:
+            col_letter (string): Letter of the users column
+        Returns:
+            appraisal (dict): cards priced and their value, a Decimal
+        """
+        prices = [price for _, _, _, price in self._records(col_letter)
+                  if price]
+        return {"cards": len(prices), "value": sum(prices, Decimal(0))}
+
+    def search(self, card_num, col_letter=None):
+        """
+        Returns a cards details
+
+        Parameters:
+            card_num (int): Card number
+            col_letter (string or None): Users column, to say if they
+                have the card
+        Returns:
+            card (dict): number, name, rarity and price, and owned if a
+                column is given
+        Raises:
+            ValueError: If there is no such card
+        """
+        if not 1 <= card_num <= CARD_COUNT:
+            raise ValueError(f"{card_num} is not a card number "
+                             f"(1 - {CARD_COUNT})")
+        user_cards = self.user_cards(col_letter) if col_letter else None
+        card = record_dict(next(iter_catalog_records(
+            self.catalog()[card_num - 1:card_num]), (card_num,)))
+        if user_cards is not None:
+            card["owned"] = user_cards[card_num - 1] == "Yes"
+        return card
+
+    def export(self, what, export_format, file, col_letter=None):
+        """
+        Exports a portfolio, the cards needed, the catalog or every users
+        cards
+
+        Parameters:
+            what (string): "portfolio", "needed", "catalog" or
+                "collections"
+            export_format (string): Key of EXPORT_FORMATS
+            file (object): Binary file to write to
+            col_letter (string or None): Users column, for portfolio
+                and needed
+        Returns:
+            (count, size) (tuple): Records and bytes written
+        """
+        if what == "collections":
+            users = sorted(self.users().items(),
+                           key=lambda user: user[1][0])
+            columns = read_collections(
+                self.worksheet(),
+                [(username, col_letter)
+                 for username, (_, col_letter) in users])
+            return export(iter_collection_records(self.catalog(), columns),
+                          COLLECTION_FIELDS, export_format, file)
+        if what == "catalog":
+            records = iter_catalog_records(self.catalog())
+        else:
+            records = self._records(col_letter, owned=what == "portfolio")
+        return export(records, CATALOG_FIELDS, export_format, file)
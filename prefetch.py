@@ -0,0 +1,378 @@
+"""This module provides background prefetching of worksheet columns
+while the user is reading the main menu"""
+import json
+import os
+import threading
+import time
+
+# File used to store menu transition counts and prefetch stats across sessions
+TRANSITIONS_FILE = os.environ.get("PREFETCH_TRANSITIONS_FILE",
+                                  ".menu_transitions.json")
+
+# Maximum number of prefetch requests sent to the API per session
+REQUEST_BUDGET = int(os.environ.get("PREFETCH_REQUEST_BUDGET", 8))
+
+# Seconds a prefetched column is used before it is read again, the same
+# setting as the PortfolioService cache so both show the same cards
+COLUMN_TTL = float(os.environ.get("SERVICE_CACHE_TTL", 60))
+
+# Options with a predicted probability below this are not warmed
+MIN_PROBABILITY = 0.15
+
+# Catalog columns in base_set_shadowless (name, rarity, number, price)
+CATALOG_COLUMNS = {2: "B", 3: "C", 4: "D", 5: "E"}
+
+# Marker used in place of the user column number
+USER_COLUMN = "user"
+
+# Columns needed by each main menu option (3 view portfolio,
+# 4 cards needed, 5 appraise, 7 card search)
+OPTION_COLUMNS = {
+    3: [2, USER_COLUMN, 4],
+    4: [2, USER_COLUMN, 4],
+    5: [5, USER_COLUMN],
+    7: [2, 3, 4, 5, USER_COLUMN],
+}
+
+# State used as the previous selection when the menu is first shown
+START_STATE = "start"
+
+
+class MenuPrefetcher:
+    """
+    Warms worksheet columns in a background thread, based on how likely
+    each main menu option is to be selected next.
+
+    Attributes:
+        worksheet (object): base_set_shadowless worksheet to read from
+        user_col_number (int): Column that stores user card collection
+        user_col_letter (string): Letter to represent user column
+        request_budget (int): Max prefetch requests allowed this session
+    """
+
+    def __init__(self, worksheet, user_col_number, user_col_letter,
+                 request_budget=REQUEST_BUDGET,
+                 transitions_file=TRANSITIONS_FILE, column_ttl=COLUMN_TTL):
+        """
+        Initialise an instance of the MenuPrefetcher class.
+
+        Parameters:
+            worksheet (object): Worksheet to prefetch columns from
+            user_col_number (int): Column number of the users cards
+            user_col_letter (string): Column letter of the users cards
+            request_budget (int): Max prefetch requests for this session
+            transitions_file (string): Path to persisted transition counts
+            column_ttl (float): Seconds a fetched column is used for
+        """
+        self.worksheet = worksheet
+        self.user_col_number = user_col_number
+        self.user_col_letter = user_col_letter
+        self.request_budget = request_budget
+        self.transitions_file = transitions_file
+        self.column_ttl = column_ttl
+        self._closed = False
+
+        self.requests_made = 0
+        self.hits = 0
+        self.misses = 0
+
+        # Column number -> list of values and when they were read, columns
+        # in flight, the prefetch request each column came from and
+        # requests that were read from
+        self._columns = {}
+        self._fetched_at = {}
+        self._pending = {}
+        self._origin = {}
+        self._used_requests = set()
+        # Counts invalidations, a column read while one happened may be
+        # from before a write landed so it is not kept
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+        self._transitions = self._load()
+        self._session_transitions = {}
+        self._last_selection = START_STATE
+
+    def warm(self):
+        """
+        Starts a background fetch of the columns needed by the options
+        the user is most likely to select next
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        columns = self._columns_to_warm()
+        if not columns or self.requests_made >= self.request_budget:
+            return
+
+        with self._lock:
+            for col in columns:
+                self._pending[col] = threading.Event()
+            self.requests_made += 1
+            request_id = self.requests_made
+            invalidations = self._invalidations
+
+        thread = threading.Thread(
+            target=self._fetch, args=(columns, request_id, invalidations),
+            daemon=True)
+        thread.start()
+
+    def col_values(self, col):
+        """
+        Returns the values of a column, using the prefetched copy if we
+        have one, otherwise reading it from the worksheet
+
+        Parameters:
+            col (int): Column number to return values for
+        Returns:
+            values (list): All values in the column, including heading
+        """
+        with self._lock:
+            pending = self._pending.get(col)
+
+        # Wait for an in flight prefetch rather than sending a second request
+        if pending:
+            pending.wait()
+
+        with self._lock:
+            if self._is_fresh(col):
+                self.hits += 1
+                if col in self._origin:
+                    self._used_requests.add(self._origin[col])
+                return self._columns[col]
+            self.misses += 1
+            invalidations = self._invalidations
+
+        values = self.worksheet.col_values(col)
+        with self._lock:
+            if self._invalidations == invalidations:
+                self._columns[col] = values
+                self._fetched_at[col] = time.monotonic()
+        return values
+
+    def has_columns(self, *cols):
+        """
+        Returns True if every column is prefetched or being fetched
+
+        Parameters:
+            cols (int): Column numbers to check
+        Returns:
+            ready (boolean): True if col_values will not read the sheet
+        """
+        with self._lock:
+            return all(self._is_fresh(col) or col in self._pending
+                       for col in cols)
+
+    def invalidate(self, col):
+        """
+        Drops a cached column, used after the column has been updated
+
+        Parameters:
+            col (int): Column number to drop
+        Returns:
+            None
+        """
+        with self._lock:
+            self._invalidations += 1
+            self._columns.pop(col, None)
+            self._origin.pop(col, None)
+
+    def record_selection(self, selection):
+        """
+        Records a main menu selection to learn transition frequencies
+
+        Parameters:
+            selection (int): Option selected from the main menu
+        Returns:
+            None
+        """
+        previous = str(self._last_selection)
+        current = str(selection)
+        for counts in (self._transitions, self._session_transitions):
+            next_counts = counts.setdefault(previous, {})
+            next_counts[current] = next_counts.get(current, 0) + 1
+        self._last_selection = selection
+
+    def close(self):
+        """
+        Saves the transition counts and stats for use in future sessions,
+        only the first call saves so it can be called on logout and exit
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._save()
+
+    def stats(self):
+        """
+        Returns the prefetch stats for this session
+
+        Parameters:
+            None
+        Returns:
+            stats (dict): Requests made, hits, misses, wasted and hit rate
+                wasted is the number of prefetch requests never read from
+        """
+        lookups = self.hits + self.misses
+        return {
+            "requests": self.requests_made,
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.requests_made - len(self._used_requests),
+            "hit_rate": round(self.hits / lookups, 2) if lookups else 0.0,
+        }
+
+    def _predict(self):
+        """
+        Returns the probability of each option being selected next,
+        falling back to equal odds when we have no history
+        """
+        counts = self._transitions.get(str(self._last_selection), {})
+        total = sum(counts.values())
+        if not total:
+            return {option: 1 / len(OPTION_COLUMNS)
+                    for option in OPTION_COLUMNS}
+        return {int(option): count / total
+                for option, count in counts.items()}
+
+    def _columns_to_warm(self):
+        """
+        Returns the column numbers needed by the likely next options
+        that are not already cached or in flight
+        """
+        columns = []
+        for option, probability in sorted(self._predict().items(),
+                                          key=lambda item: -item[1]):
+            if probability < MIN_PROBABILITY:
+                break
+            for col in OPTION_COLUMNS.get(option, []):
+                if col == USER_COLUMN:
+                    col = self.user_col_number
+                if col not in columns:
+                    columns.append(col)
+
+        with self._lock:
+            return [col for col in columns
+                    if not self._is_fresh(col) and col not in self._pending]
+
+    def _is_fresh(self, col):
+        """
+        Returns True if a column is held and has not expired, dropping
+        it if it has, called with the lock held
+        """
+        if col not in self._columns:
+            return False
+        if time.monotonic() - self._fetched_at[col] < self.column_ttl:
+            return True
+        self._columns.pop(col)
+        self._origin.pop(col, None)
+        return False
+
+    def _fetch(self, columns, request_id, invalidations):
+        """
+        Reads the given columns with a single batch request and stores
+        them, unless a column was invalidated since the fetch started
+        """
+        ranges = [f"{self._col_letter(col)}:{self._col_letter(col)}"
+                  for col in columns]
+        try:
+            value_ranges = self.worksheet.batch_get(ranges)
+        except Exception:
+            # Leave these columns to be read directly when needed
+            value_ranges = []
+
+        with self._lock:
+            if self._invalidations != invalidations:
+                # Leave the columns to be read again when needed
+                value_ranges = []
+            for col, value_range in zip(columns, value_ranges):
+                # Match col_values, which returns "" for empty cells
+                self._columns[col] = [row[0] if row else ""
+                                      for row in value_range]
+                self._fetched_at[col] = time.monotonic()
+                self._origin[col] = request_id
+            for col in columns:
+                self._pending.pop(col).set()
+
+    def _col_letter(self, col):
+        """
+        Returns the column letter for a catalog or user column number
+        """
+        if col == self.user_col_number:
+            return self.user_col_letter
+        return CATALOG_COLUMNS[col]
+
+    def _load(self):
+        """
+        Loads transition counts saved by previous sessions
+        """
+        try:
+            with open(self.transitions_file, encoding="utf-8") as file:
+                return json.load(file).get("transitions", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """
+        Merges this sessions transitions and stats into the saved file,
+        re-reading it first so concurrent sessions do not lose counts
+        """
+        try:
+            with open(self.transitions_file, encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            saved = {}
+
+        transitions = saved.setdefault("transitions", {})
+        for previous, counts in self._session_transitions.items():
+            saved_counts = transitions.setdefault(previous, {})
+            for option, count in counts.items():
+                saved_counts[option] = saved_counts.get(option, 0) + count
+
+        totals = saved.setdefault("stats", {})
+        session_stats = self.stats()
+        for key in ("requests", "hits", "misses", "wasted"):
+            totals[key] = totals.get(key, 0) + session_stats[key]
+
+        temp_file = f"{self.transitions_file}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as file:
+                json.dump(saved, file)
+            os.replace(temp_file, self.transitions_file)
+        except OSError:
+            pass
+        self._session_transitions = {}
+
+
+def report(transitions_file=TRANSITIONS_FILE):
+    """
+    Returns the prefetch stats saved across all sessions
+
+    Parameters:
+        transitions_file (string): Path to persisted transition counts
+    Returns:
+        report (string): Requests made, hit rate and wasted requests
+    """
+    try:
+        with open(transitions_file, encoding="utf-8") as file:
+            totals = json.load(file).get("stats", {})
+    except (OSError, ValueError):
+        totals = {}
+
+    hits = totals.get("hits", 0)
+    lookups = hits + totals.get("misses", 0)
+    hit_rate = hits / lookups * 100 if lookups else 0
+    return (f"Prefetch requests: {totals.get('requests', 0)}, "
+            f"hit rate: {hit_rate:.0f}%, "
+            f"wasted requests: {totals.get('wasted', 0)}")
+
+
+if __name__ == "__main__":
+    print(report())
@@ -0,0 +1,88 @@
+"""Build step that prerenders the static frames of each screen for the
+default terminal width and writes them to the frames file"""
+import io
+import os
+from contextlib import redirect_stdout
+
+from terminal_metrics import DEFAULT_WIDTH
+
+# Render for the bridge pty size and keep colours when not writing to a tty
+os.environ["COLUMNS"] = str(DEFAULT_WIDTH)
+os.environ["FORCE_COLOR"] = "1"
+
+from data_store import IndexedFile  # noqa: E402
+from frames import (FRAME_BUILDERS, FRAMES_FILE, card_frame,  # noqa: E402
+                    card_frame_name)
+
+# Read only access is enough to get card names from the catalog
+SCOPE = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.readonly",
+]
+
+
+def capture(builder, *args):
+    """
+    Runs a frame builder and returns what it printed as utf-8 bytes
+
+    Parameters:
+        builder (func): Function that prints the frame
+        args: Arguments passed to the builder
+    Returns:
+        frame (bytes): Printed frame
+    """
+    buffer = io.BytesIO()
+    output = io.TextIOWrapper(buffer, encoding="utf-8", newline="\n")
+    with redirect_stdout(output):
+        builder(*args)
+    output.flush()
+    return buffer.getvalue()
+
+
+def load_card_names():
+    """
+    Reads card numbers and names from the catalog sheet
+
+    Parameters:
+        None
+    Returns:
+        cards (list): (card number, card name) pairs, empty if the
+            sheet could not be read
+    """
+    try:
+        import gspread
+        from google.oauth2.service_account import Credentials
+
+        creds = Credentials.from_service_account_file("creds.json")
+        client = gspread.authorize(creds.with_scopes(SCOPE))
+        worksheet = client.open("pokemon_portfolio").worksheet(
+            "base_set_shadowless")
+        card_names = worksheet.col_values(2)[1:]
+        card_nums = worksheet.col_values(4)[1:]
+    except Exception as err:
+        print(f"Skipping card frames, could not read catalog: {err}")
+        return []
+
+    return list(zip(card_nums, card_names))
+
+
+def main():
+    """
+    Prerender all static frames and card search frames
+    """
+    frames = {name: capture(builder)
+              for name, builder in FRAME_BUILDERS.items()}
+
+    for card_num, card_name in load_card_names():
+        frames[card_frame_name(card_num, card_name)] = capture(
+            card_frame, card_num, card_name)
+
+    IndexedFile.write(FRAMES_FILE,
+                      {name: (frame, {}) for name, frame in frames.items()})
+    print(f"Wrote {len(frames)} frames "
+          f"({sum(len(frame) for frame in frames.values())} bytes) "
+          f"to {FRAMES_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,42 @@
 # ------------------------- LIBRARY IMPORTS ---------------------------
+import atexit
 import os
-import re
+import signal
 import sys
 import time
+from functools import partial
 import gspread
-import pyfiglet as pyf
-import bcrypt
 from google.oauth2.service_account import Credentials
-from termcolor import colored
 from tabulate import tabulate
+from card_grid import catalog_cells, collection_fingerprint, fixed_widths
+from commands import (CARD_COUNT, MENU_OPTIONS, UPDATE_VALUES, CommandError,
+                      parse_card_list, parse_commands, summarise_results)
+from importer import iter_entries, summarise_import
+from exporter import EXPORT_FORMATS
+from portfolio_service import (PortfolioService, ServiceError,
+                               check_password_text, check_phone_num,
+                               check_username)
+from card_views import (cards_needed_pages, iter_card_chunks,
+                        iter_grid_rows, iter_matching_cells,
+                        page_lines_for_height, portfolio_pages,
+                        stream_first_page)
 from pokemon_ascii_art import print_pokemon
+from frames import show_card_screen, show_screen
+from display import (clear_below_frame, get_terminal_height,
+                     get_terminal_width, print_art_font, print_center_string,
+                     print_styled_msg)
+from bandwidth import (SCREEN_BYTE_BUDGET, SCREEN_BYTES_LOG, install_counter,
+                       start_screen)
+from compositor import install_compositor
+from terminal_metrics import watch_resize
+from background import (ActionCancelled, BackgroundWorksheet,
+                        install_typeahead, invalidate_when_done,
+                        run_in_background)
+from prefetch import MenuPrefetcher
+from login_throttle import LoginThrottle
+from session_tokens import (SECRET, TOKEN_SEQUENCE, issue_token,
+                            revoke_tokens, verify_token)
+from cli import run_cli
 
 # ---------------------------- API SETUP ------------------------------
 # Specify what parts of the google account the user has access to
@@ -44,6 +71,19 @@ except Exception as err:
           "please press the Run Program above to try again\n")
     sys.exit(1)
 
+# Throttles logins, the limits are shared with every other process. The
+# bridge passes the clients address as CONNECTION_ID so reconnecting does
+# not start a new connection bucket, the process id is used without it
+LOGIN_THROTTLE = LoginThrottle()
+CONNECTION_ID = os.environ.get("CONNECTION_ID", str(os.getpid()))
+
+# Portfolio and account operations, calls on the worksheets it opens run
+# off the UI thread with a spinner
+SERVICE = PortfolioService(
+    lambda name: BackgroundWorksheet(run_in_background(SHEET.worksheet,
+                                                       name)),
+    LOGIN_THROTTLE)
+
 
 # --------------------------- CLASSES -----------------------------
 class User:
@@ -55,6 +95,14 @@ class User:
             Represents column that stores user card collection
         col_letter (string):
             Letter to represent user column
+        prefetcher (MenuPrefetcher or None):
+            Warms worksheet columns while the main menu is shown
+        view_cache (dict):
+            Rendered collection views keyed by view name
+        queued_screens (list):
+            Screens left to show from a chain of commands
+        menu_messages (list):
+            (message, colour) pairs shown once below the main menu heading
     """
 
     def __init__(self, col_number, col_letter):
@@ -67,133 +115,254 @@ class User:
         """
         self.col_number = col_number
         self.col_letter = col_letter
+        self.prefetcher = None
+        self.view_cache = {}
+        self.queued_screens = []
+        self.menu_messages = []
 
-    def add_card(self):
+    def get_col_values(self, worksheet, col):
         """
-        Adds a card to users collection based on the card number
+        Returns the values in a worksheet column, using the prefetcher
+        when one is running for this user
 
         Parameters:
             self (object): An instance of the User class
+            worksheet (object): Worksheet to read from
+            col (int): Column number to read
         Returns:
-            None
+            values (list): All values in the column, including heading
         """
+        if self.prefetcher:
+            return self.prefetcher.col_values(col)
+        return worksheet.col_values(col)
 
-        clear_terminal()
-        print_art_font("               Add  a  card", "big", "yellow")
-        print_pokemon("19")
-        print("\n")
+    def menu_screen(self):
+        """
+        Returns the main menu screen for this user, or the next screen
+        queued by a chain of commands
 
-        # Get card number from user and validate
-        while True:
-            card_num_selection = input(
-                "\nEnter the card number (1-102) that you "
-                "would like to add: \n"
-            )
+        Parameters:
+            self (object): An instance of the User class
+        Returns:
+            screen (func): Main menu screen for this user
+        """
+        if self.queued_screens:
+            return self.queued_screens.pop(0)
+        return partial(main_menu, self)
 
-            validated_card_num = validate_selection(
-                card_num_selection, list(range(1, 103))
-            )
+    def invalidate_user_column(self):
+        """
+        Drops any prefetched copy of the users column and any views
+        rendered from it after it is updated
 
-            if validated_card_num:
-                break
+        Parameters:
+            self (object): An instance of the User class
+        Returns:
+            None
+        """
+        self.view_cache.clear()
+        if self.prefetcher:
+            self.prefetcher.invalidate(self.col_number)
 
-        bss_worksheet = open_worksheet("base_set_shadowless")
-        # Exit if we had an API error
-        if not bss_worksheet:
-            return
+    def cached_view(self, name, fingerprint, render):
+        """
+        Returns a collection view, only building it again if the collection
+        fingerprint or terminal size has changed since it was cached
 
-        # Set card row adding 1 to account for headings
-        card_row = str(validated_card_num + 1)
+        Parameters:
+            self (object): An instance of the User class
+            name (string): View name
+            fingerprint (bytes): Fingerprint of the collection shown
+            render (func): Builds the view when it is not cached
+        Returns:
+            view (object): Cached view
+        """
+        key = (fingerprint, get_terminal_width(), get_terminal_height())
+        cached = self.view_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, render())
+            self.view_cache[name] = cached
+        return cached[1]
+
+    def show_collection_view(self, frame_name, worksheet, build_pages,
+                             value):
+        """
+        Shows the cards a user has or is missing. If the columns have
+        not been prefetched the first page is streamed, each grid row is
+        printed as soon as the chunk of the sheet holding it is read
 
-        try:
-            # Check if card is not in collection (== "No") and ad it
-            if bss_worksheet.cell(card_row, self.col_number).value == "No":
-                bss_worksheet.update_cell(card_row, self.col_number, "Yes")
+        Parameters:
+            self (object): An instance of the User class
+            frame_name (string): Frame shown above the view
+            worksheet (object): Base set worksheet
+            build_pages (func): Builds the pages of the view
+            value (string): "Yes" for owned cards, "No" for missing cards
+        Returns:
+            screen (func): Next screen to display
+        """
+        widths = fixed_widths(get_terminal_width())
+        page_lines = page_lines_for_height(get_terminal_height())
+
+        streamed = not (self.prefetcher and self.prefetcher.has_columns(
+            2, 4, self.col_number))
+        if streamed:
+            card_nums, card_names, user_cards = [], [], []
+            stream_first_page(iter_grid_rows(iter_matching_cells(
+                iter_card_chunks(worksheet, self.col_letter), value,
+                (card_nums, card_names, user_cards))), widths, page_lines)
+        else:
+            # Get pokemon card names, numbers and user cards -
+            # (Yes/No's to indicate which cards are in their collection)
+            card_names = self.get_col_values(worksheet, 2)[1:]
+            user_cards = self.get_col_values(worksheet, self.col_number)[1:]
+            card_nums = self.get_col_values(worksheet, 4)[1:]
 
-                cardname = bss_worksheet.cell(card_row, 2).value
-                clear_terminal()
-                print_styled_msg(f"You have successfully added {cardname}, "
-                                 f"card No.{validated_card_num}\n", "green")
+        card_cells = catalog_cells(tuple(card_nums), tuple(card_names))
 
-                print_pokemon(str(validated_card_num))
+        # Only split the view into pages again if the collection changed
+        fingerprint = collection_fingerprint(card_cells, user_cards)
+        pages = self.cached_view(frame_name, fingerprint, partial(
+            build_pages, card_cells, user_cards, widths, page_lines))
 
-                select_from_avail_options(
-                    self.add_card, "Add another card", True)
+        return self.show_card_pages(frame_name, pages, streamed)
 
-            else:
-                print_styled_msg("This card is already in your collection\n",
-                                 "red")
+    def show_card_pages(self, frame_name, pages, grid_shown=False):
+        """
+        Shows a collection view a page at a time, the user can move to
+        the next or previous page or jump to a page number
 
-                select_from_avail_options(
-                    self.add_card, "Add another card", True)
+        Parameters:
+            self (object): An instance of the User class
+            frame_name (string): Frame shown above each page
+            pages (CardPages): Pages of the view
+            grid_shown (boolean): Flag set if the first pages grid
+                has already been streamed
+        Returns:
+            screen (func): Next screen to display
+        """
+        page = 1
+        error = ""
+        while True:
+            if grid_shown:
+                print(pages.render_below_grid(page))
+                grid_shown = False
+            else:
+                print(pages.render_page(page))
+            if error:
+                print_styled_msg(error, "red")
+
+            if pages.num_pages == 1:
+                input("Press enter to return to main menu\n")
+                return self.menu_screen()
+
+            choice = input("Enter a page number, n for next, p for previous "
+                           "or press enter for the main menu\n")
+            choice = choice.strip().lower()
+            if not choice:
+                return self.menu_screen()
+
+            error = ""
+            if choice == "n":
+                page = min(page + 1, pages.num_pages)
+            elif choice == "p":
+                page = max(page - 1, 1)
+            elif choice.isdigit() and 1 <= int(choice) <= pages.num_pages:
+                page = int(choice)
+            else:
+                error = (f"Please enter a page number from 1 to "
+                         f"{pages.num_pages}, n or p")
+            show_screen(frame_name)
 
-        except Exception as e:
-            print_styled_msg(f"Error: {e}, "
-                             "please try again, later\n", "red")
-            select_from_avail_options(self.add_card, "Add another card", True)
+    def update_cards(self, commands):
+        """
+        Applies the adds and removes in a list of commands to the users
+        column, writing every changed cell with a single batch_update
 
-    def remove_card(self):
+        Parameters:
+            self (object): An instance of the User class
+            commands (list): (name, card_nums) for each command
+        Returns:
+            (results, card_names) (tuple): Results from plan_updates and
+                the name of each card
         """
-        Allows a user to remove a card from their collection
-        based on the card number
+        try:
+            result = SERVICE.apply_commands(self.col_letter, commands)
+        except BaseException as e:
+            # Cancelling only stops the wait, the write may still land
+            invalidate_when_done(e, self.invalidate_user_column)
+            raise
+        if result["updates"]:
+            self.invalidate_user_column()
+        return result["results"], result["card_names"]
+
+    def change_cards(self, name, card_nums, rejected):
+        """
+        Adds or removes the selected cards and shows which cards were
+        changed, which were skipped and which entries were rejected
 
         Parameters:
             self (object): An instance of the User class
+            name (string): "add" or "remove"
+            card_nums (list): Card numbers selected
+            rejected (list): Entries that were not valid cards
         Returns:
             None
         """
+        try:
+            results, card_names = self.update_cards([(name, card_nums)])
 
-        clear_terminal()
-        print_art_font("       Remove  a  Card", "big", "yellow")
-        print_pokemon("28")
-        print("\n")
+            clear_below_frame()
+            for message, colour in summarise_results(
+                    results, card_names, rejected):
+                print_styled_msg(message, colour)
 
-        while True:
-            card_num_selection = input(
-                "\nEnter the card number (1-102) that "
-                "you would like to remove: \n"
-            )
+            # Show the pokemon when a single card was changed
+            changed = [card_num for _, card_num, was_changed in results
+                       if was_changed]
+            if len(changed) == 1:
+                print_pokemon(str(changed[0]))
 
-            validated_card_num = validate_selection(
-                card_num_selection, list(range(1, 103))
-            )
-            if validated_card_num:
-                break
+        except Exception as e:
+            print_styled_msg(f"Error: {e}, "
+                             "please try again, later\n", "red")
 
-        bss_worksheet = open_worksheet("base_set_shadowless")
-        # Exit if we had an API error
-        if not bss_worksheet:
-            return
+    def add_card(self):
+        """
+        Adds cards to users collection based on the card numbers,
+        lists and ranges such as 1-16, 23 can be entered
 
-        # Set card row adding 1 to account for headings
-        card_row = str(validated_card_num + 1)
+        Parameters:
+            self (object): An instance of the User class
+        Returns:
+            screen (func): Next screen to display
+        """
 
-        try:
-            # Check if card is card is in collection (== "Yes") and remove it
-            if bss_worksheet.cell(card_row, self.col_number).value == "Yes":
-                bss_worksheet.update_cell(card_row, self.col_number, "No")
+        show_screen("add_card")
 
-                cardname = bss_worksheet.cell(card_row, 2).value
-                clear_terminal()
-                print_styled_msg(f"You have successfully removed {cardname}, "
-                                 f"card No.{validated_card_num}\n", "green")
+        card_nums, rejected = get_valid_card_numbers("add")
+        self.change_cards("add", card_nums, rejected)
 
-                print_pokemon(str(validated_card_num))
+        return select_from_avail_options(
+            self.add_card, "Add another card", self.menu_screen)
 
-                select_from_avail_options(
-                    self.remove_card, "Remove another card", True)
+    def remove_card(self):
+        """
+        Allows a user to remove cards from their collection
+        based on the card numbers, lists and ranges can be entered
 
-            else:
-                print_styled_msg(
-                    "You do not have this card in your collection\n", "red")
+        Parameters:
+            self (object): An instance of the User class
+        Returns:
+            screen (func): Next screen to display
+        """
 
-                select_from_avail_options(
-                    self.remove_card, "Remove another card", True)
-        except Exception as e:
-            print_styled_msg(f"Error: {e}, "
-                             "please try again, later\n", "red")
-            select_from_avail_options(
-                self.remove_card, "Remove another card", True)
+        show_screen("remove_card")
+
+        card_nums, rejected = get_valid_card_numbers("remove")
+        self.change_cards("remove", card_nums, rejected)
+
+        return select_from_avail_options(
+            self.remove_card, "Remove another card", self.menu_screen)
 
     def view_portfolio(self):
         """
@@ -202,57 +371,18 @@ class User:
         Parameters:
             self (object): An instance of the User class
         Returns:
-            None
+            screen (func): Next screen to display
         """
 
-        clear_terminal()
-        print_art_font("       Your  Portfolio", "big", "yellow")
-        print("")
+        show_screen("view_portfolio")
 
         bss_worksheet = open_worksheet("base_set_shadowless")
         # Exit if we had an API error
         if not bss_worksheet:
-            return
-
-        # Get pokemon card names, numbers and user cards -
-        # (Yes/No's to indicate which cards are in their collection)
-        card_names = bss_worksheet.col_values(2)[1:]
-        user_cards = bss_worksheet.col_values(self.col_number)[1:]
-        card_nums = bss_worksheet.col_values(4)[1:]
-
-        # Generate a list of pokemon cards in the users collection
-        user_collection = []
-        for card, card_num, name in zip(user_cards, card_nums, card_names):
-            if card == "Yes":
-                card_string = f"B{card_num}:{name}"
-                user_collection.append(card_string)
-
-        # Check if we have cards to display
-        num_cards_collected = len(user_collection)
-        if num_cards_collected > 0:
-            # Structure list of cards for display in 3 columns
-            user_coll_columns = []
-            num_cols = 4
-            for i in range(0, len(user_collection), num_cols):
-                column = user_collection[i:i + num_cols]
-                user_coll_columns.append(column)
-
-            print(tabulate(user_coll_columns, tablefmt="fancy_grid"))
-
-            # Check how many cards we show and display % complete
-            percentage = round((num_cards_collected / len(card_nums) * 100))
-            if percentage == 100:
-                print_styled_msg(f"Congratulation your set is {percentage}%"
-                                 " complete\n", "green")
-            else:
-                print_styled_msg(f"You have collected {percentage}%, "
-                                 "of available cards in this set\n", "green")
-        else:
-            print("")
-            print_styled_msg(
-                "You do not have any cards in you collection\n", "red")
+            return self.menu_screen()
 
-        input("Press enter to return to main menu\n")
+        return self.show_collection_view("view_portfolio", bss_worksheet,
+                                         portfolio_pages, "Yes")
 
     def view_cards_needed(self):
         """
@@ -261,53 +391,18 @@ class User:
         Parameters:
             self (object): An instance of the User class
         Returns:
-            None
+            screen (func): Next screen to display
         """
 
-        clear_terminal()
-        print_art_font("         Cards  Needed", "big", "yellow")
-        print("")
+        show_screen("cards_needed")
 
         bss_worksheet = open_worksheet("base_set_shadowless")
         # Exit if we had an API error
         if not bss_worksheet:
-            return
-
-        # Get pokemon card names, numbers and user cards -
-        # (Yes/No's to indicate which cards are in their collection)
-        card_names = bss_worksheet.col_values(2)[1:]
-        user_cards = bss_worksheet.col_values(self.col_number)[1:]
-        card_nums = bss_worksheet.col_values(4)[1:]
-
-        # Generate a list of pokemon cards not in the users collection
-        user_missing_cards = []
-        for card, card_num, name in zip(user_cards, card_nums, card_names):
-            if card == "No":
-                card_string = f"B{card_num}:{name}"
-                user_missing_cards.append(card_string)
-
-        # Check if we have cards to display
-        num_cards_missing = len(user_missing_cards)
-        if num_cards_missing > 0:
-            # Structure list of cards for display in 3 columns
-            user_coll_columns = []
-            num_cols = 4
-            for i in range(0, len(user_missing_cards), num_cols):
-                column = user_missing_cards[i:i + num_cols]
-                user_coll_columns.append(column)
-
-            print(tabulate(user_coll_columns, tablefmt="fancy_grid"))
-
-            # Check how many cards we show and display % complete
-            percentage = round((num_cards_missing / len(card_nums) * 100))
-            print_styled_msg(f"You are missing {percentage}%, "
-                             "of available cards in this set\n", "red")
-        else:
-            print("")
-            print_styled_msg("Your collection is 100% complete, "
-                             "CONGRATULATIONS\n", "green")
+            return self.menu_screen()
 
-        input("Press enter to return to main menu\n")
+        return self.show_collection_view("cards_needed", bss_worksheet,
+                                         cards_needed_pages, "No")
 
     def appraise_portfolio(self):
         """
@@ -316,32 +411,18 @@ class User:
         Parameters:
             self (object): An instance of the User class
         Returns:
-            None
+            screen (func): Next screen to display
         """
 
-        clear_terminal()
-        print_art_font("      Portfolio  Value", "big", "yellow")
+        show_screen("portfolio_value")
 
-        bss_worksheet = open_worksheet("base_set_shadowless")
-        # Exit if we had an API error
-        if not bss_worksheet:
-            return
-
-        # Get pokemon card values and user cards -
-        # (Yes/No's to indicate which cards are in their collection)
-        card_values = bss_worksheet.col_values(5)[1:]
-        user_cards = bss_worksheet.col_values(self.col_number)[1:]
-
-        # Sum the values of the cards the user
-        # using a generator expression and sum function
-        portfolio_value = round(
-            sum(
-                float(card_value)
-                for card, card_value in zip(user_cards, card_values)
-                if card == "Yes"
-            ),
-            2,
-        )
+        try:
+            portfolio_value = SERVICE.appraise(self.col_letter)["value"]
+        except Exception as e:
+            print_styled_msg(f"Error: {e}, "
+                             "please try again, later\n", "red")
+            input("Press enter to return to main menu\n")
+            return self.menu_screen()
 
         print_pokemon("51")
         print_styled_msg(f"Your pokemon portfolio value is, "
@@ -355,6 +436,7 @@ class User:
                              "in your portfolio\n", "red")
 
         input("Press enter to return to main menu\n")
+        return self.menu_screen()
 
     def delete_portfolio(self):
 
@@ -364,25 +446,27 @@ class User:
         Parameters:
             self (object): An instance of the User class
         Returns:
-            None
+            screen (func): Next screen to display
         """
 
         # Add No to all cells in user column
-        bss_worksheet = open_worksheet("base_set_shadowless")
-        # Exit if we had an API error
-        if not bss_worksheet:
-            return
-        update_values = [["No"] for i in range(102)]
-        range_to_update = f"{self.col_letter}2:{self.col_letter}103"
-        bss_worksheet.update(range_to_update, update_values)
+        try:
+            SERVICE.delete_portfolio(self.col_letter)
+        except BaseException as e:
+            # Cancelling only stops the wait, the write may still land
+            invalidate_when_done(e, self.invalidate_user_column)
+            if not isinstance(e, Exception):
+                raise
+            print_styled_msg(f"Error: {e}, "
+                             "please try again, later\n", "red")
+            input("Press enter to return to main menu\n")
+            return self.menu_screen()
+        self.invalidate_user_column()
 
-        clear_terminal()
-        print_art_font("     Portfolio Deleted", "big", "yellow")
-        print_pokemon("50")
-        print_styled_msg("Your Portfolio has been successfully deleted\n",
-                         "green")
+        show_screen("portfolio_deleted")
 
         input("Press enter to return to main menu\n")
+        return self.menu_screen()
 
     def card_search(self):
         """
@@ -392,11 +476,9 @@ class User:
         Parameters:
             self (object): An instance of the User class
         Returns:
-            None
+            screen (func): Next screen to display
         """
-        clear_terminal()
-        print_art_font("             Card  search", "big", "yellow")
-        print_pokemon("35")
+        show_screen("card_search")
 
         # Get card number from user and validate
         while True:
@@ -412,47 +494,241 @@ class User:
             if validated_card_num:
                 break
         print_center_string("Loading card details....\n")
-        bss_worksheet = open_worksheet("base_set_shadowless")
-        # Exit if we had an API error
-        if not bss_worksheet:
-            return
+        sys.stdout.flush()
+        self.show_card_details(validated_card_num)
+
+        return select_from_avail_options(
+            self.card_search, "Search again", self.menu_screen)
 
-        # Get all the cards details
-        card_row = validated_card_num + 1
+    def show_card_details(self, card_number):
+        """
+        Shows a cards image and details, used by card search and by
+        search commands chained at the main menu
 
+        Parameters:
+            self (object): An instance of the User class
+            card_number (int): Card number to show
+        Returns:
+            shown (boolean): False if an error was shown instead
+        """
         try:
-            card_details = bss_worksheet.row_values(card_row)[1:6]
-            card_name = card_details[0]
-            card_rarity = card_details[1]
-            card_num = card_details[2]
-            card_price = card_details[3]
-            card_in_collection = card_details[4]
+            card = SERVICE.search(card_number, self.col_letter)
+            card_num = str(card["number"])
+            card_name = card["name"]
 
             # Store details in a dictionary in a list for use with tabulate
             card_details_formatted = [
                 {
-                    "Card No.": "BS" + str(card_num),
+                    "Card No.": "BS" + card_num,
                     "Card Name": card_name,
-                    "Card Rarity": card_rarity,
-                    "Card Price": "$" + card_price,
-                    "In collection": card_in_collection
+                    "Card Rarity": card["rarity"],
+                    "Card Price": f"${card['price'] or ''}",
+                    "In collection": "Yes" if card["owned"] else "No"
                 }
             ]
 
             # Display card image and details
-            clear_terminal()
-            print_art_font(f"{card_name}", "small", "yellow")
-            print_pokemon(f"{card_num}")
+            show_card_screen(card_num, card_name)
             print(tabulate(
                 card_details_formatted, headers="keys", tablefmt="github"))
 
             input("Press enter to continue\n")
-            select_from_avail_options(self.card_search, "Search again", True)
 
         except Exception as e:
             print_styled_msg(f"Error: {e}, "
                              "please try again, later\n", "red")
-            select_from_avail_options(self.card_search, "Search again", True)
+            return False
+        return True
+
+    def import_collection(self):
+        """
+        Imports cards from a CSV or JSON file of card numbers or names,
+        or from lines pasted into the terminal. The file is streamed an
+        entry at a time and only the cells that change are written.
+
+        Parameters:
+            self (object): An instance of the User class
+        Returns:
+            screen (func): Next screen to display
+        """
+        show_screen("import_cards")
+
+        print_styled_msg("Import card numbers or names from a CSV or JSON "
+                         "file\n", "white")
+        path = input("Enter the path of the file, or press enter to paste "
+                     "cards in,\nending with an empty line: \n").strip()
+
+        try:
+            lines = (open(path, newline="", encoding="utf-8-sig") if path
+                     else iter(partial(input, ""), ""))
+        except OSError as e:
+            print_styled_msg(f"Could not open {path}: {e.strerror}, "
+                             "please try again\n", "red")
+            return select_from_avail_options(
+                self.import_collection, "Import again", self.menu_screen)
+
+        try:
+            mode = get_valid_option([
+                "Add the cards to your portfolio",
+                "Make your portfolio match the cards, removing any others"])
+
+            def show_read(count):
+                sys.stdout.write(f"\rRead {count} entries ....\x1b[K")
+                sys.stdout.flush()
+
+            def show_write(number, total):
+                sys.stdout.write("\r\x1b[K")
+                print_center_string(f"Saving changes {number} of {total} "
+                                    "....\n")
+                sys.stdout.flush()
+
+            if not path:
+                print_styled_msg("Paste or type the cards below\n", "white")
+            try:
+                plan = SERVICE.import_cards(
+                    self.col_letter, iter_entries(lines, path),
+                    replace=mode == 2, progress=show_read if path else None,
+                    write_progress=show_write)
+            except BaseException as e:
+                # Cancelling only stops the wait, the write may still land
+                invalidate_when_done(e, self.invalidate_user_column)
+                raise
+            if path:
+                sys.stdout.write("\r\x1b[K")
+
+            if plan["updates"]:
+                self.invalidate_user_column()
+
+            clear_below_frame()
+            for message, colour in summarise_import(plan):
+                print_styled_msg(message, colour)
+
+        except ValueError as e:
+            print_styled_msg(f"Could not read {path}: {e}, "
+                             "please try again\n", "red")
+        except Exception as e:
+            print_styled_msg(f"Error: {e}, "
+                             "please try again, later\n", "red")
+        finally:
+            if path:
+                lines.close()
+
+        return select_from_avail_options(
+            self.import_collection, "Import more cards", self.menu_screen)
+
+    def export_collection(self):
+        """
+        Exports the users portfolio or the card catalog as CSV, JSON Lines
+        or the columnar format, to a file or shown in the terminal. The
+        sheet is read with one request and the export written as it is
+        made.
+
+        Parameters:
+            self (object): An instance of the User class
+        Returns:
+            screen (func): Next screen to display
+        """
+        show_screen("export_cards")
+
+        print_styled_msg("What would you like to export?\n", "white")
+        portfolio = get_valid_option(["Your portfolio",
+                                      "The card catalog"]) == 1
+        print_styled_msg("Which format would you like?\n", "white")
+        export_format = list(EXPORT_FORMATS)[get_valid_option([
+            "CSV", "JSON Lines", "Columnar (binary, to a file only)"]) - 1]
+
+        while True:
+            path = input("Enter a file path to save to, or press enter to "
+                         "show it here: \n").strip()
+            if path or export_format != "columnar":
+                break
+            print_styled_msg("The columnar format can only be saved to a "
+                             "file, please enter a path\n", "red")
+
+        what = "portfolio" if portfolio else "catalog"
+        try:
+            if path:
+                with open(path, "wb") as file:
+                    count, size = SERVICE.export(what, export_format, file,
+                                                 self.col_letter)
+                print_styled_msg(f"Exported {count} cards to {path}, "
+                                 f"{size} bytes\n", "green")
+            else:
+                clear_below_frame()
+                sys.stdout.flush()
+                count, size = SERVICE.export(what, export_format,
+                                             sys.stdout.buffer,
+                                             self.col_letter)
+                print()
+                print_styled_msg(f"Exported {count} cards\n", "green")
+
+        except OSError as e:
+            print_styled_msg(f"Could not save to {path}: {e.strerror}, "
+                             "please try again\n", "red")
+        except Exception as e:
+            print_styled_msg(f"Error: {e}, "
+                             "please try again, later\n", "red")
+
+        return select_from_avail_options(
+            self.export_collection, "Export again", self.menu_screen)
+
+    def search_card_screen(self, card_number):
+        """
+        Shows a card searched for in a chain of commands
+
+        Parameters:
+            self (object): An instance of the User class
+            card_number (int): Card number to show
+        Returns:
+            screen (func): Next screen to display
+        """
+        show_screen("card_search")
+        print_center_string("Loading card details....\n")
+        sys.stdout.flush()
+        if not self.show_card_details(card_number):
+            input("Press enter to continue\n")
+        return self.menu_screen()
+
+    def run_commands(self, commands):
+        """
+        Runs a chain of commands entered at the main menu. Every add and
+        remove is written to the sheet in one batch, then the views,
+        searches and log out are shown in the order they were entered
+
+        Parameters:
+            self (object): An instance of the User class
+            commands (list): (name, card_nums) for each command
+        Returns:
+            screen (func): Next screen to display
+        """
+        if any(name in UPDATE_VALUES for name, card_nums in commands):
+            print_center_string("Updating your collection ....\n")
+            sys.stdout.flush()
+            try:
+                results, card_names = self.update_cards(commands)
+                # Shown when the main menu is drawn again
+                self.menu_messages = summarise_results(results, card_names)
+            except Exception as e:
+                # Skip the rest of the chain, it may rely on the updates
+                self.menu_messages = [(f"Error: {e}, "
+                                       "please try again, later\n", "red")]
+                return self.menu_screen()
+
+        screens = {
+            "view": [self.view_portfolio],
+            "needed": [self.view_cards_needed],
+            "appraise": [self.appraise_portfolio],
+            "logout": [partial(log_out, self)],
+            "import": [self.import_collection],
+            "export": [self.export_collection],
+        }
+        for name, card_nums in commands:
+            if name == "search":
+                self.queued_screens += [partial(self.search_card_screen, num)
+                                        for num in card_nums]
+            else:
+                self.queued_screens += screens.get(name, [])
+        return self.menu_screen()
 
 
 # --------------------- APP LOGIC FUNCTIONS -----------------------
@@ -465,33 +741,22 @@ def display_welcome_banner():
     Parameters:
         None
     Returns:
-        None
+        screen (func): Next screen to display
     """
-    clear_terminal()
-
-    print_art_font("Pokemon Portfolio", "big", "yellow")
-    print()
-    print_center_string(
-        colored(
-            "Manage and appraise your base set pokemon"
-            " card collection", "yellow"
-        )
-    )
-
-    print_pokemon("pikachu_banner")
+    show_screen("welcome")
 
-    login_options()
+    return login_options
 
 
 def login_options():
     """
     Displays the login options to user.
-    Takes user selection, validates and calls appropriate function.
+    Takes user selection, validates and returns the selected screen.
 
     Parameters:
         None
     Returns:
-        None
+        screen (func): Next screen to display
     """
     while True:
         print_styled_msg("Please select an option (1-3) from the list "
@@ -507,14 +772,11 @@ def login_options():
             login_selection, list(range(1, 4)))
 
         if validated_selection == 1:
-            account_login()
-            break
+            return account_login
         elif validated_selection == 2:
-            create_account()
-            break
+            return create_account
         elif validated_selection == 3:
-            reset_password()
-            break
+            return reset_password
 
 
 def account_login():
@@ -525,64 +787,61 @@ def account_login():
     Parameters:
         None
     Returns:
-        None
+        screen (func): Next screen to display
     """
 
-    clear_terminal()
-    print_art_font("       Account  Login", "big", "yellow")
-    print_pokemon("10")
-
-    print_styled_msg("Please enter your username and password below to login "
-                     "(both are case sensitive)", "white")
+    show_screen("account_login")
 
     username = get_valid_username(False)
+
+    # Limit attempts before doing any lookups or password checks
+    wait = LOGIN_THROTTLE.attempt(username, CONNECTION_ID)
+    if wait:
+        print_styled_msg("Too many login attempts, please wait "
+                         f"{int(wait) + 1} seconds and try again\n", "red")
+        return select_from_avail_options(account_login, "Try again")
+
     checked_username = check_username_in_use(username)
 
     if checked_username == 1:
-        password_attempt = get_valid_password(False)
+        password_attempt = get_valid_password()
 
         print_center_string("Logging in ....\n")
+        sys.stdout.flush()
 
-        login_worksheet = open_worksheet("login")
-        bss_worksheet = open_worksheet("base_set_shadowless")
-        # Exit if we had an API error
-        if not (login_worksheet and bss_worksheet):
-            display_welcome_banner()
-
-        # Find the row their username is on and
-        # return the corresponding password
-        username_found = login_worksheet.find(username, in_column=1)
-        row_num = username_found.row
-        stored_hashed_pass = login_worksheet.cell(row_num, 2).value
-
-        # Slice the b'' from the stored pass and
-        # change type from string to bytes for comparison
-        stored_hashed_pass = stored_hashed_pass[2:-1].encode("utf-8")
-        password_attempt_bytes = password_attempt.encode()
-
-        # Check if password entered matches
-        if bcrypt.checkpw(password_attempt_bytes, stored_hashed_pass):
-            print_styled_msg("Login Successful\n", "green")
-
-            # Get the users col number/letter and
-            # create a user using this value
-            username_found_bss = bss_worksheet.find(username, in_row=1)
-            user_col_num = username_found_bss.col
-            user_col_letter = bss_worksheet.cell(104, user_col_num).value
-            print(user_col_letter)
-            human_user = User(user_col_num, user_col_letter)
-            main_menu(human_user)
-        else:
-            print_styled_msg("Login failed, password incorrect\n", "red")
-            select_from_avail_options(account_login, "Try again")
+        # Check the password, if every verification slot is busy or the
+        # password is wrong, ask the user to retry rather than queueing
+        try:
+            account = SERVICE.login(username, password_attempt)
+        except ServiceError as e:
+            print_styled_msg(f"{e}\n", "red")
+            return select_from_avail_options(account_login, "Try again")
+        except Exception as e:
+            print_styled_msg(f"An error occurred: {e}, "
+                             "please try again, Loading ..\n", "red")
+            sys.stdout.flush()
+            time.sleep(3)
+            return display_welcome_banner
+
+        print_styled_msg("Login Successful\n", "green")
+
+        # Create a user using the users col number/letter
+        user_col_num = account["col_number"]
+        user_col_letter = account["col_letter"]
+        print(user_col_letter)
+        human_user = User(user_col_num, user_col_letter)
+
+        # Let the bridge resume this session if the socket reconnects
+        send_resume_token(issue_token(user_col_num, user_col_letter))
+        return human_user.menu_screen()
 
     elif checked_username == 0:
         print_styled_msg("The username entered is not associated "
                          "with an account\n", "red")
 
-        select_from_avail_options(account_login, "Try again")
+        return select_from_avail_options(account_login, "Try again")
     else:
-        display_welcome_banner()
+        return display_welcome_banner
 
 
 def create_account():
@@ -596,67 +855,42 @@ def create_account():
     Parameters:
         None
     Returns:
-        None
+        screen (func): Next screen to display
     """
-    clear_terminal()
-    print_art_font(" Account Creation", "big", "yellow")
-    print_pokemon("44")
-
-    print("")
-    print_styled_msg("Please follow the steps below to create an account\n",
-                     "white")
+    show_screen("create_account")
 
     # Get new user details, if API err, return to home
     username = get_valid_username()
     if username == 1:
-        display_welcome_banner()
+        return display_welcome_banner
 
     print_styled_msg("Username available\n", "green")
     password = get_valid_password()
 
     phone_num = get_valid_phone_num()
     if phone_num == 1:
-        display_welcome_banner()
+        return display_welcome_banner
 
     print_center_string("Creating Account ....\n")
+    sys.stdout.flush()
 
-    login_worksheet = open_worksheet("login")
-    bss_worksheet = open_worksheet("base_set_shadowless")
-    # Exit if we had an API error
-    if not (login_worksheet and bss_worksheet):
-        display_welcome_banner()
-
-    # Store user account details
-    account_details = [username, password, phone_num]
-    login_worksheet.append_row(account_details)
-
-    # Assign the user the next available column in
-    # base_set_shadowless sheet and add his username
-    next_avail_column = bss_worksheet.acell("A2").value
-    bss_worksheet.update_acell(next_avail_column + "1", username)
-
-    # Add empty collection ("No's")
-    update_values = [["No"] for i in range(102)]
-    range_to_update = f"{next_avail_column}2:{next_avail_column}103"
-
-    bss_worksheet.update(range_to_update, update_values)
-
-    # Save the column letter assigned to that account as a letter
-    # for use when creating a user object
-    bss_worksheet.update_acell(next_avail_column + "104", next_avail_column)
-
-    # Increment the next_avail_column stored in gsheets, and add a new column
-    # to ensure were always ready and have a column for next account creation
-    bss_worksheet.update_acell(
-        "A2", increment_gsheet_column_value(next_avail_column))
-    add_column_to_sheet("base_set_shadowless")
-
-    clear_terminal()
-    print_styled_msg("Account created successfully\n", "green")
+    # Store the account and assign the user the next available column
+    try:
+        SERVICE.create_account(username, password, phone_num)
+    except ServiceError as e:
+        print_styled_msg(f"{e}, please try again\n", "red")
+        return select_from_avail_options(create_account,
+                                         "Create another account")
+    except Exception as e:
+        print_styled_msg(f"An error occurred: {e}, "
+                         "please try again, Loading ..\n", "red")
+        sys.stdout.flush()
+        time.sleep(3)
+        return display_welcome_banner
 
-    print_pokemon("5")
+    show_screen("account_created")
 
-    select_from_avail_options(create_account, "Create another account")
+    return select_from_avail_options(create_account, "Create another account")
 
 
 def reset_password():
@@ -666,40 +900,29 @@ def reset_password():
     Parameters:
         None
     Returns:
-        None
+        screen (func): Next screen to display
     """
-    clear_terminal()
-
-    print_art_font("      Password  Reset", "big", "yellow")
-    print_pokemon("63")
-
-    print("")
-    print_styled_msg(
-        "Please follow the steps below to reset your password\n", "white")
+    show_screen("reset_password")
 
     phone_num = get_valid_phone_num(False)
     print_center_string("Checking for account ....\n")
+    sys.stdout.flush()
 
     checked_phone_num = check_phone_num_in_use(phone_num)
     if checked_phone_num == 1:  # Not in use
-        login_worksheet = open_worksheet("login")
-        # Exit if we had an API error
-        if not (login_worksheet):
-            display_welcome_banner()
-
-        # Find the row their phone number is on and
-        # return the corresponding username
-        phone_num_found = login_worksheet.find(phone_num, in_column=3)
-        row_num = phone_num_found.row
-        username = login_worksheet.cell(row_num, 1).value
-
-        print_styled_msg(f"Account found, username is {username}\n", "green")
-
-        # Get and store new password
-        hashed_password = get_valid_password()
+        try:
+            username = SERVICE.username_for_phone_num(phone_num)
+            print_styled_msg(f"Account found, username is {username}\n",
+                             "green")
 
-        # Write users new hashed pass
-        login_worksheet.update_acell("B" + str(row_num), hashed_password)
+            # Get and store new password
+            SERVICE.set_password(username, get_valid_password())
+        except Exception as e:
+            print_styled_msg(f"An error occurred: {e}, "
+                             "please try again, Loading ..\n", "red")
+            sys.stdout.flush()
+            time.sleep(3)
+            return display_welcome_banner
 
         print("")
         print_styled_msg("Password has been reset\n", "green")
@@ -708,10 +931,10 @@ def reset_password():
         print_styled_msg("The phone number entered is not associated "
                          "with an account\n", "red")
     else:
-        display_welcome_banner()
+        return display_welcome_banner
 
     # Return to login menu or try again
-    select_from_avail_options(reset_password, "Reset password again")
+    return select_from_avail_options(reset_password, "Reset password again")
 
 
 def main_menu(human_user):
@@ -722,100 +945,172 @@ def main_menu(human_user):
         human_user (object of User class):
             The logged in user that is using the app
     Returns:
-        None
+        screen (func): Next screen to display
     """
+    # Warm the columns the user is likely to need while they read the menu
+    if not human_user.prefetcher:
+        bss_worksheet = open_worksheet("base_set_shadowless")
+        if bss_worksheet:
+            human_user.prefetcher = MenuPrefetcher(
+                bss_worksheet, human_user.col_number, human_user.col_letter)
+            # Most sessions end by closing the browser rather than
+            # logging out, the stats are saved either way
+            atexit.register(human_user.prefetcher.close)
+
+    show_screen("main_menu")
+
+    # Screens left over from a cancelled chain of commands are dropped
+    human_user.queued_screens.clear()
+    for message, colour in human_user.menu_messages:
+        print_styled_msg(message, colour)
+    human_user.menu_messages = []
+
+    if human_user.prefetcher:
+        human_user.prefetcher.warm()
+
     while True:
-        clear_terminal()
-        print_art_font("                Main  Menu", "big", "yellow")
-        print_pokemon("4")
+        print_styled_msg("Please select an option (1-8) from the"
+                         " list shown and enter it below\n", "white")
+
+        print("1. Add a card to your portfolio")
+        print("2. Remove a card from your portfolio")
+        print("3. View portfolio")
+        print("4. View cards needed to complete collection")
+        print("5. Appraise portfolio")
+        print("6. Delete portfolio")
+        print("7. Search for card")
+        print("8. Log out")
+        print("Or chain commands: a/r card numbers, v, n, $, s card number, "
+              "l,\ni (import), x (export) e.g. a 4 5 16; r 9; v")
+
+        menu_selection = input("Enter your selection: \n")
+
+        # Anything other than a number is run as a chain of commands
+        if menu_selection.strip() and not menu_selection.strip().isdigit():
+            try:
+                commands = parse_commands(menu_selection)
+            except CommandError as e:
+                print()
+                print_styled_msg(f"Invalid command: {e}, "
+                                 "please try again\n", "red")
+                continue
+
+            if human_user.prefetcher:
+                for name, card_nums in commands:
+                    if name in MENU_OPTIONS:
+                        human_user.prefetcher.record_selection(
+                            MENU_OPTIONS[name])
+            return partial(human_user.run_commands, commands)
 
-        while True:
-            print_styled_msg("Please select an option (1-8) from the"
-                             " list shown and enter it below\n", "white")
+        validated_selection = validate_selection(
+            menu_selection, list(range(1, 9)))
 
-            print("1. Add a card to your portfolio")
-            print("2. Remove a card from your portfolio")
-            print("3. View portfolio")
-            print("4. View cards needed to complete collection")
-            print("5. Appraise portfolio")
-            print("6. Delete portfolio")
-            print("7. Search for card")
-            print("8. Log out")
+        if validated_selection:
+            break
 
-            menu_selection = input("Enter your selection: \n")
+    if human_user.prefetcher:
+        human_user.prefetcher.record_selection(validated_selection)
 
-            validated_selection = validate_selection(
-                menu_selection, list(range(1, 9)))
+    if validated_selection == 1:
+        return human_user.add_card
 
-            if validated_selection:
-                break
+    elif validated_selection == 2:
+        return human_user.remove_card
 
-        if validated_selection == 1:
-            human_user.add_card()
+    elif validated_selection == 3:
+        return human_user.view_portfolio
 
-        elif validated_selection == 2:
-            human_user.remove_card()
+    elif validated_selection == 4:
+        return human_user.view_cards_needed
+
+    elif validated_selection == 5:
+        return human_user.appraise_portfolio
+
+    elif validated_selection == 6:
+        return partial(confirm_delete_portfolio, human_user)
+
+    elif validated_selection == 7:
+        return human_user.card_search
+
+    elif validated_selection == 8:
+        return log_out(human_user)
 
-        elif validated_selection == 3:
-            human_user.view_portfolio()
-
-        elif validated_selection == 4:
-            human_user.view_cards_needed()
-
-        elif validated_selection == 5:
-            human_user.appraise_portfolio()
-
-        elif validated_selection == 6:
-            clear_terminal()
-            print_art_font("      Delete  Portfolio", "big", "yellow")
-            print_pokemon("29")
-            while True:
-                print_styled_msg("Please select an option (1 or 2) from the "
-                                 "list shown and enter it below\n", "white")
-
-                print_styled_msg("CAUTION, selecting option 1 will delete"
-                                 " all cards from your portfolio\n", "red")
-
-                print("1. Yes delete my portfolio")
-                print("2. Return to main menu\n")
-                confirm_selection = input("Enter your selection: \n")
-
-                confirm_selection_validated = validate_selection(
-                    confirm_selection, list(range(1, 3))
-                )
-                if confirm_selection_validated == 1:
-                    human_user.delete_portfolio()
-                    break
-                elif confirm_selection_validated == 2:
-                    break
-        elif validated_selection == 7:
-            human_user.card_search()
-        elif validated_selection == 8:
-            print_styled_msg("Logging out...", "white")
-            time.sleep(2)
-            main()
+
+def log_out(human_user):
+    """
+    Logs a user out and returns to the welcome banner
+
+    Parameters:
+        human_user (object of User class):
+            The logged in user that is using the app
+    Returns:
+        screen (func): Next screen to display
+    """
+    print_styled_msg("Logging out...", "white")
+    human_user.queued_screens.clear()
+    if human_user.prefetcher:
+        human_user.prefetcher.close()
+        human_user.prefetcher = None
+    # Tokens already sent, such as one saved by another tab, stop working
+    revoke_tokens(human_user.col_letter)
+    send_resume_token("")
+    sys.stdout.flush()
+    time.sleep(2)
+    return display_welcome_banner
+
+
+def confirm_delete_portfolio(human_user):
+    """
+    Asks the user to confirm before deleting their portfolio
+
+    Parameters:
+        human_user (object of User class):
+            The logged in user that is using the app
+    Returns:
+        screen (func): Next screen to display
+    """
+    show_screen("delete_portfolio")
+    while True:
+        print_styled_msg("Please select an option (1 or 2) from the "
+                         "list shown and enter it below\n", "white")
+
+        print_styled_msg("CAUTION, selecting option 1 will delete"
+                         " all cards from your portfolio\n", "red")
+
+        print("1. Yes delete my portfolio")
+        print("2. Return to main menu\n")
+        confirm_selection = input("Enter your selection: \n")
+
+        confirm_selection_validated = validate_selection(
+            confirm_selection, list(range(1, 3))
+        )
+        if confirm_selection_validated == 1:
+            return human_user.delete_portfolio
+        elif confirm_selection_validated == 2:
+            return human_user.menu_screen()
 
 
 def select_from_avail_options(
-        function_to_call, function_text, main_menu=False):
+        function_to_call, function_text, menu_screen=None):
     """
     Used to display a list of options to the user
     and allow them to make a selection
 
     Parameters:
-        function_to_call (func): Function to be called if option 1 is selected
+        function_to_call (func): Screen to return if option 1 is selected
         function_text (string): Text to be shown for option 1
-        main_menu (boolean):
-            Flag to indicate if we want to return to the main menu
-    Returns: None:
-
+        menu_screen (func or None):
+            Returns the main menu screen, called only if the user goes
+            back to it, None returns to the home page
+    Returns:
+        screen (func): Next screen to display
     """
     while True:
         print_styled_msg("Please select option (1 or 2) from the list shown "
                          "and enter it below\n", "white")
 
         print("1. " + function_text)
-        if not (main_menu):
+        if not (menu_screen):
             print("2. Return to home page\n")
         else:
             print("2. Return to main menu\n")
@@ -825,70 +1120,67 @@ def select_from_avail_options(
         validated_selection = validate_selection(selection, list(range(1, 3)))
 
         if validated_selection == 1:
-            function_to_call()
-            break
+            return function_to_call
         elif validated_selection == 2:
-            if not (main_menu):
-                print("2. Return to main menu\n")
-                display_welcome_banner()
-                break
+            if not (menu_screen):
+                return display_welcome_banner
             else:
-                break  # Returns to main menu
-
-
-# ----------------------- HELPER FUNCTIONS ------------------------
+                # Called now so a queued chain screen is only taken
+                # when the user goes back to the menu
+                return menu_screen()
 
 
-def print_art_font(string, font, color):
+def run_screens(screen):
     """
-    Uses pyfiglet library to convert given string into an art font style
-    Prints sting in selected colour
+    Runs the app as a flat loop, each screen returns the next screen to
+    display rather than calling it, so the stack does not grow however
+    long a user stays connected
+
+    A cancelled network call or Ctrl-C returns to the home screen, the
+    users main menu once they have logged in, rather than ending the
+    session. Ctrl-C on the home screen itself still exits.
 
     Parameters:
-        string (string): Text to be converted
-        color (string): Colour to print converted text
-        font (string): Font to print in
+        screen (func): First screen to display
     Returns:
         None
     """
-    font = pyf.Figlet(font=font, width=110)
-    msg = font.renderText(string)
-    msg = msg.rstrip()
+    home_screen = display_welcome_banner
+    while screen:
+        screen_func = getattr(screen, "func", screen)
+        if screen_func in (main_menu, display_welcome_banner):
+            home_screen = screen
+        start_screen(screen_func.__name__)
 
-    print(colored(msg, color))
+        try:
+            screen = screen()
+        except (ActionCancelled, KeyboardInterrupt) as e:
+            if isinstance(e, KeyboardInterrupt) and screen is home_screen:
+                raise
+            print()
+            print_styled_msg("Cancelled\n", "yellow")
+            sys.stdout.flush()
+            time.sleep(1)
+            screen = home_screen
+
+
+# ----------------------- HELPER FUNCTIONS ------------------------
 
 
-def print_center_string(string):
+def exit_on_hangup():
     """
-    Centers and prints the given text to the terminal
-    If text contains ascii escape codes for colour etc, strip
-    these out for calculating spacing.
+    Exits normally when the bridge hangs up or the process is asked to
+    stop, so atexit handlers such as saving prefetch stats still run
 
     Parameters:
-        string (string): String to be centered and printed
+        None
     Returns:
         None
     """
-
-    terminal_width = os.get_terminal_size().columns
-
-    # If string contains ascii escape chars, use regex
-    # to substitute them with " " before calculations
-    processed_string = re.sub(r"(\x1b|\033)\[[0-9;]*m", "", string)
-
-    spaces = int((terminal_width - len(processed_string)) / 2)
-    centered_string = " " * spaces + string
-    print(centered_string)
-
-
-def clear_terminal():
-    """
-    Clears text from terminal
-    """
-    if os.name == "posix":  # Linux and macOS
-        os.system("clear")
-    elif os.name == "nt":  # Windows
-        os.system("cls")
+    for name in ("SIGHUP", "SIGTERM"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name),
+                          lambda signum, frame: sys.exit(0))
 
 
 def check_username_in_use(username):
@@ -902,20 +1194,14 @@ def check_username_in_use(username):
                     2 Username not found
                     3 API error
     """
-    result = None
-    login_worksheet = open_worksheet("login")
-    # Exit if we had an API error
-    if not (login_worksheet):
-        result = 3
-        return result
-
-    username_found = login_worksheet.find(username, in_column=1)
-    if username_found:
-        result = 1
-        return result
-    else:
-        result = 0
-        return result
+    try:
+        return 1 if SERVICE.username_in_use(username) else 0
+    except Exception as e:
+        print_styled_msg(f"An error occurred: {e}, "
+                         "please try again, Loading ..\n", "red")
+        sys.stdout.flush()
+        time.sleep(3)
+        return 3
 
 
 def check_phone_num_in_use(phone_num):
@@ -929,107 +1215,40 @@ def check_phone_num_in_use(phone_num):
                     2 Phone num not found
                     3 API error
     """
-    result = None
-    login_worksheet = open_worksheet("login")
-    # Exit if we had an API error
-    if not (login_worksheet):
-        result = 3
-        return result
-
-    phone_num_found = login_worksheet.find(phone_num, in_column=3)
-    if phone_num_found:
-        result = 1
-        return result
-    else:
-        result = 0
-        return result
+    try:
+        return 1 if SERVICE.phone_num_in_use(phone_num) else 0
+    except Exception as e:
+        print_styled_msg(f"An error occurred: {e}, "
+                         "please try again, Loading ..\n", "red")
+        sys.stdout.flush()
+        time.sleep(3)
+        return 3
 
 
-def hash_password(password):
+def send_resume_token(token):
     """
-    Hashes given password using a generated salt
+    Writes a resume token to the terminal bridge as an escape sequence
+    An empty token tells the bridge to forget the current one
 
     Parameters:
-        password (string): Password to be hashed
+        token (string or None): Token to send, None if resume is disabled
     Returns:
-        hashed_pass (string): String representing the hashed password
-    """
-    salt = bcrypt.gensalt()
-    hashed_pass = bcrypt.hashpw(password.encode(), salt)
-
-    # Returned as strings for storage in gsheets
-    hashed_pass = str(hashed_pass)
-
-    return hashed_pass
-
-
-def print_styled_msg(msg, color):
+        None
     """
-    Prints a centered, bold message in a selected colour
+    if token is None or not SECRET:
+        return
 
-    Parameters:
-        msg: Message to be printed
-        color: Colour of message to be printed
-    Returns:
-        None:
-    """
-    print_center_string(colored(msg, color, attrs=["bold", "underline"]))
+    sys.stdout.write(TOKEN_SEQUENCE.format(token))
+    sys.stdout.flush()
 
 
 # ----------------------- GSHEETS FUNCTIONS -----------------------
 
 
-def increment_gsheet_column_value(column):
-    """
-    Used to increment column values from gsheets.
-    Pass in A returns B
-    Pass in Z returns AA
-    Pass in GZ returns HA etc.
-
-    Parameters:
-        column (string): Column to be incremented
-    Returns:
-        incremented_col (string): Value of the next column
-
-    """
-    # Use in the case where we reach Z and need to move to AA
-    if column == "":
-        return "A"
-
-    last_char_in_column = column[-1]
-    other_chars = column[:-1]
-
-    if last_char_in_column == "Z":
-        # Call this function again passing in other_chars
-        # to update the letters before the Z and change the Z to A
-        return increment_gsheet_column_value(other_chars) + "A"
-    else:
-        return other_chars + chr(ord(last_char_in_column) + 1)
-
-
-def add_column_to_sheet(sheet_name):
-    """
-    Adds a new column to the specified google sheet
-
-    Parameters:
-        sheet_name (string): Sheet to add column to
-    Returns:
-        None:
-    """
-    worksheet = SHEET.worksheet(sheet_name)
-    empty_lists = [[]]
-    last_col_index = worksheet.col_count - 1
-    worksheet.insert_cols(
-        empty_lists,
-        col=last_col_index,
-        value_input_option="RAW",
-        inherit_from_before=True,
-    )
-
-
 def open_worksheet(worksheet_name):
     """
     Open google worksheet and handle errors that may occur
+    Calls on the opened sheet run off the UI thread with a spinner
 
     Parameters:
         worksheet_name: Name of worksheet to open
@@ -1038,23 +1257,26 @@ def open_worksheet(worksheet_name):
         Opened sheet or False (if error occurs)
     """
     try:
-        opened_worksheet = SHEET.worksheet(worksheet_name)
-        return opened_worksheet
+        opened_worksheet = run_in_background(SHEET.worksheet, worksheet_name)
+        return BackgroundWorksheet(opened_worksheet)
 
     except gspread.exceptions.WorksheetNotFound as e:
         print_styled_msg(f"Worksheet {e} not found, please try again, "
                          "Loading ...\n", "red")
+        sys.stdout.flush()
         time.sleep(3)
         return False
     except gspread.exceptions.APIError as e:
         print_styled_msg(f"Error opening worksheet: {e}, "
                          "please try again, Loading ..\n", "red")
+        sys.stdout.flush()
         time.sleep(3)
         return False
 
     except Exception as e:
         print_styled_msg(f"An error occurred: {e}, "
                          "please try again, Loading ..\n", "red")
+        sys.stdout.flush()
         time.sleep(3)
         return False
 
@@ -1093,6 +1315,53 @@ def validate_selection(selection_str, available_choices):
     return selection_value
 
 
+def get_valid_option(options):
+    """
+    Shows numbered options and asks for one until a valid one is entered
+
+    Parameters:
+        options (list): Text of each option
+    Returns:
+        selection (int): Number of the option selected, starting at 1
+    """
+    while True:
+        for number, option in enumerate(options, 1):
+            print(f"{number}. {option}")
+        print()
+
+        selection = validate_selection(input("Enter your selection: \n"),
+                                       list(range(1, len(options) + 1)))
+        if selection:
+            return selection
+
+
+def get_valid_card_numbers(action):
+    """
+    Asks for card numbers until at least one valid card is entered,
+    lists and ranges such as 1-16, 23, 58-60 can be entered
+
+    Parameters:
+        action (string): What will be done with the cards, for the prompt
+    Returns:
+        (card_nums, rejected) (tuple): Valid card numbers in the order
+            entered, and the entries that are not valid cards
+    """
+    while True:
+        card_num_selection = input(
+            f"\nEnter the card numbers (1-{CARD_COUNT}) that you would "
+            f"like to {action},\nsuch as 4 or 1-16, 23: \n"
+        )
+
+        card_nums, rejected = parse_card_list(card_num_selection)
+        if card_nums:
+            return card_nums, rejected
+
+        print()
+        print_styled_msg(f"Invalid selection: {card_num_selection} is not "
+                         "a card number or range, please try again\n",
+                         "red")
+
+
 def get_valid_username(check_for_match=True):
     """
     Gets a valid username from the user
@@ -1113,17 +1382,7 @@ def get_valid_username(check_for_match=True):
                 "long,\n(You may use letters, numbers, _ or -) : \n"
             )
 
-            if len(username) < 5:
-                raise ValueError("Username must be at least 5 characters")
-
-            if len(username) > 15:
-                raise ValueError("Username can not be more than 15 characters")
-
-            # Uses regex to check username from start to end and
-            # ensures it only contains, letters, numbers, _ and -
-            if not re.match("^[a-zA-Z0-9_-]*$", username):
-                raise ValueError("Username can only use letters, "
-                                 "numbers, _ or -")
+            check_username(username)
 
             if check_for_match:
                 checked_username = check_username_in_use(username)
@@ -1139,16 +1398,16 @@ def get_valid_username(check_for_match=True):
             print_styled_msg(f"{e}, please try again\n", "red")
 
 
-def get_valid_password(hash_pass=True):
+def get_valid_password():
     """
     Gets a valid password from user
     Password can be between 5 and 15 chars and use  _ , - , & or !
-    Hashes password via call to external function
+    The service hashes it before it is stored
 
     Parameters:
-        hash_pass: Flag used to control if password hashing is carried out
+        None
     Returns:
-        password (string): Validated, Hashed password
+        password (string): Validated password
     """
     while True:
         try:
@@ -1157,23 +1416,8 @@ def get_valid_password(hash_pass=True):
                 "long,\n(You may user letters, numbers, _ , - , & or !) : \n"
             )
 
-            if len(password) < 5:
-                raise ValueError("Password must be at least 5 characters")
-
-            if len(password) > 15:
-                raise ValueError("Password cannot be more than 15 characters")
-
-            # Uses regex to check password from start to end and ensures
-            # it only contains, letters, numbers, _ , & , ! and  -
-            if not re.match("^[a-zA-Z0-9_&!-]*$", password):
-                raise ValueError("Please only use letters, "
-                                 "numbers, _ , - , & or !")
-
-            if hash_pass:
-                password = hash_password(password)
-                return password
-            else:
-                return password
+            check_password_text(password)
+            return password
 
         except ValueError as e:
             print("")
@@ -1199,16 +1443,7 @@ def get_valid_phone_num(check_for_match=True):
                 "of 10 to 15 digits: \n"
             )
 
-            if len(phone_num) < 10:
-                raise ValueError("Phone number must be at least 10 digits")
-
-            if len(phone_num) > 15:
-                raise ValueError("Phone number cannot be more than 15 digits")
-
-            # Uses regex to check phone_num from start to end and
-            # ensure it only contains, letters, numbers
-            if not re.match("^[0-9]*$", phone_num):
-                raise ValueError("Please only use numbers")
+            check_phone_num(phone_num)
 
             if check_for_match:
                 checked_phone_num = check_phone_num_in_use(phone_num)
@@ -1232,7 +1467,25 @@ def main():
     """
     Run Pokemon Portfolio terminal application
     """
-    display_welcome_banner()
+    # Commands given on the command line run without any screens
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:], SHEET))
+
+    # The counter goes under the compositor so it counts the bytes sent
+    if SCREEN_BYTES_LOG or SCREEN_BYTE_BUDGET:
+        install_counter()
+    install_compositor()
+    install_typeahead()
+    watch_resize()
+    exit_on_hangup()
+
+    # Resume a session handed back by the bridge on reconnect, the token
+    # is removed so logging out returns to the welcome banner
+    resumed_user = verify_token(os.environ.pop("RESUME_TOKEN", ""))
+    if resumed_user:
+        run_screens(User(*resumed_user).menu_screen())
+    else:
+        run_screens(display_welcome_banner)
 
 
 # Ensures main is only executed when the script is directly run
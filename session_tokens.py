@@ -0,0 +1,135 @@
+"""This module provides short lived signed tokens that let a reconnecting
+terminal resume a logged in session without logging in again. Each token
+carries the generation of its users column, revoke_tokens bumps it on
+logout or a password change so older tokens stop working."""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks on Windows, generations are then only safe to bump
+    # from one process at a time
+    fcntl = None
+
+# Key used to sign tokens, resume is disabled when this is not set
+SECRET = os.environ.get("SESSION_SECRET", "")
+
+# How long in seconds a token can be used to resume a session
+TOKEN_TTL = int(os.environ.get("SESSION_TOKEN_TTL", 900))
+
+# Escape sequence used to pass a token to the terminal bridge, the
+# browser picks it out of the stream and the terminal ignores it
+TOKEN_SEQUENCE = "\x1b]1337;ResumeToken={}\x07"
+
+# Token generation of each users column, shared by every process
+GENERATIONS_FILE = os.environ.get("SESSION_GENERATIONS_FILE",
+                                  ".session_generations.json")
+
+_generations_lock = threading.Lock()
+
+
+def _sign(payload):
+    """
+    Returns the url safe HMAC-SHA256 signature of the payload
+    """
+    digest = hmac.new(SECRET.encode(), payload, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=")
+
+
+def _read_generations():
+    """
+    Returns the token generation of each users column
+    """
+    try:
+        with open(GENERATIONS_FILE, encoding="utf-8") as file:
+            generations = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return generations if isinstance(generations, dict) else {}
+
+
+def revoke_tokens(col_letter):
+    """
+    Stops every token issued so far for a users column from working,
+    by moving the column on to its next generation
+
+    Parameters:
+        col_letter (string): Letter to represent user column
+    Returns:
+        None
+    """
+    with _generations_lock, open(f"{GENERATIONS_FILE}.lock",
+                                 "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        generations = _read_generations()
+        generations[col_letter] = generations.get(col_letter, 0) + 1
+
+        # Written aside and moved into place so readers never see half
+        temp_path = f"{GENERATIONS_FILE}.{os.getpid()}"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(generations, file)
+        os.replace(temp_path, GENERATIONS_FILE)
+
+
+def issue_token(col_number, col_letter, ttl=TOKEN_TTL):
+    """
+    Creates a signed token for the users column
+
+    Parameters:
+        col_number (int): Column number that stores the users cards
+        col_letter (string): Letter to represent user column
+        ttl (int): Seconds until the token expires
+    Returns:
+        token (string or None): Signed token, None if no secret is set
+    """
+    if not SECRET:
+        return None
+
+    payload = json.dumps({
+        "col": col_number,
+        "letter": col_letter,
+        "gen": _read_generations().get(col_letter, 0),
+        "exp": int(time.time()) + ttl,
+    }, separators=(",", ":")).encode()
+    payload = base64.urlsafe_b64encode(payload).rstrip(b"=")
+
+    return (payload + b"." + _sign(payload)).decode()
+
+
+def verify_token(token):
+    """
+    Checks a tokens signature, expiry time and that it has not been
+    revoked
+
+    Parameters:
+        token (string): Token handed back by the terminal bridge
+    Returns:
+        (col_number, col_letter) or None: Users column if token is valid
+    """
+    if not (SECRET and token):
+        return None
+
+    try:
+        payload, signature = token.encode().split(b".")
+        if not hmac.compare_digest(signature, _sign(payload)):
+            return None
+
+        # Restore the padding stripped when the token was issued
+        padded = payload + b"=" * (-len(payload) % 4)
+        details = json.loads(base64.urlsafe_b64decode(padded))
+
+        if details["exp"] < time.time():
+            return None
+        if details["gen"] != _read_generations().get(details["letter"], 0):
+            return None
+        return int(details["col"]), str(details["letter"])
+
+    except (ValueError, KeyError, TypeError):
+        return None
@@ -0,0 +1,129 @@
+"""This module provides the terminal size, cached and refreshed when the
+terminal is resized, and the width text takes up on screen"""
+import re
+import shutil
+import signal
+import unicodedata
+from functools import lru_cache
+
+# Size of the pty spawned by the terminal bridge
+DEFAULT_WIDTH = 85
+DEFAULT_HEIGHT = 37
+
+# Max number of strings whose display width is kept in memory
+WIDTH_CACHE_SIZE = 2048
+
+# Escape codes, which take up no space on screen: colour and cursor
+# codes (CSI) and commands such as the resume token (OSC)
+ESCAPE_CODES = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]"
+                          r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"
+                          r"|\x1b[@-Z\\-_]")
+
+# Cached terminal size, None until read or after a resize
+_size = None
+
+# Set once the resize signal handler is installed, until then the size
+# is read every time as there is nothing to refresh the cache
+_watching = False
+
+
+def get_terminal_size():
+    """
+    Returns the size of the terminal, COLUMNS and LINES override the
+    real size and the default pty size is used if there is no terminal
+
+    Parameters:
+        None
+    Returns:
+        size (os.terminal_size): Columns and lines of the terminal
+    """
+    global _size
+
+    if _size is None or not _watching:
+        _size = shutil.get_terminal_size((DEFAULT_WIDTH, DEFAULT_HEIGHT))
+    return _size
+
+
+def _on_resize(signum, frame, previous=None):
+    """
+    Forgets the cached size when the terminal is resized
+    """
+    global _size
+
+    _size = None
+    if callable(previous):
+        previous(signum, frame)
+
+
+def watch_resize():
+    """
+    Caches the terminal size, refreshing it when SIGWINCH is received
+    Must be called from the main thread, does nothing on Windows
+
+    Parameters:
+        None
+    Returns:
+        watching (boolean): True if the size is now cached
+    """
+    global _watching
+
+    if _watching or not hasattr(signal, "SIGWINCH"):
+        return _watching
+
+    previous = signal.getsignal(signal.SIGWINCH)
+    try:
+        signal.signal(signal.SIGWINCH, lambda signum, frame: _on_resize(
+            signum, frame, previous))
+    except ValueError:
+        # Not the main thread
+        return False
+    _watching = True
+    return True
+
+
+def strip_escape_codes(string):
+    """
+    Removes escape codes from a string
+
+    Parameters:
+        string (string): String that may contain escape codes
+    Returns:
+        string (string): String as it appears on screen
+    """
+    return ESCAPE_CODES.sub("", string)
+
+
+def char_width(char):
+    """
+    Returns the number of columns a character takes up, 2 for wide east
+    asian characters and 0 for combining marks and control characters
+
+    Parameters:
+        char (string): Single character
+    Returns:
+        width (int): Number of columns
+    """
+    if unicodedata.combining(char) or \
+            unicodedata.category(char) in ("Cc", "Cf", "Mn", "Me"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def display_width(string):
+    """
+    Returns the number of columns a line of text takes up on screen,
+    ignoring escape codes and counting wide characters as 2
+
+    Parameters:
+        string (string): Line of text, may contain escape codes
+    Returns:
+        width (int): Number of columns
+    """
+    if "\x1b" in string:
+        string = strip_escape_codes(string)
+    if string.isascii():
+        return len(string)
+    return sum(char_width(char) for char in string)
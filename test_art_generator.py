@@ -0,0 +1,24 @@
+"""Tests for threshold_pixels in art_generator, run with python -m pytest"""
+import numpy as np
+
+from art_generator import threshold_pixels
+
+
+def test_white_image_has_no_dots():
+    assert not threshold_pixels(np.ones((16, 16))).any()
+
+
+def test_black_image_is_all_dots():
+    assert threshold_pixels(np.zeros((16, 16))).all()
+
+
+def test_white_background_stays_clear():
+    pixels = np.ones((16, 16))
+    pixels[4:12, 4:12] = 0.2
+    dots = threshold_pixels(pixels)
+    assert not dots[:4].any() and not dots[12:].any()
+    assert dots[4:12, 4:12].all()
+
+
+def test_invert_makes_white_image_all_dots():
+    assert threshold_pixels(np.ones((16, 16)), invert=True).all()